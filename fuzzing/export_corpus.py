@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This script exports the Ragger test fixtures as seeds for the fuzzing harnesses.
+
+Each test case is turned into the APDU sequence the tests send, built with the
+CommandBuilder, then into the records read by the harnesses:
+    ins (1B) | p1 (1B) | p2 (1B) | lc (1B) | data (lc B)
+
+Seeds are written to corpus/<command>/, and all of them to corpus/all/ for all_harness.
+As done by libFuzzer, seeds are named after the SHA1 of their content, so identical seeds are only written once.
+
+Run it with the tests requirements installed:
+    python export_corpus.py
+"""
+
+from hashlib import sha1
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, Set, Type, TypeVar
+import sys
+
+FUZZING_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(FUZZING_DIR.parent / "tests"))
+
+# pylint: disable=wrong-import-position
+from application_client.command_builder import CommandBuilder, P1Type
+
+from input_files import cvote, derive_address, derive_native_script, pubkey, signMsg, signOpCert, signTx
+from input_files.derive_native_script import NativeScript, NativeScriptParamsNofK, NativeScriptParamsScripts
+from input_files.derive_native_script import NativeScriptType, ValidNativeScriptTestCase
+
+from utils import gather_witness_paths
+
+CORPUS_DIR = FUZZING_DIR / "corpus"
+ALL_HARNESS = "all"
+
+CaseType = TypeVar("CaseType")
+
+# Header of a harness record: ins, p1, p2, lc
+RECORD_HEADER_SIZE = 4
+# The harnesses only process a record while more than this remains in the input
+RECORD_MIN_SIZE = 6
+
+
+def _records(apdus: Iterable[bytes]) -> bytes:
+    """Convert APDUs to harness records, dropping the records the harness would never reach
+
+    Args:
+        apdus (Iterable[bytes]): The APDUs, as built by the CommandBuilder (CLA INS P1 P2 LC DATA)
+
+    Returns:
+        The seed content
+    """
+
+    # The records are the APDUs without the CLA
+    records = [apdu[1:] for apdu in apdus]
+    for record in records:
+        assert len(record) == RECORD_HEADER_SIZE + record[3], "Invalid APDU length"
+    # Trailing records too short for the harness loop are ignored, so drop them
+    while len(records) > 0 and len(records[-1]) < RECORD_MIN_SIZE:
+        records.pop()
+    return b"".join(records)
+
+
+def _fixtures(module: ModuleType, caseType: Type[CaseType]) -> Iterator[CaseType]:
+    """Test cases of a given type, in all the fixture lists of a module"""
+
+    for value in vars(module).values():
+        if isinstance(value, list):
+            yield from (testCase for testCase in value if isinstance(testCase, caseType))
+
+
+def _getPublicKeys(builder: CommandBuilder) -> Iterator[bytes]:
+    """Get Public Keys sequences: one per key, then the multiple keys sessions of the tests"""
+
+    for testCase in _fixtures(pubkey, pubkey.PubKeyTestCase):
+        yield _records([builder.get_pubkey(P1Type.P1_KEY_INIT, testCase.path)])
+    for session in (pubkey.byronTestCases + pubkey.testsShelleyUsual + pubkey.testsColdKeys + pubkey.testsCVoteKeys,
+                    pubkey.testsShelleyUnusual + pubkey.byronTestCases + pubkey.testsColdKeys + pubkey.testsShelleyUsual):
+        apdus = [builder.get_pubkey(P1Type.P1_KEY_INIT, session[0].path, len(session) - 1)]
+        apdus += [builder.get_pubkey(P1Type.P1_KEY_NEXT, testCase.path) for testCase in session[1:]]
+        yield _records(apdus)
+
+
+def _deriveAddress(builder: CommandBuilder) -> Iterator[bytes]:
+    """Derive Address sequences, returned and displayed"""
+
+    for testCase in _fixtures(derive_address, derive_address.DeriveAddressTestCase):
+        for p1 in (P1Type.P1_RETURN, P1Type.P1_DISPLAY):
+            yield _records([builder.derive_address(p1, testCase)])
+
+
+def _nativeScriptApdus(builder: CommandBuilder, script: NativeScript) -> Iterator[bytes]:
+    """Native script APDUs, the complex scripts being followed by their sub-scripts"""
+
+    if script.type in [NativeScriptType.ALL, NativeScriptType.ANY, NativeScriptType.N_OF_K]:
+        yield builder.derive_script_add_complex(script)
+        assert isinstance(script.params, (NativeScriptParamsScripts, NativeScriptParamsNofK))
+        for subscript in script.params.scripts:
+            yield from _nativeScriptApdus(builder, subscript)
+    else:
+        yield builder.derive_script_add_simple(script)
+
+
+def _deriveNativeScriptHash(builder: CommandBuilder) -> Iterator[bytes]:
+    """Derive Native Script Hash sequences"""
+
+    for testCase in _fixtures(derive_native_script, ValidNativeScriptTestCase):
+        apdus = list(_nativeScriptApdus(builder, testCase.script))
+        apdus.append(builder.derive_script_finish(testCase.displayFormat))
+        yield _records(apdus)
+
+
+def _signCVote(builder: CommandBuilder) -> Iterator[bytes]:
+    """Sign CIP36 Vote sequences"""
+
+    for testCase in _fixtures(cvote, cvote.CVoteTestCase):
+        apdus = [builder.sign_cip36_init(testCase)]
+        apdus += builder.sign_cip36_chunk(testCase)
+        apdus += [builder.sign_cip36_confirm(), builder.sign_cip36_witness(testCase)]
+        yield _records(apdus)
+
+
+def _signMsg(builder: CommandBuilder) -> Iterator[bytes]:
+    """Sign Message sequences"""
+
+    for testCase in _fixtures(signMsg, signMsg.SignMsgTestCase):
+        apdus = [builder.sign_msg_init(testCase)]
+        apdus += builder.sign_msg_chunk(testCase)
+        apdus.append(builder.sign_msg_confirm())
+        yield _records(apdus)
+
+
+def _signOpCert(builder: CommandBuilder) -> Iterator[bytes]:
+    """Sign Operational Certificate sequences"""
+
+    for testCase in _fixtures(signOpCert, signOpCert.OpCertTestCase):
+        yield _records([builder.sign_opCert(testCase)])
+
+
+def _signTx(builder: CommandBuilder) -> Iterator[bytes]:
+    """Sign TX sequences"""
+
+    for testCase in _fixtures(signTx, signTx.SignTxTestCase):
+        witnessPaths = gather_witness_paths(testCase)
+        yield _records(signTxApdu.apdu for signTxApdu in builder.iter_sign_tx(testCase, witnessPaths))
+
+
+# Seed generators, by harness (<command>_harness)
+HARNESSES = {
+    "deriveAddress": _deriveAddress,
+    "deriveNativeScriptHash": _deriveNativeScriptHash,
+    "getPublicKeys": _getPublicKeys,
+    "signCVote": _signCVote,
+    "signMsg": _signMsg,
+    "signOpCert": _signOpCert,
+    "signTx": _signTx,
+}
+
+
+def _writeCorpus(harness: str, seeds: Set[bytes]) -> None:
+    """Replace the corpus of a harness"""
+
+    corpus = CORPUS_DIR / harness
+    corpus.mkdir(parents=True, exist_ok=True)
+    for seedFile in corpus.iterdir():
+        seedFile.unlink()
+    for seed in seeds:
+        (corpus / sha1(seed).hexdigest()).write_bytes(seed)
+
+
+def main() -> None:
+    builder = CommandBuilder()
+    allSeeds: Set[bytes] = set()
+    counts: Dict[str, int] = {}
+    for harness, generator in HARNESSES.items():
+        seeds = {seed for seed in generator(builder) if len(seed) > 0}
+        _writeCorpus(harness, seeds)
+        allSeeds |= seeds
+        counts[harness] = len(seeds)
+    _writeCorpus(ALL_HARNESS, allSeeds)
+    counts[ALL_HARNESS] = len(allSeeds)
+
+    for harness, count in counts.items():
+        print(f"{harness}_harness".ljust(32) + f"{count:>6} seeds")
+
+
+if __name__ == "__main__":
+    main()
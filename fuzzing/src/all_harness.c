@@ -1,3 +1,4 @@
+#include <common.h>
 #include <cx.h>
 #include <handlers.h>
 #include <os_io.h>
@@ -10,12 +11,13 @@
 uint8_t G_io_apdu_buffer[IO_APDU_BUFFER_SIZE];
 
 int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size) {
-    uint8_t *input = NULL;
     bool is_first = true;
     command_t cmd = {0};
 
     while (size > 5) {
         io_state = IO_EXPECT_NONE;
+        // records do not carry the CLA
+        cmd.cla = CLA;
         cmd.ins = data[0];
         cmd.p1 = data[1];
         cmd.p2 = data[2];
@@ -29,11 +31,11 @@ int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size) {
         }
 
         cmd.data = malloc(cmd.lc);
-        if (input == NULL) {
+        if (cmd.data == NULL) {
             return 0;
         }
 
-        memcpy(input, data, cmd.lc);
+        memcpy(cmd.data, data, cmd.lc);
 
         data += cmd.lc;
         size -= cmd.lc;
@@ -50,7 +52,7 @@ int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size) {
         END_TRY;
 
         is_first = false;
-        free(input);
+        free(cmd.data);
     }
     return 0;
 }
@@ -111,9 +111,21 @@ void test_decimalPlaces() {
     }
 }
 
+void test_tokenRegistryOrder() {
+    // the tokens are looked up by binary search on their fingerprint,
+    // so the registry must be sorted by fingerprint without duplicates (see tokenRegistry/convert.py)
+    for (size_t i = 1; i < tokenRegistry_size(); i++) {
+        EXPECT_EQ(memcmp(tokenRegistry_fingerprint(i - 1),
+                         tokenRegistry_fingerprint(i),
+                         ASSET_FINGERPRINT_SIZE) < 0,
+                  true);
+    }
+}
+
 void run_tokens_test() {
     test_assetFingerprint();
     test_decimalPlaces();
+    test_tokenRegistryOrder();
 }
 
 #endif
@@ -4,8 +4,6 @@
 #include "hash.h"
 #include "bech32.h"
 
-#define ASSET_FINGERPRINT_SIZE 20
-
 void deriveAssetFingerprintBytes(const uint8_t* policyId,
                                  size_t policyIdSize,
                                  const uint8_t* assetName,
@@ -62,8 +60,9 @@ typedef struct {
     const char* ticker;
 } token_info_t;
 
-const token_info_t tokenInfos[] = {
 // a fixed list of most popular tokens
+// sorted by fingerprint (see tokenRegistry/convert.py) for the binary search in _getTokenInfo
+const token_info_t tokenInfos[] = {
 #include "../tokenRegistry/token_data.c"
 };
 
@@ -80,15 +79,37 @@ static const token_info_t* _getTokenInfo(const token_group_t* tokenGroup,
                                 fingerprintBuffer,
                                 SIZEOF(fingerprintBuffer));
 
-    for (size_t i = 0; i < ARRAY_LEN(tokenInfos); i++) {
-        if (!memcmp(tokenInfos[i].fingerprint, fingerprintBuffer, ASSET_FINGERPRINT_SIZE)) {
-            return &tokenInfos[i];
+    // binary search in [low, high)
+    size_t low = 0;
+    size_t high = ARRAY_LEN(tokenInfos);
+    while (low < high) {
+        const size_t middle = low + (high - low) / 2;
+        const int cmp =
+            memcmp(tokenInfos[middle].fingerprint, fingerprintBuffer, ASSET_FINGERPRINT_SIZE);
+        if (cmp == 0) {
+            return &tokenInfos[middle];
+        }
+        if (cmp < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
         }
     }
 
     return NULL;
 }
 
+#ifdef DEVEL
+size_t tokenRegistry_size() {
+    return ARRAY_LEN(tokenInfos);
+}
+
+const uint8_t* tokenRegistry_fingerprint(size_t index) {
+    ASSERT(index < ARRAY_LEN(tokenInfos));
+    return tokenInfos[index].fingerprint;
+}
+#endif  // DEVEL
+
 size_t str_formatTokenAmountOutput(const token_group_t* tokenGroup,
                                    const uint8_t* assetNameBytes,
                                    size_t assetNameSize,
@@ -4,6 +4,8 @@
 #include "common.h"
 #include "cardano.h"
 
+#define ASSET_FINGERPRINT_SIZE 20
+
 __noinline_due_to_stack__ size_t deriveAssetFingerprintBech32(const uint8_t* policyId,
                                                               size_t policyIdSize,
                                                               const uint8_t* assetName,
@@ -25,4 +27,10 @@ __noinline_due_to_stack__ size_t str_formatTokenAmountMint(const token_group_t*
                                                            char* out,
                                                            size_t outSize);
 
+#ifdef DEVEL
+// the registry of known tokens, for the unit tests
+size_t tokenRegistry_size();
+const uint8_t* tokenRegistry_fingerprint(size_t index);
+#endif  // DEVEL
+
 #endif  // H_CARDANO_APP_TOKENS
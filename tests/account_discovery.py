@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a Shelley wallet account discovery, with gap limit scanning.
+
+Only the account extended public keys (m/1852'/1815'/account') are retrieved from the device,
+through a multiple keys Get Public Keys session.
+The payment and staking keys are then derived on the host with the BIP32-Ed25519 soft derivation
+(see key_derivation), so scanning the addresses of an account does not cost any additional device exchange.
+
+The key source is a function with the signature of CommandSender.get_pubkeys,
+or utils.derive_many to discover the Speculos seed accounts without any device.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Tuple
+import hashlib
+
+from application_client.app_def import AddressType, NetworkDesc
+
+from input_files.derive_address import DeriveAddressTestCase
+
+from key_derivation import ExtendedPublicKey, derive_path, derive_range
+from utils import derive_address_bytes
+
+
+# Path, public key and chain code of each key, as returned by CommandSender.get_pubkeys
+KeySource = Callable[[List[str]], List[Tuple[str, bytes, bytes]]]
+
+DEFAULT_GAP_LIMIT = 20
+
+# CIP-1852 chains
+CHAIN_EXTERNAL = 0
+CHAIN_INTERNAL = 1
+CHAIN_STAKING_KEY = 2
+# Index of the staking key of the account, used in the base addresses
+STAKING_KEY_INDEX = 0
+
+KEY_HASH_LENGTH = 28
+
+
+@dataclass
+class DiscoveredAddress:
+    """Used address of an account"""
+    path: str
+    address: bytes
+
+
+@dataclass
+class DiscoveredAccount:
+    """Account with at least one used address"""
+    account: int
+    publicKey: bytes
+    chainCode: bytes
+    stakingKeyHash: bytes
+    # Used addresses, by chain
+    addresses: Dict[int, List[DiscoveredAddress]] = field(default_factory=dict)
+
+
+def account_path(account: int) -> str:
+    """Derivation path of a Shelley account
+
+    Args:
+        account (int): The account index
+
+    Returns:
+        The account path
+    """
+
+    return f"m/1852'/1815'/{account}'"
+
+
+def _keyHash(node: ExtendedPublicKey) -> bytes:
+    """blake2b-224 hash of the public key of a node"""
+
+    return hashlib.blake2b(node.publicKey, digest_size=KEY_HASH_LENGTH).digest()
+
+
+class AccountDiscovery:
+    """Discovery of the used Shelley accounts and addresses of a wallet"""
+
+    def __init__(self,
+                 getPubkeys: KeySource,
+                 netDesc: NetworkDesc,
+                 isUsed: Callable[[bytes], bool],
+                 gapLimit: int = DEFAULT_GAP_LIMIT,
+                 accountBatchSize: int = 1) -> None:
+        """Class initializer
+
+        Args:
+            getPubkeys (KeySource): Source of the account extended public keys
+            netDesc (NetworkDesc): Network of the addresses
+            isUsed (Callable): Whether an address appears on the blockchain
+            gapLimit (int): Number of consecutive unused addresses ending the scan of a chain
+            accountBatchSize (int): Number of account keys retrieved per Get Public Keys session;
+                a session of several keys must be confirmed by the user
+        """
+
+        self._getPubkeys = getPubkeys
+        self._netDesc = netDesc
+        self._isUsed = isUsed
+        self._gapLimit = gapLimit
+        self._accountBatchSize = accountBatchSize
+
+
+    def discover(self) -> List[DiscoveredAccount]:
+        """Discover the accounts, up to the first one without any used address
+
+        Returns:
+            The used accounts
+        """
+
+        accounts: List[DiscoveredAccount] = []
+        for account, publicKey, chainCode in self._accountKeys():
+            discovered = self.scan_account(account, publicKey, chainCode)
+            if not discovered.addresses:
+                break
+            accounts.append(discovered)
+        return accounts
+
+
+    def _accountKeys(self) -> Iterator[Tuple[int, bytes, bytes]]:
+        """Account extended public keys, retrieved by batches"""
+
+        account = 0
+        while True:
+            batch = [account_path(account + index) for index in range(self._accountBatchSize)]
+            for index, (_, publicKey, chainCode) in enumerate(self._getPubkeys(batch)):
+                yield account + index, publicKey, chainCode
+            account += self._accountBatchSize
+
+
+    def scan_account(self, account: int, publicKey: bytes, chainCode: bytes) -> DiscoveredAccount:
+        """Scan the external and internal chains of an account
+
+        Args:
+            account (int): The account index
+            publicKey (bytes): The account public key
+            chainCode (bytes): The account chain code
+
+        Returns:
+            The account, with its used addresses
+        """
+
+        accountNode = ExtendedPublicKey(publicKey, chainCode)
+        stakingKeyHash = _keyHash(derive_path(accountNode, (CHAIN_STAKING_KEY, STAKING_KEY_INDEX)))
+        discovered = DiscoveredAccount(account, publicKey, chainCode, stakingKeyHash)
+        for chain in (CHAIN_EXTERNAL, CHAIN_INTERNAL):
+            used = self._scanChain(account, accountNode, chain, stakingKeyHash)
+            if used:
+                discovered.addresses[chain] = used
+        return discovered
+
+
+    def _scanChain(self, account: int, accountNode: ExtendedPublicKey, chain: int,
+                   stakingKeyHash: bytes) -> List[DiscoveredAddress]:
+        """Scan the addresses of a chain, until the gap limit is reached"""
+
+        used: List[DiscoveredAddress] = []
+        start = 0
+        unused = 0
+        while unused < self._gapLimit:
+            # The keys are derived by ranges of the size of the remaining gap
+            stop = start + self._gapLimit - unused
+            for index, node in enumerate(derive_range(accountNode, (chain,), start, stop), start):
+                address = self.base_address(_keyHash(node), stakingKeyHash)
+                if self._isUsed(address):
+                    used.append(DiscoveredAddress(f"{account_path(account)}/{chain}/{index}", address))
+                    unused = 0
+                else:
+                    unused += 1
+            start = stop
+        return used
+
+
+    def base_address(self, paymentKeyHash: bytes, stakingKeyHash: bytes) -> bytes:
+        """Base address of a payment and a staking key
+
+        Args:
+            paymentKeyHash (bytes): The payment key hash
+            stakingKeyHash (bytes): The staking key hash
+
+        Returns:
+            The address bytes
+        """
+
+        return derive_address_bytes(DeriveAddressTestCase("", self._netDesc, AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+                                                          paymentKeyHash.hex(), stakingKeyHash.hex()))
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a bulk address codec, encoding addresses as displayed by the device:
+bech32 for the Shelley addresses (src/crypto/bech32.c) and base58 for the Byron ones
+(src/crypto/base58.c), the human readable part depending on the address header
+(humanReadableAddress in src/addressUtils/addressUtilsShelley.c).
+
+The bech32 strings are processed by batches of payloads of the same length, one column
+per byte or symbol position holding that byte or symbol for every string of the batch.
+Each 5-bit symbol only depends on 2 payload bytes at a fixed position, and the polymod
+being linear, each checksum symbol is the xor of a precomputed contribution of every
+payload byte. The columns are therefore converted with byte translation tables and
+combined as big integers, then interleaved into a single output buffer.
+"""
+
+from base64 import b32decode
+from collections import defaultdict
+from functools import lru_cache, reduce
+from operator import or_, xor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from application_client.app_def import AddressType
+
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_SEPARATOR = "1"
+BECH32_CHECKSUM_LEN = 6
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+TESTNET_NETWORK_ID = 0
+
+# Human readable parts, as chosen by the device (mainnet, testnet)
+HRP_ADDRESS = ("addr", "addr_test")
+HRP_REWARD = ("stake", "stake_test")
+
+# Generator of the bech32 polymod (bech32_polymod_step)
+_GENERATOR = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+
+# Translation between the 5-bit values and the bech32 characters, invalid characters giving 0xFF
+_INVALID_VALUE = 0xFF
+_TO_CHARS = bytes.maketrans(bytes(range(32)), BECH32_CHARSET.encode())
+_TO_VALUES = bytes(BECH32_CHARSET.find(chr(char)) & _INVALID_VALUE for char in range(256))
+
+# The standard base32 alphabet, of the same 5-bit values as the bech32 one
+_BASE32_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+_FROM_BECH32 = str.maketrans(BECH32_CHARSET, _BASE32_ALPHABET)
+_NOT_BASE32 = str.maketrans("", "", _BASE32_ALPHABET)
+# 5-bit value of each base32 character
+_BASE32_VALUES = bytes.maketrans(_BASE32_ALPHABET.encode(), bytes(range(32)))
+_BASE32_PADDING = {0: "", 2: "======", 4: "====", 5: "===", 7: "="}
+
+# Base58 digits are converted by groups fitting in a machine word
+_BASE58_GROUP = 10
+_BASE58_GROUP_BASE = 58 ** _BASE58_GROUP
+_BASE58_VALUES = {char: value for value, char in enumerate(BASE58_ALPHABET)}
+
+# A column of bytes, one per string of a batch
+Column = bytes
+
+
+def _polymodStep(chk: int) -> int:
+    """bech32_polymod_step"""
+
+    top = chk >> 25
+    chk = (chk & 0x1FFFFFF) << 5
+    for bit, generator in enumerate(_GENERATOR):
+        if (top >> bit) & 1:
+            chk ^= generator
+    return chk
+
+
+def _polymodTable() -> Tuple[int, ...]:
+    """Effect of the 10 top bits of the checksum over 2 polymod steps, the polymod being linear"""
+
+    return tuple(_polymodStep(_polymodStep(top << 20)) for top in range(1 << 10))
+
+
+_POLYMOD_TABLE = _polymodTable()
+
+
+def _polymod(chk: int, values: bytes) -> int:
+    """Consume 5-bit values into the checksum, 2 values per step"""
+
+    table = _POLYMOD_TABLE
+    last = len(values) & ~1
+    for index in range(0, last, 2):
+        chk = ((chk & 0xFFFFF) << 10) ^ table[chk >> 20] ^ (values[index] << 5) ^ values[index + 1]
+    if last != len(values):
+        chk = _polymodStep(chk) ^ values[last]
+    return chk
+
+
+@lru_cache(maxsize=None)
+def _hrpChecksum(hrp: str) -> int:
+    """Checksum state after the expanded human readable part"""
+
+    if len(hrp) == 0 or hrp != hrp.lower() or any(not 33 <= ord(char) <= 126 for char in hrp):
+        raise ValueError(f"Invalid human readable part: {hrp!r}")
+    expanded = bytes(ord(char) >> 5 for char in hrp) + b"\x00" + bytes(ord(char) & 0x1F for char in hrp)
+    return _polymod(1, expanded)
+
+
+def _nbSymbols(nbBytes: int) -> int:
+    """Number of 5-bit symbols of a payload, the last group being padded with zero bits"""
+
+    return (8 * nbBytes + 4) // 5
+
+
+@lru_cache(maxsize=None)
+def _shiftTable(shift: int, mask: int) -> bytes:
+    """Translation table of each byte shifted left (or right if negative) then masked"""
+
+    return bytes(((value << shift) if shift >= 0 else (value >> -shift)) & mask for value in range(256))
+
+
+@lru_cache(maxsize=None)
+def _checksumTables(nbBytes: int) -> Tuple[Tuple[bytes, ...], ...]:
+    """Contribution of each payload byte to each checksum symbol, by payload byte position"""
+
+    # contribution of each bit (msb first) of a symbol followed by the zero checksum symbols
+    bits = [1 << (4 - bit) for bit in range(5)]
+    for _ in range(BECH32_CHECKSUM_LEN):
+        bits = [_polymodStep(chk) for chk in bits]
+    symbolBits = []
+    for _ in range(_nbSymbols(nbBytes)):
+        symbolBits.append(bits)
+        bits = [_polymodStep(chk) for chk in bits]
+    symbolBits.reverse()
+
+    tables = []
+    for index in range(nbBytes):
+        # payload bit 8 * index + position is bit 7 - position of the byte value
+        bitContributions = [symbolBits[(8 * index + position) // 5][(8 * index + position) % 5]
+                            for position in reversed(range(8))]
+        contributions = [0] * 256
+        for value in range(1, 256):
+            lowBit = (value & -value).bit_length() - 1
+            contributions[value] = contributions[value & (value - 1)] ^ bitContributions[lowBit]
+        tables.append(tuple(bytes((chk >> (5 * (BECH32_CHECKSUM_LEN - 1 - symbol))) & 0x1F for chk in contributions)
+                            for symbol in range(BECH32_CHECKSUM_LEN)))
+    return tuple(tables)
+
+
+@lru_cache(maxsize=None)
+def _hrpConstant(hrp: str, nbBytes: int) -> int:
+    """Final checksum of a zero payload of the given length"""
+
+    return _polymod(_hrpChecksum(hrp), bytes(_nbSymbols(nbBytes) + BECH32_CHECKSUM_LEN)) ^ 1
+
+
+def _combine(operator: Callable[[int, int], int], columns: Iterable[Column], size: int) -> Column:
+    """Combine columns of the given size byte per byte, with a bitwise operator"""
+
+    return reduce(operator, (int.from_bytes(column, "big") for column in columns)).to_bytes(size, "big")
+
+
+def _symbolColumns(byteColumns: Sequence[Column], size: int) -> List[Column]:
+    """5-bit symbol columns of payload byte columns, the last symbol being padded with zero bits"""
+
+    nbBytes = len(byteColumns)
+    symbols = []
+    for symbol in range(_nbSymbols(nbBytes)):
+        # the byte at index contributes its bits shifted by 5 * symbol - 8 * index - 3
+        indexes = range(5 * symbol // 8, min((5 * symbol + 4) // 8 + 1, nbBytes))
+        symbols.append(_combine(or_, (byteColumns[index].translate(_shiftTable(5 * symbol - 8 * index - 3, 0x1F))
+                                      for index in indexes), size))
+    return symbols
+
+
+def _byteColumns(symbolColumns: Sequence[Column], nbBytes: int, size: int) -> List[Column]:
+    """Payload byte columns of 5-bit symbol columns, as the inverse of _symbolColumns"""
+
+    byteColumns = []
+    for index in range(nbBytes):
+        symbols = range(8 * index // 5, (8 * index + 7) // 5 + 1)
+        byteColumns.append(_combine(or_, (symbolColumns[symbol].translate(_shiftTable(8 * index + 3 - 5 * symbol, 0xFF))
+                                          for symbol in symbols), size))
+    return byteColumns
+
+
+def _checksumColumns(hrp: str, byteColumns: Sequence[Column], size: int) -> List[Column]:
+    """Checksum symbol columns of payload byte columns"""
+
+    nbBytes = len(byteColumns)
+    constant = _hrpConstant(hrp, nbBytes)
+    tables = _checksumTables(nbBytes)
+    checksum = []
+    for symbol in range(BECH32_CHECKSUM_LEN):
+        constantColumn = bytes([(constant >> (5 * (BECH32_CHECKSUM_LEN - 1 - symbol))) & 0x1F]) * size
+        checksum.append(_combine(xor, [constantColumn] + [column.translate(table[symbol])
+                                                          for column, table in zip(byteColumns, tables)], size))
+    return checksum
+
+
+def _encodeBech32Batch(hrp: str, payloads: Sequence[bytes]) -> List[str]:
+    """Encode payloads of the same length in bech32"""
+
+    size = len(payloads)
+    nbBytes = len(payloads[0])
+    joined = b"".join(payloads)
+    byteColumns = [joined[index::nbBytes] for index in range(nbBytes)]
+    columns = _symbolColumns(byteColumns, size) + _checksumColumns(hrp, byteColumns, size)
+
+    # one line per string, the prefix being already in place
+    prefix = (hrp + BECH32_SEPARATOR).encode()
+    stride = len(prefix) + len(columns) + 1
+    buffer = bytearray((prefix + bytes(len(columns)) + b"\n") * size)
+    for position, column in enumerate(columns):
+        buffer[len(prefix) + position::stride] = column.translate(_TO_CHARS)
+    return buffer.decode("ascii").split("\n")[:-1]
+
+
+def encode_bech32_many(hrp: str, payloads: Iterable[bytes]) -> List[str]:
+    """Encode payloads in bech32, as bech32_encode
+
+    Args:
+        hrp (str): The human readable part
+        payloads (Iterable[bytes]): The payloads
+
+    Returns:
+        The bech32 strings
+    """
+
+    _hrpChecksum(hrp)
+    batches: Dict[int, List[int]] = defaultdict(list)
+    payloads = list(payloads)
+    for index, payload in enumerate(payloads):
+        batches[len(payload)].append(index)
+
+    encoded = [""] * len(payloads)
+    for indexes in batches.values():
+        strings = _encodeBech32Batch(hrp, [payloads[index] for index in indexes])
+        for index, string in zip(indexes, strings):
+            encoded[index] = string
+    return encoded
+
+
+def decode_bech32(address: str) -> Tuple[str, bytes]:
+    """Decode a bech32 string, checking its checksum
+
+    Args:
+        address (str): The bech32 string
+
+    Returns:
+        The human readable part and the payload
+    """
+
+    hrp, separator, data = address.rpartition(BECH32_SEPARATOR)
+    if not separator or len(data) < BECH32_CHECKSUM_LEN or address != address.lower():
+        raise ValueError(f"Invalid bech32 string: {address}")
+    base32 = data.translate(_FROM_BECH32)
+    if base32.translate(_NOT_BASE32):
+        raise ValueError(f"Invalid bech32 character in: {address}")
+    values = base32.encode().translate(_BASE32_VALUES)
+    if _polymod(_hrpChecksum(hrp), values) != 1:
+        raise ValueError(f"Invalid bech32 checksum: {address}")
+
+    nbValues = len(values) - BECH32_CHECKSUM_LEN
+    padding = _BASE32_PADDING.get(nbValues % 8)
+    if padding is None:
+        raise ValueError(f"Invalid bech32 data length: {address}")
+    payload = b32decode(base32[:nbValues] + padding)
+    # the bits of the last group beyond the payload must be zero
+    extraBits = 5 * nbValues - 8 * len(payload)
+    if nbValues > 0 and values[nbValues - 1] & ((1 << extraBits) - 1) != 0:
+        raise ValueError(f"Invalid bech32 padding: {address}")
+    return hrp, payload
+
+
+def _isValidBech32Batch(joined: bytes, columns: Sequence[bytes], nbValues: int, nbBytes: int) -> bool:
+    """Whether the symbol columns of a batch hold a payload: length, case, characters and padding bits"""
+
+    if nbBytes == 0 or _nbSymbols(nbBytes) != nbValues or joined != joined.lower():
+        return False
+    if any(_INVALID_VALUE in column for column in columns):
+        return False
+    # the bits of the last symbol beyond the payload must be zero
+    extraBits = 5 * nbValues - 8 * nbBytes
+    return not columns[nbValues - 1].translate(_shiftTable(0, (1 << extraBits) - 1)).strip(b"\x00")
+
+
+def _decodeBech32Batch(hrp: str, addresses: Sequence[str]) -> Optional[List[bytes]]:
+    """Decode bech32 strings of the same human readable part and length
+
+    Returns:
+        The payloads, or None if any string is invalid
+    """
+
+    size = len(addresses)
+    offset = len(hrp) + len(BECH32_SEPARATOR)
+    stride = len(addresses[0])
+    nbValues = stride - offset - BECH32_CHECKSUM_LEN
+    nbBytes = 5 * nbValues // 8
+    # a non ascii character is replaced by an invalid one, keeping the strings aligned
+    joined = "".join(addresses).encode("ascii", "replace")
+    columns = [joined[position::stride].translate(_TO_VALUES) for position in range(offset, stride)]
+    if not _isValidBech32Batch(joined, columns, nbValues, nbBytes):
+        return None
+    byteColumns = _byteColumns(columns[:nbValues], nbBytes, size)
+    if _checksumColumns(hrp, byteColumns, size) != columns[nbValues:]:
+        return None
+
+    payloads = bytearray(nbBytes * size)
+    for index, column in enumerate(byteColumns):
+        payloads[index::nbBytes] = column
+    return [bytes(payloads[start:start + nbBytes]) for start in range(0, len(payloads), nbBytes)]
+
+
+def encode_base58_many(payloads: Iterable[bytes]) -> List[str]:
+    """Encode payloads in base58, as base58_encode
+
+    Args:
+        payloads (Iterable[bytes]): The payloads
+
+    Returns:
+        The base58 strings
+    """
+
+    encoded = []
+    for payload in payloads:
+        value = int.from_bytes(payload, "big")
+        digits: List[str] = []
+        while value > 0:
+            value, group = divmod(value, _BASE58_GROUP_BASE)
+            for _ in range(_BASE58_GROUP):
+                group, digit = divmod(group, 58)
+                digits.append(BASE58_ALPHABET[digit])
+        # the leading zero digits of the groups are not part of the value
+        while digits and digits[-1] == BASE58_ALPHABET[0]:
+            digits.pop()
+        leadingZeros = len(payload) - len(payload.lstrip(b"\x00"))
+        encoded.append(BASE58_ALPHABET[0] * leadingZeros + "".join(reversed(digits)))
+    return encoded
+
+
+def decode_base58(address: str) -> bytes:
+    """Decode a base58 string
+
+    Args:
+        address (str): The base58 string
+
+    Returns:
+        The payload
+    """
+
+    value = 0
+    for char in address:
+        if char not in _BASE58_VALUES:
+            raise ValueError(f"Invalid base58 character in: {address}")
+        value = value * 58 + _BASE58_VALUES[char]
+    leadingZeros = len(address) - len(address.lstrip(BASE58_ALPHABET[0]))
+    return bytes(leadingZeros) + value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def address_hrp(header: int) -> str:
+    """Human readable part of a Shelley address, as chosen by the device
+
+    Args:
+        header (int): The address header byte
+
+    Returns:
+        The human readable part
+    """
+
+    isTestnet = header & 0x0F == TESTNET_NETWORK_ID
+    if header >> 4 in (AddressType.REWARD_KEY, AddressType.REWARD_SCRIPT):
+        return HRP_REWARD[isTestnet]
+    return HRP_ADDRESS[isTestnet]
+
+
+def encode_addresses(addresses: Iterable[bytes]) -> List[str]:
+    """Encode addresses as displayed by the device, as humanReadableAddress
+
+    The addresses are grouped by human readable part and encoding,
+    then returned in their original order.
+
+    Args:
+        addresses (Iterable[bytes]): The raw addresses
+
+    Returns:
+        The human readable addresses
+    """
+
+    addresses = list(addresses)
+    groups: Dict[Optional[str], List[int]] = {}
+    for index, address in enumerate(addresses):
+        if not address:
+            raise ValueError(f"Empty address at index {index}")
+        key = None if address[0] >> 4 == AddressType.BYRON else address_hrp(address[0])
+        groups.setdefault(key, []).append(index)
+
+    encoded = [""] * len(addresses)
+    for hrp, indexes in groups.items():
+        payloads = [addresses[index] for index in indexes]
+        strings = encode_base58_many(payloads) if hrp is None else encode_bech32_many(hrp, payloads)
+        for index, string in zip(indexes, strings):
+            encoded[index] = string
+    return encoded
+
+
+def decode_many(addresses: Iterable[str]) -> List[bytes]:
+    """Decode human readable addresses to raw addresses
+
+    Shelley addresses are recognized by their human readable part, the others are decoded as base58.
+    The Shelley addresses are decoded by batches of the same human readable part and length,
+    a batch containing an invalid address being decoded again one address at a time to report it.
+
+    Args:
+        addresses (Iterable[str]): The human readable addresses
+
+    Returns:
+        The raw addresses
+    """
+
+    addresses = list(addresses)
+    batches: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+    decoded = [b""] * len(addresses)
+    for index, address in enumerate(addresses):
+        hrp = address.rpartition(BECH32_SEPARATOR)[0]
+        if hrp in HRP_ADDRESS + HRP_REWARD:
+            batches[(hrp, len(address))].append(index)
+        else:
+            decoded[index] = decode_base58(address)
+
+    for (hrp, _), indexes in batches.items():
+        batch = [addresses[index] for index in indexes]
+        payloads = _decodeBech32Batch(hrp, batch)
+        if payloads is None:
+            payloads = [decode_bech32(address)[1] for address in batch]
+        for index, payload in zip(indexes, payloads):
+            decoded[index] = payload
+    return decoded
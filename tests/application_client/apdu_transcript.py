@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains the recording of the APDU exchanges into a transcript, and their replay.
+
+The transcript is an append-only binary log, each session being started by a header:
+    Session: 'S' (1B), wall clock time in ns (8B)
+    Exchange: 'E' or 'A' for an asynchronous one (1B),
+              sent and received times in ns since the session start (8B each),
+              command size (2B), status word (2B), response data size (2B),
+              command, response data
+The numbers are big endian. A record interrupted by the end of the file is ignored when read,
+and dropped before a new session is appended, so a transcript remains readable whatever
+the moment its recording stopped.
+
+The replay pushes the commands into a backend back to back and diffs the responses,
+the asynchronous exchanges (waiting for a user approval when recorded) included:
+the backend is expected to approve them by itself, unless a navigation is given.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+import os
+import struct
+import time
+
+from ragger.backend.interface import BackendInterface
+from ragger.error import ExceptionRAPDU
+
+
+KIND_SESSION = ord("S")
+KIND_EXCHANGE = ord("E")
+KIND_EXCHANGE_ASYNC = ord("A")
+
+_SESSION = struct.Struct(">BQ")
+_EXCHANGE = struct.Struct(">BQQHHH")
+
+# Position of the INS in a command APDU
+APDU_INS_OFFSET = 1
+
+# Navigation of an asynchronous exchange during its replay, given the recorded exchange
+ReplayNavigation = Callable[["TranscriptExchange"], None]
+
+
+class TranscriptExchange(NamedTuple):
+    """Exchange of a transcript"""
+    session: int
+    interactive: bool
+    sentNs: int
+    receivedNs: int
+    command: bytes
+    status: int
+    data: bytes
+
+
+class TranscriptRecorder:
+    """Recorder of APDU exchanges, appended to a transcript file
+
+    The records are buffered: the recorder has to be closed (or flushed)
+    for them to reach the file, using it as a context manager closing it:
+        with TranscriptRecorder(path) as recorder:
+            recorder.record(...)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        # drop the record interrupted at the end of a previous recording, if any
+        content = Path(path).read_bytes() if os.path.exists(path) else b""
+        complete = 0
+        for _, _, complete in _iter_records(memoryview(content)):
+            pass
+        # the file lives as long as the recorder, closed by close() or the context manager exit
+        self._file: BinaryIO = open(path, "ab")  # pylint: disable=consider-using-with
+        if complete < len(content):
+            self._file.truncate(complete)
+        self._startNs = time.monotonic_ns()
+        self._file.write(_SESSION.pack(KIND_SESSION, time.time_ns()))
+
+
+    def record(self,
+               command: bytes,
+               status: int,
+               data: bytes,
+               sentNs: int,
+               receivedNs: int,
+               interactive: bool = False) -> None:
+        """Append an exchange
+
+        Args:
+            command (bytes): The command APDU
+            status (int): The response status word
+            data (bytes): The response data
+            sentNs (int): The time.monotonic_ns() of the command
+            receivedNs (int): The time.monotonic_ns() of the response
+            interactive (bool): Whether the exchange was asynchronous, waiting for a user interaction
+        """
+
+        kind = KIND_EXCHANGE_ASYNC if interactive else KIND_EXCHANGE
+        self._file.write(_EXCHANGE.pack(kind, sentNs - self._startNs, receivedNs - self._startNs,
+                                        len(command), status, len(data)))
+        self._file.write(command)
+        self._file.write(data)
+
+
+    def flush(self) -> None:
+        self._file.flush()
+
+
+    def close(self) -> None:
+        self._file.close()
+
+
+    def __enter__(self) -> "TranscriptRecorder":
+        return self
+
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def read_transcript(path: Union[str, os.PathLike]) -> List[TranscriptExchange]:
+    """Read the exchanges of a transcript
+
+    Args:
+        path (PathLike): The transcript file
+
+    Returns:
+        The exchanges of all the sessions, in order
+    """
+
+    return list(iter_transcript(Path(path).read_bytes()))
+
+
+def iter_transcript(buffer: bytes) -> Iterator[TranscriptExchange]:
+    """Parse the exchanges of a transcript
+
+    Args:
+        buffer (bytes): The transcript content
+
+    Returns:
+        Iterator on the exchanges
+    """
+
+    view = memoryview(buffer)
+    session = -1
+    for kind, offset, end in _iter_records(view):
+        if kind == KIND_SESSION:
+            session += 1
+            continue
+        _, sentNs, receivedNs, commandSize, status, _ = _EXCHANGE.unpack_from(view, offset)
+        start = offset + _EXCHANGE.size
+        yield TranscriptExchange(session, kind == KIND_EXCHANGE_ASYNC, sentNs, receivedNs,
+                                 bytes(view[start:start + commandSize]), status,
+                                 bytes(view[start + commandSize:end]))
+
+
+def _iter_records(view: memoryview) -> Iterator[Tuple[int, int, int]]:
+    """Locate the complete records of a transcript, ignoring an interrupted last one
+
+    Args:
+        view (memoryview): The transcript content
+
+    Returns:
+        Iterator on the kind, start and end offsets of the records
+    """
+
+    offset = 0
+    while offset < len(view):
+        kind = view[offset]
+        if kind == KIND_SESSION:
+            end = offset + _SESSION.size
+        elif kind in (KIND_EXCHANGE, KIND_EXCHANGE_ASYNC):
+            if offset + _EXCHANGE.size > len(view):
+                return
+            _, _, _, commandSize, _, dataSize = _EXCHANGE.unpack_from(view, offset)
+            end = offset + _EXCHANGE.size + commandSize + dataSize
+        else:
+            raise ValueError(f"Invalid transcript record {kind:#04x} at offset {offset}")
+        if end > len(view):
+            return
+        yield kind, offset, end
+        offset = end
+
+
+@dataclass
+class ReplayMismatch:
+    """Response differing from the recorded one"""
+    index: int
+    exchange: TranscriptExchange
+    status: int
+    data: bytes
+
+
+@dataclass
+class InsLatency:
+    """Latencies of the exchanges of an instruction"""
+    exchanges: int = 0
+    recordedNs: int = 0
+    replayedNs: int = 0
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of a transcript replay"""
+    exchanges: int = 0
+    mismatches: List[ReplayMismatch] = field(default_factory=list)
+    durationNs: int = 0
+    # Latencies of the exchanges answered without user interaction, by INS
+    latencies: Dict[int, InsLatency] = field(default_factory=dict)
+
+
+def replay_transcript(backend: BackendInterface,
+                      exchanges: List[TranscriptExchange],
+                      navigate: Optional[ReplayNavigation] = None,
+                      stopOnMismatch: bool = False) -> ReplayResult:
+    """Push the commands of a transcript into a backend, diffing the responses
+
+    Args:
+        backend (BackendInterface): The backend
+        exchanges (List[TranscriptExchange]): The recorded exchanges
+        navigate (Optional[ReplayNavigation]): Navigation of the asynchronous exchanges;
+            when not given, they are replayed as synchronous ones
+        stopOnMismatch (bool): Whether to stop at the first mismatch
+
+    Returns:
+        The replay outcome
+    """
+
+    result = ReplayResult()
+    latencies = result.latencies
+    exchangeRaw = backend.exchange_raw
+    start = time.monotonic_ns()
+    for index, exchange in enumerate(exchanges):
+        sentNs = time.monotonic_ns()
+        try:
+            if exchange.interactive and navigate is not None:
+                with backend.exchange_async_raw(exchange.command):
+                    navigate(exchange)
+                rapdu = backend.last_async_response
+                assert rapdu is not None
+            else:
+                rapdu = exchangeRaw(exchange.command)
+            status, data = rapdu.status, rapdu.data
+        except ExceptionRAPDU as error:
+            status, data = error.status, error.data
+        receivedNs = time.monotonic_ns()
+
+        result.exchanges += 1
+        if not exchange.interactive:
+            latency = latencies.setdefault(exchange.command[APDU_INS_OFFSET], InsLatency())
+            latency.exchanges += 1
+            latency.recordedNs += exchange.receivedNs - exchange.sentNs
+            latency.replayedNs += receivedNs - sentNs
+        if status != exchange.status or data != exchange.data:
+            result.mismatches.append(ReplayMismatch(index, exchange, status, data))
+            if stopOnMismatch:
+                break
+    result.durationNs = time.monotonic_ns() - start
+    return result
@@ -0,0 +1,1012 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains the asyncio command sending part, talking directly to the Speculos APDU port.
+"""
+
+import asyncio
+from itertools import islice
+from types import TracebackType
+from typing import Iterable, List, Optional, Tuple, Type
+import hashlib
+
+from ragger.backend.interface import RAPDU
+
+from input_files.derive_address import DeriveAddressTestCase
+from input_files.cvote import CVoteTestCase
+from input_files.signOpCert import OpCertTestCase
+from input_files.signMsg import SignMsgTestCase, open_message, iter_message_chunks
+from input_files.signTx import SignTxTestCase, TxInput, TxOutput, TxAuxiliaryData, TxAuxiliaryDataCIP36, CIP36VoteDelegation
+from input_files.signTx import Withdrawal, Certificate, VoterVotes, AssetGroup, Token, RequiredSigner, Datum
+from input_files.signTx import PoolRegistrationParams, PoolKey, Relay, PoolMetadataParams
+from input_files.derive_native_script import NativeScript, NativeScriptHashDisplayFormat
+
+from application_client.command_builder import CommandBuilder, P1Type, P2Type
+from application_client.app_def import Errors
+from application_client.command_sender import SignMsgStream, CIP8_MSG_HASH_LENGTH, unpack_pubkeys
+
+
+# Speculos APDU port framing:
+#   - Command: APDU length (4B, big endian) + APDU
+#   - Response: Response data length, without the status word (4B, big endian) + data + status word (2B)
+SPECULOS_APDU_PORT = 9999
+
+
+class AsyncCommandSender:
+    """Class to send APDU to a Speculos instance, using asyncio
+
+    Unlike CommandSender, the methods of this class do not hide the user interaction:
+    each one returns once the device has answered, any navigation being performed
+    concurrently (for instance through the Speculos REST API).
+    The response status is not checked, the caller has to do it.
+    A cancelled exchange closes the connection, its response being lost.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = SPECULOS_APDU_PORT) -> None:
+        """Class initializer
+
+        Args:
+            host (str): Speculos host
+            port (int): Speculos APDU port
+        """
+
+        self._host = host
+        self._port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        # Only one APDU can be processed at a time by the device
+        self._lock = asyncio.Lock()
+        self._cmd_builder = CommandBuilder()
+
+
+    async def connect(self) -> None:
+        """Open the connection to the Speculos APDU port"""
+
+        self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+
+
+    async def close(self) -> None:
+        """Close the connection to the Speculos APDU port"""
+
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+        self._reader = None
+        self._writer = None
+
+
+    async def __aenter__(self) -> "AsyncCommandSender":
+        await self.connect()
+        return self
+
+
+    async def __aexit__(self,
+                        excType: Optional[Type[BaseException]],
+                        exc: Optional[BaseException],
+                        tb: Optional[TracebackType]) -> None:
+        await self.close()
+
+
+    async def _exchange(self, payload: bytes) -> RAPDU:
+        """APDU exchange with response
+
+        Args:
+            payload (bytes): APDU data to send
+
+        Returns:
+            Response APDU
+        """
+
+        async with self._lock:
+            if self._reader is None or self._writer is None:
+                raise ConnectionError("Not connected to Speculos, call connect() first")
+            try:
+                self._writer.write(len(payload).to_bytes(4, "big") + payload)
+                await self._writer.drain()
+                size = int.from_bytes(await self._reader.readexactly(4), "big")
+                response = await self._reader.readexactly(size + 2)
+            except asyncio.CancelledError:
+                # The response may be partly read, or still to come: the framing of the next
+                # exchanges can't be trusted anymore, so the connection is closed
+                self._writer.close()
+                self._reader = None
+                self._writer = None
+                raise
+        return RAPDU(int.from_bytes(response[-2:], "big"), response[:-2])
+
+
+    async def exchange_many(self, apdus: Iterable[bytes]) -> List[RAPDU]:
+        """Exchange of a sequence of prebuilt APDUs
+
+        The APDUs are sent back to back, stopping at the first response
+        with a status different from SW_SUCCESS.
+        Only suitable for APDUs not requiring any user interaction.
+
+        Args:
+            apdus (Iterable[bytes]): APDUs to send, in order
+
+        Returns:
+            Response APDUs, the last one being the failing one if any
+        """
+
+        rapdus: List[RAPDU] = []
+        for apdu in apdus:
+            rapdu = await self._exchange(apdu)
+            rapdus.append(rapdu)
+            if rapdu.status != Errors.SW_SUCCESS:
+                break
+        return rapdus
+
+
+    async def exchange_raw(self, apdu: bytes) -> RAPDU:
+        """Exchange of a prebuilt APDU
+
+        Args:
+            apdu (bytes): APDU to send
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(apdu)
+
+
+    def exchange_async_raw(self, apdu: bytes) -> "asyncio.Task[RAPDU]":
+        """Start the exchange of a prebuilt APDU, in the running event loop
+
+        The task is to be awaited once the user interaction is done,
+        as the response of CommandSender.exchange_async_raw is retrieved.
+
+        Args:
+            apdu (bytes): APDU to send
+
+        Returns:
+            The exchange task, resulting in the response APDU
+        """
+
+        return asyncio.ensure_future(self._exchange(apdu))
+
+
+    async def send_raw(self, cla: int, ins: int, p1: int, p2: int, payload: bytes) -> RAPDU:
+        """Exchange of an APDU built from its fields
+
+        Args:
+            cla (int): The APDU class
+            ins (int): The APDU instruction
+            p1 (int): The APDU P1 parameter
+            p2 (int): The APDU P2 parameter
+            payload (bytes): The APDU data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(bytes([cla, ins, p1, p2, len(payload)]) + payload)
+
+
+    async def get_version(self) -> bytes:
+        """APDU Get Version
+
+        Returns:
+            Version data
+        """
+
+        rapdu = await self._exchange(self._cmd_builder.get_version())
+        assert rapdu.status == Errors.SW_SUCCESS
+        return rapdu.data
+
+
+    async def get_serial(self) -> bytes:
+        """APDU Get Serial
+
+        Returns:
+            Serial data
+        """
+
+        rapdu = await self._exchange(self._cmd_builder.get_serial())
+        assert rapdu.status == Errors.SW_SUCCESS
+        return rapdu.data
+
+
+    async def derive_address(self, p1: P1Type, testCase: DeriveAddressTestCase) -> RAPDU:
+        """APDU Derive Address
+
+        Args:
+            p1 (P1Type): APDU Parameter 1
+            testCase (DeriveAddressTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.derive_address(p1, testCase))
+
+
+    async def get_pubkey(self, p1: P1Type, path: str, remainingKeysData: int = 0) -> RAPDU:
+        """APDU Get Public Key
+
+        Args:
+            p1 (P1Type): APDU Parameter 1
+            path (str): Test parameters
+            remainingKeysData (int): Nb of remaining paths
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.get_pubkey(p1, path, remainingKeysData))
+
+
+    async def get_pubkeys(self, paths: List[str]) -> List[Tuple[str, bytes, bytes]]:
+        """APDU Get Public Keys, as a single multiple keys session
+
+        The APDUs are all built before the session is started (see CommandBuilder.get_pubkeys),
+        then sent back to back: a session requiring a confirmation has to be navigated concurrently.
+
+        Args:
+            paths (List[str]): Derivation paths of the keys
+
+        Returns:
+            The path, public key and chain code of each key
+        """
+
+        return unpack_pubkeys(paths, await self.exchange_many(self._cmd_builder.get_pubkeys(paths)))
+
+
+    async def sign_cip36_init(self, testCase: CVoteTestCase) -> RAPDU:
+        """APDU CIP36 Vote - INIT step
+
+        Args:
+            testCase (CVoteTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_cip36_init(testCase))
+
+
+    async def sign_cip36_chunk(self, testCase: CVoteTestCase) -> Optional[RAPDU]:
+        """APDU CIP36 Vote - CHUNK step
+
+        Args:
+            testCase (CVoteTestCase): Test parameters
+
+        Returns:
+            Response APDU of the last chunk, None if the data fits in the INIT step
+        """
+
+        resp = None
+        for chunk in islice(self._cmd_builder.iter_sign_cip36(testCase), 1, None):
+            if resp is not None:
+                assert resp.status == Errors.SW_SUCCESS
+            resp = await self._exchange(chunk)
+        return resp
+
+
+    async def sign_cip36_confirm(self) -> RAPDU:
+        """APDU CIP36 Vote - CONFIRM step
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_cip36_confirm())
+
+
+    async def sign_cip36_witness(self, testCase: CVoteTestCase) -> RAPDU:
+        """APDU CIP36 Vote - WITNESS step
+
+        Args:
+            testCase (CVoteTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_cip36_witness(testCase))
+
+
+    async def sign_opCert(self, testCase: OpCertTestCase) -> RAPDU:
+        """APDU Sign Operational Certificate
+
+        Args:
+            testCase (OpCertTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_opCert(testCase))
+
+
+    async def sign_msg_init(self, testCase: SignMsgTestCase) -> RAPDU:
+        """APDU Sign Message - INIT step
+
+        Args:
+            testCase (SignMsgTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_msg_init(testCase))
+
+
+    async def sign_msg_chunk(self, testCase: SignMsgTestCase) -> Tuple[RAPDU, SignMsgStream]:
+        """APDU Sign Message - CHUNK step
+
+        The chunks are streamed from the message source, in constant memory,
+        the message hash being computed in the same pass, as by CommandSender.sign_msg_chunk.
+
+        Args:
+            testCase (SignMsgTestCase): Test parameters
+
+        Returns:
+            Tuple of:
+                - Response APDU of the first (displayed) chunk
+                - The CHUNK step outcome, the hash being only set once all the chunks are sent
+        """
+
+        msgData = testCase.msgData
+        stream = SignMsgStream()
+        msgHash = hashlib.blake2b(digest_size=CIP8_MSG_HASH_LENGTH) if msgData.hashPayload else None
+        with open_message(msgData) as message:
+            chunks = iter_message_chunks(message, msgData.isAscii)
+            firstChunk = next(chunks, None)
+            if firstChunk is None:
+                raise ValueError("A message has at least one chunk")
+            with firstChunk as chunk:
+                if msgHash is not None:
+                    msgHash.update(chunk)
+                apdu = self._cmd_builder.sign_msg_chunk_apdu(chunk)
+            rapdu = await self._exchange(apdu)
+            if rapdu.status != Errors.SW_SUCCESS:
+                return rapdu, stream
+            stream.numChunks = 1
+            for chunk in chunks:
+                with chunk:
+                    if msgHash is not None:
+                        msgHash.update(chunk)
+                    apdu = self._cmd_builder.sign_msg_chunk_apdu(chunk)
+                resp = await self._exchange(apdu)
+                assert resp.status == Errors.SW_SUCCESS
+                stream.numChunks += 1
+        if msgHash is not None:
+            stream.msgHash = msgHash.digest()
+        return rapdu, stream
+
+
+    async def sign_msg_confirm(self) -> RAPDU:
+        """APDU Sign Message - CONFIRM step
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_msg_confirm())
+
+
+    async def sign_tx_init(self, testCase: SignTxTestCase, nbWitnessPaths: int) -> RAPDU:
+        """APDU Sign TX - INIT step
+
+        Args:
+            testCase (SignTxTestCase): Test parameters
+            nbWitnessPaths (int): The number of unique witness paths
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_init(testCase, nbWitnessPaths))
+
+
+    async def sign_tx_aux_data_serialize(self, auxData: TxAuxiliaryData) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - SERIALIZE mode
+
+        Args:
+            auxData (TxAuxiliaryData): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_serialize(auxData))
+
+
+    async def sign_tx_aux_data_init(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - INIT mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_init(auxData))
+
+
+    async def sign_tx_aux_data_vote_key(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - VOTE KEY mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_vote_key(auxData))
+
+
+    async def sign_tx_aux_data_delegation(self, delegation: CIP36VoteDelegation) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - DELEGATION mode
+
+        Args:
+            delegation (CIP36VoteDelegation): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_delegation(delegation))
+
+
+    async def sign_tx_aux_data_staking(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - STAKING mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_staking(auxData))
+
+
+    async def sign_tx_aux_data_payment(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - PAYMENT mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_payment(auxData))
+
+
+    async def sign_tx_aux_data_nonce(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - NONCE mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_nonce(auxData))
+
+
+    async def sign_tx_aux_data_voting_purpose(self, auxData: TxAuxiliaryDataCIP36) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - VOTING PURPOSE mode
+
+        Args:
+            auxData (TxAuxiliaryDataCIP36): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_voting_purpose(auxData))
+
+
+    async def sign_tx_aux_data_confirm(self) -> RAPDU:
+        """APDU Sign TX - AUX_DATA step - CONFIRM mode
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_aux_data_confirm())
+
+
+    async def sign_tx_inputs(self, txInput: TxInput) -> RAPDU:
+        """APDU Sign TX - INPUTS step
+
+        Args:
+            txInput (TxInput): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_inputs(txInput))
+
+
+    async def sign_tx_outputs_basic(self, txOutput: TxOutput) -> RAPDU:
+        """APDU Sign TX - OUTPUTS step - BASIC DATA level
+
+        Args:
+            txOutput (TxOutput): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_outputs_basic(txOutput))
+
+
+    async def sign_tx_outputs_datum(self, datum: Datum) -> RAPDU:
+        """APDU Sign TX - OUTPUTS step - DATUM level
+
+        Args:
+            datum (Datum): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_outputs_datum(datum))
+
+
+    async def sign_tx_outputs_ref_script(self, referenceScriptHex: str) -> RAPDU:
+        """APDU Sign TX - OUTPUTS step - REFERENCE SCRIPT level
+
+        Args:
+            referenceScriptHex (str): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_outputs_ref_script(referenceScriptHex))
+
+
+    async def sign_tx_outputs_chunk(self, p2: P2Type, chunkHex: str) -> RAPDU:
+        """APDU Sign TX - OUTPUTS step - xxx CHUNKS level
+
+        Args:
+            p2 (P2Type): APDU Parameter 2
+            chunkHex (str): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_outputs_chunk(p2, chunkHex))
+
+
+    async def sign_tx_outputs_confirm(self) -> RAPDU:
+        """APDU Sign TX - OUTPUTS step -CONFIRM level
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_outputs_confirm())
+
+
+    async def sign_tx_fee(self, testCase: SignTxTestCase) -> RAPDU:
+        """APDU Sign TX - FEE step
+
+        Args:
+            testCase (SignTxTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_fee(testCase))
+
+
+    async def sign_tx_ttl(self, testCase: SignTxTestCase) -> RAPDU:
+        """APDU Sign TX - TTL step
+
+        Args:
+            testCase (SignTxTestCase): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_ttl(testCase))
+
+
+    async def sign_tx_withdrawal(self, withdrawal: Withdrawal) -> RAPDU:
+        """APDU Sign TX - WITNESS step
+
+        Args:
+            withdrawal (Withdrawal): Input Test path
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_withdrawal(withdrawal))
+
+
+    async def sign_tx_validity(self, validity: int) -> RAPDU:
+        """APDU Sign TX - VALIDITY START step
+
+        Args:
+            validity (int): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_validity(validity))
+
+
+    async def sign_tx_script_data_hash(self, script: str) -> RAPDU:
+        """APDU Sign TX - SCRIPT DATA HASH step
+
+        Args:
+            script (str): Input Test script data hash
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_script_data_hash(script))
+
+
+    async def sign_tx_mint_init(self, nbMints: int) -> RAPDU:
+        """APDU Sign TX - MINT step - INIT mode
+
+        Args:
+            nbMints (int): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_mint_init(nbMints))
+
+
+    async def sign_tx_mint_confirm(self,) -> RAPDU:
+        """APDU Sign TX - MINT step - CONFIRM mode
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_mint_confirm())
+
+
+    async def sign_tx_asset_group(self, p1: P1Type, asset: AssetGroup) -> RAPDU:
+        """APDU Sign TX - TOKEN BUNDLE step - ASSET mode
+
+        Args:
+            p1 (P1Type): APDU Parameter 1
+            token (AssetGroup): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_asset_group(p1, asset))
+
+
+    async def sign_tx_token(self, p1: P1Type, token: Token) -> RAPDU:
+        """APDU Sign TX - TOKEN BUNDLE step - TOKEN mode
+
+        Args:
+            p1 (P1Type): APDU Parameter 1
+            asset (AssetGroup): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_token(p1, token))
+
+
+    async def sign_tx_voting_procedure(self, votingProcedure: VoterVotes) -> RAPDU:
+        """APDU Sign TX - VOTING PROCEDURES step
+
+        Args:
+            votingProcedure (VoterVotes): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_voting_procedure(votingProcedure))
+
+
+    async def sign_tx_treasury(self, treasury: int) -> RAPDU:
+        """APDU Sign TX - TREASURY step
+
+        Args:
+            treasury (int): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_treasury(treasury))
+
+
+    async def sign_tx_donation(self, donation: int) -> RAPDU:
+        """APDU Sign TX - DONATION step
+
+        Args:
+            donation (int): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_donation(donation))
+
+
+    async def sign_tx_collateral_inputs(self, txInput: TxInput) -> RAPDU:
+        """APDU Sign TX - COLLATERAL INPUTS step
+
+        Args:
+            txInput (TxInput): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_collateral_inputs(txInput))
+
+
+    async def sign_tx_collateral_output_basic(self, txOutput: TxOutput) -> RAPDU:
+        """APDU Sign TX - COLLATERAL OUTPUTS step - BASIC DATA level
+
+        Args:
+            txOutput (TxOutput): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_collateral_output_basic(txOutput))
+
+
+    async def sign_tx_collateral_output_confirm(self) -> RAPDU:
+        """APDU Sign TX - COLLATERAL OUTPUTS step - CONFIRM level
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_collateral_output_confirm())
+
+
+    async def sign_tx_total_collateral(self, total: int) -> RAPDU:
+        """APDU Sign TX - TOTAL COLLATERAL step
+
+        Args:
+            total (int): Test parameters
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_total_collateral(total))
+
+
+    async def sign_tx_reference_inputs(self, txInput: TxInput) -> RAPDU:
+        """APDU Sign TX - REFERENCE INPUTS step
+
+        Args:
+            txInput (TxInput): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_reference_inputs(txInput))
+
+
+    async def sign_tx_required_signers(self, signer: RequiredSigner) -> RAPDU:
+        """APDU Sign TX - REQUIRED SIGNERS step
+
+        Args:
+            signer (RequiredSigner): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_required_signers(signer))
+
+
+    async def sign_tx_certificate(self, certificate: Certificate) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step
+
+        Args:
+            withdrawal (Withdrawal): Input Test path
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_certificate(certificate))
+
+
+    async def sign_tx_cert_pool_reg_init(self, pool: PoolRegistrationParams) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - POOL INITIAL PARAMS level
+
+        Args:
+            pool (PoolRegistrationParams): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_init(pool))
+
+
+    async def sign_tx_cert_pool_reg_pool_key(self, pool: PoolKey) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - POOL KEY level
+
+        Args:
+            pool (PoolKey): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_pool_key(pool))
+
+
+    async def sign_tx_cert_pool_reg_vrf(self, pool: str) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - VRF level
+
+        Args:
+            pool (str): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_vrf(pool))
+
+
+    async def sign_tx_cert_pool_reg_financials(self, pool: PoolRegistrationParams) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - FINANCIALS level
+
+        Args:
+            pool (PoolRegistrationParams): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_financials(pool))
+
+
+    async def sign_tx_cert_pool_reg_reward(self, pool: PoolKey) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - REWARD ACCOUNT level
+
+        Args:
+            pool (PoolKey): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_reward(pool))
+
+
+    async def sign_tx_cert_pool_reg_owner(self, pool: PoolKey) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - POOL OWNER level
+
+        Args:
+            pool (PoolKey): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_owner(pool))
+
+
+    async def sign_tx_cert_pool_reg_relay(self, pool: Relay) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - POOL RELAY level
+
+        Args:
+            pool (Relay): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_relay(pool))
+
+
+    async def sign_tx_cert_pool_reg_metadata(self, pool: Optional[PoolMetadataParams]) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - POOL METADATA level
+
+        Args:
+            pool (Optional[PoolMetadataParams]): Input Test data
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_metadata(pool))
+
+
+    async def sign_tx_cert_pool_reg_confirm(self) -> RAPDU:
+        """APDU Sign TX - CERTIFICATE step - CONFIRM level
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_cert_pool_reg_confirm())
+
+
+    async def sign_tx_confirm(self) -> RAPDU:
+        """APDU Sign TX - CONFIRM step
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_confirm())
+
+
+    async def sign_tx_witness(self, path: str) -> RAPDU:
+        """APDU Sign TX - WITNESS step
+
+        Args:
+            path (str): Input Test path
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.sign_tx_witness(path))
+
+
+    async def derive_script_add_simple(self, script: NativeScript) -> RAPDU:
+        """APDU NATIVE SCRIPT HASH - SIMPLE SCRIPT step
+
+        Args:
+            script (NativeScript): Input Test param
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.derive_script_add_simple(script))
+
+
+    async def derive_script_add_complex(self, script: NativeScript) -> RAPDU:
+        """APDU NATIVE SCRIPT HASH - COMPLEX SCRIPT step
+
+        Args:
+            script (NativeScript): Input Test param
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.derive_script_add_complex(script))
+
+
+    async def derive_script_finish(self, displayFormat: NativeScriptHashDisplayFormat) -> RAPDU:
+        """APDU NATIVE SCRIPT HASH - FINISH step
+
+        Args:
+            displayFormat (NativeScriptHashDisplayFormat): Input Test param
+
+        Returns:
+            Response APDU
+        """
+
+        return await self._exchange(self._cmd_builder.derive_script_finish(displayFormat))
@@ -6,15 +6,19 @@ This module provides Ragger tests Client application.
 It contains the command building part.
 """
 
+from dataclasses import dataclass
 from enum import IntEnum
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterator, List, Optional, Tuple, Union
+import struct
 
 from ragger.bip import pack_derivation_path
 
 from input_files.derive_address import DeriveAddressTestCase
-from input_files.cvote import MAX_CIP36_PAYLOAD_SIZE, CVoteTestCase
+from input_files.cvote import CVoteTestCase
 from input_files.signOpCert import OpCertTestCase
-from input_files.signMsg import SignMsgTestCase, MessageAddressFieldType
+from input_files.signMsg import SignMsgTestCase, MessageAddressFieldType, message_size, open_message, iter_message_chunks
 from input_files.signTx import SignTxTestCase, TxInput, TxOutput, Certificate, Withdrawal
 from input_files.signTx import TxAuxiliaryData, TxAuxiliaryDataHash, DRepParams
 from input_files.signTx import TxOutputDestinationType, TxOutputDestination
@@ -33,6 +37,7 @@ from input_files.derive_native_script import NativeScriptParamsPubkey, NativeScr
 from input_files.derive_native_script import NativeScriptParamsScripts, NativeScriptParamsNofK
 
 from application_client.app_def import InsType, AddressType, StakingDataSourceType
+from application_client.votecast_hash_builder import VotecastHashBuilder, iter_votecast_chunks
 
 
 class P1Type(IntEnum):
@@ -106,22 +111,244 @@ class P2Type(IntEnum):
     P2_CERT_CONFIRM = 0x38
 
 
+@dataclass(frozen=True)
+class SignTxApdu:
+    """Sign TX APDU, as produced by CommandBuilder.iter_sign_tx"""
+    apdu: bytes
+    # True when the device may wait for a user interaction before answering
+    interactive: bool
+
+
+APDU_HEADER_SIZE = 5
+MAX_APDU_DATA_SIZE = 255
+
+_U8 = struct.Struct(">B")
+_U32 = struct.Struct(">I")
+_U64 = struct.Struct(">Q")
+# Coin (8B), TokenBundle Length (4B), datum option flag (1B), referenceScriptHex option flag (1B)
+_OUTPUT_BASIC_TAIL = struct.Struct(">QIBB")
+# Format (1B), Destination type (1B), Address Length (4B): third party output head, packed with the APDU header
+_APDU_OUTPUT_THIRD_PARTY_HEAD = struct.Struct(">5BBBI")
+# kesPublicKey (32B), kesPeriod (8B), issueCounter (8B)
+_OP_CERT_HEAD = struct.Struct(">32sQQ")
+
+# Fixed-layout APDUs, packed at once with their header (CLA, INS, P1, P2, Lc)
+_APDU_U32 = struct.Struct(">5BI")
+_APDU_U64 = struct.Struct(">5BQ")
+# Tx Hash (32B), Tx Output Index (4B)
+_APDU_TX_INPUT = struct.Struct(">5B32sI")
+# Policy Id (28B), Nb of tokens (4B)
+_APDU_ASSET_GROUP = struct.Struct(">5B28sI")
+# Pledge (8B), Cost (8B), Margin numerator (8B), Margin denominator (8B)
+_APDU_POOL_FINANCIALS = struct.Struct(">5B4Q")
+# Options (8B), Network Id (1B), Protocol Magic (4B), 10 option flags (1B), Signing mode (1B), 9 counters (4B)
+_APDU_TX_INIT = struct.Struct(">5BQBI10BB9I")
+
+TX_HASH_SIZE = 32
+POLICY_ID_SIZE = 28
+KES_PUBLIC_KEY_SIZE = 32
+
+
+def _optionFlag(included: bool) -> int:
+    """Option flag value: 02 if included, 01 otherwise"""
+
+    return 0x02 if included else 0x01
+
+
+def _outputBasicTail(txOutput: TxOutput) -> Tuple[int, int, int, int]:
+    """Values of the TX Output basic data tail (see _OUTPUT_BASIC_TAIL)"""
+
+    hasRefScript = isinstance(txOutput, TxOutputBabbage) and txOutput.referenceScriptHex is not None
+    return txOutput.amount, len(txOutput.tokenBundle), _optionFlag(txOutput.datum is not None), _optionFlag(hasRefScript)
+
+
+def _checkDataSize(size: int) -> None:
+    """Reject an APDU data exceeding the APDU capacity"""
+
+    if size > MAX_APDU_DATA_SIZE:
+        raise ValueError(f"APDU data too long: {size} > {MAX_APDU_DATA_SIZE}")
+
+
+@lru_cache(maxsize=None)
+def _tokenLayout(nameSize: int) -> struct.Struct:
+    """Token APDU layout: Asset Name Length (4B), Asset Name, Amount (8B, signed)"""
+
+    return struct.Struct(f">5BI{nameSize}sq")
+
+
+@lru_cache(maxsize=1024)
+def _packDerivationPath(path: str) -> bytes:
+    """Serialized derivation path, the same few paths being used by most APDUs"""
+
+    return pack_derivation_path(path)
+
+
+class ApduWriter:
+    """APDU writer over a preallocated buffer
+
+    The header and the payload are written in place in a buffer allocated once,
+    so that building an APDU only allocates the final bytes object.
+    The buffer is reused by the next APDU: the writer is not thread-safe.
+    """
+
+    _HEADER = struct.Struct(">BBBBB")
+
+    def __init__(self) -> None:
+        """Class initializer"""
+
+        self._buffer = bytearray(APDU_HEADER_SIZE + MAX_APDU_DATA_SIZE)
+        self._view = memoryview(self._buffer)
+        self._offset = APDU_HEADER_SIZE
+
+
+    def start(self, cla: int, ins: int, p1: int = 0x00, p2: int = 0x00) -> "ApduWriter":
+        """Start a new APDU, discarding any previous content
+
+        Args:
+            cla (int): APDU Class
+            ins (int): APDU Instruction
+            p1 (int): APDU Parameter 1
+            p2 (int): APDU Parameter 2
+
+        Returns:
+            The writer itself, to chain the payload fields
+        """
+
+        self._HEADER.pack_into(self._buffer, 0, cla, ins, p1, p2, 0)
+        self._offset = APDU_HEADER_SIZE
+        return self
+
+
+    def pack(self, fmt: struct.Struct, *values: Any) -> "ApduWriter":
+        """Append several fixed size fields with a precompiled format"""
+
+        offset = self._offset
+        # pack_into raises struct.error when the buffer is too small
+        fmt.pack_into(self._buffer, offset, *values)
+        self._offset = offset + fmt.size
+        return self
+
+
+    def u8(self, value: int) -> "ApduWriter":
+        """Append a 1 byte unsigned value"""
+
+        _U8.pack_into(self._buffer, self._offset, value)
+        self._offset += _U8.size
+        return self
+
+
+    def u32(self, value: int) -> "ApduWriter":
+        """Append a 4 bytes big endian unsigned value"""
+
+        _U32.pack_into(self._buffer, self._offset, value)
+        self._offset += _U32.size
+        return self
+
+
+    def u64(self, value: int) -> "ApduWriter":
+        """Append a 8 bytes big endian unsigned value"""
+
+        _U64.pack_into(self._buffer, self._offset, value)
+        self._offset += _U64.size
+        return self
+
+
+    def flag(self, included: bool) -> "ApduWriter":
+        """Append an option flag (1B): 02 if included, 01 otherwise"""
+
+        return self.u8(_optionFlag(included))
+
+
+    def raw(self, data: Union[bytes, bytearray, memoryview]) -> "ApduWriter":
+        """Append a raw buffer"""
+
+        offset = self._offset
+        end = offset + len(data)
+        _checkDataSize(end - APDU_HEADER_SIZE)
+        self._view[offset:end] = data
+        self._offset = end
+        return self
+
+
+    def hex(self, dataHex: str) -> "ApduWriter":
+        """Append a buffer given as an hex string"""
+
+        return self.raw(bytes.fromhex(dataHex))
+
+
+    def path(self, path: str) -> "ApduWriter":
+        """Append a derivation path (1B for length + [0-10] x 4B)"""
+
+        return self.raw(_packDerivationPath(path))
+
+
+    def path_or_hex(self, value: str) -> "ApduWriter":
+        """Append a derivation path if value starts with 'm/', an hex buffer otherwise"""
+
+        if value.startswith("m/"):
+            return self.raw(_packDerivationPath(value))
+        return self.raw(bytes.fromhex(value))
+
+
+    def finish(self) -> bytes:
+        """Close the APDU, setting its data length
+
+        Returns:
+            Serial data APDU
+        """
+
+        self._buffer[APDU_HEADER_SIZE - 1] = self._offset - APDU_HEADER_SIZE
+        return self._view[:self._offset].tobytes()
+
+
 class CommandBuilder:
     _CLA: int = 0xd7
 
+    def __init__(self) -> None:
+        """Class initializer"""
+
+        self._writer = ApduWriter()
+
+
+    def _start(self, ins: int, p1: int = 0x00, p2: int = 0x00) -> ApduWriter:
+        """Start an APDU built in place
+
+        Args:
+            ins (InsType): APDU Instruction
+            p1 (int): APDU Parameter 1
+            p2 (int): APDU Parameter 2
+
+        Returns:
+            The APDU writer
+        """
+
+        return self._writer.start(self._CLA, ins, p1, p2)
+
+
+    def _pack(self, layout: struct.Struct, ins: int, p1: int, p2: int, *values: Any) -> bytes:
+        """Build a fixed-layout APDU with a single struct call
+
+        Args:
+            layout (struct.Struct): APDU layout, header included
+            ins (InsType): APDU Instruction
+            p1 (int): APDU Parameter 1
+            p2 (int): APDU Parameter 2
+            values: APDU data fields
+
+        Returns:
+            Serial data APDU
+        """
+
+        return layout.pack(self._CLA, ins, p1, p2, layout.size - APDU_HEADER_SIZE, *values)
+
+
     def _serialize(self,
                    ins: InsType,
                    p1: int = 0x00,
                    p2: int = 0x00,
                    cdata: bytes = bytes()) -> bytes:
 
-        header = bytearray()
-        header.append(self._CLA)
-        header.append(ins)
-        header.append(p1)
-        header.append(p2)
-        header.append(len(cdata))
-        return header + cdata
+        return self._start(ins, p1, p2).raw(cdata).finish()
 
 
     def get_version(self) -> bytes:
@@ -170,6 +397,52 @@ class CommandBuilder:
         return self._serialize(InsType.GET_PUBLIC_ADDR, p1, 0x00, data)
 
 
+    def get_pubkeys(self, paths: List[str]) -> List[bytes]:
+        """APDU Builder for Public Keys, as a single multiple keys session
+
+        The first key is sent with P1_KEY_INIT and the number of remaining keys,
+        the other ones with P1_KEY_NEXT, one APDU per key.
+
+        Args:
+            paths (List[str]): Derivation paths of the keys
+
+        Returns:
+            The APDU of each key
+        """
+
+        if not paths:
+            raise ValueError("At least one derivation path is required")
+        apdus = [self.get_pubkey(P1Type.P1_KEY_INIT, paths[0], len(paths) - 1)]
+        apdus += [self.get_pubkey(P1Type.P1_KEY_NEXT, path) for path in paths[1:]]
+        return apdus
+
+
+    def iter_sign_cip36(self, testCase: CVoteTestCase, hashBuilder: Optional[VotecastHashBuilder] = None) -> Iterator[bytes]:
+        """CIP36 Vote INIT and CHUNK APDUs, lazily built from views of the vote cast data
+
+        Args:
+            testCase (CVoteTestCase): Test parameters
+            hashBuilder (Optional[VotecastHashBuilder]): Builder fed with the vote cast data along the APDUs
+
+        Returns:
+            Iterator on the INIT APDU, then the CHUNK APDUs
+        """
+
+        voteCastData = testCase.cVote.voteCastData
+        chunks = iter_votecast_chunks(voteCastData, hashBuilder)
+        # Serialization format:
+        #    Full length of the vote cast data (4B)
+        #    First chunk (up to MAX_CIP36_PAYLOAD_SIZE B)
+        writer = self._start(InsType.SIGN_CIP36_VOTE, P1Type.P1_INIT).u32(len(voteCastData))
+        for chunk in islice(chunks, 1):
+            writer.raw(chunk)
+        yield writer.finish()
+        # Serialization format:
+        #    Following chunks (up to MAX_CIP36_PAYLOAD_SIZE B each)
+        for chunk in chunks:
+            yield self._start(InsType.SIGN_CIP36_VOTE, P1Type.P1_CHUNK).raw(chunk).finish()
+
+
     def sign_cip36_init(self, testCase: CVoteTestCase) -> bytes:
         """APDU Builder for CIP36 Vote - INIT step
 
@@ -180,18 +453,7 @@ class CommandBuilder:
             Serial data APDU
         """
 
-        # Serialization format:
-        #    Full length of voteCastDataHex (4B)
-        #    voteCastDataHex (up to 240 B)
-        data = bytes()
-        # 2 hex chars per byte
-        data_size = int(len(testCase.cVote.voteCastDataHex) / 2)
-        chunk_size = min(MAX_CIP36_PAYLOAD_SIZE * 2, len(testCase.cVote.voteCastDataHex))
-        data += data_size.to_bytes(4, "big")
-        data += bytes.fromhex(testCase.cVote.voteCastDataHex[:chunk_size])
-        # Remove the data sent in this step
-        testCase.cVote.voteCastDataHex = testCase.cVote.voteCastDataHex[chunk_size:]
-        return self._serialize(InsType.SIGN_CIP36_VOTE, P1Type.P1_INIT, 0x00, data)
+        return next(self.iter_sign_cip36(testCase))
 
 
     def sign_cip36_chunk(self, testCase: CVoteTestCase) -> List[bytes]:
@@ -201,22 +463,10 @@ class CommandBuilder:
             testCase (CVoteTestCase): Test parameters
 
         Returns:
-            Response APDU
+            Serial data APDUs, the data of the INIT step excluded
         """
 
-        # Serialization format:
-        #    voteCastDataHex (following data, up to MAX_CIP36_PAYLOAD_SIZE B each)
-        chunks = []
-        payload = testCase.cVote.voteCastDataHex
-        max_payload_size = MAX_CIP36_PAYLOAD_SIZE * 2 # 2 hex chars per byte
-        while len(payload) > 0:
-            chunks.append(self._serialize(InsType.SIGN_CIP36_VOTE,
-                                          P1Type.P1_CHUNK,
-                                          0x00,
-                                          bytes.fromhex(payload[:max_payload_size])))
-            payload = payload[max_payload_size:]
-
-        return chunks
+        return list(islice(self.iter_sign_cip36(testCase), 1, None))
 
 
     def sign_cip36_confirm(self) -> bytes:
@@ -262,12 +512,14 @@ class CommandBuilder:
         # kesPeriod (8B)
         # issueCounter (8B)
         # derivation path (1B for length + [0-10] x 4B)
-        data = bytes()
-        data += bytes.fromhex(testCase.opCert.kesPublicKeyHex)
-        data += testCase.opCert.kesPeriod.to_bytes(8, "big")
-        data += testCase.opCert.issueCounter.to_bytes(8, "big")
-        data += pack_derivation_path(testCase.opCert.path)
-        return self._serialize(InsType.SIGN_OP_CERT, 0x00, 0x00, data)
+        opCert = testCase.opCert
+        kesPublicKey = bytes.fromhex(opCert.kesPublicKeyHex)
+        writer = self._start(InsType.SIGN_OP_CERT, 0x00, 0x00)
+        if len(kesPublicKey) == KES_PUBLIC_KEY_SIZE:
+            writer.pack(_OP_CERT_HEAD, kesPublicKey, opCert.kesPeriod, opCert.issueCounter)
+        else:
+            writer.raw(kesPublicKey).u64(opCert.kesPeriod).u64(opCert.issueCounter)
+        return writer.path(opCert.path).finish()
 
 
     def sign_msg_init(self, testCase: SignMsgTestCase) -> bytes:
@@ -281,16 +533,14 @@ class CommandBuilder:
         """
 
         # Serialization format:
-        #    Full length of messageHex (4B)
+        #    Full length of the message (4B)
         #    signingPath (1B for length + [0-10] x 4B)
         #    hashPayload (1B)
         #    isAscii display (1B)
         #    addressFieldType (1B)
         #    addressBuffer, if any
         data = bytes()
-        # 2 hex chars per byte
-        data_size = int(len(testCase.msgData.messageHex) / 2)
-        data += data_size.to_bytes(4, "big")
+        data += message_size(testCase.msgData).to_bytes(4, "big")
         data += pack_derivation_path(testCase.msgData.signingPath)
 
         data += testCase.msgData.hashPayload.to_bytes(1, "big")
@@ -309,32 +559,27 @@ class CommandBuilder:
             testCase (SignMsgTestCase): Test parameters
 
         Returns:
-            Response APDU
+            Serial data APDUs
+        """
+
+        with open_message(testCase.msgData) as message:
+            return [self.sign_msg_chunk_apdu(chunk) for chunk in iter_message_chunks(message, testCase.msgData.isAscii)]
+
+
+    def sign_msg_chunk_apdu(self, chunk: memoryview) -> bytes:
+        """APDU Builder for Sign Message - CHUNK step, for a single chunk
+
+        Args:
+            chunk (memoryview): The message chunk, see iter_message_chunks
+
+        Returns:
+            Serial data APDU
         """
 
-        MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE = 198 * 2
-        MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE = 99 * 2
-        MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE = 250 * 2
         # Serialization format:
-        #    messageHex (up to MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE B each, started by the length)
-        chunks = []
-        if testCase.msgData.isAscii:
-            firstChunkSize = MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE
-        else:
-            firstChunkSize = MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE
-        chunk_size = min(firstChunkSize, len(testCase.msgData.messageHex))
-        payload = testCase.msgData.messageHex
-        while True:
-            data = bytes()
-            data += int(chunk_size / 2).to_bytes(4, "big")
-            data += bytes.fromhex(payload[:chunk_size])
-            chunks.append(self._serialize(InsType.SIGN_MSG, P1Type.P1_CHUNK, 0x00, data))
-            payload = payload[chunk_size:]
-            chunk_size = min(MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE, len(payload))
-            if len(payload) == 0:
-                break
-
-        return chunks
+        #    Chunk size (4B)
+        #    Chunk data (up to MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE B)
+        return self._start(InsType.SIGN_MSG, P1Type.P1_CHUNK).u32(len(chunk)).raw(chunk).finish()
 
 
     def sign_msg_confirm(self) -> bytes:
@@ -383,31 +628,31 @@ class CommandBuilder:
         #    referenceInputs
         #    votingProcedures
         #    witnessBabbage
-        data = bytes()
-        data += testCase.options.to_bytes(8, "big")
-        data += testCase.tx.network.networkId.to_bytes(1, "big")
-        data += testCase.tx.network.protocol.to_bytes(4, "big")
-        data += self._serializeOptionFlags(testCase.tx.ttl is not None)
-        data += self._serializeOptionFlags(testCase.tx.auxiliaryData is not None)
-        data += self._serializeOptionFlags(testCase.tx.validityIntervalStart is not None)
-        data += self._serializeOptionFlags(len(testCase.tx.mint) > 0)
-        data += self._serializeOptionFlags(testCase.tx.scriptDataHash is not None)
-        data += self._serializeOptionFlags(testCase.tx.includeNetworkId is not None)
-        data += self._serializeOptionFlags(testCase.tx.collateralOutput is not None)
-        data += self._serializeOptionFlags(testCase.tx.totalCollateral is not None)
-        data += self._serializeOptionFlags(testCase.tx.treasury is not None)
-        data += self._serializeOptionFlags(testCase.tx.donation is not None)
-        data += testCase.signingMode.to_bytes(1, "big")
-        data += len(testCase.tx.inputs).to_bytes(4, "big")
-        data += len(testCase.tx.outputs).to_bytes(4, "big")
-        data += len(testCase.tx.certificates).to_bytes(4, "big")
-        data += len(testCase.tx.withdrawals).to_bytes(4, "big")
-        data += len(testCase.tx.collateralInputs).to_bytes(4, "big")
-        data += len(testCase.tx.requiredSigners).to_bytes(4, "big")
-        data += len(testCase.tx.referenceInputs).to_bytes(4, "big")
-        data += len(testCase.tx.votingProcedures).to_bytes(4, "big")
-        data += nbWitnessPaths.to_bytes(4, "big")
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_INIT, 0x00, data)
+        tx = testCase.tx
+        return self._pack(_APDU_TX_INIT, InsType.SIGN_TX, P1Type.P1_INIT, 0x00,
+                          testCase.options,
+                          tx.network.networkId,
+                          tx.network.protocol,
+                          _optionFlag(tx.ttl is not None),
+                          _optionFlag(tx.auxiliaryData is not None),
+                          _optionFlag(tx.validityIntervalStart is not None),
+                          _optionFlag(len(tx.mint) > 0),
+                          _optionFlag(tx.scriptDataHash is not None),
+                          _optionFlag(tx.includeNetworkId is not None),
+                          _optionFlag(tx.collateralOutput is not None),
+                          _optionFlag(tx.totalCollateral is not None),
+                          _optionFlag(tx.treasury is not None),
+                          _optionFlag(tx.donation is not None),
+                          testCase.signingMode,
+                          len(tx.inputs),
+                          len(tx.outputs),
+                          len(tx.certificates),
+                          len(tx.withdrawals),
+                          len(tx.collateralInputs),
+                          len(tx.requiredSigners),
+                          len(tx.referenceInputs),
+                          len(tx.votingProcedures),
+                          nbWitnessPaths)
 
 
     def sign_tx_aux_data_serialize(self, auxData: TxAuxiliaryData) -> bytes:
@@ -593,10 +838,7 @@ class CommandBuilder:
         # Serialization format:
         #    Tx Hash Hex
         #    Tx Output Index (4B)
-        data = bytes()
-        data += bytes.fromhex(txInput.txHashHex)
-        data += txInput.outputIndex.to_bytes(4, "big")
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_INPUTS, 0x00, data)
+        return self._txInput(P1Type.P1_INPUTS, txInput)
 
 
     def sign_tx_outputs_basic(self, txOutput: TxOutput) -> bytes:
@@ -616,18 +858,19 @@ class CommandBuilder:
         #    TokenBundle Length (4B)
         #    datum option flag (1B)
         #    referenceScriptHex option flag (1B)
-        data = bytes()
-        data += txOutput.format.to_bytes(1, "big")
-        data += self._serializeTxOutputDestination(txOutput.destination)
-        data += self._serializeCoin(txOutput.amount)
-        data += len(txOutput.tokenBundle).to_bytes(4, "big")
-        data += self._serializeOptionFlags(txOutput.datum is not None)
-        if isinstance(txOutput, TxOutputBabbage):
-            data += self._serializeOptionFlags(txOutput.referenceScriptHex is not None)
-        else:
-            data += self._serializeOptionFlags(False)
-
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_OUTPUTS, P2Type.P2_BASIC_DATA, data)
+        destination = txOutput.destination
+        if destination.type == TxOutputDestinationType.THIRD_PARTY:
+            # Most outputs: the APDU is packed at once, cheaper than going through the writer
+            assert isinstance(destination.params, ThirdPartyAddressParams)
+            address = bytes.fromhex(destination.params.addressHex)
+            size = _APDU_OUTPUT_THIRD_PARTY_HEAD.size - APDU_HEADER_SIZE + len(address) + _OUTPUT_BASIC_TAIL.size
+            _checkDataSize(size)
+            return _APDU_OUTPUT_THIRD_PARTY_HEAD.pack(self._CLA, InsType.SIGN_TX, P1Type.P1_OUTPUTS, P2Type.P2_BASIC_DATA,
+                                                      size, txOutput.format, destination.type, len(address)) \
+                + address + _OUTPUT_BASIC_TAIL.pack(*_outputBasicTail(txOutput))
+        writer = self._start(InsType.SIGN_TX, P1Type.P1_OUTPUTS, P2Type.P2_BASIC_DATA)
+        self._writeTxOutputBasic(writer, txOutput)
+        return writer.finish()
 
 
     def sign_tx_outputs_datum(self, datum: Datum) -> bytes:
@@ -708,8 +951,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Fee (8B)
-        data = self._serializeCoin(testCase.tx.fee)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_FEE, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_FEE, 0x00, testCase.tx.fee)
 
 
     def sign_tx_ttl(self, testCase: SignTxTestCase) -> bytes:
@@ -725,8 +967,7 @@ class CommandBuilder:
         # Serialization format:
         #    TTL (8B)
         assert testCase.tx.ttl is not None
-        data = self._serializeCoin(testCase.tx.ttl)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_TTL, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_TTL, 0x00, testCase.tx.ttl)
 
 
     def sign_tx_withdrawal(self, withdrawal: Withdrawal) -> bytes:
@@ -760,8 +1001,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Validity Start (8B)
-        data = validity.to_bytes(8, "big")
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_VALIDITY_INTERVAL_START, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_VALIDITY_INTERVAL_START, 0x00, validity)
 
 
     def sign_tx_mint_init(self, nbMints: int) -> bytes:
@@ -776,8 +1016,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Nb of mint elements (4B)
-        data = nbMints.to_bytes(4, "big")
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_MINT, P2Type.P2_BASIC_DATA, data)
+        return self._pack(_APDU_U32, InsType.SIGN_TX, P1Type.P1_MINT, P2Type.P2_BASIC_DATA, nbMints)
 
 
     def sign_tx_mint_confirm(self) -> bytes:
@@ -802,9 +1041,12 @@ class CommandBuilder:
         """
 
         # Serialization format:
-        #    Asset Group
-        data = self._serializeAssetGroup(asset)
-        return self._serialize(InsType.SIGN_TX, p1, P2Type.ASSET_GROUP, data)
+        #    Policy ID
+        #    Nb of tokens (4B)
+        policyId = bytes.fromhex(asset.policyIdHex)
+        if len(policyId) == POLICY_ID_SIZE:
+            return self._pack(_APDU_ASSET_GROUP, InsType.SIGN_TX, p1, P2Type.ASSET_GROUP, policyId, len(asset.tokens))
+        return self._start(InsType.SIGN_TX, p1, P2Type.ASSET_GROUP).raw(policyId).u32(len(asset.tokens)).finish()
 
 
     def sign_tx_token(self, p1: P1Type, token: Token) -> bytes:
@@ -819,9 +1061,12 @@ class CommandBuilder:
         """
 
         # Serialization format:
-        #    Asset Token
-        data = self._serializeToken(token)
-        return self._serialize(InsType.SIGN_TX, p1, P2Type.TOKEN, data)
+        #    Asset Name Length (4B)
+        #    Asset Name
+        #    Amount (8B)
+        assetName = bytes.fromhex(token.assetNameHex)
+        return self._pack(_tokenLayout(len(assetName)), InsType.SIGN_TX, p1, P2Type.TOKEN,
+                          len(assetName), assetName, token.amount)
 
 
     def sign_tx_script_data_hash(self, script: str) -> bytes:
@@ -852,8 +1097,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Collateral Input
-        data = self._serializeTxInput(txInput)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_COLLATERAL_INPUTS, 0x00, data)
+        return self._txInput(P1Type.P1_COLLATERAL_INPUTS, txInput)
 
 
     def sign_tx_total_collateral(self, total: int) -> bytes:
@@ -868,8 +1112,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Nb of collateral elements (8B)
-        data = self._serializeCoin(total)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_TOTAL_COLLATERAL, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_TOTAL_COLLATERAL, 0x00, total)
 
 
     def sign_tx_reference_inputs(self, txInput: TxInput) -> bytes:
@@ -884,8 +1127,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Reference Input
-        data = self._serializeTxInput(txInput)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_REFERENCE_INPUTS, 0x00, data)
+        return self._txInput(P1Type.P1_REFERENCE_INPUTS, txInput)
 
 
     def sign_tx_collateral_output_basic(self, txOutput: TxOutput) -> bytes:
@@ -905,17 +1147,9 @@ class CommandBuilder:
         #    TokenBundle Length (4B)
         #    datum option flag (1B)
         #    referenceScriptHex option flag (1B)
-        data = bytes()
-        data += txOutput.format.to_bytes(1, "big")
-        data += self._serializeTxOutputDestination(txOutput.destination)
-        data += self._serializeCoin(txOutput.amount)
-        data += len(txOutput.tokenBundle).to_bytes(4, "big")
-        data += self._serializeOptionFlags(txOutput.datum is not None)
-        if isinstance(txOutput, TxOutputBabbage):
-            data += self._serializeOptionFlags(txOutput.referenceScriptHex is not None)
-        else:
-            data += self._serializeOptionFlags(False)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_COLLATERAL_OUTPUT, P2Type.P2_BASIC_DATA, data)
+        writer = self._start(InsType.SIGN_TX, P1Type.P1_COLLATERAL_OUTPUT, P2Type.P2_BASIC_DATA)
+        self._writeTxOutputBasic(writer, txOutput)
+        return writer.finish()
 
 
     def sign_tx_collateral_output_confirm(self) -> bytes:
@@ -961,8 +1195,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Coin (8B)
-        data = self._serializeCoin(treasury)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_TREASURY, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_TREASURY, 0x00, treasury)
 
 
     def sign_tx_donation(self, donation: int) -> bytes:
@@ -977,8 +1210,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Coin (8B)
-        data = self._serializeCoin(donation)
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_DONATION, 0x00, data)
+        return self._pack(_APDU_U64, InsType.SIGN_TX, P1Type.P1_DONATION, 0x00, donation)
 
 
     def sign_tx_voting_procedure(self, votingProcedure: VoterVotes) -> bytes:
@@ -1025,83 +1257,80 @@ class CommandBuilder:
         # Serialization format:
         #   Certificate Type (1B)
         #   Certificate Data
-        data = bytes()
+        writer = self._start(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, 0x00)
         if certificate.type in (CertificateType.STAKE_REGISTRATION, CertificateType.STAKE_DEREGISTRATION):
             assert isinstance(certificate.params, StakeRegistrationParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.stakeCredential is not None
-            data += self._serializeCredential(certificate.params.stakeCredential)
+            self._writeCredential(writer, certificate.params.stakeCredential)
         elif certificate.type in (CertificateType.STAKE_REGISTRATION_CONWAY, CertificateType.STAKE_DEREGISTRATION_CONWAY):
             assert isinstance(certificate.params, StakeRegistrationConwayParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.stakeCredential is not None
-            data += self._serializeCredential(certificate.params.stakeCredential)
+            self._writeCredential(writer, certificate.params.stakeCredential)
             assert certificate.params.deposit is not None
-            data += self._serializeCoin(certificate.params.deposit)
+            writer.u64(certificate.params.deposit)
         elif certificate.type == CertificateType.STAKE_DELEGATION:
             assert isinstance(certificate.params, StakeDelegationParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.stakeCredential is not None
-            data += self._serializeCredential(certificate.params.stakeCredential)
+            self._writeCredential(writer, certificate.params.stakeCredential)
             assert certificate.params.poolKeyHash is not None
-            data += bytes.fromhex(certificate.params.poolKeyHash)
+            writer.hex(certificate.params.poolKeyHash)
         elif certificate.type == CertificateType.VOTE_DELEGATION:
             assert isinstance(certificate.params, VoteDelegationParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.stakeCredential is not None
-            data += self._serializeCredential(certificate.params.stakeCredential)
+            self._writeCredential(writer, certificate.params.stakeCredential)
             assert certificate.params.dRep is not None
-            data += self._serializeDRep(certificate.params.dRep)
+            writer.raw(self._serializeDRep(certificate.params.dRep))
         elif certificate.type == CertificateType.AUTHORIZE_COMMITTEE_HOT:
             assert isinstance(certificate.params, AuthorizeCommitteeParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.coldCredential is not None
-            data += self._serializeCredential(certificate.params.coldCredential)
+            self._writeCredential(writer, certificate.params.coldCredential)
             assert certificate.params.hotCredential is not None
-            data += self._serializeCredential(certificate.params.hotCredential)
+            self._writeCredential(writer, certificate.params.hotCredential)
         elif certificate.type == CertificateType.RESIGN_COMMITTEE_COLD:
             assert isinstance(certificate.params, ResignCommitteeParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.coldCredential is not None
-            data += self._serializeCredential(certificate.params.coldCredential)
-            data += self._serializeAnchor(certificate.params.anchor)
+            self._writeCredential(writer, certificate.params.coldCredential)
+            self._writeAnchor(writer, certificate.params.anchor)
         elif certificate.type == CertificateType.DREP_REGISTRATION:
             assert isinstance(certificate.params, DRepRegistrationParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.dRepCredential is not None
-            data += self._serializeCredential(certificate.params.dRepCredential)
+            self._writeCredential(writer, certificate.params.dRepCredential)
             assert certificate.params.deposit is not None
-            data += self._serializeCoin(certificate.params.deposit)
-            data += self._serializeAnchor(certificate.params.anchor)
+            writer.u64(certificate.params.deposit)
+            self._writeAnchor(writer, certificate.params.anchor)
         elif certificate.type == CertificateType.DREP_DEREGISTRATION:
             assert isinstance(certificate.params, DRepRegistrationParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.dRepCredential is not None
-            data += self._serializeCredential(certificate.params.dRepCredential)
+            self._writeCredential(writer, certificate.params.dRepCredential)
             assert certificate.params.deposit is not None
-            data += self._serializeCoin(certificate.params.deposit)
+            writer.u64(certificate.params.deposit)
         elif certificate.type == CertificateType.DREP_UPDATE:
             assert isinstance(certificate.params, DRepUpdateParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.dRepCredential is not None
-            data += self._serializeCredential(certificate.params.dRepCredential)
-            data += self._serializeAnchor(certificate.params.anchor)
+            self._writeCredential(writer, certificate.params.dRepCredential)
+            self._writeAnchor(writer, certificate.params.anchor)
         elif certificate.type == CertificateType.STAKE_POOL_REGISTRATION:
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
         elif certificate.type == CertificateType.STAKE_POOL_RETIREMENT:
             assert isinstance(certificate.params, PoolRetirementParams)
-            data += certificate.type.to_bytes(1, "big")
+            writer.u8(certificate.type)
             assert certificate.params.poolKeyPath is not None
-            if certificate.params.poolKeyPath.startswith("m/"):
-                data += pack_derivation_path(certificate.params.poolKeyPath)
-            else:
-                data += bytes.fromhex(certificate.params.poolKeyPath)
+            writer.path_or_hex(certificate.params.poolKeyPath)
             assert certificate.params.retirementEpoch is not None
-            data += certificate.params.retirementEpoch.to_bytes(8, "big")
+            writer.u64(certificate.params.retirementEpoch)
         else:
             raise NotImplementedError("Not implemented yet")
 
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, 0x00, data)
+        return writer.finish()
 
 
     def sign_tx_cert_pool_reg_init(self, pool: PoolRegistrationParams) -> bytes:
@@ -1175,12 +1404,8 @@ class CommandBuilder:
         #    Coin pledge (8B)
         #    Coin cost (8B)
         #    Pool margin (8B each)
-        data = bytes()
-        data += self._serializeCoin(pool.pledge)
-        data += self._serializeCoin(pool.cost)
-        data += pool.margin.numerator.to_bytes(8, "big")
-        data += pool.margin.denominator.to_bytes(8, "big")
-        return self._serialize(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, P2Type.P2_FINANCIALS, data)
+        return self._pack(_APDU_POOL_FINANCIALS, InsType.SIGN_TX, P1Type.P1_CERTIFICATES, P2Type.P2_FINANCIALS,
+                          pool.pledge, pool.cost, pool.margin.numerator, pool.margin.denominator)
 
 
     def sign_tx_cert_pool_reg_reward(self, pool: PoolKey) -> bytes:
@@ -1269,11 +1494,11 @@ class CommandBuilder:
         return self._serialize(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, P2Type.P2_RELAYS, data)
 
 
-    def sign_tx_cert_pool_reg_metadata(self, pool: PoolMetadataParams) -> bytes:
+    def sign_tx_cert_pool_reg_metadata(self, pool: Optional[PoolMetadataParams]) -> bytes:
         """APDU Builder for Sign TX - CERTIFICATE step - POOL METADATA level
 
         Args:
-            pool (PoolMetadataParams): Input Test data
+            pool (Optional[PoolMetadataParams]): Input Test data
 
         Returns:
             Serial data APDU
@@ -1327,6 +1552,108 @@ class CommandBuilder:
         return self._serialize(InsType.SIGN_TX, P1Type.P1_TX_WITNESSES, 0x00, data)
 
 
+    def iter_sign_tx(self, testCase: SignTxTestCase, witnessPaths: List[str]) -> Iterator[SignTxApdu]:
+        """Sign TX APDUs, lazily built in protocol order
+
+        Args:
+            testCase (SignTxTestCase): Test parameters
+            witnessPaths (List[str]): The unique witness paths
+
+        Returns:
+            Iterator on the APDUs, tagged if a user interaction may be expected
+        """
+
+        tx = testCase.tx
+        # INIT
+        yield SignTxApdu(self.sign_tx_init(testCase, len(witnessPaths)), True)
+        # AUX DATA
+        if tx.auxiliaryData is not None:
+            yield SignTxApdu(self.sign_tx_aux_data_serialize(tx.auxiliaryData), True)
+            if isinstance(tx.auxiliaryData.params, TxAuxiliaryDataCIP36):
+                cip36 = tx.auxiliaryData.params
+                yield SignTxApdu(self.sign_tx_aux_data_init(cip36), False)
+                if cip36.voteKey:
+                    yield SignTxApdu(self.sign_tx_aux_data_vote_key(cip36), True)
+                else:
+                    for delegation in cip36.delegations:
+                        yield SignTxApdu(self.sign_tx_aux_data_delegation(delegation), True)
+                yield SignTxApdu(self.sign_tx_aux_data_staking(cip36), True)
+                yield SignTxApdu(self.sign_tx_aux_data_payment(cip36), True)
+                yield SignTxApdu(self.sign_tx_aux_data_nonce(cip36), True)
+                yield SignTxApdu(self.sign_tx_aux_data_voting_purpose(cip36), False)
+                yield SignTxApdu(self.sign_tx_aux_data_confirm(), True)
+        # INPUTS
+        for txInput in tx.inputs:
+            yield SignTxApdu(self.sign_tx_inputs(txInput), False)
+        # OUTPUTS
+        for txOutput in tx.outputs:
+            yield SignTxApdu(self.sign_tx_outputs_basic(txOutput), True)
+            yield from self._iterTokenBundle(P1Type.P1_OUTPUTS, txOutput.tokenBundle)
+            if txOutput.datum is not None:
+                yield SignTxApdu(self.sign_tx_outputs_datum(txOutput.datum), False)
+                if txOutput.datum.type == DatumType.INLINE:
+                    yield from self._iterTxChunks(P2Type.P2_DATUM_CHUNK, txOutput.datum.datumHex)
+            if isinstance(txOutput, TxOutputBabbage) and txOutput.referenceScriptHex is not None:
+                yield SignTxApdu(self.sign_tx_outputs_ref_script(txOutput.referenceScriptHex), False)
+                yield from self._iterTxChunks(P2Type.P2_SCRIPT_CHUNK, txOutput.referenceScriptHex)
+            yield SignTxApdu(self.sign_tx_outputs_confirm(), True)
+        # FEE
+        yield SignTxApdu(self.sign_tx_fee(testCase), True)
+        # TTL
+        if tx.ttl is not None:
+            yield SignTxApdu(self.sign_tx_ttl(testCase), False)
+        # CERTIFICATES
+        for certificate in tx.certificates:
+            yield SignTxApdu(self.sign_tx_certificate(certificate), True)
+            if isinstance(certificate.params, PoolRegistrationParams):
+                yield from self._iterPoolRegistration(certificate.params)
+        # WITHDRAWALS
+        for withdrawal in tx.withdrawals:
+            yield SignTxApdu(self.sign_tx_withdrawal(withdrawal), True)
+        # VALIDITY START
+        if tx.validityIntervalStart is not None:
+            yield SignTxApdu(self.sign_tx_validity(tx.validityIntervalStart), False)
+        # MINT
+        if len(tx.mint) > 0:
+            yield SignTxApdu(self.sign_tx_mint_init(len(tx.mint)), True)
+            yield from self._iterTokenBundle(P1Type.P1_MINT, tx.mint)
+            yield SignTxApdu(self.sign_tx_mint_confirm(), True)
+        # SCRIPT DATA HASH
+        if tx.scriptDataHash is not None:
+            yield SignTxApdu(self.sign_tx_script_data_hash(tx.scriptDataHash), False)
+        # COLLATERAL INPUTS
+        for txInput in tx.collateralInputs:
+            yield SignTxApdu(self.sign_tx_collateral_inputs(txInput), False)
+        # REQUIRED SIGNERS
+        for signer in tx.requiredSigners:
+            yield SignTxApdu(self.sign_tx_required_signers(signer), False)
+        # COLLATERAL OUTPUT
+        if tx.collateralOutput is not None:
+            yield SignTxApdu(self.sign_tx_collateral_output_basic(tx.collateralOutput), True)
+            yield from self._iterTokenBundle(P1Type.P1_COLLATERAL_OUTPUT, tx.collateralOutput.tokenBundle)
+            yield SignTxApdu(self.sign_tx_collateral_output_confirm(), True)
+        # TOTAL COLLATERAL
+        if tx.totalCollateral:
+            yield SignTxApdu(self.sign_tx_total_collateral(tx.totalCollateral), True)
+        # REFERENCE INPUTS
+        for txInput in tx.referenceInputs:
+            yield SignTxApdu(self.sign_tx_reference_inputs(txInput), False)
+        # VOTING PROCEDURES
+        for votingProcedure in tx.votingProcedures:
+            yield SignTxApdu(self.sign_tx_voting_procedure(votingProcedure), True)
+        # TREASURY
+        if tx.treasury is not None:
+            yield SignTxApdu(self.sign_tx_treasury(tx.treasury), True)
+        # DONATION
+        if tx.donation is not None:
+            yield SignTxApdu(self.sign_tx_donation(tx.donation), True)
+        # CONFIRM
+        yield SignTxApdu(self.sign_tx_confirm(), True)
+        # WITNESSES
+        for path in witnessPaths:
+            yield SignTxApdu(self.sign_tx_witness(path), True)
+
+
     def derive_script_add_simple(self, script: NativeScript) -> bytes:
         """APDU Builder for DERIVE NATIVE SCRIPT HASH - SIMPLE SCRIPT step
 
@@ -1443,16 +1770,80 @@ class CommandBuilder:
         return data
 
 
-    def _serializeTxInput(self, txInput: TxInput) -> bytes:
-        """Serialize TX Input"""
+    def _iterTxChunks(self, p2: P2Type, dataHex: str) -> Iterator[SignTxApdu]:
+        """Additional chunks of a datum or a reference script, the first one being sent with the header"""
+
+        for offset in range(MAX_SIGN_TX_CHUNK_SIZE * 2, len(dataHex), MAX_SIGN_TX_CHUNK_SIZE * 2):
+            yield SignTxApdu(self.sign_tx_outputs_chunk(p2, dataHex[offset:offset + MAX_SIGN_TX_CHUNK_SIZE * 2]), False)
+
+
+    def _iterTokenBundle(self, p1: P1Type, assetGroups: List[AssetGroup]) -> Iterator[SignTxApdu]:
+        """Asset groups and their tokens, for outputs or mint"""
+
+        for assetGroup in assetGroups:
+            yield SignTxApdu(self.sign_tx_asset_group(p1, assetGroup), True)
+            for token in assetGroup.tokens:
+                yield SignTxApdu(self.sign_tx_token(p1, token), True)
+
+
+    def _iterPoolRegistration(self, pool: PoolRegistrationParams) -> Iterator[SignTxApdu]:
+        """Additional data for a pool registration certificate"""
+
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_init(pool), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_pool_key(pool.poolKey), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_vrf(pool.vrfKeyHashHex), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_financials(pool), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_reward(pool.rewardAccount), True)
+        for owner in pool.poolOwners:
+            yield SignTxApdu(self.sign_tx_cert_pool_reg_owner(owner), True)
+        for relay in pool.relays:
+            yield SignTxApdu(self.sign_tx_cert_pool_reg_relay(relay), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_metadata(pool.metadata), True)
+        yield SignTxApdu(self.sign_tx_cert_pool_reg_confirm(), True)
+
+
+    def _txInput(self, p1: P1Type, txInput: TxInput) -> bytes:
+        """Build a TX Input APDU (inputs, collateral inputs, reference inputs)"""
 
         # Serialization format:
-        #    Input Hash
+        #    Input Hash (32B)
         #    Output Index (4B)
-        data = bytes()
-        data += bytes.fromhex(txInput.txHashHex)
-        data += txInput.outputIndex.to_bytes(4, "big")
-        return data
+        txHash = bytes.fromhex(txInput.txHashHex)
+        if len(txHash) == TX_HASH_SIZE:
+            return self._pack(_APDU_TX_INPUT, InsType.SIGN_TX, p1, 0x00, txHash, txInput.outputIndex)
+        return self._start(InsType.SIGN_TX, p1, 0x00).raw(txHash).u32(txInput.outputIndex).finish()
+
+
+    def _writeTxOutputBasic(self, writer: ApduWriter, txOutput: TxOutput) -> None:
+        """Write TX Output basic data"""
+
+        writer.u8(txOutput.format)
+        writer.raw(self._serializeTxOutputDestination(txOutput.destination))
+        writer.pack(_OUTPUT_BASIC_TAIL, *_outputBasicTail(txOutput))
+
+
+    def _writeCredential(self, writer: ApduWriter, credential: CredentialParams) -> None:
+        """Write Credential"""
+
+        # Serialization format:
+        #    Type (1B)
+        #    Credential data
+        writer.u8(credential.type)
+        assert credential.keyValue is not None
+        writer.path_or_hex(credential.keyValue)
+
+
+    def _writeAnchor(self, writer: ApduWriter, anchor: Optional[AnchorParams] = None) -> None:
+        """Write Anchor"""
+
+        # Serialization format:
+        #    Anchor option flag (1B)
+        #    Anchor hash
+        #    Anchor URL
+        writer.flag(anchor is not None)
+        if anchor is not None:
+            writer.hex(anchor.hashHex)
+            writer.raw(anchor.url.encode("ascii"))
 
 
     def _serializeAnchor(self, anchor: Optional[AnchorParams] = None) -> bytes:
@@ -1475,8 +1866,7 @@ class CommandBuilder:
 
         # Serialization format:
         #    Flag value (1B): 02 if included, 01 otherwise
-        value = 0x02 if included else 0x01
-        return value.to_bytes(1, "big")
+        return bytes([_optionFlag(included)])
 
 
     def _serializeCoin(self, coin: int) -> bytes:
@@ -1591,29 +1981,3 @@ class CommandBuilder:
             raise NotImplementedError("Not implemented yet")
 
         return data
-
-
-    def _serializeAssetGroup(self, asset: AssetGroup) -> bytes:
-        """Serialize Asset Group"""
-
-        # Serialization format:
-        #    Policy ID
-        #    Nb of tokens (4B)
-        data = bytes()
-        data += bytes.fromhex(asset.policyIdHex)
-        data += len(asset.tokens).to_bytes(4, "big")
-        return data
-
-
-    def _serializeToken(self, token: Token) -> bytes:
-        """Serialize Token"""
-
-        # Serialization format:
-        #    Asset Name Length (4B)
-        #    Asset Name
-        #    Amount (8B)
-        data = bytes()
-        data += int(len(token.assetNameHex) / 2).to_bytes(4, "big")
-        data += bytes.fromhex(token.assetNameHex)
-        data += token.amount.to_bytes(8, "big", signed=True)
-        return data
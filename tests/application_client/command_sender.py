@@ -6,15 +6,20 @@ This module provides Ragger tests Client application.
 It contains the command sending part.
 """
 
-from typing import Generator, Optional
+from typing import Callable, Generator, Iterable, List, Optional, Tuple
 from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+import hashlib
+import time
 
 from ragger.backend.interface import BackendInterface, RAPDU
+from ragger.error import ExceptionRAPDU
 
 from input_files.derive_address import DeriveAddressTestCase
 from input_files.cvote import CVoteTestCase
 from input_files.signOpCert import OpCertTestCase
-from input_files.signMsg import SignMsgTestCase
+from input_files.signMsg import SignMsgTestCase, open_message, iter_message_chunks
 from input_files.signTx import SignTxTestCase, TxInput, TxOutput, TxAuxiliaryData, TxAuxiliaryDataCIP36, CIP36VoteDelegation
 from input_files.signTx import Withdrawal, Certificate, VoterVotes, AssetGroup, Token, RequiredSigner, Datum
 from input_files.signTx import PoolRegistrationParams, PoolKey, Relay, PoolMetadataParams
@@ -22,17 +27,57 @@ from input_files.derive_native_script import NativeScript, NativeScriptHashDispl
 
 from application_client.command_builder import CommandBuilder, P1Type, P2Type
 from application_client.app_def import Errors
+from application_client.apdu_transcript import TranscriptRecorder
+
+# Extended public key returned by GET_PUBLIC_ADDR: public key then chain code
+PUBLIC_KEY_SIZE = 32
+CHAIN_CODE_SIZE = 32
+
+CIP8_MSG_HASH_LENGTH = 28
+
+
+@dataclass
+class SignMsgStream:
+    """Outcome of the Sign Message CHUNK step, complete once its context is left"""
+    numChunks: int = 0
+    # Host side blake2b-224 hash of the message, computed along the chunks when hashPayload is set
+    msgHash: Optional[bytes] = None
+
+
+def unpack_pubkeys(paths: List[str], rapdus: List[RAPDU]) -> List[Tuple[str, bytes, bytes]]:
+    """Check and split the responses of a Get Public Keys session
+
+    Args:
+        paths (List[str]): Derivation paths of the keys
+        rapdus (List[RAPDU]): Response of each key
+
+    Returns:
+        The path, public key and chain code of each key
+    """
+
+    keys = []
+    for path, rapdu in zip(paths, rapdus):
+        assert rapdu.status == Errors.SW_SUCCESS
+        assert len(rapdu.data) == PUBLIC_KEY_SIZE + CHAIN_CODE_SIZE
+        keys.append((path,
+                     bytes(rapdu.data[:PUBLIC_KEY_SIZE]),
+                     bytes(rapdu.data[PUBLIC_KEY_SIZE:PUBLIC_KEY_SIZE + CHAIN_CODE_SIZE])))
+    return keys
 
 
 class CommandSender:
     """Base class to send APDU to the selected backend"""
 
-    def __init__(self, backend: BackendInterface) -> None:
+    # Recorder of the exchanges of all the senders, when requested (see conftest.py)
+    defaultRecorder: Optional[TranscriptRecorder] = None
+
+    def __init__(self, backend: BackendInterface, recorder: Optional[TranscriptRecorder] = None) -> None:
         """Class initializer"""
 
         self._backend = backend
         self._firmware = backend.firmware
         self._cmd_builder = CommandBuilder()
+        self._recorder = recorder if recorder is not None else CommandSender.defaultRecorder
 
 
     def _exchange(self, payload: bytes) -> RAPDU:
@@ -45,7 +90,16 @@ class CommandSender:
             Response APDU
         """
 
-        return self._backend.exchange_raw(payload)
+        if self._recorder is None:
+            return self._backend.exchange_raw(payload)
+        sentNs = time.monotonic_ns()
+        try:
+            rapdu = self._backend.exchange_raw(payload)
+        except ExceptionRAPDU as error:
+            self._recorder.record(payload, error.status, error.data, sentNs, time.monotonic_ns())
+            raise
+        self._recorder.record(payload, rapdu.status, rapdu.data, sentNs, time.monotonic_ns())
+        return rapdu
 
 
     @contextmanager
@@ -59,7 +113,72 @@ class CommandSender:
             Generator
         """
 
-        with self._backend.exchange_async_raw(payload):
+        if self._recorder is None:
+            with self._backend.exchange_async_raw(payload):
+                yield
+            return
+        sentNs = time.monotonic_ns()
+        try:
+            with self._backend.exchange_async_raw(payload):
+                yield
+        except ExceptionRAPDU as error:
+            self._recorder.record(payload, error.status, error.data, sentNs, time.monotonic_ns(), interactive=True)
+            raise
+        rapdu = self._backend.last_async_response
+        if rapdu is not None:
+            self._recorder.record(payload, rapdu.status, rapdu.data, sentNs, time.monotonic_ns(), interactive=True)
+
+
+    def exchange_many(self, apdus: Iterable[bytes]) -> List[RAPDU]:
+        """Synchronous exchange of a sequence of prebuilt APDUs
+
+        The APDUs are sent back to back, stopping at the first response
+        with a status different from SW_SUCCESS.
+        Only suitable for APDUs not requiring any user interaction.
+
+        Args:
+            apdus (Iterable[bytes]): APDUs to send, in order
+
+        Returns:
+            Response APDUs, the last one being the failing one if any
+        """
+
+        # the recorder, if any, is only reached through _exchange
+        exchange = self._backend.exchange_raw if self._recorder is None else self._exchange
+        rapdus: List[RAPDU] = []
+        for apdu in apdus:
+            rapdu = exchange(apdu)
+            rapdus.append(rapdu)
+            if rapdu.status != Errors.SW_SUCCESS:
+                break
+        return rapdus
+
+
+    def exchange_raw(self, apdu: bytes) -> RAPDU:
+        """Synchronous exchange of a prebuilt APDU
+
+        Args:
+            apdu (bytes): APDU to send
+
+        Returns:
+            Response APDU
+        """
+
+        return self._exchange(apdu)
+
+
+    @contextmanager
+    def exchange_async_raw(self, apdu: bytes) -> Generator[None, None, None]:
+        """Asynchronous exchange of a prebuilt APDU
+
+        Args:
+            apdu (bytes): APDU to send
+
+        Returns:
+            Generator
+        """
+
+        with self._exchange_async(apdu):
             yield
 
 
@@ -169,6 +288,36 @@ class CommandSender:
         return self._exchange(self._cmd_builder.get_pubkey(p1, path, remainingKeysData))
 
 
+    def get_pubkeys(self,
+                    paths: List[str],
+                    navigate: Optional[Callable[[int], None]] = None) -> List[Tuple[str, bytes, bytes]]:
+        """APDU Get Public Keys, as a single multiple keys session
+
+        The APDUs are all built before the session is started (see CommandBuilder.get_pubkeys).
+
+        Args:
+            paths (List[str]): Derivation paths of the keys
+            navigate (Callable): Navigation done while each key APDU is pending,
+                called with the key index; if None, the keys are exchanged synchronously
+
+        Returns:
+            The path, public key and chain code of each key
+        """
+
+        apdus = self._cmd_builder.get_pubkeys(paths)
+        if navigate is None:
+            rapdus = self.exchange_many(apdus)
+        else:
+            rapdus = []
+            for index, apdu in enumerate(apdus):
+                with self._exchange_async(apdu):
+                    navigate(index)
+                rapdu = self.get_async_response()
+                assert rapdu is not None
+                rapdus.append(rapdu)
+        return unpack_pubkeys(paths, rapdus)
+
+
     @contextmanager
     def sign_cip36_init(self, testCase: CVoteTestCase) -> Generator[None, None, None]:
         """APDU CIP36 Vote - INIT step
@@ -184,21 +333,22 @@ class CommandSender:
             yield
 
 
-    def sign_cip36_chunk(self, testCase: CVoteTestCase) -> RAPDU:
-        """APDU CIP36 Vote - INIT step
+    def sign_cip36_chunk(self, testCase: CVoteTestCase) -> Optional[RAPDU]:
+        """APDU CIP36 Vote - CHUNK step
 
         Args:
             testCase (CVoteTestCase): Test parameters
 
         Returns:
-            Response APDU
+            Response APDU of the last chunk, None if the data fits in the INIT step
         """
 
-        chunks = self._cmd_builder.sign_cip36_chunk(testCase)
-        for chunk in chunks[:-1]:
+        resp = None
+        for chunk in islice(self._cmd_builder.iter_sign_cip36(testCase), 1, None):
+            if resp is not None:
+                assert resp.status == Errors.SW_SUCCESS
             resp = self._exchange(chunk)
-            assert resp.status == Errors.SW_SUCCESS
-        return self._exchange(chunks[-1])
+        return resp
 
 
     @contextmanager
@@ -259,22 +409,44 @@ class CommandSender:
 
 
     @contextmanager
-    def sign_msg_chunk(self, testCase: SignMsgTestCase) -> Generator[None, None, None]:
-        """APDU Sign Message - INIT step
+    def sign_msg_chunk(self, testCase: SignMsgTestCase) -> Generator[SignMsgStream, None, None]:
+        """APDU Sign Message - CHUNK step
+
+        The chunks are streamed from the message source, in constant memory,
+        the message hash being computed in the same pass.
 
         Args:
             testCase (SignMsgTestCase): Test parameters
 
         Returns:
-            Response APDU
-        """
-
-        chunks = self._cmd_builder.sign_msg_chunk(testCase)
-        with self._exchange_async(chunks[0]):
-            yield
-        for chunk in chunks[1:]:
-            resp = self._exchange(chunk)
-            assert resp.status == Errors.SW_SUCCESS
+            Generator of the CHUNK step outcome
+        """
+
+        msgData = testCase.msgData
+        stream = SignMsgStream()
+        msgHash = hashlib.blake2b(digest_size=CIP8_MSG_HASH_LENGTH) if msgData.hashPayload else None
+        with open_message(msgData) as message:
+            chunks = iter_message_chunks(message, msgData.isAscii)
+            firstChunk = next(chunks, None)
+            if firstChunk is None:
+                raise ValueError("A message has at least one chunk")
+            # the chunk views are released once sent, so that the message can be unmapped
+            with firstChunk as chunk:
+                if msgHash is not None:
+                    msgHash.update(chunk)
+                apdu = self._cmd_builder.sign_msg_chunk_apdu(chunk)
+            with self._exchange_async(apdu):
+                yield stream
+            stream.numChunks = 1
+            for chunk in chunks:
+                with chunk:
+                    if msgHash is not None:
+                        msgHash.update(chunk)
+                    resp = self._exchange(self._cmd_builder.sign_msg_chunk_apdu(chunk))
+                assert resp.status == Errors.SW_SUCCESS
+                stream.numChunks += 1
+        if msgHash is not None:
+            stream.msgHash = msgHash.digest()
 
 
     @contextmanager
@@ -886,11 +1058,11 @@ class CommandSender:
 
 
     @contextmanager
-    def sign_tx_cert_pool_reg_metadata(self, pool: PoolMetadataParams) -> Generator[None, None, None]:
+    def sign_tx_cert_pool_reg_metadata(self, pool: Optional[PoolMetadataParams]) -> Generator[None, None, None]:
         """APDU Sign TX - CERTIFICATE step - POOL METADATA level
 
         Args:
-            pool (PoolMetadataParams): Input Test data
+            pool (Optional[PoolMetadataParams]): Input Test data
 
         Returns:
             Generator
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a native script hash builder mirroring the device one
+(src/nativeScriptHashBuilder/nativeScriptHashBuilder.c), fed script by script
+as the Derive Native Script Hash APDUs, and a hasher of whole native script trees.
+
+The hasher walks the trees iteratively, so their depth is not bounded by the recursion limit,
+and caches the encoding of each subtree by identity: the subtrees shared by several
+scripts (or several times by the same script) are only serialized once.
+"""
+
+from enum import IntEnum
+from typing import Callable, Dict, List, Tuple
+import hashlib
+import struct
+
+from input_files.derive_native_script import NativeScript, NativeScriptType
+from input_files.derive_native_script import NativeScriptParamsPubkey, NativeScriptParamsScripts
+from input_files.derive_native_script import NativeScriptParamsNofK, NativeScriptParamsInvalid
+from application_client.tx_hash_builder import CborHashWriter, CborType, ADDRESS_KEY_HASH_LENGTH, SCRIPT_HASH_LENGTH
+
+
+# Maximal nesting of the native scripts (src/cardano.h)
+MAX_SCRIPT_DEPTH = 11
+
+# The native script hash is computed on the script CBOR, with a zero byte prepended
+NATIVE_SCRIPT_HASH_PREFIX = b"\x00"
+
+# Host side resolver of the key hash of a device owned key path
+KeyHashResolver = Callable[[str], bytes]
+
+
+class NativeScriptHashBuilderState(IntEnum):
+    SCRIPT = 100
+    FINISHED = 200
+
+
+# Native script types as serialized in the CBOR (src/cardano.h)
+class NativeScriptCborType(IntEnum):
+    PUBKEY = 0
+    ALL = 1
+    ANY = 2
+    N_OF_K = 3
+    INVALID_BEFORE = 4
+    INVALID_HEREAFTER = 5
+
+
+_COMPLEX_CBOR_TYPES = {
+    NativeScriptType.ALL: NativeScriptCborType.ALL,
+    NativeScriptType.ANY: NativeScriptCborType.ANY,
+    NativeScriptType.N_OF_K: NativeScriptCborType.N_OF_K,
+}
+
+_TIMELOCK_CBOR_TYPES = {
+    NativeScriptType.INVALID_BEFORE: NativeScriptCborType.INVALID_BEFORE,
+    NativeScriptType.INVALID_HEREAFTER: NativeScriptCborType.INVALID_HEREAFTER,
+}
+
+_CBOR_W1 = struct.Struct(">BB")
+_CBOR_W2 = struct.Struct(">BH")
+_CBOR_W4 = struct.Struct(">BI")
+_CBOR_W8 = struct.Struct(">BQ")
+
+
+class NativeScriptHashBuilder:
+    """Native script hash builder, with the same state machine as the device
+
+    The failed device ASSERTs raise a ValueError.
+    """
+
+    def __init__(self) -> None:
+        self._writer = CborHashWriter(digestSize=SCRIPT_HASH_LENGTH)
+        self._writer.data(NATIVE_SCRIPT_HASH_PREFIX)
+        self.state = NativeScriptHashBuilderState.SCRIPT
+        self.level = 0
+        self.remainingScripts = [0] * MAX_SCRIPT_DEPTH
+        self.remainingScripts[self.level] = 1
+
+
+    def _assert(self, condition: bool, check: str) -> None:
+        """Fail as the device ASSERT, naming the failed check"""
+
+        if not condition:
+            raise ValueError(f"Native script hash builder check failed in state {self.state.name}: {check}")
+
+
+    def _advanceState(self) -> None:
+        """Finish when the top level script is complete"""
+
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+        if self.level == 0 and self.remainingScripts[self.level] == 0:
+            self.state = NativeScriptHashBuilderState.FINISHED
+
+
+    def _isComplexScriptFinished(self) -> bool:
+        return self.level > 0 and self.remainingScripts[self.level] == 0
+
+
+    def _complexScriptFinished(self) -> None:
+        """Leave the complete complex scripts, each of them completing a script of its parent"""
+
+        while self._isComplexScriptFinished():
+            self.level -= 1
+            self._assert(self.remainingScripts[self.level] > 0, "remainingScripts > 0")
+            self.remainingScripts[self.level] -= 1
+
+
+    def _simpleScriptFinished(self) -> None:
+        self._assert(self.remainingScripts[self.level] > 0, "remainingScripts > 0")
+        self.remainingScripts[self.level] -= 1
+        self._complexScriptFinished()
+
+
+    def _startComplexScript(self, remainingScripts: int) -> None:
+        self._writer.token(CborType.ARRAY, remainingScripts)
+        self._assert(self.level + 1 < MAX_SCRIPT_DEPTH, "level + 1 < MAX_SCRIPT_DEPTH")
+        self.level += 1
+        self.remainingScripts[self.level] = remainingScripts
+        self._complexScriptFinished()
+        self._advanceState()
+
+
+    def startComplexScriptAll(self, remainingScripts: int) -> None:
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+
+        # Array(2)[Unsigned[1], Array(remainingScripts)[...]]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, NativeScriptCborType.ALL)
+        self._startComplexScript(remainingScripts)
+
+
+    def startComplexScriptAny(self, remainingScripts: int) -> None:
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+
+        # Array(2)[Unsigned[2], Array(remainingScripts)[...]]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, NativeScriptCborType.ANY)
+        self._startComplexScript(remainingScripts)
+
+
+    def startComplexScriptNofK(self, requiredScripts: int, remainingScripts: int) -> None:
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+
+        # Array(3)[Unsigned[3], Unsigned[requiredScripts], Array(remainingScripts)[...]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, NativeScriptCborType.N_OF_K)
+        self._writer.token(CborType.UNSIGNED, requiredScripts)
+        self._startComplexScript(remainingScripts)
+
+
+    def addScriptPubkey(self, pubKeyHash: bytes) -> None:
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+        self._assert(len(pubKeyHash) == ADDRESS_KEY_HASH_LENGTH, "pubKeyHashSize == ADDRESS_KEY_HASH_LENGTH")
+
+        # Array(2)[Unsigned[0], Bytes[pubKeyHash]]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, NativeScriptCborType.PUBKEY)
+        self._writer.byteString(pubKeyHash)
+        self._simpleScriptFinished()
+        self._advanceState()
+
+
+    def _addScriptTimelock(self, cborType: NativeScriptCborType, timelock: int) -> None:
+        self._assert(self.state == NativeScriptHashBuilderState.SCRIPT, "state == SCRIPT")
+
+        # Array(2)[Unsigned[native script type], Unsigned[timelock]]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, cborType)
+        self._writer.token(CborType.UNSIGNED, timelock)
+        self._simpleScriptFinished()
+        self._advanceState()
+
+
+    def addScriptInvalidBefore(self, timelock: int) -> None:
+        self._addScriptTimelock(NativeScriptCborType.INVALID_BEFORE, timelock)
+
+
+    def addScriptInvalidHereafter(self, timelock: int) -> None:
+        self._addScriptTimelock(NativeScriptCborType.INVALID_HEREAFTER, timelock)
+
+
+    def finalize(self) -> bytes:
+        """Check the native script is complete and finalize its hash
+
+        Returns:
+            The blake2b-224 native script hash
+        """
+
+        self._assert(self.state == NativeScriptHashBuilderState.FINISHED, "state == FINISHED")
+        return self._writer.digest()
+
+
+def feed_native_script(builder: NativeScriptHashBuilder, script: NativeScript, keyHash: KeyHashResolver) -> None:
+    """Give a whole native script to the builder, in the order of the Derive Native Script Hash APDUs
+
+    Args:
+        builder (NativeScriptHashBuilder): The builder
+        script (NativeScript): The native script
+        keyHash (KeyHashResolver): The resolver of the key hashes of the device owned keys
+    """
+
+    # pre-order walk: each complex script is started before its subscripts
+    stack = [script]
+    while stack:
+        node = stack.pop()
+        params = node.params
+        if node.type == NativeScriptType.PUBKEY_DEVICE_OWNED:
+            assert isinstance(params, NativeScriptParamsPubkey)
+            builder.addScriptPubkey(keyHash(params.key))
+        elif node.type == NativeScriptType.PUBKEY_THIRD_PARTY:
+            assert isinstance(params, NativeScriptParamsPubkey)
+            builder.addScriptPubkey(bytes.fromhex(params.key))
+        elif node.type in _TIMELOCK_CBOR_TYPES:
+            assert isinstance(params, NativeScriptParamsInvalid)
+            if node.type == NativeScriptType.INVALID_BEFORE:
+                builder.addScriptInvalidBefore(params.slot)
+            else:
+                builder.addScriptInvalidHereafter(params.slot)
+        else:
+            assert isinstance(params, (NativeScriptParamsScripts, NativeScriptParamsNofK))
+            if node.type == NativeScriptType.ALL:
+                builder.startComplexScriptAll(len(params.scripts))
+            elif node.type == NativeScriptType.ANY:
+                builder.startComplexScriptAny(len(params.scripts))
+            else:
+                assert isinstance(params, NativeScriptParamsNofK)
+                builder.startComplexScriptNofK(params.requiredCount, len(params.scripts))
+            stack.extend(reversed(params.scripts))
+
+
+def _token(cborType: CborType, value: int) -> bytes:
+    """Encode a CBOR token header, as the device does (cbor_writeToken)"""
+
+    if value < 0 or value >= 1 << 64:
+        raise ValueError(f"Value out of range: {value}")
+    if value < 24:
+        return bytes([cborType | value])
+    if value < 0x100:
+        return _CBOR_W1.pack(cborType | 24, value)
+    if value < 0x10000:
+        return _CBOR_W2.pack(cborType | 25, value)
+    if value < 0x100000000:
+        return _CBOR_W4.pack(cborType | 26, value)
+    return _CBOR_W8.pack(cborType | 27, value)
+
+
+def _subscripts(script: NativeScript) -> List[NativeScript]:
+    """The direct subscripts of a script, none for the simple ones"""
+
+    if script.type in _COMPLEX_CBOR_TYPES:
+        assert isinstance(script.params, (NativeScriptParamsScripts, NativeScriptParamsNofK))
+        return script.params.scripts
+    return []
+
+
+class NativeScriptHasher:
+    """Hasher of whole native script trees
+
+    The encodings are cached by script identity, the scripts must therefore
+    not be modified once hashed (or the cache cleared).
+    The key hashes of the device owned keys are provided by the resolver.
+    """
+
+    def __init__(self, keyHash: KeyHashResolver) -> None:
+        self._keyHash = keyHash
+        # encoding of each encoded script, by identity; the script is kept so that its id is not reused
+        self._cache: Dict[int, Tuple[NativeScript, bytes]] = {}
+
+
+    def clear(self) -> None:
+        """Forget the cached encodings"""
+
+        self._cache.clear()
+
+
+    def encode(self, script: NativeScript) -> bytes:
+        """Serialize a native script, as hashed by the device
+
+        Args:
+            script (NativeScript): The native script
+
+        Returns:
+            The script CBOR
+        """
+
+        cache = self._cache
+        cached = cache.get(id(script))
+        if cached is not None:
+            return cached[1]
+        # post-order walk: the subscripts are encoded before their parent
+        entered = set()
+        stack = [script]
+        while stack:
+            node = stack[-1]
+            if id(node) in cache:
+                stack.pop()
+                continue
+            subscripts = _subscripts(node)
+            if id(node) not in entered:
+                entered.add(id(node))
+                pending = [subscript for subscript in subscripts if id(subscript) not in cache]
+                if pending:
+                    if any(id(subscript) in entered for subscript in pending):
+                        raise ValueError("A native script cannot contain itself")
+                    stack.extend(reversed(pending))
+                    continue
+            stack.pop()
+            cache[id(node)] = (node, self._encodeNode(node, subscripts))
+        return cache[id(script)][1]
+
+
+    def hash(self, script: NativeScript) -> bytes:
+        """Compute the native script hash
+
+        Args:
+            script (NativeScript): The native script
+
+        Returns:
+            The blake2b-224 hash, as returned by Derive Native Script Hash
+        """
+
+        return hashlib.blake2b(NATIVE_SCRIPT_HASH_PREFIX + self.encode(script), digest_size=SCRIPT_HASH_LENGTH).digest()
+
+
+    def _encodeNode(self, script: NativeScript, subscripts: List[NativeScript]) -> bytes:
+        """Serialize a script, its subscripts being already cached"""
+
+        if script.type in _COMPLEX_CBOR_TYPES:
+            cborType = _COMPLEX_CBOR_TYPES[script.type]
+            if isinstance(script.params, NativeScriptParamsNofK):
+                # as validated by the device
+                if script.params.requiredCount > len(subscripts):
+                    raise ValueError(f"N_OF_K script requiring {script.params.requiredCount} of {len(subscripts)} scripts")
+                header = bytes([CborType.ARRAY | 3, cborType]) + _token(CborType.UNSIGNED, script.params.requiredCount)
+            else:
+                header = bytes([CborType.ARRAY | 2, cborType])
+            cache = self._cache
+            return b"".join([header, _token(CborType.ARRAY, len(subscripts))]
+                            + [cache[id(subscript)][1] for subscript in subscripts])
+
+        if script.type in _TIMELOCK_CBOR_TYPES:
+            assert isinstance(script.params, NativeScriptParamsInvalid)
+            return bytes([CborType.ARRAY | 2, _TIMELOCK_CBOR_TYPES[script.type]]) + _token(CborType.UNSIGNED, script.params.slot)
+
+        assert isinstance(script.params, NativeScriptParamsPubkey)
+        if script.type == NativeScriptType.PUBKEY_DEVICE_OWNED:
+            pubKeyHash = self._keyHash(script.params.key)
+        elif script.type == NativeScriptType.PUBKEY_THIRD_PARTY:
+            pubKeyHash = bytes.fromhex(script.params.key)
+        else:
+            raise ValueError(f"Unknown native script type: {script.type}")
+        if len(pubKeyHash) != ADDRESS_KEY_HASH_LENGTH:
+            raise ValueError(f"Invalid key hash size: {len(pubKeyHash)}")
+        return bytes([CborType.ARRAY | 2, NativeScriptCborType.PUBKEY]) + _token(CborType.BYTES, len(pubKeyHash)) + pubKeyHash
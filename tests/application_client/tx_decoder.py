@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a streaming decoder of TX bodies: the CBOR items of a binary stream
+(TX bodies, transactions or blocks) are read one by one through a bounded buffer,
+and each TX body is mapped to the Sign TX test case dataclasses.
+"""
+
+from typing import Any, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import struct
+
+from application_client.app_def import Mainnet, NetworkDesc
+from application_client.tx_hash_builder import CborTag, TxBodyKey, TxOutputKey
+from input_files.signTx import Transaction, TxInput, TxOutput, TxOutputAlonzo, TxOutputBabbage, TxOutputFormat
+from input_files.signTx import TxOutputDestination, TxOutputDestinationType, ThirdPartyAddressParams
+from input_files.signTx import AssetGroup, Token, Datum, DatumType, TxAuxiliaryData, TxAuxiliaryDataType
+from input_files.signTx import TxAuxiliaryDataHash, RequiredSigner, TxRequiredSignerType
+from input_files.signTx import Certificate, CertificateType, CredentialParams, CredentialParamsType
+from input_files.signTx import DRepParams, DRepParamsType, AnchorParams, Withdrawal
+from input_files.signTx import Voter, VoterType, VoterVotes, Vote, GovActionId, VotingProcedure, VoteOption
+from input_files.signTx import StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams
+from input_files.signTx import VoteDelegationParams, AuthorizeCommitteeParams, ResignCommitteeParams
+from input_files.signTx import DRepRegistrationParams, DRepUpdateParams, PoolRetirementParams
+from input_files.signTx import PoolRegistrationParams, PoolKey, PoolKeyType, PoolMetadataParams, Margin
+from input_files.signTx import Relay, RelayType, SingleHostIpAddrRelayParams, SingleHostHostnameRelayParams
+from input_files.signTx import MultiHostRelayParams
+
+
+# Size of the stream reads, the buffer growing as needed for larger items
+READ_CHUNK_SIZE = 1 << 20
+
+# Hard fork combinator era of a block, as wrapped by the node: Array(2)[Unsigned[era], block]
+_FIRST_SHELLEY_ERA = 2
+
+_BREAK = 0xFF
+# Remaining items of an indefinite length container, never counted down to 0
+_INDEFINITE = 1 << 62
+_FLOATS = {0xF9: struct.Struct(">e"), 0xFA: struct.Struct(">f"), 0xFB: struct.Struct(">d")}
+_SIMPLE_VALUES = {0xF4: False, 0xF5: True, 0xF6: None, 0xF7: None}
+
+_TX_BODY_KEYS = frozenset(TxBodyKey)
+
+
+class Tagged(NamedTuple):
+    """A tagged CBOR item"""
+    tag: int
+    value: Any
+
+
+def _head(data: bytes, pos: int) -> Tuple[int, int, int]:
+    """Parse the head of an item
+
+    Returns:
+        Tuple of the initial byte, the argument (-1 for an indefinite length) and the next position
+    """
+
+    initial = data[pos]
+    info = initial & 0x1F
+    if info < 24:
+        return initial, info, pos + 1
+    if info < 28:
+        end = pos + 1 + (1 << (info - 24))
+        if end > len(data):
+            raise IndexError("Truncated CBOR item")
+        return initial, int.from_bytes(data[pos + 1:end], "big"), end
+    if info == 31 and initial >> 5 in (2, 3, 4, 5, 7):
+        return initial, -1, pos + 1
+    raise ValueError(f"Invalid CBOR initial byte {initial:#04x} at {pos}")
+
+
+def _skip(data: bytes, pos: int) -> int:
+    """Skip an item, raising IndexError when it is truncated
+
+    The nested items are counted down instead of being skipped recursively.
+
+    Returns:
+        The position following the item
+    """
+
+    size = len(data)
+    remaining = 1
+    # remaining items of the containers enclosing the indefinite length ones
+    enclosing = []
+    while True:
+        initial = data[pos]
+        pos += 1
+        info = initial & 0x1F
+        if info < 24:
+            argument = info
+        elif info < 28:
+            end = pos + (1 << (info - 24))
+            if end > size:
+                raise IndexError("Truncated CBOR item")
+            argument = int.from_bytes(data[pos:end], "big")
+            pos = end
+        elif info == 31 and initial >> 5 in (2, 3, 4, 5):
+            # only ended by a break
+            enclosing.append(remaining - 1)
+            remaining = _INDEFINITE
+            continue
+        elif initial == _BREAK and len(enclosing) > 0:
+            remaining = enclosing.pop()
+            if remaining == 0:
+                return pos
+            continue
+        else:
+            raise ValueError(f"Invalid CBOR initial byte {initial:#04x} at {pos - 1}")
+        remaining -= 1
+        major = initial >> 5
+        if major in (2, 3):
+            pos += argument
+            if pos > size:
+                raise IndexError("Truncated CBOR item")
+        elif major == 4:
+            remaining += argument
+        elif major == 5:
+            remaining += 2 * argument
+        elif major == 6:
+            remaining += 1
+        if remaining == 0:
+            return pos
+
+
+def _hashable(key: Any) -> Any:
+    """Map key as a hashable value, arrays becoming tuples"""
+
+    if isinstance(key, list):
+        return tuple(_hashable(item) for item in key)
+    if isinstance(key, Tagged):
+        return Tagged(key.tag, _hashable(key.value))
+    if isinstance(key, dict):
+        raise ValueError("Unsupported CBOR map key: map")
+    return key
+
+
+def _decodeSimple(data: bytes, initial: int, pos: int) -> Any:
+    """Simple value or float, whose initial byte and argument end at pos"""
+
+    if initial in _SIMPLE_VALUES:
+        return _SIMPLE_VALUES[initial]
+    if initial in _FLOATS:
+        floatStruct = _FLOATS[initial]
+        return floatStruct.unpack(data[pos - floatStruct.size:pos])[0]
+    raise ValueError(f"Unsupported CBOR simple value {initial:#04x}")
+
+
+def decode_cbor(data: bytes, pos: int = 0) -> Tuple[Any, int]:
+    """Decode a CBOR item
+
+    The maps are decoded as dict, with the array keys as tuples,
+    and the tagged items as Tagged.
+
+    Args:
+        data (bytes): The CBOR data
+        pos (int): The item position
+
+    Returns:
+        Tuple of the item and the position following it
+    """
+
+    initial = data[pos]
+    if initial & 0x1F < 24:
+        argument = initial & 0x1F
+        pos += 1
+    else:
+        initial, argument, pos = _head(data, pos)
+    major = initial >> 5
+    if major < 2:
+        return (argument if major == 0 else -1 - argument), pos
+    if major in (2, 3):
+        if argument < 0:
+            chunks = []
+            while data[pos] != _BREAK:
+                chunk, pos = decode_cbor(data, pos)
+                chunks.append(chunk)
+            value: Any = b"".join(chunks) if major == 2 else "".join(chunks)
+            pos += 1
+        else:
+            end = pos + argument
+            if end > len(data):
+                raise IndexError("Truncated CBOR item")
+            value = data[pos:end] if major == 2 else data[pos:end].decode("utf-8")
+            pos = end
+        return value, pos
+    if major == 4:
+        items = []
+        if argument < 0:
+            while data[pos] != _BREAK:
+                item, pos = decode_cbor(data, pos)
+                items.append(item)
+            pos += 1
+        else:
+            for _ in range(argument):
+                item, pos = decode_cbor(data, pos)
+                items.append(item)
+        return items, pos
+    if major == 5:
+        entries = {}
+        remaining = argument
+        while remaining != 0 and (remaining > 0 or data[pos] != _BREAK):
+            key, pos = decode_cbor(data, pos)
+            entries[_hashable(key)], pos = decode_cbor(data, pos)
+            remaining -= 1
+        return entries, pos + (argument < 0)
+    if major == 6:
+        value, pos = decode_cbor(data, pos)
+        return Tagged(argument, value), pos
+    return _decodeSimple(data, initial, pos), pos
+
+
+def iter_cbor_items(stream: BinaryIO, chunkSize: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read the concatenated CBOR items of a stream
+
+    Only the current item and a read chunk are buffered, whatever the stream size.
+
+    Args:
+        stream (BinaryIO): The binary stream
+        chunkSize (int): The size of the stream reads
+
+    Returns:
+        Iterator on the serialized items
+    """
+
+    buffer = b""
+    pos = 0
+    eof = False
+    while not (eof and pos == len(buffer)):
+        try:
+            if pos == len(buffer):
+                raise IndexError("Empty buffer")
+            end = _skip(buffer, pos)
+        except IndexError as error:
+            if eof:
+                raise ValueError(f"Truncated CBOR item at the end of the stream: {error}") from error
+            # grow the reads with the item, so that a large item is not skipped over and over
+            chunk = stream.read(max(chunkSize, len(buffer) - pos))
+            eof = len(chunk) == 0
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        yield buffer[pos:end]
+        pos = end
+
+
+def _iterArray(data: bytes, pos: int) -> Iterator[Tuple[int, int]]:
+    """Span of each item of an array: (start, end)"""
+
+    initial, argument, pos = _head(data, pos)
+    if initial >> 5 != 4:
+        raise ValueError(f"CBOR array expected at {pos - 1}")
+    index = 0
+    while index != argument and (argument >= 0 or data[pos] != _BREAK):
+        end = _skip(data, pos)
+        yield pos, end
+        pos = end
+        index += 1
+
+
+def iter_tx_bodies(stream: BinaryIO, chunkSize: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read the TX bodies of a stream of concatenated CBOR items
+
+    Each item can be:
+        - a TX body: Map[...]
+        - a transaction: Array[body, witnesses, ...]
+        - a block: Array[header, Array[bodies], ...]
+        - a block wrapped with its era: Array(2)[Unsigned[era], block], the Byron blocks being skipped
+
+    Args:
+        stream (BinaryIO): The binary stream
+        chunkSize (int): The size of the stream reads
+
+    Returns:
+        Iterator on the serialized TX bodies, as found in the stream
+    """
+
+    for item in iter_cbor_items(stream, chunkSize):
+        yield from iter_item_tx_bodies(item)
+
+
+def iter_item_tx_bodies(item: bytes) -> Iterator[bytes]:
+    """Read the TX bodies of a CBOR item: a TX body, a transaction or a block (see iter_tx_bodies)
+
+    Args:
+        item (bytes): The serialized item
+
+    Returns:
+        Iterator on the serialized TX bodies, as found in the item
+    """
+
+    return _itemTxBodies(item, 0)
+
+
+def _itemTxBodies(item: bytes, pos: int) -> Iterator[bytes]:
+    """TX bodies of an item"""
+
+    major = item[pos] >> 5
+    if major == 5:
+        yield item[pos:_skip(item, pos)]
+        return
+    spans = _iterArray(item, pos)
+    firstSpan = next(spans, None)
+    if firstSpan is None:
+        raise ValueError(f"Truncated transaction/block, empty array at {pos}")
+    first, firstEnd = firstSpan
+    firstMajor = item[first] >> 5
+    if firstMajor == 5:
+        # transaction
+        yield item[first:firstEnd]
+        return
+    if firstMajor not in (0, 4):
+        raise ValueError(f"Not a TX body, transaction or block: {item[:16].hex()}")
+    secondSpan = next(spans, None)
+    if secondSpan is None:
+        raise ValueError(f"Truncated {'era wrapped block' if firstMajor == 0 else 'block'} at {pos}")
+    if firstMajor == 0:
+        # era wrapped block
+        if decode_cbor(item, first)[0] >= _FIRST_SHELLEY_ERA:
+            yield from _itemTxBodies(item, secondSpan[0])
+    else:
+        # block, after its header
+        for start, end in _iterArray(item, secondSpan[0]):
+            yield item[start:end]
+
+
+class TxDecoder:
+    """Decoder of TX bodies into the Sign TX test case dataclasses
+
+    All the data is third party: the outputs are given by their address
+    and the credentials by their key or script hash.
+    """
+
+    def __init__(self, network: NetworkDesc = Mainnet) -> None:
+        self._network = network
+        self._taggedSets = False
+
+
+    def decode(self, body: bytes) -> Tuple[Transaction, bool]:
+        """Decode a TX body
+
+        Args:
+            body (bytes): The serialized TX body
+
+        Returns:
+            Tuple of:
+                - The transaction
+                - Whether the sets are tagged (tag 258), as requested by the TX options
+        """
+
+        entries, end = decode_cbor(body)
+        if end != len(body):
+            raise ValueError(f"Trailing data after the TX body: {len(body) - end} bytes")
+        if not isinstance(entries, dict):
+            raise ValueError("The TX body is not a map")
+        self._taggedSets = False
+        unsupported = entries.keys() - _TX_BODY_KEYS
+        if len(unsupported) > 0:
+            raise ValueError(f"Unsupported TX body items: {sorted(unsupported)}")
+
+        tx = Transaction(self._network,
+                         [self._txInput(txInput) for txInput in self._set(entries[TxBodyKey.INPUTS])],
+                         [self._txOutput(txOutput) for txOutput in entries[TxBodyKey.OUTPUTS]],
+                         entries[TxBodyKey.FEE],
+                         entries.get(TxBodyKey.TTL))
+        if TxBodyKey.CERTIFICATES in entries:
+            tx.certificates = [self._certificate(certificate)
+                               for certificate in self._set(entries[TxBodyKey.CERTIFICATES])]
+        if TxBodyKey.WITHDRAWALS in entries:
+            tx.withdrawals = [Withdrawal(self._rewardCredential(address), amount)
+                              for address, amount in entries[TxBodyKey.WITHDRAWALS].items()]
+        if TxBodyKey.AUX_DATA in entries:
+            tx.auxiliaryData = TxAuxiliaryData(TxAuxiliaryDataType.ARBITRARY_HASH,
+                                               TxAuxiliaryDataHash(entries[TxBodyKey.AUX_DATA].hex()))
+        tx.validityIntervalStart = entries.get(TxBodyKey.VALIDITY_INTERVAL_START)
+        if TxBodyKey.MINT in entries:
+            tx.mint = self._multiasset(entries[TxBodyKey.MINT])
+        if TxBodyKey.SCRIPT_HASH_DATA in entries:
+            tx.scriptDataHash = entries[TxBodyKey.SCRIPT_HASH_DATA].hex()
+        if TxBodyKey.COLLATERAL_INPUTS in entries:
+            tx.collateralInputs = [self._txInput(txInput) for txInput in self._set(entries[TxBodyKey.COLLATERAL_INPUTS])]
+        if TxBodyKey.REQUIRED_SIGNERS in entries:
+            tx.requiredSigners = [RequiredSigner(TxRequiredSignerType.HASH, keyHash.hex())
+                                  for keyHash in self._set(entries[TxBodyKey.REQUIRED_SIGNERS])]
+        if TxBodyKey.NETWORK_ID in entries:
+            if entries[TxBodyKey.NETWORK_ID] != self._network.networkId:
+                raise ValueError(f"Unexpected network id: {entries[TxBodyKey.NETWORK_ID]}")
+            tx.includeNetworkId = True
+        if TxBodyKey.COLLATERAL_OUTPUT in entries:
+            tx.collateralOutput = self._txOutput(entries[TxBodyKey.COLLATERAL_OUTPUT])
+        tx.totalCollateral = entries.get(TxBodyKey.TOTAL_COLLATERAL)
+        if TxBodyKey.REFERENCE_INPUTS in entries:
+            tx.referenceInputs = [self._txInput(txInput) for txInput in self._set(entries[TxBodyKey.REFERENCE_INPUTS])]
+        if TxBodyKey.VOTING_PROCEDURES in entries:
+            tx.votingProcedures = [self._voterVotes(voter, votes)
+                                   for voter, votes in entries[TxBodyKey.VOTING_PROCEDURES].items()]
+        tx.treasury = entries.get(TxBodyKey.TREASURY)
+        tx.donation = entries.get(TxBodyKey.DONATION)
+        return tx, self._taggedSets
+
+
+    def _set(self, value: Any) -> List[Any]:
+        """Items of a set, noting whether it is tagged"""
+
+        if isinstance(value, Tagged):
+            if value.tag != CborTag.SET:
+                raise ValueError(f"Unexpected tag {value.tag} for a set")
+            self._taggedSets = True
+            value = value.value
+        return value
+
+
+    @staticmethod
+    def _txInput(txInput: List[Any]) -> TxInput:
+        txHash, index = txInput
+        return TxInput(txHash.hex(), None, index)
+
+
+    def _txOutput(self, txOutput: Any) -> TxOutput:
+        """Output, with the legacy array or babbage map format"""
+
+        if isinstance(txOutput, list):
+            # [address, value, ? datum_hash]
+            destination = self._destination(txOutput[0])
+            amount, tokenBundle = self._value(txOutput[1])
+            datum = Datum(DatumType.HASH, txOutput[2].hex()) if len(txOutput) > 2 else None
+            return TxOutputAlonzo(destination, amount, TxOutputFormat.ARRAY_LEGACY, tokenBundle, datum)
+
+        # {0: address, 1: value, ? 2: datum_option, ? 3: script_ref}
+        destination = self._destination(txOutput[TxOutputKey.ADDRESS])
+        amount, tokenBundle = self._value(txOutput[TxOutputKey.VALUE])
+        datum = None
+        if TxOutputKey.DATUM_OPTION in txOutput:
+            datumType, datumValue = txOutput[TxOutputKey.DATUM_OPTION]
+            if datumType == DatumType.INLINE:
+                datumValue = self._embeddedCbor(datumValue)
+            datum = Datum(DatumType(datumType), datumValue.hex())
+        refScript = None
+        if TxOutputKey.SCRIPT_REF in txOutput:
+            refScript = self._embeddedCbor(txOutput[TxOutputKey.SCRIPT_REF]).hex()
+        return TxOutputBabbage(destination, amount, TxOutputFormat.MAP_BABBAGE, tokenBundle, datum, refScript)
+
+
+    @staticmethod
+    def _destination(address: bytes) -> TxOutputDestination:
+        return TxOutputDestination(TxOutputDestinationType.THIRD_PARTY, ThirdPartyAddressParams(address.hex()))
+
+
+    @staticmethod
+    def _embeddedCbor(value: Any) -> bytes:
+        """Data of an embedded CBOR byte string: #6.24(Bytes[data])"""
+
+        if not isinstance(value, Tagged) or value.tag != CborTag.EMBEDDED_CBOR_BYTE_STRING:
+            raise ValueError("Embedded CBOR byte string expected")
+        return value.value
+
+
+    def _value(self, value: Any) -> Tuple[int, List[AssetGroup]]:
+        """Output value: coin / [coin, multiasset<uint>]"""
+
+        if isinstance(value, int):
+            return value, []
+        amount, multiasset = value
+        return amount, self._multiasset(multiasset)
+
+
+    @staticmethod
+    def _multiasset(multiasset: Dict[bytes, Dict[bytes, int]]) -> List[AssetGroup]:
+        return [AssetGroup(policyId.hex(), [Token(assetName.hex(), amount) for assetName, amount in tokens.items()])
+                for policyId, tokens in multiasset.items()]
+
+
+    @staticmethod
+    def _credential(credential: List[Any]) -> CredentialParams:
+        """Credential: [0, key hash] / [1, script hash]"""
+
+        credentialType, credentialHash = credential
+        if credentialType == 1:
+            return CredentialParams(CredentialParamsType.SCRIPT_HASH, credentialHash.hex())
+        return CredentialParams(CredentialParamsType.KEY_HASH, credentialHash.hex())
+
+
+    @staticmethod
+    def _rewardCredential(address: bytes) -> CredentialParams:
+        """Stake credential of a reward address: header (0xE0 / 0xF0 | networkId) + hash"""
+
+        if address[0] & 0xE0 != 0xE0:
+            raise ValueError(f"Not a reward address header: {address[0]:#04x}")
+        credentialType = CredentialParamsType.SCRIPT_HASH if address[0] & 0x10 else CredentialParamsType.KEY_HASH
+        return CredentialParams(credentialType, address[1:].hex())
+
+
+    @staticmethod
+    def _anchor(anchor: Optional[List[Any]]) -> Optional[AnchorParams]:
+        """Anchor: [url, hash] / null"""
+
+        if anchor is None:
+            return None
+        url, anchorHash = anchor
+        return AnchorParams(url, anchorHash.hex())
+
+
+    def _certificate(self, certificate: List[Any]) -> Certificate:
+        certificateType = certificate[0]
+        params: Any
+        if certificateType in (CertificateType.STAKE_REGISTRATION, CertificateType.STAKE_DEREGISTRATION):
+            params = StakeRegistrationParams(self._credential(certificate[1]))
+        elif certificateType in (CertificateType.STAKE_REGISTRATION_CONWAY, CertificateType.STAKE_DEREGISTRATION_CONWAY):
+            params = StakeRegistrationConwayParams(self._credential(certificate[1]), certificate[2])
+        elif certificateType == CertificateType.STAKE_DELEGATION:
+            params = StakeDelegationParams(self._credential(certificate[1]), certificate[2].hex())
+        elif certificateType == CertificateType.VOTE_DELEGATION:
+            dRepType, *dRepHash = certificate[2]
+            dRep = DRepParams(DRepParamsType(dRepType), dRepHash[0].hex() if dRepHash else None)
+            params = VoteDelegationParams(self._credential(certificate[1]), dRep)
+        elif certificateType == CertificateType.AUTHORIZE_COMMITTEE_HOT:
+            params = AuthorizeCommitteeParams(self._credential(certificate[1]), self._credential(certificate[2]))
+        elif certificateType == CertificateType.RESIGN_COMMITTEE_COLD:
+            params = ResignCommitteeParams(self._credential(certificate[1]), self._anchor(certificate[2]))
+        elif certificateType == CertificateType.DREP_REGISTRATION:
+            params = DRepRegistrationParams(self._credential(certificate[1]), certificate[2], self._anchor(certificate[3]))
+        elif certificateType == CertificateType.DREP_DEREGISTRATION:
+            params = DRepRegistrationParams(self._credential(certificate[1]), certificate[2])
+        elif certificateType == CertificateType.DREP_UPDATE:
+            params = DRepUpdateParams(self._credential(certificate[1]), self._anchor(certificate[2]))
+        elif certificateType == CertificateType.STAKE_POOL_RETIREMENT:
+            params = PoolRetirementParams(certificate[1].hex(), certificate[2])
+        elif certificateType == CertificateType.STAKE_POOL_REGISTRATION:
+            params = self._poolRegistration(certificate)
+        else:
+            raise ValueError(f"Unsupported certificate type: {certificateType}")
+        return Certificate(CertificateType(certificateType), params)
+
+
+    def _poolRegistration(self, certificate: List[Any]) -> PoolRegistrationParams:
+        """Pool registration: [3, operator, vrf, pledge, cost, margin, rewardAccount, owners, relays, metadata]"""
+
+        _, operator, vrfKeyHash, pledge, cost, margin, rewardAccount, owners, relays, metadata = certificate
+        if not isinstance(margin, Tagged) or margin.tag != CborTag.UNIT_INTERVAL:
+            raise ValueError("Unit interval expected for the pool margin")
+        return PoolRegistrationParams(PoolKey(PoolKeyType.THIRD_PARTY, operator.hex()),
+                                      vrfKeyHash.hex(),
+                                      pledge,
+                                      cost,
+                                      Margin(*margin.value),
+                                      PoolKey(PoolKeyType.THIRD_PARTY, rewardAccount.hex()),
+                                      [PoolKey(PoolKeyType.THIRD_PARTY, owner.hex()) for owner in self._set(owners)],
+                                      [self._relay(relay) for relay in relays],
+                                      None if metadata is None else PoolMetadataParams(metadata[0], metadata[1].hex()))
+
+
+    @staticmethod
+    def _relay(relay: List[Any]) -> Relay:
+        relayType = relay[0]
+        if relayType == RelayType.SINGLE_HOST_IP_ADDR:
+            _, port, ipv4, ipv6 = relay
+            # The device serializes the IPv6 address as 4 big-endian uint32, read in its native order
+            return Relay(RelayType.SINGLE_HOST_IP_ADDR,
+                         SingleHostIpAddrRelayParams(port,
+                                                     None if ipv4 is None else ".".join(str(part) for part in ipv4),
+                                                     None if ipv6 is None else
+                                                     b"".join(ipv6[i:i + 4][::-1] for i in range(0, len(ipv6), 4)).hex()))
+        if relayType == RelayType.SINGLE_HOST_HOSTNAME:
+            return Relay(RelayType.SINGLE_HOST_HOSTNAME, SingleHostHostnameRelayParams(relay[1], relay[2]))
+        if relayType == RelayType.MULTI_HOST:
+            return Relay(RelayType.MULTI_HOST, MultiHostRelayParams(relay[1]))
+        raise ValueError(f"Unsupported relay type: {relayType}")
+
+
+    def _voterVotes(self, voter: Tuple[Any, ...], votes: Dict[Tuple[Any, ...], List[Any]]) -> VoterVotes:
+        """Votes of a voter: [type, hash] => {[txHash, index] => [vote, anchor / null]}"""
+
+        voterType, voterHash = voter
+        return VoterVotes(Voter(VoterType(voterType), voterHash.hex()),
+                          [Vote(GovActionId(txHash.hex(), index), VotingProcedure(VoteOption(vote), self._anchor(anchor)))
+                           for (txHash, index), (vote, anchor) in votes.items()])
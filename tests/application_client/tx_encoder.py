@@ -0,0 +1,612 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a reference encoder of the TX body, serializing a Transaction
+the same way as the device (src/txHashBuilder/txHashBuilder.c) and hashing
+it incrementally with blake2b-256.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+from input_files.derive_address import DeriveAddressTestCase
+from input_files.signTx import SignTxTestCase, Transaction, TxInput, TxOutput, TxOutputBabbage, TxOutputFormat
+from input_files.signTx import TxOutputDestination, TxOutputDestinationType, ThirdPartyAddressParams
+from input_files.signTx import AssetGroup, Datum, DatumType, TxAuxiliaryDataHash, RequiredSigner
+from input_files.signTx import Certificate, CertificateType, CredentialParams, CredentialParamsType
+from input_files.signTx import DRepParams, DRepParamsType, AnchorParams, Withdrawal, VoterVotes, VoterType
+from input_files.signTx import StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams
+from input_files.signTx import VoteDelegationParams, AuthorizeCommitteeParams, ResignCommitteeParams
+from input_files.signTx import DRepRegistrationParams, DRepUpdateParams, PoolRetirementParams
+from input_files.signTx import PoolRegistrationParams, PoolKey, PoolKeyType, Relay, RelayType
+from input_files.signTx import SingleHostIpAddrRelayParams, SingleHostHostnameRelayParams, MultiHostRelayParams
+from application_client.tx_hash_builder import CborHashWriter, CborType, CborTag, TxBodyKey, TxOutputKey
+
+
+# Host side resolvers of the data the device derives from its keys
+KeyHashResolver = Callable[[str], bytes]
+AddressResolver = Callable[[DeriveAddressTestCase], bytes]
+
+
+# Reward address header: (AddressType << 4) | networkId
+_REWARD_KEY_HEADER = 0xE0
+_REWARD_SCRIPT_HEADER = 0xF0
+
+# Voters given by a key path are serialized with their key hash type
+_VOTER_KEY_PATH_TYPES = {
+    VoterType.COMMITTEE_KEY_PATH: VoterType.COMMITTEE_KEY_HASH,
+    VoterType.DREP_KEY_PATH: VoterType.DREP_KEY_HASH,
+    VoterType.STAKE_POOL_KEY_PATH: VoterType.STAKE_POOL_KEY_HASH,
+}
+
+
+class TxEncoder:
+    """Reference encoder of the TX body, as hashed by the device
+
+    The data derived by the device from its keys (key hashes of paths,
+    device owned addresses) are provided by the resolvers, so that the
+    encoder itself only relies on the test case content.
+    """
+
+    def __init__(self, keyHash: KeyHashResolver, address: AddressResolver) -> None:
+        self._keyHash = keyHash
+        self._address = address
+
+
+    def encode(self, testCase: SignTxTestCase) -> Tuple[bytes, bytes]:
+        """Serialize the TX body of a test case
+
+        Args:
+            testCase (SignTxTestCase): The test case
+
+        Returns:
+            Tuple of:
+                - The serialized TX body
+                - The TX body hash
+        """
+
+        writer = CborHashWriter(keepData=True)
+        self.write(writer, testCase.tx, testCase.options)
+        return writer.getData(), writer.digest()
+
+
+    def hash(self, testCase: SignTxTestCase) -> bytes:
+        """Compute the TX body hash of a test case, without keeping the body
+
+        Args:
+            testCase (SignTxTestCase): The test case
+
+        Returns:
+            The TX body hash
+        """
+
+        writer = CborHashWriter()
+        self.write(writer, testCase.tx, testCase.options)
+        return writer.digest()
+
+
+    def write(self, writer: CborHashWriter, tx: Transaction, tagCborSets: bool = False) -> None:
+        """Write a TX body, in the device order
+
+        Args:
+            writer (CborHashWriter): The destination writer
+            tx (Transaction): The transaction
+            tagCborSets (bool): Tag the sets (tag 258), as requested by the TX options
+        """
+
+        writer.token(CborType.MAP, self._countItems(tx))
+
+        writer.token(CborType.UNSIGNED, TxBodyKey.INPUTS)
+        self._writeInputs(writer, tx.inputs, tagCborSets)
+
+        writer.token(CborType.UNSIGNED, TxBodyKey.OUTPUTS)
+        writer.token(CborType.ARRAY, len(tx.outputs))
+        for txOutput in tx.outputs:
+            self._writeOutput(writer, txOutput)
+
+        writer.token(CborType.UNSIGNED, TxBodyKey.FEE)
+        writer.token(CborType.UNSIGNED, tx.fee)
+
+        if tx.ttl is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.TTL)
+            writer.token(CborType.UNSIGNED, tx.ttl)
+
+        if len(tx.certificates) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.CERTIFICATES)
+            self._tagSet(writer, tagCborSets)
+            writer.token(CborType.ARRAY, len(tx.certificates))
+            for certificate in tx.certificates:
+                self._writeCertificate(writer, certificate, tx, tagCborSets)
+
+        if len(tx.withdrawals) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.WITHDRAWALS)
+            writer.token(CborType.MAP, len(tx.withdrawals))
+            for withdrawal in tx.withdrawals:
+                self._writeWithdrawal(writer, withdrawal, tx)
+
+        if tx.auxiliaryData is not None:
+            if not isinstance(tx.auxiliaryData.params, TxAuxiliaryDataHash):
+                # The CIP36 registration hash includes a signature computed by the device
+                raise NotImplementedError("Only the auxiliary data given by their hash are supported")
+            writer.token(CborType.UNSIGNED, TxBodyKey.AUX_DATA)
+            writer.byteString(bytes.fromhex(tx.auxiliaryData.params.hashHex))
+
+        if tx.validityIntervalStart is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.VALIDITY_INTERVAL_START)
+            writer.token(CborType.UNSIGNED, tx.validityIntervalStart)
+
+        if len(tx.mint) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.MINT)
+            self._writeMultiasset(writer, tx.mint)
+
+        if tx.scriptDataHash is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.SCRIPT_HASH_DATA)
+            writer.byteString(bytes.fromhex(tx.scriptDataHash))
+
+        if len(tx.collateralInputs) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.COLLATERAL_INPUTS)
+            self._writeInputs(writer, tx.collateralInputs, tagCborSets)
+
+        if len(tx.requiredSigners) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.REQUIRED_SIGNERS)
+            self._tagSet(writer, tagCborSets)
+            writer.token(CborType.ARRAY, len(tx.requiredSigners))
+            for signer in tx.requiredSigners:
+                writer.byteString(self._requiredSignerHash(signer))
+
+        if tx.includeNetworkId is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.NETWORK_ID)
+            writer.token(CborType.UNSIGNED, tx.network.networkId)
+
+        if tx.collateralOutput is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.COLLATERAL_OUTPUT)
+            self._writeOutput(writer, tx.collateralOutput)
+
+        if tx.totalCollateral is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.TOTAL_COLLATERAL)
+            writer.token(CborType.UNSIGNED, tx.totalCollateral)
+
+        if len(tx.referenceInputs) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.REFERENCE_INPUTS)
+            self._writeInputs(writer, tx.referenceInputs, tagCborSets)
+
+        if len(tx.votingProcedures) > 0:
+            writer.token(CborType.UNSIGNED, TxBodyKey.VOTING_PROCEDURES)
+            writer.token(CborType.MAP, len(tx.votingProcedures))
+            for voterVotes in tx.votingProcedures:
+                self._writeVoterVotes(writer, voterVotes)
+
+        if tx.treasury is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.TREASURY)
+            writer.token(CborType.UNSIGNED, tx.treasury)
+
+        if tx.donation is not None:
+            writer.token(CborType.UNSIGNED, TxBodyKey.DONATION)
+            writer.token(CborType.UNSIGNED, tx.donation)
+
+
+    @staticmethod
+    def _countItems(tx: Transaction) -> int:
+        """Number of items of the TX body map"""
+
+        # inputs, outputs and fee are always included
+        optionalItems: List[bool] = [
+            tx.ttl is not None,
+            len(tx.certificates) > 0,
+            len(tx.withdrawals) > 0,
+            tx.auxiliaryData is not None,
+            tx.validityIntervalStart is not None,
+            len(tx.mint) > 0,
+            tx.scriptDataHash is not None,
+            len(tx.collateralInputs) > 0,
+            len(tx.requiredSigners) > 0,
+            tx.includeNetworkId is not None,
+            tx.collateralOutput is not None,
+            tx.totalCollateral is not None,
+            len(tx.referenceInputs) > 0,
+            len(tx.votingProcedures) > 0,
+            tx.treasury is not None,
+            tx.donation is not None,
+        ]
+        return 3 + sum(optionalItems)
+
+
+    @staticmethod
+    def _tagSet(writer: CborHashWriter, tagCborSets: bool) -> None:
+        """Tag a set, if requested by the TX options"""
+
+        if tagCborSets:
+            writer.token(CborType.TAG, CborTag.SET)
+
+
+    def _writeInputs(self, writer: CborHashWriter, txInputs: List[TxInput], tagCborSets: bool) -> None:
+        """Write a set of inputs"""
+
+        # Array(2)[
+        #    Bytes[hash],
+        #    Unsigned[index]
+        # ]
+        self._tagSet(writer, tagCborSets)
+        writer.token(CborType.ARRAY, len(txInputs))
+        for txInput in txInputs:
+            writer.token(CborType.ARRAY, 2)
+            writer.byteString(bytes.fromhex(txInput.txHashHex))
+            writer.token(CborType.UNSIGNED, txInput.outputIndex)
+
+
+    def _writeOutput(self, writer: CborHashWriter, txOutput: TxOutput) -> None:
+        """Write an output, with the legacy array or babbage map format"""
+
+        address = self._destinationAddress(txOutput.destination)
+        refScript = txOutput.referenceScriptHex if isinstance(txOutput, TxOutputBabbage) else None
+        if txOutput.format == TxOutputFormat.ARRAY_LEGACY:
+            # Array(2 + includeDatumHash)[
+            #   Bytes[address]
+            #   value
+            #   ? datum_hash = $hash32
+            # ]
+            writer.token(CborType.ARRAY, 2 + (txOutput.datum is not None))
+            writer.byteString(address)
+            self._writeValue(writer, txOutput.amount, txOutput.tokenBundle)
+            if txOutput.datum is not None:
+                if txOutput.datum.type != DatumType.HASH:
+                    raise ValueError("Inline datum is only supported with the babbage output format")
+                writer.byteString(bytes.fromhex(txOutput.datum.datumHex))
+        else:
+            # Map(2 + includeDatum + includeRefScript)[
+            #   Unsigned[0] Bytes[address]
+            #   Unsigned[1] value
+            #   ? Unsigned[2] datum_option
+            #   ? Unsigned[3] script_ref
+            # ]
+            writer.token(CborType.MAP, 2 + (txOutput.datum is not None) + (refScript is not None))
+            writer.token(CborType.UNSIGNED, TxOutputKey.ADDRESS)
+            writer.byteString(address)
+            writer.token(CborType.UNSIGNED, TxOutputKey.VALUE)
+            self._writeValue(writer, txOutput.amount, txOutput.tokenBundle)
+            if txOutput.datum is not None:
+                writer.token(CborType.UNSIGNED, TxOutputKey.DATUM_OPTION)
+                self._writeDatumOption(writer, txOutput.datum)
+            if refScript is not None:
+                # #6.24(Bytes[script])
+                writer.token(CborType.UNSIGNED, TxOutputKey.SCRIPT_REF)
+                writer.token(CborType.TAG, CborTag.EMBEDDED_CBOR_BYTE_STRING)
+                writer.byteString(bytes.fromhex(refScript))
+
+
+    def _writeValue(self, writer: CborHashWriter, amount: int, tokenBundle: List[AssetGroup]) -> None:
+        """Write an output value: coin / [coin, multiasset<uint>]"""
+
+        if len(tokenBundle) == 0:
+            writer.token(CborType.UNSIGNED, amount)
+        else:
+            writer.token(CborType.ARRAY, 2)
+            writer.token(CborType.UNSIGNED, amount)
+            self._writeMultiasset(writer, tokenBundle)
+
+
+    @staticmethod
+    def _writeMultiasset(writer: CborHashWriter, assetGroups: List[AssetGroup]) -> None:
+        """Write a multiasset map, the amounts being negative for the burnt tokens"""
+
+        # Map(numAssetGroups)[
+        #   Bytes[policyId] Map(numTokens)[
+        #     Bytes[assetName] Unsigned[amount] / Negative[amount]
+        #   ]
+        # ]
+        writer.token(CborType.MAP, len(assetGroups))
+        for assetGroup in assetGroups:
+            writer.byteString(bytes.fromhex(assetGroup.policyIdHex))
+            writer.token(CborType.MAP, len(assetGroup.tokens))
+            for token in assetGroup.tokens:
+                writer.byteString(bytes.fromhex(token.assetNameHex))
+                writer.integer(token.amount)
+
+
+    @staticmethod
+    def _writeDatumOption(writer: CborHashWriter, datum: Datum) -> None:
+        """Write a babbage datum option: [0, $hash32 // 1, #6.24(data)]"""
+
+        writer.token(CborType.ARRAY, 2)
+        writer.token(CborType.UNSIGNED, datum.type)
+        if datum.type == DatumType.INLINE:
+            writer.token(CborType.TAG, CborTag.EMBEDDED_CBOR_BYTE_STRING)
+        writer.byteString(bytes.fromhex(datum.datumHex))
+
+
+    def _writeCertificate(self,
+                          writer: CborHashWriter,
+                          certificate: Certificate,
+                          tx: Transaction,
+                          tagCborSets: bool) -> None:
+        """Write a certificate"""
+
+        params = certificate.params
+        if certificate.type in (CertificateType.STAKE_REGISTRATION, CertificateType.STAKE_DEREGISTRATION):
+            assert isinstance(params, StakeRegistrationParams)
+            writer.token(CborType.ARRAY, 2)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.stakeCredential)
+        elif certificate.type in (CertificateType.STAKE_REGISTRATION_CONWAY, CertificateType.STAKE_DEREGISTRATION_CONWAY):
+            assert isinstance(params, StakeRegistrationConwayParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.stakeCredential)
+            writer.token(CborType.UNSIGNED, params.deposit)
+        elif certificate.type == CertificateType.STAKE_DELEGATION:
+            assert isinstance(params, StakeDelegationParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.stakeCredential)
+            writer.byteString(bytes.fromhex(params.poolKeyHash))
+        elif certificate.type == CertificateType.VOTE_DELEGATION:
+            assert isinstance(params, VoteDelegationParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.stakeCredential)
+            self._writeDRep(writer, params.dRep)
+        elif certificate.type == CertificateType.AUTHORIZE_COMMITTEE_HOT:
+            assert isinstance(params, AuthorizeCommitteeParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.coldCredential)
+            self._writeCredential(writer, params.hotCredential)
+        elif certificate.type == CertificateType.RESIGN_COMMITTEE_COLD:
+            assert isinstance(params, ResignCommitteeParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.coldCredential)
+            self._writeAnchor(writer, params.anchor)
+        elif certificate.type == CertificateType.DREP_REGISTRATION:
+            assert isinstance(params, DRepRegistrationParams)
+            writer.token(CborType.ARRAY, 4)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.dRepCredential)
+            writer.token(CborType.UNSIGNED, params.deposit)
+            self._writeAnchor(writer, params.anchor)
+        elif certificate.type == CertificateType.DREP_DEREGISTRATION:
+            assert isinstance(params, DRepRegistrationParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.dRepCredential)
+            writer.token(CborType.UNSIGNED, params.deposit)
+        elif certificate.type == CertificateType.DREP_UPDATE:
+            assert isinstance(params, DRepUpdateParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            self._writeCredential(writer, params.dRepCredential)
+            self._writeAnchor(writer, params.anchor)
+        elif certificate.type == CertificateType.STAKE_POOL_RETIREMENT:
+            assert isinstance(params, PoolRetirementParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, certificate.type)
+            writer.byteString(self._hashOrKeyHash(params.poolKeyPath))
+            writer.token(CborType.UNSIGNED, params.retirementEpoch)
+        elif certificate.type == CertificateType.STAKE_POOL_REGISTRATION:
+            assert isinstance(params, PoolRegistrationParams)
+            self._writePoolRegistration(writer, params, tx, tagCborSets)
+        else:
+            raise NotImplementedError("Not implemented yet")
+
+
+    def _writePoolRegistration(self,
+                               writer: CborHashWriter,
+                               pool: PoolRegistrationParams,
+                               tx: Transaction,
+                               tagCborSets: bool) -> None:
+        """Write a pool registration certificate"""
+
+        # Array(10)[
+        #   Unsigned[3]
+        #   Bytes[pool_keyhash]
+        #   Bytes[vrf_keyhash]
+        #   Unsigned[pledge]
+        #   Unsigned[cost]
+        #   Tag(30) Array(2)[Unsigned[marginNumerator], Unsigned[marginDenominator]]
+        #   Bytes[rewardAccount]
+        #   Array(numOwners)[Bytes[ownerKeyHash]]
+        #   Array(numRelays)[relay]
+        #   Array(2)[Tstr[url], Bytes[metadataHash]] / Null
+        # ]
+        writer.token(CborType.ARRAY, 10)
+        writer.token(CborType.UNSIGNED, CertificateType.STAKE_POOL_REGISTRATION)
+        writer.byteString(self._poolKeyHash(pool.poolKey))
+        writer.byteString(bytes.fromhex(pool.vrfKeyHashHex))
+        writer.token(CborType.UNSIGNED, pool.pledge)
+        writer.token(CborType.UNSIGNED, pool.cost)
+        writer.token(CborType.TAG, CborTag.UNIT_INTERVAL)
+        writer.token(CborType.ARRAY, 2)
+        writer.token(CborType.UNSIGNED, pool.margin.numerator)
+        writer.token(CborType.UNSIGNED, pool.margin.denominator)
+        if pool.rewardAccount.type == PoolKeyType.DEVICE_OWNED:
+            writer.byteString(self._rewardAddress(_REWARD_KEY_HEADER, self._keyHash(pool.rewardAccount.key), tx))
+        else:
+            writer.byteString(bytes.fromhex(pool.rewardAccount.key))
+        self._tagSet(writer, tagCborSets)
+        writer.token(CborType.ARRAY, len(pool.poolOwners))
+        for owner in pool.poolOwners:
+            writer.byteString(self._poolKeyHash(owner))
+        writer.token(CborType.ARRAY, len(pool.relays))
+        for relay in pool.relays:
+            self._writeRelay(writer, relay)
+        if pool.metadata is None:
+            writer.token(CborType.NULL)
+        else:
+            writer.token(CborType.ARRAY, 2)
+            writer.text(pool.metadata.metadataUrl)
+            writer.byteString(bytes.fromhex(pool.metadata.metadataHashHex))
+
+
+    @staticmethod
+    def _writeRelay(writer: CborHashWriter, relay: Relay) -> None:
+        """Write a pool relay"""
+
+        params = relay.params
+        if relay.type == RelayType.SINGLE_HOST_IP_ADDR:
+            # Array(4)[Unsigned[0], Unsigned[port] / Null, Bytes[ipv4] / Null, Bytes[ipv6] / Null]
+            assert isinstance(params, SingleHostIpAddrRelayParams)
+            writer.token(CborType.ARRAY, 4)
+            writer.token(CborType.UNSIGNED, relay.type)
+            TxEncoder._writePort(writer, params.portNumber)
+            if params.ipv4 is None:
+                writer.token(CborType.NULL)
+            else:
+                writer.byteString(bytes(int(part) for part in params.ipv4.split(".")))
+            if params.ipv6 is None:
+                writer.token(CborType.NULL)
+            else:
+                # The device serializes the address as 4 big-endian uint32, read in its native order
+                ipv6 = bytes.fromhex(params.ipv6.replace(":", ""))
+                writer.byteString(b"".join(ipv6[i:i + 4][::-1] for i in range(0, len(ipv6), 4)))
+        elif relay.type == RelayType.SINGLE_HOST_HOSTNAME:
+            # Array(3)[Unsigned[1], Unsigned[port] / Null, Text[dnsName]]
+            assert isinstance(params, SingleHostHostnameRelayParams)
+            writer.token(CborType.ARRAY, 3)
+            writer.token(CborType.UNSIGNED, relay.type)
+            TxEncoder._writePort(writer, params.portNumber)
+            writer.text(params.dnsName)
+        else:
+            # Array(2)[Unsigned[2], Text[dnsName]]
+            assert isinstance(params, MultiHostRelayParams)
+            writer.token(CborType.ARRAY, 2)
+            writer.token(CborType.UNSIGNED, relay.type)
+            writer.text(params.dnsName)
+
+
+    @staticmethod
+    def _writePort(writer: CborHashWriter, port: Optional[int]) -> None:
+        """Write a relay port: Unsigned[port] / Null"""
+
+        if port is None:
+            writer.token(CborType.NULL)
+        else:
+            writer.token(CborType.UNSIGNED, port)
+
+
+    def _writeWithdrawal(self, writer: CborHashWriter, withdrawal: Withdrawal, tx: Transaction) -> None:
+        """Write a withdrawal map entry: Bytes[rewardAddress] Unsigned[amount]"""
+
+        credential = withdrawal.stakeCredential
+        assert credential.keyValue is not None
+        if credential.type == CredentialParamsType.SCRIPT_HASH:
+            address = self._rewardAddress(_REWARD_SCRIPT_HEADER, bytes.fromhex(credential.keyValue), tx)
+        else:
+            address = self._rewardAddress(_REWARD_KEY_HEADER, self._hashOrKeyHash(credential.keyValue), tx)
+        writer.byteString(address)
+        writer.token(CborType.UNSIGNED, withdrawal.amount)
+
+
+    def _writeVoterVotes(self, writer: CborHashWriter, voterVotes: VoterVotes) -> None:
+        """Write the votes of a voter, the device supporting a single vote"""
+
+        if len(voterVotes.votes) != 1:
+            raise ValueError("Only a single vote per voter is supported")
+        voter = voterVotes.voter
+        # Array(2)[Unsigned[voter type], Bytes[key or script hash]]
+        writer.token(CborType.ARRAY, 2)
+        writer.token(CborType.UNSIGNED, _VOTER_KEY_PATH_TYPES.get(voter.type, voter.type))
+        writer.byteString(self._hashOrKeyHash(voter.keyValue))
+        vote = voterVotes.votes[0]
+        # Map(1)[
+        #   Array(2)[Bytes[txHash], Unsigned[govActionIndex]]
+        #   Array(2)[Unsigned[vote], Null / ...anchor]
+        # ]
+        writer.token(CborType.MAP, 1)
+        writer.token(CborType.ARRAY, 2)
+        writer.byteString(bytes.fromhex(vote.govActionId.txHashHex))
+        writer.token(CborType.UNSIGNED, vote.govActionId.govActionIndex)
+        writer.token(CborType.ARRAY, 2)
+        writer.token(CborType.UNSIGNED, vote.votingProcedure.vote)
+        self._writeAnchor(writer, vote.votingProcedure.anchor)
+
+
+    def _writeCredential(self, writer: CborHashWriter, credential: CredentialParams) -> None:
+        """Write a credential: Array(2)[Unsigned[0 / 1], Bytes[key / script hash]]"""
+
+        assert credential.keyValue is not None
+        writer.token(CborType.ARRAY, 2)
+        if credential.type == CredentialParamsType.SCRIPT_HASH:
+            writer.token(CborType.UNSIGNED, 1)
+            writer.byteString(bytes.fromhex(credential.keyValue))
+        else:
+            writer.token(CborType.UNSIGNED, 0)
+            writer.byteString(self._hashOrKeyHash(credential.keyValue))
+
+
+    def _writeDRep(self, writer: CborHashWriter, dRep: DRepParams) -> None:
+        """Write a DRep: Array(1 or 2)[Unsigned[drep type], ?Bytes[key / script hash]]"""
+
+        if dRep.type in (DRepParamsType.ABSTAIN, DRepParamsType.NO_CONFIDENCE):
+            writer.token(CborType.ARRAY, 1)
+            writer.token(CborType.UNSIGNED, dRep.type)
+            return
+        assert dRep.keyValue is not None
+        writer.token(CborType.ARRAY, 2)
+        if dRep.type == DRepParamsType.SCRIPT_HASH:
+            writer.token(CborType.UNSIGNED, DRepParamsType.SCRIPT_HASH)
+            writer.byteString(bytes.fromhex(dRep.keyValue))
+        else:
+            writer.token(CborType.UNSIGNED, DRepParamsType.KEY_HASH)
+            writer.byteString(self._hashOrKeyHash(dRep.keyValue))
+
+
+    @staticmethod
+    def _writeAnchor(writer: CborHashWriter, anchor: Optional[AnchorParams]) -> None:
+        """Write an anchor: Array(2)[Tstr[url], Bytes[hash]] / Null"""
+
+        if anchor is None:
+            writer.token(CborType.NULL)
+        else:
+            writer.token(CborType.ARRAY, 2)
+            writer.text(anchor.url)
+            writer.byteString(bytes.fromhex(anchor.hashHex))
+
+
+    def _destinationAddress(self, destination: TxOutputDestination) -> bytes:
+        """Address of an output destination, derived for the device owned ones"""
+
+        if destination.type == TxOutputDestinationType.THIRD_PARTY:
+            assert isinstance(destination.params, ThirdPartyAddressParams)
+            return bytes.fromhex(destination.params.addressHex)
+        assert isinstance(destination.params, DeriveAddressTestCase)
+        return self._address(destination.params)
+
+
+    def _requiredSignerHash(self, signer: RequiredSigner) -> bytes:
+        """Key hash of a required signer"""
+
+        return self._hashOrKeyHash(signer.addressHex)
+
+
+    def _poolKeyHash(self, poolKey: PoolKey) -> bytes:
+        """Key hash of a pool key or owner"""
+
+        if poolKey.type == PoolKeyType.DEVICE_OWNED:
+            return self._keyHash(poolKey.key)
+        return bytes.fromhex(poolKey.key)
+
+
+    def _hashOrKeyHash(self, value: str) -> bytes:
+        """Hash given as hex string, or key hash of a derivation path"""
+
+        if value.startswith("m/"):
+            return self._keyHash(value)
+        return bytes.fromhex(value)
+
+
+    @staticmethod
+    def _rewardAddress(header: int, keyHash: bytes, tx: Transaction) -> bytes:
+        """Reward address of a stake credential, on the TX network"""
+
+        return bytes([header | tx.network.networkId]) + keyHash
+
+
+def _unresolved(_: object) -> bytes:
+    """Resolver of the transactions without any device owned data"""
+
+    raise ValueError("Only third party data can be encoded without the device keys")
+
+
+# Encoder of the transactions only containing third party data, without any key derivation
+THIRD_PARTY_ENCODER = TxEncoder(_unresolved, _unresolved)
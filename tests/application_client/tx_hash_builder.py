@@ -0,0 +1,1371 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a TX hash builder mirroring the device one (src/txHashBuilder/txHashBuilder.c):
+the TX body is given item by item through the same state machine, with the same
+state checks, and streamed as CBOR into a running blake2b-256 hash.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+import hashlib
+import struct
+
+from input_files.signTx import CertificateType, DatumType, DRepParamsType, RelayType
+from input_files.signTx import TxOutputFormat, VoteOption, VoterType
+
+
+TX_HASH_SIZE = 32
+
+# Size of the hashing buffer, flushed into the running hash when full
+HASH_BUFFER_SIZE = 4096
+
+# Sizes checked by the device
+ADDRESS_KEY_HASH_LENGTH = 28
+SCRIPT_HASH_LENGTH = 28
+POOL_KEY_HASH_LENGTH = 28
+VRF_KEY_HASH_LENGTH = 32
+REWARD_ACCOUNT_SIZE = 1 + ADDRESS_KEY_HASH_LENGTH
+MINTING_POLICY_ID_SIZE = SCRIPT_HASH_LENGTH
+ASSET_NAME_SIZE_MAX = 32
+OUTPUT_DATUM_HASH_LENGTH = 32
+AUX_DATA_HASH_LENGTH = 32
+SCRIPT_DATA_HASH_LENGTH = 32
+POOL_METADATA_HASH_LENGTH = 32
+ANCHOR_HASH_LENGTH = 32
+DNS_NAME_SIZE_MAX = 128
+IPV4_SIZE = 4
+IPV6_SIZE = 16
+
+
+class CborType(IntEnum):
+    UNSIGNED = 0x00
+    NEGATIVE = 0x20
+    BYTES = 0x40
+    TEXT = 0x60
+    ARRAY = 0x80
+    MAP = 0xA0
+    TAG = 0xC0
+    PRIMITIVES = 0xE0
+    NULL = 0xF6
+
+
+class CborTag(IntEnum):
+    EMBEDDED_CBOR_BYTE_STRING = 24
+    UNIT_INTERVAL = 30
+    SET = 258
+
+
+class TxBodyKey(IntEnum):
+    INPUTS = 0
+    OUTPUTS = 1
+    FEE = 2
+    TTL = 3
+    CERTIFICATES = 4
+    WITHDRAWALS = 5
+    AUX_DATA = 7
+    VALIDITY_INTERVAL_START = 8
+    MINT = 9
+    SCRIPT_HASH_DATA = 11
+    COLLATERAL_INPUTS = 13
+    REQUIRED_SIGNERS = 14
+    NETWORK_ID = 15
+    COLLATERAL_OUTPUT = 16
+    TOTAL_COLLATERAL = 17
+    REFERENCE_INPUTS = 18
+    VOTING_PROCEDURES = 19
+    TREASURY = 21
+    DONATION = 22
+
+
+class TxOutputKey(IntEnum):
+    ADDRESS = 0
+    VALUE = 1
+    DATUM_OPTION = 2
+    SCRIPT_REF = 3
+
+
+class TxHashBuilderState(IntEnum):
+    INIT = 100
+    IN_INPUTS = 200
+    IN_OUTPUTS = 300
+    IN_FEE = 400
+    IN_TTL = 500
+    IN_CERTIFICATES = 600
+    IN_CERTIFICATES_POOL_INIT = 610
+    IN_CERTIFICATES_POOL_KEY_HASH = 611
+    IN_CERTIFICATES_POOL_VRF = 612
+    IN_CERTIFICATES_POOL_FINANCIALS = 613
+    IN_CERTIFICATES_POOL_REWARD_ACCOUNT = 614
+    IN_CERTIFICATES_POOL_OWNERS = 615
+    IN_CERTIFICATES_POOL_RELAYS = 616
+    IN_CERTIFICATES_POOL_METADATA = 617
+    IN_WITHDRAWALS = 700
+    IN_AUX_DATA = 800
+    IN_VALIDITY_INTERVAL_START = 900
+    IN_MINT = 1000
+    IN_SCRIPT_DATA_HASH = 1100
+    IN_COLLATERAL_INPUTS = 1200
+    IN_REQUIRED_SIGNERS = 1300
+    IN_NETWORK_ID = 1400
+    IN_COLLATERAL_OUTPUT = 1500
+    IN_TOTAL_COLLATERAL = 1600
+    IN_REFERENCE_INPUTS = 1700
+    IN_VOTING_PROCEDURES = 1800
+    IN_TREASURY = 1900
+    IN_DONATION = 2000
+    FINISHED = 2100
+
+
+class TxOutputState(IntEnum):
+    INIT = 10
+    TOP_LEVEL_DATA = 11
+    ASSET_GROUP = 13
+    DATUM_HASH = 20
+    DATUM_INLINE = 21
+    SCRIPT_REFERENCE_CHUNKS = 31
+
+
+class CredentialType(IntEnum):
+    KEY_HASH = 0
+    SCRIPT_HASH = 1
+
+
+@dataclass
+class Credential:
+    type: CredentialType
+    hash: bytes
+
+
+@dataclass
+class DRep:
+    type: DRepParamsType
+    hash: Optional[bytes] = None  # key or script hash, if any
+
+
+@dataclass
+class Anchor:
+    url: str
+    hash: bytes
+
+
+@dataclass
+class Voter:
+    type: VoterType  # only the key and script hash types
+    hash: bytes
+
+
+@dataclass
+class TxOutputDescription:
+    format: TxOutputFormat
+    address: bytes
+    amount: int
+    numAssetGroups: int = 0
+    includeDatum: bool = False
+    includeRefScript: bool = False
+
+
+@dataclass
+class PoolRelay:
+    type: RelayType
+    port: Optional[int] = None
+    ipv4: Optional[bytes] = None
+    ipv6: Optional[bytes] = None  # as serialized, i.e. 4 big-endian uint32
+    dnsName: Optional[str] = None
+
+
+_CBOR_W1 = struct.Struct(">BB")
+_CBOR_W2 = struct.Struct(">BH")
+_CBOR_W4 = struct.Struct(">BI")
+_CBOR_W8 = struct.Struct(">BQ")
+
+
+class CborHashWriter:
+    """Write CBOR tokens into a running blake2b hash (blake2b-256 by default)
+
+    The tokens are encoded as the device does (cbor_writeToken), with the
+    shortest definite length. They are buffered and hashed by blocks,
+    the serialized data being kept only on request.
+    """
+
+    def __init__(self, keepData: bool = False, digestSize: int = TX_HASH_SIZE) -> None:
+        self._hash = hashlib.blake2b(digest_size=digestSize)
+        self._buffer = bytearray()
+        self._data: Optional[bytearray] = bytearray() if keepData else None
+
+
+    def token(self, cborType: CborType, value: int = 0) -> None:
+        """Append a CBOR token
+
+        Args:
+            cborType (CborType): The token major type
+            value (int): The token value; the integer itself for NEGATIVE
+        """
+
+        if cborType == CborType.NULL:
+            self._buffer.append(CborType.NULL)
+        else:
+            if cborType == CborType.NEGATIVE:
+                if value >= 0:
+                    raise ValueError(f"Not a negative value: {value}")
+                value = -value - 1
+            if value < 0 or value >= 1 << 64:
+                raise ValueError(f"Value out of range: {value}")
+            if value < 24:
+                self._buffer.append(cborType | value)
+            elif value < 0x100:
+                self._buffer += _CBOR_W1.pack(cborType | 24, value)
+            elif value < 0x10000:
+                self._buffer += _CBOR_W2.pack(cborType | 25, value)
+            elif value < 0x100000000:
+                self._buffer += _CBOR_W4.pack(cborType | 26, value)
+            else:
+                self._buffer += _CBOR_W8.pack(cborType | 27, value)
+        if len(self._buffer) >= HASH_BUFFER_SIZE:
+            self._flush()
+
+
+    def integer(self, value: int) -> None:
+        """Append an UNSIGNED or NEGATIVE token, depending on the value sign"""
+
+        self.token(CborType.NEGATIVE if value < 0 else CborType.UNSIGNED, value)
+
+
+    def data(self, buffer: bytes) -> None:
+        """Append raw data, without any CBOR header"""
+
+        self._buffer += buffer
+        if len(self._buffer) >= HASH_BUFFER_SIZE:
+            self._flush()
+
+
+    def byteString(self, buffer: bytes) -> None:
+        """Append a byte string"""
+
+        self.token(CborType.BYTES, len(buffer))
+        self.data(buffer)
+
+
+    def text(self, value: str) -> None:
+        """Append a text string"""
+
+        encoded = value.encode("utf-8")
+        self.token(CborType.TEXT, len(encoded))
+        self.data(encoded)
+
+
+    def digest(self) -> bytes:
+        """Finalize the hash of the written data
+
+        Returns:
+            The blake2b digest
+        """
+
+        self._flush()
+        return self._hash.digest()
+
+
+    def getData(self) -> bytes:
+        """Retrieve the written data, if kept
+
+        Returns:
+            The serialized CBOR
+        """
+
+        if self._data is None:
+            raise ValueError("The written data is not kept")
+        self._flush()
+        return bytes(self._data)
+
+
+    def _flush(self) -> None:
+        """Hash the buffered data"""
+
+        self._hash.update(self._buffer)
+        if self._data is not None:
+            self._data += self._buffer
+        self._buffer.clear()
+
+
+class TxHashBuilder:
+    """TX body hash builder, driven by the same calls as the device one
+
+    Each method mirrors the txHashBuilder_* function of the same name. A call
+    the device would reject with a failed ASSERT raises a ValueError naming
+    the failed check, the builder being unusable afterwards as on the device.
+    The body is only kept if requested, so any body size is hashed in
+    constant memory.
+    """
+
+    def __init__(self,
+                 numInputs: int,
+                 numOutputs: int,
+                 tagCborSets: bool = False,
+                 includeTtl: bool = False,
+                 numCertificates: int = 0,
+                 numWithdrawals: int = 0,
+                 includeAuxData: bool = False,
+                 includeValidityIntervalStart: bool = False,
+                 includeMint: bool = False,
+                 includeScriptDataHash: bool = False,
+                 numCollateralInputs: int = 0,
+                 numRequiredSigners: int = 0,
+                 includeNetworkId: bool = False,
+                 includeCollateralOutput: bool = False,
+                 includeTotalCollateral: bool = False,
+                 numReferenceInputs: int = 0,
+                 numVotingProcedures: int = 0,
+                 includeTreasury: bool = False,
+                 includeDonation: bool = False,
+                 keepData: bool = False) -> None:
+        self._writer = CborHashWriter(keepData)
+        self.tagCborSets = tagCborSets
+
+        self.remainingInputs = numInputs
+        self.remainingOutputs = numOutputs
+        self.includeTtl = includeTtl
+        self.remainingCertificates = numCertificates
+        self.remainingWithdrawals = numWithdrawals
+        self.includeAuxData = includeAuxData
+        self.includeValidityIntervalStart = includeValidityIntervalStart
+        self.includeMint = includeMint
+        self.includeScriptDataHash = includeScriptDataHash
+        self.remainingCollateralInputs = numCollateralInputs
+        self.remainingRequiredSigners = numRequiredSigners
+        self.includeNetworkId = includeNetworkId
+        self.includeCollateralOutput = includeCollateralOutput
+        self.includeTotalCollateral = includeTotalCollateral
+        self.remainingReferenceInputs = numReferenceInputs
+        self.remainingVotingProcedures = numVotingProcedures
+        self.includeTreasury = includeTreasury
+        self.includeDonation = includeDonation
+
+        # pool registration certificate data
+        self.remainingOwners = 0
+        self.remainingRelays = 0
+
+        # output data, the multiasset data being also used for mint
+        self.outputState = TxOutputState.INIT
+        self.serializationFormat = TxOutputFormat.ARRAY_LEGACY
+        self.includeDatum = False
+        self.includeRefScript = False
+        self.remainingAssetGroups = 0
+        self.remainingTokens = 0
+        self.datumRemainingBytes = 0
+        self.referenceScriptRemainingBytes = 0
+
+        # inputs, outputs and fee are always included
+        optionalItems = [
+            includeTtl,
+            numCertificates > 0,
+            numWithdrawals > 0,
+            includeAuxData,
+            includeValidityIntervalStart,
+            includeMint,
+            includeScriptDataHash,
+            numCollateralInputs > 0,
+            numRequiredSigners > 0,
+            includeNetworkId,
+            includeCollateralOutput,
+            includeTotalCollateral,
+            numReferenceInputs > 0,
+            numVotingProcedures > 0,
+            includeTreasury,
+            includeDonation,
+        ]
+        self._writer.token(CborType.MAP, 3 + sum(optionalItems))
+        self.state = TxHashBuilderState.INIT
+
+
+    def _assert(self, condition: bool, check: str) -> None:
+        """Fail as the device ASSERT, naming the failed check"""
+
+        if not condition:
+            raise ValueError(f"TX hash builder check failed in state {self.state.name}: {check}")
+
+
+    def _tagCborSet(self) -> None:
+        """Tag a set, if requested"""
+
+        if self.tagCborSets:
+            self._writer.token(CborType.TAG, CborTag.SET)
+
+
+    def _appendBytes(self, buffer: bytes, size: int) -> None:
+        """Append a byte string of the expected size"""
+
+        self._assert(len(buffer) == size, f"size == {size}")
+        self._writer.byteString(buffer)
+
+
+    def _appendTxInput(self, txHash: bytes, index: int) -> None:
+        """Append an input: Array(2)[Bytes[hash], Unsigned[index]]"""
+
+        self._writer.token(CborType.ARRAY, 2)
+        self._appendBytes(txHash, TX_HASH_SIZE)
+        self._writer.token(CborType.UNSIGNED, index)
+
+
+    def _appendCredential(self, credential: Credential) -> None:
+        """Append a credential: Array(2)[Unsigned[0 / 1], Bytes[key / script hash]]"""
+
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, credential.type)
+        self._appendBytes(credential.hash, ADDRESS_KEY_HASH_LENGTH)
+
+
+    def _appendAnchor(self, anchor: Optional[Anchor]) -> None:
+        """Append an anchor: Array(2)[Tstr[url], Bytes[hash]] / Null"""
+
+        if anchor is None:
+            self._writer.token(CborType.NULL)
+        else:
+            self._writer.token(CborType.ARRAY, 2)
+            self._writer.text(anchor.url)
+            self._appendBytes(anchor.hash, ANCHOR_HASH_LENGTH)
+
+
+    # ============================== OUTPUTS DATA ==============================
+
+    def _processOutputTopLevel(self, output: TxOutputDescription) -> None:
+        """Append the address and coin of an output, and start its multiasset map"""
+
+        self.serializationFormat = output.format
+        self.includeDatum = output.includeDatum
+        self.includeRefScript = output.includeRefScript
+        self.remainingAssetGroups = output.numAssetGroups
+
+        if output.format == TxOutputFormat.ARRAY_LEGACY:
+            # Array(2 + includeDatumHash)[
+            #   Bytes[address]
+            #   value
+            #   ? datum_hash = $hash32 --- added later
+            # ]
+            self._writer.token(CborType.ARRAY, 2 + output.includeDatum)
+            self._writer.byteString(output.address)
+        else:
+            # Map(2 + includeDatum + includeRefScript)[
+            #   Unsigned[0] Bytes[address]
+            #   Unsigned[1] value
+            #   ? datum_option --- entry added later
+            #   ? script_ref --- entry added later
+            # ]
+            self._writer.token(CborType.MAP, 2 + output.includeDatum + output.includeRefScript)
+            self._writer.token(CborType.UNSIGNED, TxOutputKey.ADDRESS)
+            self._writer.byteString(output.address)
+            self._writer.token(CborType.UNSIGNED, TxOutputKey.VALUE)
+
+        if output.numAssetGroups == 0:
+            # value = Unsigned[amount]
+            self._writer.token(CborType.UNSIGNED, output.amount)
+        else:
+            # value = Array(2)[Unsigned[amount], Map(numAssetGroups)[entries added later]]
+            self._writer.token(CborType.ARRAY, 2)
+            self._writer.token(CborType.UNSIGNED, output.amount)
+            self._writer.token(CborType.MAP, output.numAssetGroups)
+
+
+    def _assertCanLeaveCurrentOutput(self) -> None:
+        """Check the current output is complete"""
+
+        if self.outputState in (TxOutputState.INIT, TxOutputState.TOP_LEVEL_DATA):
+            self._assert(self.remainingAssetGroups == 0, "remainingAssetGroups == 0")
+            self._assert(not self.includeDatum, "!includeDatum")
+            self._assert(not self.includeRefScript, "!includeRefScript")
+        elif self.outputState == TxOutputState.ASSET_GROUP:
+            self._assert(self.remainingAssetGroups == 0, "remainingAssetGroups == 0")
+            self._assert(self.remainingTokens == 0, "remainingTokens == 0")
+            self._assert(not self.includeDatum, "!includeDatum")
+            self._assert(not self.includeRefScript, "!includeRefScript")
+        elif self.outputState == TxOutputState.DATUM_HASH:
+            self._assert(not self.includeRefScript, "!includeRefScript")
+        elif self.outputState == TxOutputState.DATUM_INLINE:
+            self._assert(self.datumRemainingBytes == 0, "datumRemainingBytes == 0")
+            self._assert(not self.includeRefScript, "!includeRefScript")
+        else:
+            self._assert(self.referenceScriptRemainingBytes == 0, "referenceScriptRemainingBytes == 0")
+
+
+    def _addTokenGroup(self, policyId: bytes, numTokens: int) -> None:
+        """Start an asset group of an output or of the mint"""
+
+        if self.outputState == TxOutputState.ASSET_GROUP:
+            self._assert(self.remainingTokens == 0, "remainingTokens == 0")
+        else:
+            self._assert(self.outputState == TxOutputState.TOP_LEVEL_DATA, "outputState == TOP_LEVEL_DATA")
+        self._assert(self.remainingAssetGroups > 0, "remainingAssetGroups > 0")
+        self.remainingAssetGroups -= 1
+        self._assert(len(policyId) == MINTING_POLICY_ID_SIZE, f"policyIdSize == {MINTING_POLICY_ID_SIZE}")
+        self._assert(numTokens > 0, "numTokens > 0")
+        self.remainingTokens = numTokens
+
+        # Bytes[policyId]
+        # Map(numTokens)[entries added later]
+        self._writer.byteString(policyId)
+        self._writer.token(CborType.MAP, numTokens)
+        self.outputState = TxOutputState.ASSET_GROUP
+
+
+    def _addToken(self, assetName: bytes, amount: int) -> None:
+        """Add a token of the current asset group: Bytes[assetName] Unsigned[amount] / Negative[amount]"""
+
+        self._assert(self.outputState == TxOutputState.ASSET_GROUP, "outputState == ASSET_GROUP")
+        self._assert(self.remainingTokens > 0, "remainingTokens > 0")
+        self.remainingTokens -= 1
+        self._assert(len(assetName) <= ASSET_NAME_SIZE_MAX, f"assetNameSize <= {ASSET_NAME_SIZE_MAX}")
+
+        self._writer.byteString(assetName)
+        self._writer.integer(amount)
+        self.outputState = TxOutputState.ASSET_GROUP
+
+
+    # ============================== INPUTS ==============================
+
+    def enterInputs(self) -> None:
+        self._assert(self.state == TxHashBuilderState.INIT, "state == INIT")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.INPUTS)
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingInputs)
+        self.state = TxHashBuilderState.IN_INPUTS
+
+
+    def addInput(self, txHash: bytes, index: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_INPUTS, "state == IN_INPUTS")
+        self._assert(self.remainingInputs > 0, "remainingInputs > 0")
+        self.remainingInputs -= 1
+
+        self._appendTxInput(txHash, index)
+
+
+    def _assertCanLeaveInputs(self) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_INPUTS, "state == IN_INPUTS")
+        self._assert(self.remainingInputs == 0, "remainingInputs == 0")
+
+
+    # ============================== OUTPUTS ==============================
+
+    def enterOutputs(self) -> None:
+        self._assertCanLeaveInputs()
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.OUTPUTS)
+        self._writer.token(CborType.ARRAY, self.remainingOutputs)
+        self.state = TxHashBuilderState.IN_OUTPUTS
+        self.outputState = TxOutputState.INIT
+
+
+    def addOutputTopLevelData(self, output: TxOutputDescription) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_OUTPUTS, "state == IN_OUTPUTS")
+        self._assert(self.remainingOutputs > 0, "remainingOutputs > 0")
+        self.remainingOutputs -= 1
+        self._assertCanLeaveCurrentOutput()
+
+        self._processOutputTopLevel(output)
+        self.outputState = TxOutputState.TOP_LEVEL_DATA
+
+
+    def addOutputTokenGroup(self, policyId: bytes, numTokens: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_OUTPUTS, "state == IN_OUTPUTS")
+
+        self._addTokenGroup(policyId, numTokens)
+
+
+    def addOutputToken(self, assetName: bytes, amount: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_OUTPUTS, "state == IN_OUTPUTS")
+        self._assert(amount >= 0, "amount >= 0")
+
+        self._addToken(assetName, amount)
+
+
+    def addOutputDatum(self, datumType: DatumType, buffer: bytes, size: Optional[int] = None) -> None:
+        """Add the output datum
+
+        Args:
+            datumType (DatumType): The datum type
+            buffer (bytes): The datum hash, or the inline datum first chunk
+            size (Optional[int]): The total size of an inline datum, if given in several chunks
+        """
+
+        self._assert(self.includeDatum, "includeDatum")
+        if self.outputState == TxOutputState.ASSET_GROUP:
+            self._assert(self.remainingTokens == 0, "remainingTokens == 0")
+        else:
+            self._assert(self.outputState == TxOutputState.TOP_LEVEL_DATA, "outputState == TOP_LEVEL_DATA")
+        self._assert(self.remainingAssetGroups == 0, "remainingAssetGroups == 0")
+
+        if self.serializationFormat == TxOutputFormat.MAP_BABBAGE:
+            # Unsigned[2] Array(2)[Unsigned[datumType], Bytes[buffer] / #6.24(Bytes[buffer])]
+            self._writer.token(CborType.UNSIGNED, TxOutputKey.DATUM_OPTION)
+            self._writer.token(CborType.ARRAY, 2)
+            self._writer.token(CborType.UNSIGNED, datumType)
+
+        if datumType == DatumType.HASH:
+            self._appendBytes(buffer, OUTPUT_DATUM_HASH_LENGTH)
+            self.outputState = TxOutputState.DATUM_HASH
+        else:
+            self._assert(self.serializationFormat == TxOutputFormat.MAP_BABBAGE, "serializationFormat == MAP_BABBAGE")
+            self.datumRemainingBytes = len(buffer) if size is None else size
+            self._writer.token(CborType.TAG, CborTag.EMBEDDED_CBOR_BYTE_STRING)
+            self._writer.token(CborType.BYTES, self.datumRemainingBytes)
+            self.outputState = TxOutputState.DATUM_INLINE
+            self.addOutputDatumInlineChunk(buffer)
+
+
+    def addOutputDatumInlineChunk(self, buffer: bytes) -> None:
+        self._assert(self.outputState == TxOutputState.DATUM_INLINE, "outputState == DATUM_INLINE")
+        self._assert(len(buffer) <= self.datumRemainingBytes, "bufferSize <= datumRemainingBytes")
+        self.datumRemainingBytes -= len(buffer)
+
+        self._writer.data(buffer)
+
+
+    def addOutputReferenceScript(self, scriptSize: int) -> None:
+        self._assert(self.includeRefScript, "includeRefScript")
+        if self.outputState in (TxOutputState.TOP_LEVEL_DATA, TxOutputState.ASSET_GROUP):
+            if self.outputState == TxOutputState.ASSET_GROUP:
+                self._assert(self.remainingTokens == 0, "remainingTokens == 0")
+            self._assert(self.remainingAssetGroups == 0, "remainingAssetGroups == 0")
+        elif self.outputState == TxOutputState.DATUM_INLINE:
+            self._assert(self.datumRemainingBytes == 0, "datumRemainingBytes == 0")
+        else:
+            self._assert(self.outputState == TxOutputState.DATUM_HASH, "outputState == DATUM_HASH")
+
+        # Unsigned[3] #6.24(Bytes[script]), the chunks being added later
+        self._writer.token(CborType.UNSIGNED, TxOutputKey.SCRIPT_REF)
+        self._writer.token(CborType.TAG, CborTag.EMBEDDED_CBOR_BYTE_STRING)
+        self._writer.token(CborType.BYTES, scriptSize)
+        self.referenceScriptRemainingBytes = scriptSize
+        self.outputState = TxOutputState.SCRIPT_REFERENCE_CHUNKS
+
+
+    def addOutputReferenceScriptDataChunk(self, buffer: bytes) -> None:
+        self._assert(self.outputState == TxOutputState.SCRIPT_REFERENCE_CHUNKS,
+                     "outputState == SCRIPT_REFERENCE_CHUNKS")
+        self._assert(len(buffer) <= self.referenceScriptRemainingBytes, "bufferSize <= referenceScriptRemainingBytes")
+        self.referenceScriptRemainingBytes -= len(buffer)
+
+        self._writer.data(buffer)
+
+
+    def _assertCanLeaveOutputs(self) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_OUTPUTS, "state == IN_OUTPUTS")
+        self._assert(self.remainingOutputs == 0, "remainingOutputs == 0")
+        self._assertCanLeaveCurrentOutput()
+
+
+    # ============================== FEE ==============================
+
+    def addFee(self, fee: int) -> None:
+        self._assertCanLeaveOutputs()
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.FEE)
+        self._writer.token(CborType.UNSIGNED, fee)
+        self.state = TxHashBuilderState.IN_FEE
+
+
+    def _assertCanLeaveFee(self) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_FEE, "state == IN_FEE")
+
+
+    # ============================== TTL ==============================
+
+    def addTtl(self, ttl: int) -> None:
+        self._assertCanLeaveFee()
+        self._assert(self.includeTtl, "includeTtl")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.TTL)
+        self._writer.token(CborType.UNSIGNED, ttl)
+        self.state = TxHashBuilderState.IN_TTL
+
+
+    def _assertCanLeaveTtl(self) -> None:
+        if self.state != TxHashBuilderState.IN_TTL:
+            self._assert(not self.includeTtl, "!includeTtl")
+            self._assertCanLeaveFee()
+
+
+    # ============================== CERTIFICATES ==============================
+
+    def enterCertificates(self) -> None:
+        self._assertCanLeaveTtl()
+        self._assert(self.remainingCertificates > 0, "remainingCertificates > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.CERTIFICATES)
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingCertificates)
+        self.remainingOwners = 0
+        self.remainingRelays = 0
+        self.state = TxHashBuilderState.IN_CERTIFICATES
+
+
+    def _initNewCertificate(self) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES, "state == IN_CERTIFICATES")
+        self._assert(self.remainingCertificates > 0, "remainingCertificates > 0")
+        self.remainingCertificates -= 1
+
+
+    def addCertificateStakingOld(self, certificateType: CertificateType, stakeCredential: Credential) -> None:
+        self._initNewCertificate()
+        self._assert(certificateType in (CertificateType.STAKE_REGISTRATION, CertificateType.STAKE_DEREGISTRATION),
+                     "certificateType == STAKE_REGISTRATION || certificateType == STAKE_DEREGISTRATION")
+
+        # Array(2)[Unsigned[certificateType], credential]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, certificateType)
+        self._appendCredential(stakeCredential)
+
+
+    def addCertificateStaking(self,
+                              certificateType: CertificateType,
+                              stakeCredential: Credential,
+                              deposit: int) -> None:
+        self._initNewCertificate()
+        self._assert(certificateType in (CertificateType.STAKE_REGISTRATION_CONWAY,
+                                         CertificateType.STAKE_DEREGISTRATION_CONWAY),
+                     "certificateType == STAKE_REGISTRATION_CONWAY || certificateType == STAKE_DEREGISTRATION_CONWAY")
+
+        # Array(3)[Unsigned[certificateType], credential, Unsigned[deposit]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, certificateType)
+        self._appendCredential(stakeCredential)
+        self._writer.token(CborType.UNSIGNED, deposit)
+
+
+    def addCertificateStakeDelegation(self, stakeCredential: Credential, poolKeyHash: bytes) -> None:
+        self._initNewCertificate()
+        self._assert(len(poolKeyHash) == POOL_KEY_HASH_LENGTH, f"poolKeyHashSize == {POOL_KEY_HASH_LENGTH}")
+
+        # Array(3)[Unsigned[2], credential, Bytes[poolKeyHash]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.STAKE_DELEGATION)
+        self._appendCredential(stakeCredential)
+        self._writer.byteString(poolKeyHash)
+
+
+    def addCertificateVoteDelegation(self, stakeCredential: Credential, dRep: DRep) -> None:
+        self._initNewCertificate()
+
+        # Array(3)[Unsigned[9], credential, Array(1 or 2)[Unsigned[drep type], ?Bytes[key / script hash]]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.VOTE_DELEGATION)
+        self._appendCredential(stakeCredential)
+        if dRep.type in (DRepParamsType.KEY_HASH, DRepParamsType.SCRIPT_HASH):
+            assert dRep.hash is not None
+            self._writer.token(CborType.ARRAY, 2)
+            self._writer.token(CborType.UNSIGNED, dRep.type)
+            self._appendBytes(dRep.hash, ADDRESS_KEY_HASH_LENGTH)
+        else:
+            self._assert(dRep.type in (DRepParamsType.ABSTAIN, DRepParamsType.NO_CONFIDENCE), "valid drep type")
+            self._writer.token(CborType.ARRAY, 1)
+            self._writer.token(CborType.UNSIGNED, dRep.type)
+
+
+    def addCertificateCommitteeAuthHot(self, coldCredential: Credential, hotCredential: Credential) -> None:
+        self._initNewCertificate()
+
+        # Array(3)[Unsigned[14], credential, credential]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.AUTHORIZE_COMMITTEE_HOT)
+        self._appendCredential(coldCredential)
+        self._appendCredential(hotCredential)
+
+
+    def addCertificateCommitteeResign(self, coldCredential: Credential, anchor: Optional[Anchor]) -> None:
+        self._initNewCertificate()
+
+        # Array(3)[Unsigned[15], credential, Null / ...anchor]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.RESIGN_COMMITTEE_COLD)
+        self._appendCredential(coldCredential)
+        self._appendAnchor(anchor)
+
+
+    def addCertificateDRepRegistration(self,
+                                       dRepCredential: Credential,
+                                       deposit: int,
+                                       anchor: Optional[Anchor]) -> None:
+        self._initNewCertificate()
+
+        # Array(4)[Unsigned[16], credential, Unsigned[deposit], Null / ...anchor]
+        self._writer.token(CborType.ARRAY, 4)
+        self._writer.token(CborType.UNSIGNED, CertificateType.DREP_REGISTRATION)
+        self._appendCredential(dRepCredential)
+        self._writer.token(CborType.UNSIGNED, deposit)
+        self._appendAnchor(anchor)
+
+
+    def addCertificateDRepDeregistration(self, dRepCredential: Credential, deposit: int) -> None:
+        self._initNewCertificate()
+
+        # Array(3)[Unsigned[17], credential, Unsigned[deposit]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.DREP_DEREGISTRATION)
+        self._appendCredential(dRepCredential)
+        self._writer.token(CborType.UNSIGNED, deposit)
+
+
+    def addCertificateDRepUpdate(self, dRepCredential: Credential, anchor: Optional[Anchor]) -> None:
+        self._initNewCertificate()
+
+        # Array(3)[Unsigned[18], credential, Null / ...anchor]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.DREP_UPDATE)
+        self._appendCredential(dRepCredential)
+        self._appendAnchor(anchor)
+
+
+    def addCertificatePoolRetirement(self, poolKeyHash: bytes, epoch: int) -> None:
+        self._initNewCertificate()
+        self._assert(len(poolKeyHash) == POOL_KEY_HASH_LENGTH, f"poolKeyHashSize == {POOL_KEY_HASH_LENGTH}")
+
+        # Array(3)[Unsigned[4], Bytes[poolKeyHash], Unsigned[epoch]]
+        self._writer.token(CborType.ARRAY, 3)
+        self._writer.token(CborType.UNSIGNED, CertificateType.STAKE_POOL_RETIREMENT)
+        self._writer.byteString(poolKeyHash)
+        self._writer.token(CborType.UNSIGNED, epoch)
+
+
+    # ============================== POOL REGISTRATION ==============================
+
+    def poolRegistrationCertificateEnter(self, numOwners: int, numRelays: int) -> None:
+        self._initNewCertificate()
+        self._assert(self.remainingOwners == 0, "remainingOwners == 0")
+        self.remainingOwners = numOwners
+        self._assert(self.remainingRelays == 0, "remainingRelays == 0")
+        self.remainingRelays = numRelays
+
+        # Array(10)[Unsigned[3], ... pool params added later]
+        self._writer.token(CborType.ARRAY, 10)
+        self._writer.token(CborType.UNSIGNED, CertificateType.STAKE_POOL_REGISTRATION)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_INIT
+
+
+    def poolRegistrationCertificatePoolKeyHash(self, poolKeyHash: bytes) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_INIT, "state == IN_CERTIFICATES_POOL_INIT")
+
+        self._appendBytes(poolKeyHash, POOL_KEY_HASH_LENGTH)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_KEY_HASH
+
+
+    def poolRegistrationCertificateVrfKeyHash(self, vrfKeyHash: bytes) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_KEY_HASH,
+                     "state == IN_CERTIFICATES_POOL_KEY_HASH")
+
+        self._appendBytes(vrfKeyHash, VRF_KEY_HASH_LENGTH)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_VRF
+
+
+    def poolRegistrationCertificateFinancials(self,
+                                              pledge: int,
+                                              cost: int,
+                                              marginNumerator: int,
+                                              marginDenominator: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_VRF, "state == IN_CERTIFICATES_POOL_VRF")
+
+        # Unsigned[pledge] Unsigned[cost] Tag(30) Array(2)[Unsigned[marginNumerator], Unsigned[marginDenominator]]
+        self._writer.token(CborType.UNSIGNED, pledge)
+        self._writer.token(CborType.UNSIGNED, cost)
+        self._writer.token(CborType.TAG, CborTag.UNIT_INTERVAL)
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, marginNumerator)
+        self._writer.token(CborType.UNSIGNED, marginDenominator)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_FINANCIALS
+
+
+    def poolRegistrationCertificateRewardAccount(self, rewardAccount: bytes) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_FINANCIALS,
+                     "state == IN_CERTIFICATES_POOL_FINANCIALS")
+
+        self._appendBytes(rewardAccount, REWARD_ACCOUNT_SIZE)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_REWARD_ACCOUNT
+
+
+    def addPoolRegistrationCertificateEnterOwners(self) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_REWARD_ACCOUNT,
+                     "state == IN_CERTIFICATES_POOL_REWARD_ACCOUNT")
+
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingOwners)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_OWNERS
+
+
+    def addPoolRegistrationCertificateAddOwner(self, stakingKeyHash: bytes) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_OWNERS, "state == IN_CERTIFICATES_POOL_OWNERS")
+        self._assert(self.remainingOwners > 0, "remainingOwners > 0")
+        self.remainingOwners -= 1
+
+        self._appendBytes(stakingKeyHash, ADDRESS_KEY_HASH_LENGTH)
+
+
+    def addPoolRegistrationCertificateEnterRelays(self) -> None:
+        # enter empty owners if none were received (and none were expected)
+        if self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_REWARD_ACCOUNT:
+            self._assert(self.remainingOwners == 0, "remainingOwners == 0")
+            self.addPoolRegistrationCertificateEnterOwners()
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_OWNERS, "state == IN_CERTIFICATES_POOL_OWNERS")
+        self._assert(self.remainingOwners == 0, "remainingOwners == 0")
+
+        self._writer.token(CborType.ARRAY, self.remainingRelays)
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_RELAYS
+
+
+    def addPoolRegistrationCertificateAddRelay(self, relay: PoolRelay) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_RELAYS, "state == IN_CERTIFICATES_POOL_RELAYS")
+        self._assert(self.remainingRelays > 0, "remainingRelays > 0")
+        self.remainingRelays -= 1
+
+        if relay.type == RelayType.SINGLE_HOST_IP_ADDR:
+            # Array(4)[Unsigned[0], Unsigned[port] / Null, Bytes[ipv4] / Null, Bytes[ipv6] / Null]
+            self._writer.token(CborType.ARRAY, 4)
+            self._writer.token(CborType.UNSIGNED, relay.type)
+            self._appendRelayPort(relay.port)
+            for address, size in ((relay.ipv4, IPV4_SIZE), (relay.ipv6, IPV6_SIZE)):
+                if address is None:
+                    self._writer.token(CborType.NULL)
+                else:
+                    self._appendBytes(address, size)
+        elif relay.type == RelayType.SINGLE_HOST_HOSTNAME:
+            # Array(3)[Unsigned[1], Unsigned[port] / Null, Text[dnsName]]
+            self._writer.token(CborType.ARRAY, 3)
+            self._writer.token(CborType.UNSIGNED, relay.type)
+            self._appendRelayPort(relay.port)
+            self._appendRelayDnsName(relay.dnsName)
+        else:
+            # Array(2)[Unsigned[2], Text[dnsName]]
+            self._assert(relay.type == RelayType.MULTI_HOST, "valid relay format")
+            self._writer.token(CborType.ARRAY, 2)
+            self._writer.token(CborType.UNSIGNED, relay.type)
+            self._appendRelayDnsName(relay.dnsName)
+
+
+    def _appendRelayPort(self, port: Optional[int]) -> None:
+        """Append a relay port: Unsigned[port] / Null"""
+
+        if port is None:
+            self._writer.token(CborType.NULL)
+        else:
+            self._writer.token(CborType.UNSIGNED, port)
+
+
+    def _appendRelayDnsName(self, dnsName: Optional[str]) -> None:
+        """Append a relay DNS name: Text[dnsName]"""
+
+        assert dnsName is not None
+        self._assert(len(dnsName) <= DNS_NAME_SIZE_MAX, f"dnsNameSize <= {DNS_NAME_SIZE_MAX}")
+        self._writer.text(dnsName)
+
+
+    def _addPoolMetadataUpdateState(self) -> None:
+        """Enter empty owners or relays if none were received"""
+
+        if self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_REWARD_ACCOUNT:
+            # skipping owners is only possible if none were expected
+            self._assert(self.remainingOwners == 0, "remainingOwners == 0")
+            self.addPoolRegistrationCertificateEnterOwners()
+        if self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_OWNERS:
+            # skipping relays is only possible if none were expected
+            self._assert(self.remainingRelays == 0, "remainingRelays == 0")
+            self.addPoolRegistrationCertificateEnterRelays()
+        self._assert(self.state == TxHashBuilderState.IN_CERTIFICATES_POOL_RELAYS, "state == IN_CERTIFICATES_POOL_RELAYS")
+        self._assert(self.remainingRelays == 0, "remainingRelays == 0")
+        self.state = TxHashBuilderState.IN_CERTIFICATES_POOL_METADATA
+
+
+    def addPoolRegistrationCertificateAddPoolMetadata(self, url: str, metadataHash: bytes) -> None:
+        self._addPoolMetadataUpdateState()
+        self._assert(len(metadataHash) == POOL_METADATA_HASH_LENGTH, f"metadataHashSize == {POOL_METADATA_HASH_LENGTH}")
+
+        # Array(2)[Tstr[url], Bytes[metadataHash]]
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.text(url)
+        self._writer.byteString(metadataHash)
+        self.state = TxHashBuilderState.IN_CERTIFICATES
+
+
+    def addPoolRegistrationCertificateAddPoolMetadataNull(self) -> None:
+        self._addPoolMetadataUpdateState()
+
+        self._writer.token(CborType.NULL)
+        self.state = TxHashBuilderState.IN_CERTIFICATES
+
+
+    def _assertCanLeaveCertificates(self) -> None:
+        self._assert(self.remainingCertificates == 0, "remainingCertificates == 0")
+        if self.state != TxHashBuilderState.IN_CERTIFICATES:
+            self._assertCanLeaveTtl()
+
+
+    # ============================== WITHDRAWALS ==============================
+
+    def enterWithdrawals(self) -> None:
+        self._assertCanLeaveCertificates()
+        self._assert(self.remainingWithdrawals > 0, "remainingWithdrawals > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.WITHDRAWALS)
+        self._writer.token(CborType.MAP, self.remainingWithdrawals)
+        self.state = TxHashBuilderState.IN_WITHDRAWALS
+
+
+    def addWithdrawal(self, rewardAddress: bytes, amount: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_WITHDRAWALS, "state == IN_WITHDRAWALS")
+        self._assert(self.remainingWithdrawals > 0, "remainingWithdrawals > 0")
+        self.remainingWithdrawals -= 1
+
+        # map entry: Bytes[address] Unsigned[amount]
+        self._appendBytes(rewardAddress, REWARD_ACCOUNT_SIZE)
+        self._writer.token(CborType.UNSIGNED, amount)
+
+
+    def _assertCanLeaveWithdrawals(self) -> None:
+        self._assert(self.remainingWithdrawals == 0, "remainingWithdrawals == 0")
+        if self.state != TxHashBuilderState.IN_WITHDRAWALS:
+            self._assertCanLeaveCertificates()
+
+
+    # ============================== AUXILIARY DATA ==============================
+
+    def addAuxData(self, auxDataHash: bytes) -> None:
+        self._assertCanLeaveWithdrawals()
+        self._assert(self.includeAuxData, "includeAuxData")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.AUX_DATA)
+        self._appendBytes(auxDataHash, AUX_DATA_HASH_LENGTH)
+        self.state = TxHashBuilderState.IN_AUX_DATA
+
+
+    def _assertCanLeaveAuxData(self) -> None:
+        if self.state != TxHashBuilderState.IN_AUX_DATA:
+            self._assert(not self.includeAuxData, "!includeAuxData")
+            self._assertCanLeaveWithdrawals()
+
+
+    # ============================== VALIDITY INTERVAL START ==============================
+
+    def addValidityIntervalStart(self, validityIntervalStart: int) -> None:
+        self._assertCanLeaveAuxData()
+        self._assert(self.includeValidityIntervalStart, "includeValidityIntervalStart")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.VALIDITY_INTERVAL_START)
+        self._writer.token(CborType.UNSIGNED, validityIntervalStart)
+        self.state = TxHashBuilderState.IN_VALIDITY_INTERVAL_START
+
+
+    def _assertCanLeaveValidityIntervalStart(self) -> None:
+        if self.state != TxHashBuilderState.IN_VALIDITY_INTERVAL_START:
+            self._assert(not self.includeValidityIntervalStart, "!includeValidityIntervalStart")
+            self._assertCanLeaveAuxData()
+
+
+    # ============================== MINT ==============================
+
+    def enterMint(self) -> None:
+        self._assertCanLeaveValidityIntervalStart()
+        self._assert(self.includeMint, "includeMint")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.MINT)
+        self.state = TxHashBuilderState.IN_MINT
+
+
+    def addMintTopLevelData(self, numAssetGroups: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_MINT, "state == IN_MINT")
+        self._assert(numAssetGroups > 0, "numAssetGroups > 0")
+        self.remainingAssetGroups = numAssetGroups
+
+        # Map(numAssetGroups)[entries added later]
+        self._writer.token(CborType.MAP, numAssetGroups)
+        self.outputState = TxOutputState.TOP_LEVEL_DATA
+
+
+    def addMintTokenGroup(self, policyId: bytes, numTokens: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_MINT, "state == IN_MINT")
+
+        self._addTokenGroup(policyId, numTokens)
+
+
+    def addMintToken(self, assetName: bytes, amount: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_MINT, "state == IN_MINT")
+
+        self._addToken(assetName, amount)
+
+
+    def _assertCanLeaveMint(self) -> None:
+        if self.state == TxHashBuilderState.IN_MINT:
+            self._assert(self.outputState == TxOutputState.ASSET_GROUP, "outputState == ASSET_GROUP")
+            self._assert(self.remainingAssetGroups == 0, "remainingAssetGroups == 0")
+            self._assert(self.remainingTokens == 0, "remainingTokens == 0")
+        else:
+            self._assert(not self.includeMint, "!includeMint")
+            self._assertCanLeaveValidityIntervalStart()
+
+
+    # ============================== SCRIPT DATA HASH ==============================
+
+    def addScriptDataHash(self, scriptDataHash: bytes) -> None:
+        self._assertCanLeaveMint()
+        self._assert(self.includeScriptDataHash, "includeScriptDataHash")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.SCRIPT_HASH_DATA)
+        self._appendBytes(scriptDataHash, SCRIPT_DATA_HASH_LENGTH)
+        self.state = TxHashBuilderState.IN_SCRIPT_DATA_HASH
+
+
+    def _assertCanLeaveScriptDataHash(self) -> None:
+        if self.state != TxHashBuilderState.IN_SCRIPT_DATA_HASH:
+            self._assert(not self.includeScriptDataHash, "!includeScriptDataHash")
+            self._assertCanLeaveMint()
+
+
+    # ============================== COLLATERAL INPUTS ==============================
+
+    def enterCollateralInputs(self) -> None:
+        self._assertCanLeaveScriptDataHash()
+        # we don't allow an empty list for an optional item
+        self._assert(self.remainingCollateralInputs > 0, "remainingCollateralInputs > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.COLLATERAL_INPUTS)
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingCollateralInputs)
+        self.state = TxHashBuilderState.IN_COLLATERAL_INPUTS
+
+
+    def addCollateralInput(self, txHash: bytes, index: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_COLLATERAL_INPUTS, "state == IN_COLLATERAL_INPUTS")
+        self._assert(self.remainingCollateralInputs > 0, "remainingCollateralInputs > 0")
+        self.remainingCollateralInputs -= 1
+
+        self._appendTxInput(txHash, index)
+
+
+    def _assertCanLeaveCollateralInputs(self) -> None:
+        self._assert(self.remainingCollateralInputs == 0, "remainingCollateralInputs == 0")
+        if self.state != TxHashBuilderState.IN_COLLATERAL_INPUTS:
+            self._assertCanLeaveScriptDataHash()
+
+
+    # ============================== REQUIRED SIGNERS ==============================
+
+    def enterRequiredSigners(self) -> None:
+        self._assertCanLeaveCollateralInputs()
+        # we don't allow an empty list for an optional item
+        self._assert(self.remainingRequiredSigners > 0, "remainingRequiredSigners > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.REQUIRED_SIGNERS)
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingRequiredSigners)
+        self.state = TxHashBuilderState.IN_REQUIRED_SIGNERS
+
+
+    def addRequiredSigner(self, keyHash: bytes) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_REQUIRED_SIGNERS, "state == IN_REQUIRED_SIGNERS")
+        self._assert(self.remainingRequiredSigners > 0, "remainingRequiredSigners > 0")
+        self.remainingRequiredSigners -= 1
+
+        self._appendBytes(keyHash, ADDRESS_KEY_HASH_LENGTH)
+
+
+    def _assertCanLeaveRequiredSigners(self) -> None:
+        self._assert(self.remainingRequiredSigners == 0, "remainingRequiredSigners == 0")
+        if self.state != TxHashBuilderState.IN_REQUIRED_SIGNERS:
+            self._assertCanLeaveCollateralInputs()
+
+
+    # ============================== NETWORK ID ==============================
+
+    def addNetworkId(self, networkId: int) -> None:
+        self._assertCanLeaveRequiredSigners()
+        self._assert(self.includeNetworkId, "includeNetworkId")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.NETWORK_ID)
+        self._writer.token(CborType.UNSIGNED, networkId)
+        self.state = TxHashBuilderState.IN_NETWORK_ID
+
+
+    def _assertCanLeaveNetworkId(self) -> None:
+        if self.state != TxHashBuilderState.IN_NETWORK_ID:
+            self._assert(not self.includeNetworkId, "!includeNetworkId")
+            self._assertCanLeaveRequiredSigners()
+
+
+    # ============================== COLLATERAL RETURN OUTPUT ==============================
+
+    def addCollateralOutput(self, output: TxOutputDescription) -> None:
+        self._assertCanLeaveNetworkId()
+        self._assert(self.includeCollateralOutput, "includeCollateralOutput")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.COLLATERAL_OUTPUT)
+        self._processOutputTopLevel(output)
+        self.outputState = TxOutputState.TOP_LEVEL_DATA
+        self.state = TxHashBuilderState.IN_COLLATERAL_OUTPUT
+
+
+    def addCollateralOutputTokenGroup(self, policyId: bytes, numTokens: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_COLLATERAL_OUTPUT, "state == IN_COLLATERAL_OUTPUT")
+
+        self._addTokenGroup(policyId, numTokens)
+
+
+    def addCollateralOutputToken(self, assetName: bytes, amount: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_COLLATERAL_OUTPUT, "state == IN_COLLATERAL_OUTPUT")
+        self._assert(amount >= 0, "amount >= 0")
+
+        self._addToken(assetName, amount)
+
+
+    def _assertCanLeaveCollateralOutput(self) -> None:
+        if self.state == TxHashBuilderState.IN_COLLATERAL_OUTPUT:
+            self._assertCanLeaveCurrentOutput()
+        else:
+            self._assert(not self.includeCollateralOutput, "!includeCollateralOutput")
+            self._assertCanLeaveNetworkId()
+
+
+    # ============================== TOTAL COLLATERAL ==============================
+
+    def addTotalCollateral(self, totalCollateral: int) -> None:
+        self._assertCanLeaveCollateralOutput()
+        self._assert(self.includeTotalCollateral, "includeTotalCollateral")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.TOTAL_COLLATERAL)
+        self._writer.token(CborType.UNSIGNED, totalCollateral)
+        self.state = TxHashBuilderState.IN_TOTAL_COLLATERAL
+
+
+    def _assertCanLeaveTotalCollateral(self) -> None:
+        if self.state != TxHashBuilderState.IN_TOTAL_COLLATERAL:
+            self._assert(not self.includeTotalCollateral, "!includeTotalCollateral")
+            self._assertCanLeaveCollateralOutput()
+
+
+    # ============================== REFERENCE INPUTS ==============================
+
+    def enterReferenceInputs(self) -> None:
+        self._assertCanLeaveTotalCollateral()
+        # we don't allow an empty list for an optional item
+        self._assert(self.remainingReferenceInputs > 0, "remainingReferenceInputs > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.REFERENCE_INPUTS)
+        self._tagCborSet()
+        self._writer.token(CborType.ARRAY, self.remainingReferenceInputs)
+        self.state = TxHashBuilderState.IN_REFERENCE_INPUTS
+
+
+    def addReferenceInput(self, txHash: bytes, index: int) -> None:
+        self._assert(self.state == TxHashBuilderState.IN_REFERENCE_INPUTS, "state == IN_REFERENCE_INPUTS")
+        self._assert(self.remainingReferenceInputs > 0, "remainingReferenceInputs > 0")
+        self.remainingReferenceInputs -= 1
+
+        self._appendTxInput(txHash, index)
+
+
+    def _assertCanLeaveReferenceInputs(self) -> None:
+        self._assert(self.remainingReferenceInputs == 0, "remainingReferenceInputs == 0")
+        if self.state != TxHashBuilderState.IN_REFERENCE_INPUTS:
+            self._assertCanLeaveTotalCollateral()
+
+
+    # ============================== VOTING PROCEDURES ==============================
+
+    def enterVotingProcedures(self) -> None:
+        self._assertCanLeaveReferenceInputs()
+        # we don't allow an empty map for an optional item
+        self._assert(self.remainingVotingProcedures > 0, "remainingVotingProcedures > 0")
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.VOTING_PROCEDURES)
+        self._writer.token(CborType.MAP, self.remainingVotingProcedures)
+        self.state = TxHashBuilderState.IN_VOTING_PROCEDURES
+
+
+    def addVotingProcedure(self,
+                           voter: Voter,
+                           govActionTxHash: bytes,
+                           govActionIndex: int,
+                           vote: VoteOption,
+                           anchor: Optional[Anchor]) -> None:
+        """Add the single voting procedure of a voter"""
+
+        self._assert(self.state == TxHashBuilderState.IN_VOTING_PROCEDURES, "state == IN_VOTING_PROCEDURES")
+        self._assert(self.remainingVotingProcedures > 0, "remainingVotingProcedures > 0")
+        self.remainingVotingProcedures -= 1
+
+        # Array(2)[Unsigned[voter type], Bytes[key or script hash]]
+        self._assert(voter.type <= VoterType.STAKE_POOL_KEY_HASH, "valid voter type")
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, voter.type)
+        self._appendBytes(voter.hash, ADDRESS_KEY_HASH_LENGTH)
+        # Map(1)[
+        #   Array(2)[Bytes[txHash], Unsigned[govActionIndex]]
+        #   Array(2)[Unsigned[vote], Null / ...anchor]
+        # ]
+        self._writer.token(CborType.MAP, 1)
+        self._appendTxInput(govActionTxHash, govActionIndex)
+        self._writer.token(CborType.ARRAY, 2)
+        self._writer.token(CborType.UNSIGNED, vote)
+        self._appendAnchor(anchor)
+
+
+    def _assertCanLeaveVotingProcedures(self) -> None:
+        self._assert(self.remainingVotingProcedures == 0, "remainingVotingProcedures == 0")
+        if self.state != TxHashBuilderState.IN_VOTING_PROCEDURES:
+            self._assertCanLeaveReferenceInputs()
+
+
+    # ============================== TREASURY ==============================
+
+    def addTreasury(self, treasury: int) -> None:
+        # as on the device, the inclusion of the treasury is not checked
+        self._assertCanLeaveVotingProcedures()
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.TREASURY)
+        self._writer.token(CborType.UNSIGNED, treasury)
+        self.state = TxHashBuilderState.IN_TREASURY
+
+
+    def _assertCanLeaveTreasury(self) -> None:
+        if self.state != TxHashBuilderState.IN_TREASURY:
+            self._assert(not self.includeTreasury, "!includeTreasury")
+            self._assertCanLeaveVotingProcedures()
+
+
+    # ============================== DONATION ==============================
+
+    def addDonation(self, donation: int) -> None:
+        # as on the device, the inclusion of the donation is not checked
+        self._assertCanLeaveTreasury()
+
+        self._writer.token(CborType.UNSIGNED, TxBodyKey.DONATION)
+        self._writer.token(CborType.UNSIGNED, donation)
+        self.state = TxHashBuilderState.IN_DONATION
+
+
+    def _assertCanLeaveDonation(self) -> None:
+        if self.state != TxHashBuilderState.IN_DONATION:
+            self._assert(not self.includeDonation, "!includeDonation")
+            self._assertCanLeaveTreasury()
+
+
+    # ============================== FINALIZE ==============================
+
+    def finalize(self) -> bytes:
+        """Check the TX body is complete and finalize its hash
+
+        Returns:
+            The TX body hash
+        """
+
+        self._assertCanLeaveDonation()
+        digest = self._writer.digest()
+        self.state = TxHashBuilderState.FINISHED
+        return digest
+
+
+    def getData(self) -> bytes:
+        """Retrieve the serialized TX body, if kept
+
+        Returns:
+            The serialized TX body
+        """
+
+        return self._writer.getData()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests Client application.
+It contains a votecast hash builder mirroring the device one (src/votecastHashBuilder/votecastHashBuilder.c),
+and the chunking of the vote cast data as sent by Sign CIP36 Vote, the chunks being views
+of the vote cast buffer, hashed as they are produced.
+"""
+
+from enum import IntEnum
+from typing import Iterator, Optional
+import hashlib
+
+from input_files.cvote import MAX_CIP36_PAYLOAD_SIZE
+
+
+VOTECAST_HASH_LENGTH = 32
+
+
+class VotecastHashBuilderState(IntEnum):
+    INIT = 100
+    CHUNK = 200
+    FINISHED = 1800
+
+
+class VotecastHashBuilder:
+    """Votecast hash builder, with the same state machine as the device
+
+    The failed device ASSERTs raise a ValueError.
+    """
+
+    def __init__(self, remainingBytes: int) -> None:
+        self.state = VotecastHashBuilderState.INIT
+        self._assert(remainingBytes > 0, "remainingBytes > 0")
+        self.remainingBytes = remainingBytes
+        self._hash = hashlib.blake2b(digest_size=VOTECAST_HASH_LENGTH)
+
+
+    def _assert(self, condition: bool, check: str) -> None:
+        """Fail as the device ASSERT, naming the failed check"""
+
+        if not condition:
+            raise ValueError(f"Votecast hash builder check failed in state {self.state.name}: {check}")
+
+
+    def chunk(self, chunk: memoryview) -> None:
+        self._assert(self.state in (VotecastHashBuilderState.INIT, VotecastHashBuilderState.CHUNK),
+                     "state == INIT || state == CHUNK")
+        self._assert(0 < len(chunk) <= self.remainingBytes, "0 < chunkSize <= remainingBytes")
+        self.remainingBytes -= len(chunk)
+        self._hash.update(chunk)
+        self.state = VotecastHashBuilderState.CHUNK
+
+
+    def finalize(self) -> bytes:
+        """Check the vote cast is complete and finalize its hash
+
+        Returns:
+            The blake2b-256 votecast hash, as returned by the CONFIRM step
+        """
+
+        self._assert(self.state == VotecastHashBuilderState.CHUNK, "state == CHUNK")
+        self._assert(self.remainingBytes == 0, "remainingBytes == 0")
+        self.state = VotecastHashBuilderState.FINISHED
+        return self._hash.digest()
+
+
+def iter_votecast_chunks(voteCastData: bytes, hashBuilder: Optional[VotecastHashBuilder] = None) -> Iterator[memoryview]:
+    """Split the vote cast data in the chunks sent by Sign CIP36 Vote
+
+    The first chunk is sent by the INIT step, the following ones by the CHUNK step.
+    The vote cast data is left untouched, the chunks being views of it.
+
+    Args:
+        voteCastData (bytes): The vote cast data
+        hashBuilder (Optional[VotecastHashBuilder]): Builder fed with each chunk when produced
+
+    Returns:
+        Iterator on the chunks
+    """
+
+    view = memoryview(voteCastData)
+    for offset in range(0, len(view), MAX_CIP36_PAYLOAD_SIZE):
+        chunk = view[offset:offset + MAX_CIP36_PAYLOAD_SIZE]
+        if hashBuilder is not None:
+            hashBuilder.chunk(chunk)
+        yield chunk
+
+
+def votecast_hash(voteCastData: bytes) -> bytes:
+    """Compute the votecast hash, as returned by the CONFIRM step
+
+    Args:
+        voteCastData (bytes): The vote cast data
+
+    Returns:
+        The blake2b-256 votecast hash
+    """
+
+    hashBuilder = VotecastHashBuilder(len(voteCastData))
+    for _ in iter_votecast_chunks(voteCastData, hashBuilder):
+        pass
+    return hashBuilder.finalize()
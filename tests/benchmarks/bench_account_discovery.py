@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the account discovery.
+It discovers a synthetic wallet of the Speculos seed, with the keys given by
+utils.derive_many in place of the device, and checks the discovered addresses.
+The discovery is compared to deriving each address key from the seed, as one
+Get Public Key per address would do, with the number of keys each would retrieve
+from the device.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_account_discovery
+"""
+
+from typing import Dict, List, Set, Tuple
+
+from application_client.app_def import AddressType, Mainnet
+
+from input_files.derive_address import DeriveAddressTestCase
+
+from account_discovery import AccountDiscovery, DEFAULT_GAP_LIMIT, account_path
+from utils import clear_derivation_caches, derive_address_bytes, derive_many
+
+from benchmarks.timing import bench
+
+# Used addresses of the synthetic wallet, by account: (chain, index)
+USED_ADDRESSES = {
+    0: [(0, 0), (0, 1), (0, 7), (0, 26), (1, 0), (1, 3)],
+    1: [(0, 0), (1, 12)],
+    2: [(0, 19)],
+}
+
+
+def _pathAddress(path: str, account: int) -> bytes:
+    """Base address of a payment path, derived from the seed"""
+
+    return derive_address_bytes(DeriveAddressTestCase("", Mainnet, AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+                                                      path, f"{account_path(account)}/2/0"))
+
+
+def main() -> None:
+    expected = {f"{account_path(account)}/{chain}/{index}"
+                for account, addresses in USED_ADDRESSES.items() for chain, index in addresses}
+    usedAddresses: Set[bytes] = {_pathAddress(path, int(path.split("/")[3][:-1])) for path in expected}
+
+    deviceKeys: Dict[str, int] = {}
+
+    def getPubkeys(paths: List[str]) -> List[Tuple[str, bytes, bytes]]:
+        deviceKeys["soft derivation"] += len(paths)
+        return derive_many(paths)
+
+    def discover() -> List[str]:
+        clear_derivation_caches()
+        deviceKeys["soft derivation"] = 0
+        accounts = AccountDiscovery(getPubkeys, Mainnet, usedAddresses.__contains__).discover()
+        return [address.path for account in accounts for addresses in account.addresses.values()
+                for address in addresses]
+
+    def deriveEach() -> List[str]:
+        # The same addresses, each key being derived from the seed
+        clear_derivation_caches()
+        deviceKeys["derive each key"] = 0
+        found = []
+        for account in range(len(USED_ADDRESSES) + 1):
+            for chain in (0, 1):
+                index, unused = 0, 0
+                while unused < DEFAULT_GAP_LIMIT:
+                    path = f"{account_path(account)}/{chain}/{index}"
+                    deviceKeys["derive each key"] += 1
+                    if _pathAddress(path, account) in usedAddresses:
+                        found.append(path)
+                        unused = 0
+                    else:
+                        unused += 1
+                    index += 1
+        return found
+
+    assert set(discover()) == expected
+    assert set(deriveEach()) == expected
+
+    timings = bench({
+        "soft derivation": discover,
+        "derive each key": deriveEach,
+    }, repeat=3, number=1)
+    for name, duration in timings.items():
+        print(f"account discovery [{name}]".ljust(40) + f"{duration * 1e3:>12,.1f} ms"
+              + f"{deviceKeys[name]:>8} device keys")
+
+
+if __name__ == "__main__":
+    main()
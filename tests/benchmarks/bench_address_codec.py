@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the bulk address codec.
+It reports the addresses/s encoded and decoded, compared to bip_utils and base58;
+the codec is checked against the device test vectors and the fixtures by test_address_codec.py.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_address_codec
+"""
+
+from typing import List
+import hashlib
+
+import base58
+from bip_utils.bech32 import Bech32Decoder, Bech32Encoder
+
+from application_client.address_codec import decode_many, encode_addresses
+
+from benchmarks.timing import bench, calls
+
+NB_ADDRESSES = 100000
+
+
+def _addresses() -> List[bytes]:
+    """Base addresses of pseudo random key hashes, mainnet and testnet"""
+
+    addresses = []
+    for index in range(NB_ADDRESSES):
+        keyHashes = hashlib.blake2b(index.to_bytes(4, "big"), digest_size=56).digest()
+        addresses.append(bytes([index & 1]) + keyHashes)
+    return addresses
+
+
+def main() -> None:
+    addresses = _addresses()
+    encoded = encode_addresses(addresses)
+    assert decode_many(encoded) == addresses
+    assert encoded[:100] == [Bech32Encoder.Encode("addr" if address[0] & 1 else "addr_test", address)
+                             for address in addresses[:100]]
+    byronAddresses = [base58.b58decode(base58.b58encode(address)) for address in addresses[:100]]
+    assert decode_many(base58.b58encode(address).decode() for address in byronAddresses) == byronAddresses
+
+    def bipUtilsEncode() -> List[str]:
+        return [Bech32Encoder.Encode("addr" if address[0] & 1 else "addr_test", address) for address in addresses]
+
+    def bipUtilsDecode() -> List[bytes]:
+        return [Bech32Decoder.Decode(address[:address.rfind("1")], address) for address in encoded]
+
+    timings = bench({
+        "encode": calls(encode_addresses, [(addresses,)]),
+        "decode": calls(decode_many, [(encoded,)]),
+        "bip_utils encode": bipUtilsEncode,
+        "bip_utils decode": bipUtilsDecode,
+    }, repeat=3, number=1)
+    for name, duration in timings.items():
+        print(f"bech32 addresses [{name}]".ljust(40) + f"{NB_ADDRESSES / duration:>12,.1f} addresses/s")
+
+
+if __name__ == "__main__":
+    main()
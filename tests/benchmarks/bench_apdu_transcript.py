@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the APDU transcripts.
+It records the Sign TX APDUs of all the fixtures into a transcript, then reports the record
+and parse rates, the size of a record, and the replay overhead: the exchanges being answered
+at once by a loopback handing back the recorded responses, only the replayer is timed.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_apdu_transcript
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator, List
+import os
+import time
+
+from ragger.backend.interface import RAPDU
+
+from application_client.app_def import Errors
+from application_client.command_builder import CommandBuilder
+from application_client.apdu_transcript import TranscriptExchange, TranscriptRecorder, read_transcript, replay_transcript
+from utils import gather_witness_paths
+
+from benchmarks.bench_instructions import signTxCases
+from benchmarks.timing import bench
+
+_builder = CommandBuilder()
+NB_SESSIONS = 20
+
+
+class _Loopback:
+    """Answers each command with the recorded response, in order"""
+
+    def __init__(self, exchanges: List[TranscriptExchange]) -> None:
+        self._exchanges = exchanges
+        self._responses: Iterator[TranscriptExchange] = iter(exchanges)
+
+
+    def rewind(self) -> None:
+        self._responses = iter(self._exchanges)
+
+
+    def exchange_raw(self, _: bytes) -> RAPDU:
+        exchange = next(self._responses)
+        return RAPDU(exchange.status, exchange.data)
+
+
+def _commands() -> List[bytes]:
+    """The Sign TX APDUs of all the fixtures"""
+
+    commands: List[bytes] = []
+    for testCase in signTxCases():
+        commands += [signTxApdu.apdu for signTxApdu in _builder.iter_sign_tx(testCase, gather_witness_paths(testCase))]
+    return commands
+
+
+def _record(path: Path, commands: List[bytes], response: bytes) -> None:
+    """Record one session per run, each command answered with the response"""
+
+    with TranscriptRecorder(path) as recorder:
+        for command in commands:
+            now = time.monotonic_ns()
+            recorder.record(command, Errors.SW_SUCCESS, response, now, now)
+
+
+def main() -> None:
+    commands = _commands()
+    response = os.urandom(64)
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "transcript.apdu"
+        for _ in range(NB_SESSIONS):
+            _record(path, commands, response)
+        exchanges = read_transcript(path)
+        assert len(exchanges) == NB_SESSIONS * len(commands)
+        assert [exchange.command for exchange in exchanges[:len(commands)]] == commands
+        assert exchanges[-1].session == NB_SESSIONS - 1 and exchanges[-1].data == response
+        # an interrupted recording only loses its last exchange
+        truncated = path.read_bytes()[:-1]
+        path.write_bytes(truncated)
+        assert read_transcript(path) == exchanges[:-1]
+
+        payload = sum(len(command) + len(response) for command in commands)
+        overhead = (len(truncated) + 1 - NB_SESSIONS * payload) / len(exchanges)
+        print(f"{len(exchanges):,} exchanges, {len(truncated) / 1e6:,.2f} MB, "
+              f"{overhead:,.1f} bytes of framing per exchange")
+
+        recordPath = Path(directory) / "record.apdu"
+        loopback = _Loopback(exchanges)
+
+        def replay() -> None:
+            loopback.rewind()
+            result = replay_transcript(loopback, exchanges)  # type: ignore[arg-type]
+            assert result.exchanges == len(exchanges) and not result.mismatches
+
+        timings = bench({
+            "record": lambda: _record(recordPath, commands * NB_SESSIONS, response),
+            "parse": lambda: read_transcript(path),
+            "replay overhead": replay,
+        }, repeat=5, number=1)
+        for name, duration in timings.items():
+            print(f"{name}".ljust(25) + f"{len(exchanges) / duration:>14,.0f} exchanges/s")
+
+
+if __name__ == "__main__":
+    main()
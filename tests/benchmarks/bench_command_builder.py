@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a micro-benchmark of the APDU framing.
+It compares the in place APDU writer with the legacy concatenation path.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_command_builder
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from ragger.bip import pack_derivation_path
+
+from application_client.app_def import InsType
+from application_client.command_builder import CommandBuilder, P1Type, P2Type
+
+from input_files.signOpCert import OpCertTestCase
+from input_files.signTx import SignTxTestCase, TxInput, TxOutput, TxOutputBabbage, Certificate, CertificateType
+from input_files.signTx import AssetGroup, Token, PoolRegistrationParams
+from input_files.signTx import StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams
+from input_files.signTx import VoteDelegationParams, AuthorizeCommitteeParams, ResignCommitteeParams
+from input_files.signTx import DRepRegistrationParams, DRepUpdateParams, PoolRetirementParams
+from input_files.signTx import outputs, certificates
+
+from benchmarks.timing import bench, calls
+
+
+class LegacyCommandBuilder(CommandBuilder):
+    """APDU builder growing the payload by concatenation, as done before the APDU writer
+
+    The methods below are kept verbatim from the previous implementation.
+    """
+
+    def _serialize(self,
+                   ins: InsType,
+                   p1: int = 0x00,
+                   p2: int = 0x00,
+                   cdata: bytes = bytes()) -> bytes:
+
+        header = bytearray()
+        header.append(self._CLA)
+        header.append(ins)
+        header.append(p1)
+        header.append(p2)
+        header.append(len(cdata))
+        return header + cdata  # type: ignore[return-value]
+
+
+    def sign_opCert(self, testCase: OpCertTestCase) -> bytes:
+        data = bytes()
+        data += bytes.fromhex(testCase.opCert.kesPublicKeyHex)
+        data += testCase.opCert.kesPeriod.to_bytes(8, "big")
+        data += testCase.opCert.issueCounter.to_bytes(8, "big")
+        data += pack_derivation_path(testCase.opCert.path)
+        return self._serialize(InsType.SIGN_OP_CERT, 0x00, 0x00, data)
+
+
+    def sign_tx_init(self, testCase: SignTxTestCase, nbWitnessPaths: int) -> bytes:
+        data = bytes()
+        data += testCase.options.to_bytes(8, "big")
+        data += testCase.tx.network.networkId.to_bytes(1, "big")
+        data += testCase.tx.network.protocol.to_bytes(4, "big")
+        data += self._serializeOptionFlags(testCase.tx.ttl is not None)
+        data += self._serializeOptionFlags(testCase.tx.auxiliaryData is not None)
+        data += self._serializeOptionFlags(testCase.tx.validityIntervalStart is not None)
+        data += self._serializeOptionFlags(len(testCase.tx.mint) > 0)
+        data += self._serializeOptionFlags(testCase.tx.scriptDataHash is not None)
+        data += self._serializeOptionFlags(testCase.tx.includeNetworkId is not None)
+        data += self._serializeOptionFlags(testCase.tx.collateralOutput is not None)
+        data += self._serializeOptionFlags(testCase.tx.totalCollateral is not None)
+        data += self._serializeOptionFlags(testCase.tx.treasury is not None)
+        data += self._serializeOptionFlags(testCase.tx.donation is not None)
+        data += testCase.signingMode.to_bytes(1, "big")
+        data += len(testCase.tx.inputs).to_bytes(4, "big")
+        data += len(testCase.tx.outputs).to_bytes(4, "big")
+        data += len(testCase.tx.certificates).to_bytes(4, "big")
+        data += len(testCase.tx.withdrawals).to_bytes(4, "big")
+        data += len(testCase.tx.collateralInputs).to_bytes(4, "big")
+        data += len(testCase.tx.requiredSigners).to_bytes(4, "big")
+        data += len(testCase.tx.referenceInputs).to_bytes(4, "big")
+        data += len(testCase.tx.votingProcedures).to_bytes(4, "big")
+        data += nbWitnessPaths.to_bytes(4, "big")
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_INIT, 0x00, data)
+
+
+    def sign_tx_inputs(self, txInput: TxInput) -> bytes:
+        data = bytes()
+        data += bytes.fromhex(txInput.txHashHex)
+        data += txInput.outputIndex.to_bytes(4, "big")
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_INPUTS, 0x00, data)
+
+
+    def sign_tx_outputs_basic(self, txOutput: TxOutput) -> bytes:
+        data = bytes()
+        data += txOutput.format.to_bytes(1, "big")
+        data += self._serializeTxOutputDestination(txOutput.destination)
+        data += self._serializeCoin(txOutput.amount)
+        data += len(txOutput.tokenBundle).to_bytes(4, "big")
+        data += self._serializeOptionFlags(txOutput.datum is not None)
+        if isinstance(txOutput, TxOutputBabbage):
+            data += self._serializeOptionFlags(txOutput.referenceScriptHex is not None)
+        else:
+            data += self._serializeOptionFlags(False)
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_OUTPUTS, P2Type.P2_BASIC_DATA, data)
+
+
+    def sign_tx_fee(self, testCase: SignTxTestCase) -> bytes:
+        data = self._serializeCoin(testCase.tx.fee)
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_FEE, 0x00, data)
+
+
+    def sign_tx_mint_init(self, nbMints: int) -> bytes:
+        data = nbMints.to_bytes(4, "big")
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_MINT, P2Type.P2_BASIC_DATA, data)
+
+
+    def sign_tx_asset_group(self, p1: P1Type, asset: AssetGroup) -> bytes:
+        data = self._serializeAssetGroup(asset)
+        return self._serialize(InsType.SIGN_TX, p1, P2Type.ASSET_GROUP, data)
+
+
+    def sign_tx_token(self, p1: P1Type, token: Token) -> bytes:
+        data = self._serializeToken(token)
+        return self._serialize(InsType.SIGN_TX, p1, P2Type.TOKEN, data)
+
+
+    def _serializeAssetGroup(self, asset: AssetGroup) -> bytes:
+        """Serialize Asset Group"""
+
+        # Serialization format:
+        #    Policy ID
+        #    Nb of tokens (4B)
+        data = bytes()
+        data += bytes.fromhex(asset.policyIdHex)
+        data += len(asset.tokens).to_bytes(4, "big")
+        return data
+
+
+    def _serializeToken(self, token: Token) -> bytes:
+        """Serialize Token"""
+
+        # Serialization format:
+        #    Asset Name Length (4B)
+        #    Asset Name
+        #    Amount (8B)
+        data = bytes()
+        data += int(len(token.assetNameHex) / 2).to_bytes(4, "big")
+        data += bytes.fromhex(token.assetNameHex)
+        data += token.amount.to_bytes(8, "big", signed=True)
+        return data
+
+
+    def sign_tx_cert_pool_reg_financials(self, pool: PoolRegistrationParams) -> bytes:
+        data = bytes()
+        data += self._serializeCoin(pool.pledge)
+        data += self._serializeCoin(pool.cost)
+        data += pool.margin.numerator.to_bytes(8, "big")
+        data += pool.margin.denominator.to_bytes(8, "big")
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, P2Type.P2_FINANCIALS, data)
+
+
+    def sign_tx_certificate(self, certificate: Certificate) -> bytes:
+        # Serialization format:
+        #   Certificate Type (1B)
+        #   Certificate Data
+        data = bytes()
+        if certificate.type in (CertificateType.STAKE_REGISTRATION, CertificateType.STAKE_DEREGISTRATION):
+            assert isinstance(certificate.params, StakeRegistrationParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.stakeCredential is not None
+            data += self._serializeCredential(certificate.params.stakeCredential)
+        elif certificate.type in (CertificateType.STAKE_REGISTRATION_CONWAY, CertificateType.STAKE_DEREGISTRATION_CONWAY):
+            assert isinstance(certificate.params, StakeRegistrationConwayParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.stakeCredential is not None
+            data += self._serializeCredential(certificate.params.stakeCredential)
+            assert certificate.params.deposit is not None
+            data += self._serializeCoin(certificate.params.deposit)
+        elif certificate.type == CertificateType.STAKE_DELEGATION:
+            assert isinstance(certificate.params, StakeDelegationParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.stakeCredential is not None
+            data += self._serializeCredential(certificate.params.stakeCredential)
+            assert certificate.params.poolKeyHash is not None
+            data += bytes.fromhex(certificate.params.poolKeyHash)
+        elif certificate.type == CertificateType.VOTE_DELEGATION:
+            assert isinstance(certificate.params, VoteDelegationParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.stakeCredential is not None
+            data += self._serializeCredential(certificate.params.stakeCredential)
+            assert certificate.params.dRep is not None
+            data += self._serializeDRep(certificate.params.dRep)
+        elif certificate.type == CertificateType.AUTHORIZE_COMMITTEE_HOT:
+            assert isinstance(certificate.params, AuthorizeCommitteeParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.coldCredential is not None
+            data += self._serializeCredential(certificate.params.coldCredential)
+            assert certificate.params.hotCredential is not None
+            data += self._serializeCredential(certificate.params.hotCredential)
+        elif certificate.type == CertificateType.RESIGN_COMMITTEE_COLD:
+            assert isinstance(certificate.params, ResignCommitteeParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.coldCredential is not None
+            data += self._serializeCredential(certificate.params.coldCredential)
+            data += self._serializeAnchor(certificate.params.anchor)
+        elif certificate.type == CertificateType.DREP_REGISTRATION:
+            assert isinstance(certificate.params, DRepRegistrationParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.dRepCredential is not None
+            data += self._serializeCredential(certificate.params.dRepCredential)
+            assert certificate.params.deposit is not None
+            data += self._serializeCoin(certificate.params.deposit)
+            data += self._serializeAnchor(certificate.params.anchor)
+        elif certificate.type == CertificateType.DREP_DEREGISTRATION:
+            assert isinstance(certificate.params, DRepRegistrationParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.dRepCredential is not None
+            data += self._serializeCredential(certificate.params.dRepCredential)
+            assert certificate.params.deposit is not None
+            data += self._serializeCoin(certificate.params.deposit)
+        elif certificate.type == CertificateType.DREP_UPDATE:
+            assert isinstance(certificate.params, DRepUpdateParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.dRepCredential is not None
+            data += self._serializeCredential(certificate.params.dRepCredential)
+            data += self._serializeAnchor(certificate.params.anchor)
+        elif certificate.type == CertificateType.STAKE_POOL_REGISTRATION:
+            data += certificate.type.to_bytes(1, "big")
+        elif certificate.type == CertificateType.STAKE_POOL_RETIREMENT:
+            assert isinstance(certificate.params, PoolRetirementParams)
+            data += certificate.type.to_bytes(1, "big")
+            assert certificate.params.poolKeyPath is not None
+            if certificate.params.poolKeyPath.startswith("m/"):
+                data += pack_derivation_path(certificate.params.poolKeyPath)
+            else:
+                data += bytes.fromhex(certificate.params.poolKeyPath)
+            assert certificate.params.retirementEpoch is not None
+            data += certificate.params.retirementEpoch.to_bytes(8, "big")
+        else:
+            raise NotImplementedError("Not implemented yet")
+
+        return self._serialize(InsType.SIGN_TX, P1Type.P1_CERTIFICATES, 0x00, data)
+
+
+BENCH_OUTPUTS: List[TxOutput] = [
+    outputs["externalByronMainnet"],
+    outputs["externalShelleyBaseKeyhashKeyhash"],
+    outputs["internalBaseWithStakingPath"],
+    outputs["internalBaseWithStakingKeyHash"],
+    outputs["multiassetManyTokens"],
+]
+
+BENCH_CERTIFICATES: List[Certificate] = list(certificates.values())
+
+
+def main() -> None:
+    legacy = LegacyCommandBuilder()
+    writer = CommandBuilder()
+
+    # Both paths must produce the same APDUs
+    for txOutput in BENCH_OUTPUTS:
+        assert legacy.sign_tx_outputs_basic(txOutput) == writer.sign_tx_outputs_basic(txOutput)
+    for cert in BENCH_CERTIFICATES:
+        assert legacy.sign_tx_certificate(cert) == writer.sign_tx_certificate(cert)
+
+    steps: Dict[str, List[Tuple[Any, ...]]] = {
+        "sign_tx_outputs_basic": [(txOutput,) for txOutput in BENCH_OUTPUTS],
+        "sign_tx_certificate": [(cert,) for cert in BENCH_CERTIFICATES],
+    }
+    for label, args in steps.items():
+        timings = bench({
+            "legacy": calls(getattr(legacy, label), args),
+            "writer": calls(getattr(writer, label), args),
+        })
+        for name, duration in timings.items():
+            print(f"{label} [{name}]".ljust(40) + f"{len(args) / duration:>12,.0f} APDU/s")
+        print(f"{label} speedup".ljust(40) + f"{timings['legacy'] / timings['writer']:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the CIP36 Vote APDUs building.
+It reports the MB/s when building the INIT and CHUNK APDUs of large vote casts from views
+of the vote cast buffer, the votecast hash being computed along, compared to the former
+slicing of the hex string (which also consumed the test case).
+
+Run it from the tests directory:
+    python -m benchmarks.bench_cvote
+"""
+
+from typing import List
+import os
+
+from application_client.app_def import InsType
+from application_client.command_builder import CommandBuilder, P1Type
+from application_client.votecast_hash_builder import VotecastHashBuilder
+from input_files.cvote import MAX_CIP36_PAYLOAD_SIZE, CIP36Vote, CVoteTestCase, cvoteTestCases
+
+from benchmarks.timing import bench
+
+_builder = CommandBuilder()
+WITNESS_PATH = "m/1694'/1815'/0'/0/1"
+
+
+def _hexSlicing(voteCastDataHex: str) -> List[bytes]:
+    """The former INIT and CHUNK APDUs building, on a fresh test case as it was consumed"""
+
+    testCase = CVoteTestCase("bench", CIP36Vote(voteCastDataHex, WITNESS_PATH))
+    payload = testCase.cVote.voteCastDataHex
+    apdus = []
+    p1 = P1Type.P1_INIT
+    while len(payload) > 0:
+        data = bytes.fromhex(payload[:MAX_CIP36_PAYLOAD_SIZE * 2])
+        apdus.append(bytes([0xD7, InsType.SIGN_CIP36_VOTE, p1, 0x00, len(data)]) + data)
+        payload = payload[MAX_CIP36_PAYLOAD_SIZE * 2:]
+        testCase.cVote.voteCastDataHex = payload
+        p1 = P1Type.P1_CHUNK
+    return apdus
+
+
+def _views(testCase: CVoteTestCase) -> bytes:
+    hashBuilder = VotecastHashBuilder(len(testCase.cVote.voteCastData))
+    for _ in _builder.iter_sign_cip36(testCase, hashBuilder):
+        pass
+    return hashBuilder.finalize()
+
+
+def main() -> None:
+    # the fixtures are left untouched, and give the same APDUs on each run
+    for testCase in cvoteTestCases:
+        voteCastDataHex = testCase.cVote.voteCastDataHex
+        apdus = list(_builder.iter_sign_cip36(testCase))
+        assert list(_builder.iter_sign_cip36(testCase)) == apdus
+        assert [_builder.sign_cip36_init(testCase)] + _builder.sign_cip36_chunk(testCase) == apdus
+        assert testCase.cVote.voteCastDataHex == voteCastDataHex
+
+    for size in (1 << 12, 1 << 16, 1 << 20):
+        voteCastDataHex = os.urandom(size).hex()
+        testCase = CVoteTestCase("bench", CIP36Vote(voteCastDataHex, WITNESS_PATH))
+        timings = bench({
+            "hex string slicing": lambda: _hexSlicing(voteCastDataHex),
+            "views, hashed": lambda: _views(testCase),
+        }, repeat=3, number=1)
+        for name, duration in timings.items():
+            print(f"{name} [{size >> 10:,} KiB]".ljust(35) + f"{size / duration / 1e6:>10,.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the host side Byron address derivation.
+It compares the cached seed and coin context with a derivation from scratch.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_derive_address
+"""
+
+from bip_utils import Bip44, Bip44Coins, Bip44Changes, Bip39SeedGenerator
+from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
+from ragger.bip.seed import SPECULOS_MNEMONIC
+
+from input_files.derive_address import DeriveAddressTestCase, byronTestCases
+
+from utils import derive_address
+
+from benchmarks.timing import bench, calls
+
+
+def legacy_derive_address_byron(testCase: DeriveAddressTestCase) -> str:
+    """Byron address derivation from scratch, as done before the seed cache"""
+
+    seed_bytes = Bip39SeedGenerator(SPECULOS_MNEMONIC).Generate()
+    bip44_mst_ctx = Bip44.FromSeed(seed_bytes, Bip44Coins.CARDANO_BYRON_LEDGER)
+    bip32Path: Bip32Path = Bip32PathParser.Parse(testCase.spendingValue).ToList()
+    bip44_acc = bip44_mst_ctx.Purpose().Coin().Account(bip32Path[2])
+    bip44_chg = bip44_acc.Change(Bip44Changes.CHAIN_EXT if bip32Path[3] == 0 else Bip44Changes.CHAIN_INT)
+    bip44_addr = bip44_chg.AddressIndex(bip32Path[4])
+    return bip44_addr.PublicKey().ToAddress()
+
+
+def main() -> None:
+    args = [(testCase,) for testCase in byronTestCases]
+
+    # Both paths must produce the same addresses
+    for testCase in byronTestCases:
+        assert legacy_derive_address_byron(testCase) == derive_address(testCase)
+
+    timings = bench({
+        "legacy": calls(legacy_derive_address_byron, args),
+        "cached": calls(derive_address, args),
+    }, repeat=5, number=5)
+    for name, duration in timings.items():
+        print(f"byronTestCases [{name}]".ljust(40) + f"{len(args) / duration:>12,.1f} addresses/s")
+    print("byronTestCases speedup".ljust(40) + f"{timings['legacy'] / timings['cached']:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
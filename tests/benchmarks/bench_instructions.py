@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the APDU builders, per instruction.
+It reports the APDUs/s built from the test fixtures, and the speedup over
+the legacy concatenation path when the builder has been reworked.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_instructions
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from application_client.command_builder import CommandBuilder, P1Type
+
+from input_files.signOpCert import opCertTestCases
+from input_files.signTx import SignTxTestCase, PoolRegistrationParams, signTxTestCases
+
+from benchmarks.bench_command_builder import LegacyCommandBuilder
+from benchmarks.timing import bench, calls
+
+
+def signTxCases() -> List[SignTxTestCase]:
+    """All the Sign TX test cases of the fixtures"""
+
+    return list(signTxTestCases)
+
+
+def _instructions() -> Dict[str, List[Tuple[Any, ...]]]:
+    """Builder arguments gathered from the fixtures, by builder method"""
+
+    cases = signTxCases()
+    args: Dict[str, List[Tuple[Any, ...]]] = {
+        "sign_opCert": [(testCase,) for testCase in opCertTestCases],
+        "sign_tx_init": [(testCase, len(testCase.tx.inputs)) for testCase in cases],
+        "sign_tx_inputs": [],
+        "sign_tx_outputs_basic": [],
+        "sign_tx_asset_group": [],
+        "sign_tx_token": [],
+        "sign_tx_fee": [(testCase,) for testCase in cases],
+        "sign_tx_ttl": [(testCase,) for testCase in cases if testCase.tx.ttl is not None],
+        "sign_tx_certificate": [],
+        "sign_tx_cert_pool_reg_financials": [],
+        "sign_tx_withdrawal": [],
+        "sign_tx_mint_init": [(len(testCase.tx.mint),) for testCase in cases if len(testCase.tx.mint) > 0],
+        "sign_tx_required_signers": [],
+        "sign_tx_witness": [],
+    }
+    for testCase in cases:
+        tx = testCase.tx
+        args["sign_tx_inputs"] += [(txInput,) for txInput in tx.inputs]
+        args["sign_tx_outputs_basic"] += [(txOutput,) for txOutput in tx.outputs]
+        for txOutput in tx.outputs:
+            for assetGroup in txOutput.tokenBundle:
+                args["sign_tx_asset_group"].append((P1Type.P1_OUTPUTS, assetGroup))
+                args["sign_tx_token"] += [(P1Type.P1_OUTPUTS, token) for token in assetGroup.tokens]
+        args["sign_tx_certificate"] += [(certificate,) for certificate in tx.certificates]
+        args["sign_tx_cert_pool_reg_financials"] += [(certificate.params,) for certificate in tx.certificates
+                                                     if isinstance(certificate.params, PoolRegistrationParams)]
+        args["sign_tx_withdrawal"] += [(withdrawal,) for withdrawal in tx.withdrawals]
+        args["sign_tx_required_signers"] += [(signer,) for signer in tx.requiredSigners]
+        args["sign_tx_witness"] += [(path,) for path in testCase.additionalWitnessPaths]
+        args["sign_tx_witness"] += [(txInput.path,) for txInput in tx.inputs if txInput.path is not None]
+    return {method: values for method, values in args.items() if len(values) > 0}
+
+
+def main() -> None:
+    legacy = LegacyCommandBuilder()
+    builder = CommandBuilder()
+
+    print("Instruction".ljust(36) + "APDU/s".rjust(12) + "legacy".rjust(12) + "speedup".rjust(10))
+    for method, values in _instructions().items():
+        funcs: Dict[str, Callable[[], object]] = {"builder": calls(getattr(builder, method), values)}
+        # Only the reworked builders have a legacy implementation
+        reworked = method in vars(LegacyCommandBuilder)
+        if reworked:
+            for value in values:
+                assert getattr(legacy, method)(*value) == getattr(builder, method)(*value), method
+            funcs["legacy"] = calls(getattr(legacy, method), values)
+        timings = bench(funcs, repeat=7, number=200)
+        line = method.ljust(36) + f"{len(values) / timings['builder']:>12,.0f}"
+        if reworked:
+            line += f"{len(values) / timings['legacy']:>12,.0f}" + f"{timings['legacy'] / timings['builder']:>9.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the host-side soft derivation.
+It reports the keys/s derived for a range of addresses of an account, from the
+account extended public key, compared to the bip_utils public derivation and to
+the derivation of each full path from the seed.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_key_derivation
+"""
+
+from typing import List
+
+from bip_utils import Bip32KeyData
+from ragger.bip import CurveChoice
+from ragger.bip.seed import GET_CURVE_OBJ
+
+from key_derivation import ExtendedPublicKey, derive_range
+from utils import clear_derivation_caches, get_device_pubkey
+
+from benchmarks.timing import bench
+
+ACCOUNT_PATH = "m/1852'/1815'/0'"
+NB_ADDRESSES = 1000
+
+
+def main() -> None:
+    publicKey, chainCode = get_device_pubkey(ACCOUNT_PATH)
+    account = ExtendedPublicKey(publicKey, bytes.fromhex(chainCode))
+
+    def softDerivation() -> List[bytes]:
+        return [node.publicKey for node in derive_range(account, (0,), 0, NB_ADDRESSES)]
+
+    def bipUtils() -> List[bytes]:
+        curve = GET_CURVE_OBJ[CurveChoice.Ed25519Kholaw]
+        chain = curve.FromPublicKey(b"\x00" + publicKey, Bip32KeyData(chain_code=account.chainCode)).ChildKey(0)
+        return [chain.ChildKey(index).PublicKey().RawCompressed().ToBytes()[1:] for index in range(NB_ADDRESSES)]
+
+    def seedDerivation() -> List[bytes]:
+        clear_derivation_caches()
+        return [get_device_pubkey(f"{ACCOUNT_PATH}/0/{index}")[0] for index in range(NB_ADDRESSES)]
+
+    reference = seedDerivation()
+    assert softDerivation() == reference
+    assert bipUtils() == reference
+
+    timings = bench({
+        "soft derivation": softDerivation,
+        "bip_utils public derivation": bipUtils,
+        "seed derivation": seedDerivation,
+    }, repeat=3, number=1)
+    for name, duration in timings.items():
+        print(f"{NB_ADDRESSES} keys [{name}]".ljust(45) + f"{NB_ADDRESSES / duration:>12,.1f} keys/s")
+
+
+if __name__ == "__main__":
+    main()
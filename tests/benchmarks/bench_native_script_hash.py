@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the native script hasher.
+It checks the fixture hashes and the hasher against the builder mirroring the device,
+then reports the time to hash large multisig policies, sharing their key committees,
+and a script nested deeper than the recursion limit.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_native_script_hash
+"""
+
+from typing import List
+
+from input_files.derive_native_script import ValidNativeScriptTestCases, NativeScript, NativeScriptType
+from input_files.derive_native_script import NativeScriptParamsPubkey, NativeScriptParamsScripts
+from input_files.derive_native_script import NativeScriptParamsNofK, NativeScriptParamsInvalid
+
+from application_client.native_script_hash_builder import NativeScriptHashBuilder, NativeScriptHasher
+from application_client.native_script_hash_builder import feed_native_script
+from utils import get_device_key_hash
+
+from benchmarks.timing import bench
+
+NB_COMMITTEES = 50
+COMMITTEE_SIZE = 40
+NB_POLICIES = 20
+NESTING_DEPTH = 2000
+
+
+def _builderHash(script: NativeScript) -> bytes:
+    builder = NativeScriptHashBuilder()
+    feed_native_script(builder, script, get_device_key_hash)
+    return builder.finalize()
+
+
+def _pubkey(index: int) -> NativeScript:
+    return NativeScript(NativeScriptType.PUBKEY_THIRD_PARTY, NativeScriptParamsPubkey(index.to_bytes(28, "big").hex()))
+
+
+def _policies() -> List[NativeScript]:
+    """Treasury like policies: any committee reaching its quorum before a deadline, committees being shared"""
+
+    committees = [NativeScript(NativeScriptType.N_OF_K,
+                               NativeScriptParamsNofK(COMMITTEE_SIZE // 2 + 1,
+                                                      [_pubkey(committee * COMMITTEE_SIZE + key)
+                                                       for key in range(COMMITTEE_SIZE)]))
+                  for committee in range(NB_COMMITTEES)]
+    return [NativeScript(NativeScriptType.ALL,
+                         NativeScriptParamsScripts([
+                             NativeScript(NativeScriptType.INVALID_HEREAFTER, NativeScriptParamsInvalid(100_000 + policy)),
+                             NativeScript(NativeScriptType.ANY, NativeScriptParamsScripts(committees))]))
+            for policy in range(NB_POLICIES)]
+
+
+def _nested(depth: int) -> NativeScript:
+    script = _pubkey(0)
+    for level in range(depth):
+        script = NativeScript(NativeScriptType.ALL if level % 2 else NativeScriptType.ANY,
+                              NativeScriptParamsScripts([script, _pubkey(level + 1)]))
+    return script
+
+
+def _checkFixtures(hasher: NativeScriptHasher) -> None:
+    for testCase in ValidNativeScriptTestCases:
+        assert hasher.hash(testCase.script).hex() == testCase.expected.hash, testCase.name
+        assert _builderHash(testCase.script).hex() == testCase.expected.hash, testCase.name
+    try:
+        hasher.hash(NativeScript(NativeScriptType.N_OF_K, NativeScriptParamsNofK(1)))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Invalid N_OF_K script hashed")
+
+
+def main() -> None:
+    hasher = NativeScriptHasher(get_device_key_hash)
+    _checkFixtures(hasher)
+
+    policies = _policies()
+    numLeaves = 1 + NB_COMMITTEES * COMMITTEE_SIZE
+    assert [hasher.hash(policy) for policy in policies] == [_builderHash(policy) for policy in policies]
+
+    def coldHasher() -> List[bytes]:
+        hasher.clear()
+        return [hasher.hash(policy) for policy in policies]
+
+    def warmHasher() -> List[bytes]:
+        return [hasher.hash(policy) for policy in policies]
+
+    timings = bench({
+        "device builder": lambda: [_builderHash(policy) for policy in policies],
+        "hasher, cold cache": coldHasher,
+        "hasher, warm cache": warmHasher,
+    }, repeat=5, number=1)
+    for name, duration in timings.items():
+        print(f"{NB_POLICIES} policies of {numLeaves} leaves [{name}]".ljust(55)
+              + f"{1000 * duration / NB_POLICIES:>10,.3f} ms/policy")
+
+    nested = _nested(NESTING_DEPTH)
+    hasher.clear()
+    duration = bench({"nested": lambda: hasher.hash(nested)}, repeat=1, number=1)["nested"]
+    print(f"script nested {NESTING_DEPTH} levels deep".ljust(55) + f"{1000 * duration:>10,.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
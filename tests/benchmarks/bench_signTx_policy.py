@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the host-side Sign TX security policies.
+It reports the transactions/s classified, in normal and expert mode; the simulated policies
+are checked against the expected status of the fixtures by test_signTx_policy.py.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_signTx_policy
+"""
+
+from signTx_policy import sign_tx_denial
+
+from benchmarks.bench_instructions import signTxCases
+from benchmarks.timing import bench, calls
+
+
+def main() -> None:
+    cases = signTxCases()
+    timings = bench({
+        "normal": calls(sign_tx_denial, [(testCase, False) for testCase in cases]),
+        "expert": calls(sign_tx_denial, [(testCase, True) for testCase in cases]),
+    }, repeat=5, number=20)
+    for name, duration in timings.items():
+        print(f"signTx policies [{name}]".ljust(40) + f"{len(cases) / duration:>12,.1f} txs/s"
+              + f"{duration / len(cases) * 1e6:>10.1f} us/tx")
+
+
+if __name__ == "__main__":
+    main()
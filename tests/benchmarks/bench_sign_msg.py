@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the Sign Message chunks building.
+It reports the MB/s and the peak memory when building the CHUNK APDUs of hashed messages,
+streamed from memory mapped files along with their hash, compared to the former slicing
+of the message hex string.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_sign_msg
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, List, Optional
+import hashlib
+import os
+import time
+import tracemalloc
+
+from application_client.command_builder import CommandBuilder
+from application_client.command_sender import CIP8_MSG_HASH_LENGTH
+from input_files.signMsg import MessageData, MessageAddressFieldType, SignMsgTestCase, NavigationData
+from input_files.signMsg import open_message, iter_message_chunks
+
+_builder = CommandBuilder()
+
+
+def _testCase(messageHex: str, message: Optional[Path] = None) -> SignMsgTestCase:
+    return SignMsgTestCase("bench",
+                           MessageData(messageHex, "m/1852'/1815'/0'/0/1", True, False,
+                                       MessageAddressFieldType.KEY_HASH, message=message),
+                           NavigationData([], [], []))
+
+
+def _hexSlicing(testCase: SignMsgTestCase) -> List[bytes]:
+    """The former CHUNK APDUs building, slicing the hex string at each chunk"""
+
+    payload = testCase.msgData.messageHex
+    chunkSize = min(99 * 2, len(payload))
+    chunks = []
+    while True:
+        chunks.append(_builder.sign_msg_chunk_apdu(memoryview(bytes.fromhex(payload[:chunkSize]))))
+        payload = payload[chunkSize:]
+        chunkSize = min(250 * 2, len(payload))
+        if len(payload) == 0:
+            break
+    return chunks
+
+
+def _streaming(testCase: SignMsgTestCase) -> bytes:
+    """The CHUNK APDUs building of CommandSender.sign_msg_chunk, hashing the message in the same pass"""
+
+    msgHash = hashlib.blake2b(digest_size=CIP8_MSG_HASH_LENGTH)
+    with open_message(testCase.msgData) as message:
+        for chunk in iter_message_chunks(message, testCase.msgData.isAscii):
+            with chunk:
+                msgHash.update(chunk)
+                _builder.sign_msg_chunk_apdu(chunk)
+    return msgHash.digest()
+
+
+def _writeMessage(path: Path, size: int) -> None:
+    block = os.urandom(1 << 16)
+    with open(path, "wb") as file:
+        for _ in range(size >> 16):
+            file.write(block)
+
+
+def _report(name: str, size: int, run: Callable[[], object]) -> None:
+    """Report the MB/s, then the peak memory in a separate traced run"""
+
+    start = time.perf_counter()
+    run()
+    duration = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name} [{size >> 10:,} KiB]".ljust(40) + f"{size / duration / 1e6:>10,.2f} MB/s {peak / 1024:>12,.1f} KiB peak")
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        for size in (1 << 18, 1 << 20):
+            path = Path(directory) / f"message_{size}"
+            _writeMessage(path, size)
+            testCase = _testCase(path.read_bytes().hex())
+            streamed = _testCase("", path)
+            assert _builder.sign_msg_chunk(streamed) == _hexSlicing(testCase)
+            _report("hex string slicing", size, lambda: _hexSlicing(testCase))
+            _report("memory mapped streaming", size, lambda: _streaming(streamed))
+        for size in (16 << 20, 64 << 20):
+            path = Path(directory) / f"message_{size}"
+            _writeMessage(path, size)
+            streamed = _testCase("", path)
+            assert _streaming(streamed) == hashlib.blake2b(path.read_bytes(), digest_size=CIP8_MSG_HASH_LENGTH).digest()
+            _report("memory mapped streaming", size, lambda: _streaming(streamed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the streaming TX body decoder.
+It reports the TX bodies/s and the peak memory when replaying a large chain dump made of the
+fixture bodies, given as bare TX bodies, transactions and era wrapped blocks; the decoder is
+checked against the reference TX body encoder by test_tx_decoder.py.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_tx_decoder
+"""
+
+from itertools import cycle, islice
+from tempfile import TemporaryFile
+from typing import BinaryIO, Callable, List
+import time
+import tracemalloc
+
+from application_client.tx_decoder import TxDecoder, iter_tx_bodies
+from input_files.signTx_chain import ChainReplayStats, iter_chain_test_cases
+
+from benchmarks.bench_instructions import signTxCases
+
+BLOCK_SIZE = 50
+# Array(4)[body, Map(0), true, null]
+_TX_PREFIX, _TX_SUFFIX = bytes([0x84]), bytes([0xA0, 0xF5, 0xF6])
+# Array(2)[Unsigned[6], Array(5)[header, Array(n)[bodies], Array(n)[witnesses], Map(0), Array(0)]]
+_BLOCK_PREFIX, _BLOCK_HEADER = bytes([0x82, 0x06, 0x85]), bytes([0x82, 0x80, 0x40])
+_BLOCK_SUFFIX = bytes([0x98, BLOCK_SIZE]) + bytes([0xA0]) * BLOCK_SIZE + bytes([0xA0, 0x80])
+
+
+def _fixtureBodies() -> List[bytes]:
+    """The distinct mainnet TX bodies of the fixtures"""
+
+    bodies = {}
+    for testCase in signTxCases():
+        if testCase.txBody != "":
+            bodies[testCase.txBody] = testCase.tx.network
+    return [bytes.fromhex(bodyHex) for bodyHex, network in bodies.items() if network.networkId == 1]
+
+
+def _writeDump(stream: BinaryIO, bodies: List[bytes], numBodies: int) -> None:
+    """Write a chain dump: a third of bare TX bodies, of transactions and of blocks"""
+
+    source = cycle(bodies)
+    written = 0
+    while written < numBodies:
+        stream.write(next(source))
+        stream.write(_TX_PREFIX + next(source) + _TX_SUFFIX)
+        stream.write(_BLOCK_PREFIX + _BLOCK_HEADER + bytes([0x98, BLOCK_SIZE]))
+        stream.writelines(islice(source, BLOCK_SIZE))
+        stream.write(_BLOCK_SUFFIX)
+        written += 2 + BLOCK_SIZE
+    stream.seek(0)
+
+
+def _run(name: str, stream: BinaryIO, replay: Callable[[BinaryIO], int]) -> None:
+    """Report the TX bodies/s and the peak memory of a replay"""
+
+    start = time.perf_counter()
+    numBodies = replay(stream)
+    duration = time.perf_counter() - start
+    # the memory is traced separately, tracing slowing down the allocations
+    stream.seek(0)
+    tracemalloc.start()
+    replay(stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stream.seek(0)
+    print(f"{name} [{numBodies:,}]".ljust(40) + f"{numBodies / duration:>12,.1f} tx/s {peak / 1024:>10,.1f} KiB peak")
+
+
+def _decodeBodies(stream: BinaryIO) -> int:
+    decoder = TxDecoder()
+    numBodies = 0
+    for body in iter_tx_bodies(stream):
+        decoder.decode(body)
+        numBodies += 1
+    return numBodies
+
+
+def _testCases(stream: BinaryIO) -> int:
+    stats = ChainReplayStats()
+    for _ in iter_chain_test_cases(stream, stats=stats):
+        pass
+    assert stats.testCases + sum(stats.skipped.values()) == stats.bodies
+    return stats.testCases
+
+
+def main() -> None:
+    bodies = _fixtureBodies()
+    with TemporaryFile() as stream:
+        _writeDump(stream, bodies, 20_000)
+        stats = ChainReplayStats()
+        for _ in iter_chain_test_cases(stream, stats=stats):
+            pass
+        stream.seek(0)
+        print(f"{stats.bodies:,} bodies: {stats.testCases:,} test cases, {stats.reserialized:,} reserialized")
+        for reason, count in stats.skipped.most_common():
+            print(f"  skipped {count:>8,}: {reason}")
+        _run("decode TX bodies", stream, _decodeBodies)
+        _run("chain test cases", stream, _testCases)
+    with TemporaryFile() as stream:
+        _writeDump(stream, bodies, 100_000)
+        _run("decode TX bodies", stream, _decodeBodies)
+
+
+if __name__ == "__main__":
+    main()
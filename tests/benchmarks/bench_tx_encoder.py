@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the reference TX body encoder.
+It reports the TX bodies/s hashed from the test fixtures, with and without
+keeping the serialized body.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_tx_encoder
+"""
+
+from input_files.signTx import TxAuxiliaryDataType
+
+from utils import encode_tx_body, hash_tx_body
+
+from benchmarks.bench_instructions import signTxCases
+from benchmarks.timing import bench, calls
+
+
+def main() -> None:
+    # The CIP36 registrations are not supported by the host encoder
+    args = [(testCase,) for testCase in signTxCases()
+            if testCase.tx.auxiliaryData is None
+            or testCase.tx.auxiliaryData.type != TxAuxiliaryDataType.CIP36_REGISTRATION]
+
+    # Warm up the key derivation caches
+    for (testCase,) in args:
+        assert encode_tx_body(testCase)[1] == hash_tx_body(testCase)
+
+    timings = bench({
+        "encode": calls(encode_tx_body, args),
+        "hash": calls(hash_tx_body, args),
+    }, repeat=5, number=20)
+    for name, duration in timings.items():
+        print(f"signTx bodies [{name}]".ljust(40) + f"{len(args) / duration:>12,.1f} bodies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a benchmark of the TX hash builder.
+It reports the body items/s and the peak memory when hashing large synthetic bodies;
+the builder is checked against the reference TX body encoder by test_tx_hash_builder.py.
+
+Run it from the tests directory:
+    python -m benchmarks.bench_tx_hash_builder
+"""
+
+from typing import Iterator, Tuple
+import time
+import tracemalloc
+
+from input_files.signTx import DatumType, TxOutputFormat
+
+from application_client.tx_hash_builder import TxHashBuilder, TxOutputDescription
+
+_ADDRESS = bytes.fromhex("01" + "11" * 28 + "22" * 28)
+_POLICY_ID = bytes(range(28))
+_DATUM = bytes.fromhex("d8799f4100ff") * 20
+_CHUNK_SIZE = 40
+
+
+def _txHash(i: int) -> bytes:
+    return i.to_bytes(32, "big")
+
+
+def _outputs(numOutputs: int) -> Iterator[Tuple[int, bool, bool]]:
+    """Synthetic outputs: (amount, withTokens, withDatum)"""
+
+    for i in range(numOutputs):
+        yield 1_000_000 + i, i % 2 == 0, i % 4 == 0
+
+
+def _buildBody(numItems: int) -> TxHashBuilder:
+    builder = TxHashBuilder(numItems, numItems, includeTtl=True)
+    builder.enterInputs()
+    for i in range(numItems):
+        builder.addInput(_txHash(i), i & 0xFF)
+    builder.enterOutputs()
+    for amount, withTokens, withDatum in _outputs(numItems):
+        builder.addOutputTopLevelData(TxOutputDescription(TxOutputFormat.MAP_BABBAGE, _ADDRESS, amount,
+                                                          numAssetGroups=int(withTokens), includeDatum=withDatum))
+        if withTokens:
+            builder.addOutputTokenGroup(_POLICY_ID, 1)
+            builder.addOutputToken(b"token", amount)
+        if withDatum:
+            builder.addOutputDatum(DatumType.INLINE, _DATUM[:_CHUNK_SIZE], len(_DATUM))
+            for offset in range(_CHUNK_SIZE, len(_DATUM), _CHUNK_SIZE):
+                builder.addOutputDatumInlineChunk(_DATUM[offset:offset + _CHUNK_SIZE])
+    builder.addFee(170_000)
+    builder.addTtl(50_000_000)
+    return builder
+
+
+def main() -> None:
+    for numItems in (10_000, 100_000, 500_000):
+        start = time.perf_counter()
+        _buildBody(numItems).finalize()
+        duration = time.perf_counter() - start
+        # the memory is traced separately, tracing slowing down the allocations
+        tracemalloc.start()
+        _buildBody(numItems).finalize()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{numItems:,} inputs + outputs".ljust(40)
+              + f"{2 * numItems / duration:>12,.1f} items/s {peak / 1024:>10,.1f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
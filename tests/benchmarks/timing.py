@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the timing helpers shared by the benchmarks.
+"""
+
+import timeit
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+
+def calls(method: Callable[..., object], args: Sequence[Tuple[Any, ...]]) -> Callable[[], object]:
+    """Function calling a method once per arguments tuple
+
+    Args:
+        method (Callable): Method to call
+        args (Sequence[Tuple]): Arguments of each call
+
+    Returns:
+        The function to time
+    """
+
+    def run() -> object:
+        return [method(*arg) for arg in args]
+    return run
+
+
+def bench(funcs: Dict[str, Callable[[], object]], repeat: int = 15, number: int = 1000) -> Dict[str, float]:
+    """Time concurrent implementations, interleaving the runs to share the machine noise
+
+    Args:
+        funcs (Dict[str, Callable]): Functions to time, by name
+        repeat (int): Number of timing runs
+        number (int): Number of calls per timing run
+
+    Returns:
+        The best time of a single call, by name
+    """
+
+    best = {name: float("inf") for name in funcs}
+    for _ in range(repeat):
+        for name, func in funcs.items():
+            best[name] = min(best[name], timeit.timeit(func, number=number) / number)
+    return best
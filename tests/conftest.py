@@ -1,8 +1,11 @@
+import os
+from typing import Generator, List
 import pytest
 from ragger.conftest import configuration
 from ragger.backend import BackendInterface
 
 from application_client.command_sender import CommandSender
+from application_client.apdu_transcript import TranscriptRecorder
 
 ###########################
 ### CONFIGURATION START ###
@@ -25,6 +28,31 @@ pytest_plugins = ("ragger.conftest.base_conftest", )
 # CONFIGURATION OVERRIDE #
 ##########################
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    # Large transactions benchmark, too slow for the regular runs (see test_signTx_stress.py)
+    parser.addoption("--stress", action="store_true", default=False, help="Run the Sign TX stress tests")
+    # APDU transcript, recorded by all the command senders, or replayed (see test_replay_transcript.py)
+    parser.addoption("--transcript", action="store", default=None,
+                     help="Append all the APDU exchanges to the transcript file in parameter")
+    parser.addoption("--replay_transcript", action="store", default=None,
+                     help="Replay the transcript file in parameter, diffing the responses")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def transcriptRecorder(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    # Recorder of all the command senders of the session, closed once the session is over
+    transcript = request.config.getoption("transcript")
+    if transcript is None:
+        yield
+        return
+    with TranscriptRecorder(transcript) as recorder:
+        CommandSender.defaultRecorder = recorder
+        try:
+            yield
+        finally:
+            CommandSender.defaultRecorder = None
+
+
 @pytest.fixture(scope=configuration.OPTIONAL.BACKEND_SCOPE)
 def appFlags(backend: BackendInterface) -> dict:
     # Use the app interface instead of raw interface
@@ -37,3 +65,12 @@ def appFlags(backend: BackendInterface) -> dict:
     }
 
     return app_flags
+
+
+@pytest.fixture(scope=configuration.OPTIONAL.BACKEND_SCOPE)
+def additional_speculos_arguments() -> List[str]:
+    # Dedicated ports, when several Speculos instances are started side by side (see replay_signTx.py)
+    apiPort = os.environ.get("SPECULOS_API_PORT")
+    if apiPort is None:
+        return []
+    return ["--api-port", apiPort, "--apdu-port", str(int(apiPort) + 1)]
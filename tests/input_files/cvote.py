@@ -6,6 +6,7 @@ This module provides Ragger tests for CIP-36 Vote check
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 
 MAX_CIP36_PAYLOAD_SIZE = 240
 
@@ -15,6 +16,12 @@ class CIP36Vote:
     voteCastDataHex: str  # bytestring to sign in hex
     witnessPath: str      # the witness path for which we need a signature
 
+    @cached_property
+    def voteCastData(self) -> bytes:
+        """The bytestring to sign, decoded once and never modified"""
+
+        return bytes.fromhex(self.voteCastDataHex)
+
 @dataclass
 class CVoteTestCase:
     name: str
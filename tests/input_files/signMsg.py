@@ -4,9 +4,12 @@
 """
 This module provides Ragger tests for Sign Message
 """
+from contextlib import contextmanager
 from enum import IntEnum
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 from dataclasses import dataclass
+import mmap
+import os
 
 from ragger.navigator import NavInsID
 
@@ -14,19 +17,33 @@ from input_files.derive_address import DeriveAddressTestCase
 from application_client.app_def import AddressType, Mainnet
 
 
+# Chunk sizes expected by the device (src/signMsg/signMsg.h)
+MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE = 198
+MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE = 99
+MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE = 250
+
+# Message given as a buffer, a memory map or the path of a file
+MessageSource = Union[bytes, bytearray, memoryview, mmap.mmap, os.PathLike]
+
+
 class MessageAddressFieldType(IntEnum):
     ADDRESS = 0x01
     KEY_HASH = 0x02
 
 @dataclass
 class MessageData:
-    """CIP-8 message signing"""
+    """CIP-8 message signing
+
+    The message is given by messageHex, unless a message source is given.
+    Large messages can only be signed with hashPayload.
+    """
     messageHex: str
     signingPath: str
     hashPayload: bool
     isAscii: bool
     addressFieldType: MessageAddressFieldType
     addressDesc: Optional[DeriveAddressTestCase] = None
+    message: Optional[MessageSource] = None
 
 @dataclass
 class NavigationData:
@@ -41,6 +58,76 @@ class SignMsgTestCase:
     nav: NavigationData
 
 
+def message_size(msgData: MessageData) -> int:
+    """Size of the message, without reading it
+
+    Args:
+        msgData (MessageData): The message data
+
+    Returns:
+        The message size in bytes
+    """
+
+    if msgData.message is None:
+        return len(msgData.messageHex) // 2
+    if isinstance(msgData.message, os.PathLike):
+        return os.path.getsize(msgData.message)
+    return memoryview(msgData.message).nbytes
+
+
+@contextmanager
+def open_message(msgData: MessageData) -> Iterator[memoryview]:
+    """Access the message without copying it, the files being memory mapped
+
+    Args:
+        msgData (MessageData): The message data
+
+    Returns:
+        Generator of the message view, valid within the context only
+    """
+
+    if msgData.message is None:
+        view = memoryview(bytes.fromhex(msgData.messageHex))
+    elif not isinstance(msgData.message, os.PathLike):
+        view = memoryview(msgData.message).cast("B")
+    else:
+        with open(msgData.message, "rb") as file:
+            # empty files cannot be mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                view = memoryview(mapping)
+                try:
+                    yield view
+                finally:
+                    # the mapping cannot be closed while exported
+                    view.release()
+            return
+    with view:
+        yield view
+
+
+def iter_message_chunks(message: memoryview, isAscii: bool) -> Iterator[memoryview]:
+    """Split the message in the chunks expected by the device
+
+    The first chunk is displayed, hence smaller, the following ones are hidden.
+    An empty message is sent as a single empty chunk.
+
+    Args:
+        message (memoryview): The message
+        isAscii (bool): The message display mode
+
+    Returns:
+        Iterator on the chunks, as views of the message
+    """
+
+    firstChunkSize = MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE if isAscii else MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE
+    yield message[:firstChunkSize]
+    for offset in range(firstChunkSize, len(message), MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE):
+        yield message[offset:offset + MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE]
+
+
 # pylint: disable=line-too-long
 signMsgTestCases = [
         SignMsgTestCase("msg01: Should correctly sign an empty message with keyhash as address field",
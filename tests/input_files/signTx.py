@@ -3719,3 +3719,7 @@ outputRejectTestCases: List[SignTxTestCase] = [
                    "",
                    expected_sw=Errors.SW_REJECTED_BY_POLICY),
 ]
+
+# All the test cases above, for the checks of the host side mirrors of the app
+signTxTestCases: List[SignTxTestCase] = [testCase for value in list(globals().values()) if isinstance(value, list)
+                                         for testCase in value if isinstance(testCase, SignTxTestCase)]
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Sign TX test cases replaying chain data.
+The TX bodies of a CBOR dump (concatenated TX bodies, transactions or blocks) are decoded lazily,
+each of them giving a test case in the first signing mode the security policies allow.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, Optional
+import hashlib
+
+from application_client.app_def import Mainnet, NetworkDesc
+from application_client.tx_decoder import TxDecoder, iter_cbor_items, iter_item_tx_bodies
+from application_client.tx_encoder import THIRD_PARTY_ENCODER
+from input_files.signTx import SignTxTestCase, TransactionSigningMode
+from signTx_policy import sign_tx_denial
+
+# Signing modes tried for a chain transaction, the first one allowed being kept
+CHAIN_SIGNING_MODES = (
+    TransactionSigningMode.ORDINARY_TRANSACTION,
+    TransactionSigningMode.MULTISIG_TRANSACTION,
+    TransactionSigningMode.PLUTUS_TRANSACTION,
+)
+
+
+@dataclass
+class ChainReplayStats:
+    """Outcome of the TX bodies of a chain dump"""
+    bodies: int = 0
+    testCases: int = 0
+    # Test cases whose device serialization differs from the chain one (items order, indefinite lengths...)
+    reserialized: int = 0
+    # Items of the dump which are not a valid TX body, transaction or block, by reason
+    malformedItems: Counter = field(default_factory=Counter)
+    # Bodies without test case, by reason
+    skipped: Counter = field(default_factory=Counter)
+
+
+def _iterChainTxBodies(stream: BinaryIO, stats: ChainReplayStats) -> Iterator[bytes]:
+    """TX bodies of a chain dump, a malformed item being counted and skipped instead of ending the replay"""
+
+    for item in iter_cbor_items(stream):
+        try:
+            bodies = list(iter_item_tx_bodies(item))
+        except (ValueError, IndexError) as error:
+            stats.malformedItems[str(error)] += 1
+            continue
+        yield from bodies
+
+
+def iter_chain_test_cases(stream: BinaryIO,
+                          network: NetworkDesc = Mainnet,
+                          stats: Optional[ChainReplayStats] = None) -> Iterator[SignTxTestCase]:
+    """Generate the Sign TX test cases of a chain dump
+
+    The test cases are named by their transaction id, their TX body being the device
+    serialization of the decoded body. The bodies the device cannot sign are skipped.
+
+    Args:
+        stream (BinaryIO): The binary stream of the chain dump
+        network (NetworkDesc): The network of the transactions
+        stats (Optional[ChainReplayStats]): Statistics updated along the replay
+
+    Returns:
+        Iterator on the test cases
+    """
+
+    stats = ChainReplayStats() if stats is None else stats
+    decoder = TxDecoder(network)
+    for body in _iterChainTxBodies(stream, stats):
+        stats.bodies += 1
+        try:
+            tx, tagCborSets = decoder.decode(body)
+        except (ValueError, KeyError, TypeError) as error:
+            stats.skipped[f"decoding: {error}"] += 1
+            continue
+
+        txId = hashlib.blake2b(body, digest_size=32).hexdigest()
+        testCase = SignTxTestCase(txId, tx, CHAIN_SIGNING_MODES[0], "", tagCborSets)
+        denial = None
+        for signingMode in CHAIN_SIGNING_MODES:
+            testCase.signingMode = signingMode
+            denial = sign_tx_denial(testCase)
+            if denial is None:
+                break
+        if denial is not None:
+            stats.skipped[f"policy: {denial.element}"] += 1
+            continue
+
+        try:
+            txBody = THIRD_PARTY_ENCODER.encode(testCase)[0]
+        except (ValueError, NotImplementedError) as error:
+            stats.skipped[f"encoding: {error}"] += 1
+            continue
+        testCase.txBody = txBody.hex()
+        stats.reserialized += txBody != body
+        stats.testCases += 1
+        yield testCase
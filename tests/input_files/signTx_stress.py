@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a generator of large, valid Sign TX test cases, to stress the device.
+The transactions are made of N inputs and M outputs of K asset groups with T tokens each,
+all the outputs paying to the same third party address.
+"""
+
+from typing import List
+
+from application_client.app_def import Mainnet
+from application_client.tx_encoder import THIRD_PARTY_ENCODER
+from input_files.signTx import SignTxTestCase, Transaction, TransactionSigningMode, TxInput, TxOutputAlonzo
+from input_files.signTx import AssetGroup, Token, destinations
+
+# The inputs all share the same witness path, so there is a single witness whatever N
+STRESS_INPUT_PATH = "m/1852'/1815'/0'/0/0"
+STRESS_TX_HASH_HEX = "3b40265111d8bb3c3c608d95b3a0bf83461ace32d79336579a1939b3aad1c0b7"
+STRESS_ASSET_NAME_PREFIX = b"stress"
+
+
+def _policyIdHex(index: int) -> str:
+    # Increasing policy ids, as required by the canonical CBOR ordering
+    return index.to_bytes(28, "big").hex()
+
+
+def _assetNameHex(index: int) -> str:
+    # Increasing asset names of the same length, as required by the canonical CBOR ordering
+    return (STRESS_ASSET_NAME_PREFIX + index.to_bytes(2, "big")).hex()
+
+
+def stress_test_case(numInputs: int,
+                     numOutputs: int,
+                     numAssetGroups: int = 0,
+                     numTokens: int = 0) -> SignTxTestCase:
+    """Generate a valid Sign TX test case of the given size
+
+    Args:
+        numInputs (int): The number of inputs
+        numOutputs (int): The number of outputs
+        numAssetGroups (int): The number of asset groups of each output
+        numTokens (int): The number of tokens of each asset group
+
+    Returns:
+        The test case, with its expected TX body
+    """
+
+    if numInputs < 1 or numOutputs < 1:
+        raise ValueError("A transaction needs at least an input and an output")
+    if (numAssetGroups == 0) != (numTokens == 0):
+        raise ValueError("Asset groups need tokens, and tokens need asset groups")
+    if numAssetGroups > 0xFFFF or numTokens > 0xFFFF:
+        raise ValueError(f"Too many asset groups or tokens: {numAssetGroups} x {numTokens}")
+
+    tokenBundle = [AssetGroup(_policyIdHex(group), [Token(_assetNameHex(token), 1000 + token)
+                                                    for token in range(numTokens)])
+                   for group in range(numAssetGroups)]
+    tx = Transaction(Mainnet,
+                     [TxInput(STRESS_TX_HASH_HEX, STRESS_INPUT_PATH, index) for index in range(numInputs)],
+                     [TxOutputAlonzo(destinations["externalShelleyBaseKeyhashKeyhash"], 2000000 + index,
+                                     tokenBundle=tokenBundle)
+                      for index in range(numOutputs)],
+                     170000,
+                     10)
+    testCase = SignTxTestCase(f"Stress {numInputs} inputs, {numOutputs} outputs, {numAssetGroups}x{numTokens} tokens",
+                              tx,
+                              TransactionSigningMode.ORDINARY_TRANSACTION,
+                              "")
+    testCase.txBody = THIRD_PARTY_ENCODER.encode(testCase)[0].hex()
+    return testCase
+
+
+# Each case grows a single dimension, the last one combining them
+stressTestCases: List[SignTxTestCase] = [
+    stress_test_case(100, 1),
+    stress_test_case(1, 50),
+    stress_test_case(1, 1, 100, 1),
+    stress_test_case(1, 1, 1, 500),
+    stress_test_case(20, 20, 5, 5),
+]
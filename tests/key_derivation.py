@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host-side BIP32-Ed25519 soft derivation of public keys.
+
+The non-hardened children are derived from an extended public key (public key and chain code),
+as returned by the device for the path of a parent node (see src/keyDerivation/keyDerivation.c):
+    Z = HMAC-SHA512(chain code, 0x02 | public key | index)
+    child public key = public key + 8 * Z[0:28] * G
+    child chain code = HMAC-SHA512(chain code, 0x03 | public key | index)[32:64]
+
+The derived nodes are cached by parent node and index, so sibling paths only derive their last level,
+and ranges of indexes reuse the HMAC states of their parent instead of hashing its key for each child.
+The derivation paths of the test cases are parsed by parse_path, shared by the host side derivations and policies.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+import hashlib
+import hmac
+
+from bip_utils.ecc.ed25519.lib.ed25519_lib import point_add, point_scalar_mul_base
+
+
+HARDENED = 0x80000000
+
+PUBLIC_KEY_SIZE = 32
+CHAIN_CODE_SIZE = 32
+# Bytes of Z used for the public key tweak
+ZL_SIZE = 28
+INDEX_SIZE = 4
+
+TAG_PUBLIC_KEY = b"\x02"
+TAG_CHAIN_CODE = b"\x03"
+
+
+@dataclass(frozen=True)
+class ExtendedPublicKey:
+    """Public key and chain code of a node"""
+    publicKey: bytes
+    chainCode: bytes
+
+
+class _ParentNode:
+    """HMAC states of a parent node, its key being already hashed"""
+
+    def __init__(self, node: ExtendedPublicKey) -> None:
+        self._publicKey = node.publicKey
+        self._zHmac = hmac.new(node.chainCode, TAG_PUBLIC_KEY + node.publicKey, hashlib.sha512)
+        self._chainCodeHmac = hmac.new(node.chainCode, TAG_CHAIN_CODE + node.publicKey, hashlib.sha512)
+
+
+    def child(self, index: int) -> ExtendedPublicKey:
+        """Derive a non-hardened child"""
+
+        if not 0 <= index < HARDENED:
+            raise ValueError(f"Soft derivation of index {index:#x} is not possible")
+        indexBytes = index.to_bytes(INDEX_SIZE, "little")
+        zHmac = self._zHmac.copy()
+        zHmac.update(indexBytes)
+        chainCodeHmac = self._chainCodeHmac.copy()
+        chainCodeHmac.update(indexBytes)
+
+        zl = int.from_bytes(zHmac.digest()[:ZL_SIZE], "little")
+        tweak = point_scalar_mul_base((8 * zl).to_bytes(PUBLIC_KEY_SIZE, "little"))
+        return ExtendedPublicKey(point_add(self._publicKey, tweak), chainCodeHmac.digest()[CHAIN_CODE_SIZE:])
+
+
+@lru_cache(maxsize=None)
+def parse_path(path: str) -> Tuple[int, ...]:
+    """Parse a derivation path, like m/1852'/1815'/0'/0/1
+
+    Args:
+        path (str): The derivation path
+
+    Returns:
+        The path elements, hardened ones including the HARDENED bit
+    """
+
+    elements = []
+    for element in path.split("/")[1:]:
+        if element.endswith(("'", "h")):
+            elements.append(int(element[:-1]) | HARDENED)
+        else:
+            elements.append(int(element))
+    return tuple(elements)
+
+
+@lru_cache(maxsize=256)
+def _parentNode(node: ExtendedPublicKey) -> _ParentNode:
+    return _ParentNode(node)
+
+
+@lru_cache(maxsize=4096)
+def derive_child(node: ExtendedPublicKey, index: int) -> ExtendedPublicKey:
+    """Derive a non-hardened child of a node
+
+    Args:
+        node (ExtendedPublicKey): The parent node
+        index (int): The child index, not hardened
+
+    Returns:
+        The child node
+    """
+
+    return _parentNode(node).child(index)
+
+
+def derive_path(node: ExtendedPublicKey, indexes: Sequence[int]) -> ExtendedPublicKey:
+    """Derive a descendant of a node, reusing the cached intermediate nodes
+
+    Args:
+        node (ExtendedPublicKey): The ancestor node, like an account
+        indexes (Sequence[int]): The non-hardened indexes from the ancestor, like (0, 12) for /0/12
+
+    Returns:
+        The descendant node
+    """
+
+    for index in indexes:
+        node = derive_child(node, index)
+    return node
+
+
+def derive_range(node: ExtendedPublicKey, indexes: Sequence[int], start: int, stop: int) -> List[ExtendedPublicKey]:
+    """Derive a range of siblings, like the addresses /0/start to /0/stop-1 of an account
+
+    The parent of the range is derived once, and its children are not cached,
+    so that deriving large ranges does not evict the intermediate nodes.
+
+    Args:
+        node (ExtendedPublicKey): The ancestor node, like an account
+        indexes (Sequence[int]): The non-hardened indexes of the range parent from the ancestor, like (0,)
+        start (int): The first index of the range
+        stop (int): The index after the last one of the range
+
+    Returns:
+        The nodes of the range
+    """
+
+    parent = _parentNode(derive_path(node, indexes))
+    return [parent.child(index) for index in range(start, stop)]
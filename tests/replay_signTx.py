@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This script replays the Sign TX tests sharded over several headless Speculos instances.
+
+The test_signTx.py tests are collected once, then dealt round-robin into shards.
+Each shard is run by its own pytest process, which starts its own Speculos on dedicated ports,
+and the shard reports are merged into a single JUnit report.
+
+Run it from the tests directory:
+    python replay_signTx.py --device nanox --jobs 8 [-- <pytest options>]
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+TESTS_DIR = Path(__file__).resolve().parent
+TEST_MODULE = "test_signTx.py"
+
+# First Speculos API port, as used by Ragger; each shard uses 2 ports (API and APDU)
+DEFAULT_PORT_BASE = 5000
+PORTS_PER_SHARD = 2
+
+OUTCOMES = ("passed", "failed", "error", "skipped")
+
+
+@dataclass
+class ShardResult:
+    """Result of a shard run"""
+    index: int
+    duration: float
+    # Outcome of each test case, by pytest node id
+    outcomes: Dict[str, str] = field(default_factory=dict)
+    # Test cases elements of the shard JUnit report
+    testCases: List[ET.Element] = field(default_factory=list)
+
+
+def _pytest(args: List[str], env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    """Run pytest in the tests directory"""
+
+    return subprocess.run([sys.executable, "-m", "pytest", *args],
+                          cwd=TESTS_DIR,
+                          env=env,
+                          capture_output=True,
+                          text=True,
+                          check=False)
+
+
+def collect(device: str, pytestArgs: List[str]) -> List[str]:
+    """Collect the Sign TX tests
+
+    Args:
+        device (str): The device the tests are run on
+        pytestArgs (List[str]): Additional pytest options, like a -k filter
+
+    Returns:
+        The pytest node ids of the tests
+    """
+
+    result = _pytest(["--collect-only", "-q", TEST_MODULE, "--device", device, *pytestArgs])
+    nodeIds = [line for line in result.stdout.splitlines() if line.startswith(f"{TEST_MODULE}::")]
+    if len(nodeIds) == 0:
+        raise RuntimeError(f"No test collected:\n{result.stdout}{result.stderr}")
+    return nodeIds
+
+
+def shard(nodeIds: List[str], nbShards: int) -> List[List[str]]:
+    """Deal the tests round-robin, so each shard gets a mix of the fixture lists
+
+    Args:
+        nodeIds (List[str]): The pytest node ids
+        nbShards (int): The number of shards
+
+    Returns:
+        The non empty shards
+    """
+
+    shards = [nodeIds[index::nbShards] for index in range(nbShards)]
+    return [nodeIds for nodeIds in shards if len(nodeIds) > 0]
+
+
+def run_shard(index: int, nodeIds: List[str], device: str, portBase: int,
+              pytestArgs: List[str], reportDir: Path) -> ShardResult:
+    """Run a shard against its own Speculos instance
+
+    Args:
+        index (int): The shard index, which selects its Speculos ports
+        nodeIds (List[str]): The pytest node ids of the shard
+        device (str): The device the tests are run on
+        portBase (int): The first Speculos port of the shards
+        pytestArgs (List[str]): Additional pytest options
+        reportDir (Path): The directory of the shard JUnit reports
+
+    Returns:
+        The shard result
+    """
+
+    report = reportDir / f"shard{index}.xml"
+    env = dict(os.environ, SPECULOS_API_PORT=str(portBase + index * PORTS_PER_SHARD))
+    start = time.perf_counter()
+    process = _pytest(["-q", "-p", "no:cacheprovider", f"--junitxml={report}",
+                       "--device", device, *pytestArgs, *nodeIds], env)
+    result = ShardResult(index, time.perf_counter() - start)
+    if not report.is_file():
+        # pytest did not even start the tests: report them all as errors
+        result.outcomes = {nodeId: "error" for nodeId in nodeIds}
+        print(f"shard {index}: {process.stdout}{process.stderr}", file=sys.stderr)
+        return result
+    for testCase in ET.parse(report).getroot().iter("testcase"):
+        result.testCases.append(testCase)
+        result.outcomes[_nodeId(testCase)] = _outcome(testCase)
+    return result
+
+
+def _nodeId(testCase: ET.Element) -> str:
+    """pytest node id of a JUnit test case"""
+
+    return f"{TEST_MODULE}::{testCase.get('name')}"
+
+
+def _outcome(testCase: ET.Element) -> str:
+    """Outcome of a JUnit test case"""
+
+    for outcome in ("failure", "error", "skipped"):
+        if testCase.find(outcome) is not None:
+            return "failed" if outcome == "failure" else outcome
+    return "passed"
+
+
+def merge(results: List[ShardResult], duration: float, output: Path) -> Dict[str, int]:
+    """Merge the shard results into one JUnit report
+
+    Args:
+        results (List[ShardResult]): The shard results
+        duration (float): The wall-clock duration of the replay
+        output (Path): The merged JUnit report
+
+    Returns:
+        The number of tests, by outcome
+    """
+
+    counts = {outcome: 0 for outcome in OUTCOMES}
+    for result in results:
+        for outcome in result.outcomes.values():
+            counts[outcome] += 1
+
+    suite = ET.Element("testsuite", name="signTx", tests=str(sum(counts.values())),
+                       failures=str(counts["failed"]), errors=str(counts["error"]),
+                       skipped=str(counts["skipped"]), time=f"{duration:.3f}")
+    for result in sorted(results, key=lambda result: result.index):
+        suite.extend(result.testCases)
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.ElementTree(root).write(output, encoding="utf-8", xml_declaration=True)
+    return counts
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Replay the Sign TX tests over several Speculos instances")
+    parser.add_argument("--device", required=True, help="The device the tests are run on")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="The number of Speculos instances")
+    parser.add_argument("--port-base", type=int, default=DEFAULT_PORT_BASE, help="The first Speculos port")
+    parser.add_argument("--output", type=Path, default=Path("signTx_report.xml"), help="The merged JUnit report")
+    parser.add_argument("pytestArgs", nargs="*", help="Additional pytest options, after '--'")
+    args = parser.parse_args()
+
+    shards = shard(collect(args.device, args.pytestArgs), args.jobs)
+    print(f"{sum(len(nodeIds) for nodeIds in shards)} tests in {len(shards)} shards")
+
+    start = time.perf_counter()
+    with TemporaryDirectory() as reportDir, ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        # Each shard runs in its own pytest and Speculos processes, the threads only wait for them
+        futures = [executor.submit(run_shard, index, nodeIds, args.device, args.port_base,
+                                   args.pytestArgs, Path(reportDir))
+                   for index, nodeIds in enumerate(shards)]
+        results = [future.result() for future in futures]
+    duration = time.perf_counter() - start
+    counts = merge(results, duration, args.output)
+
+    for result in results:
+        print(f"shard {result.index}".ljust(12) + f"{len(result.outcomes):>6} tests" + f"{result.duration:>10.1f} s")
+    for result in results:
+        for nodeId, outcome in result.outcomes.items():
+            if outcome in ("failed", "error"):
+                print(f"{outcome.upper()} {nodeId}")
+    print(", ".join(f"{count} {outcome}" for outcome, count in counts.items()) + f" in {duration:.1f} s")
+    print(f"Report: {args.output}")
+    sys.exit(0 if counts["failed"] + counts["error"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,609 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the navigation plans of the Sign TX tests.
+
+A plan holds one step per APDU of CommandBuilder.iter_sign_tx, in the same order:
+either None when the APDU is answered without any user interaction,
+or the navigation to replay while the device waits for the user.
+Plans are computed at once from the screens displayed by the app for the test case,
+and cached by firmware and test case name.
+
+The APDUs of a test case are sent along its plan by drive_sign_tx, shared by the Sign TX tests.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from itertools import groupby
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import time
+
+from ragger.firmware import Firmware
+from ragger.navigator import Navigator, NavInsID
+from ragger.navigator.navigation_scenario import NavigateWithScenario
+
+from ragger.backend.interface import RAPDU
+
+from application_client.app_def import AddressType, Errors, NetworkIds
+from application_client.command_builder import CommandBuilder, SignTxApdu
+from application_client.command_sender import CommandSender
+
+from input_files.signTx import SignTxTestCase, TxOutput, TxOutputBabbage, AssetGroup, Certificate, VoterVotes
+from input_files.signTx import DeriveAddressTestCase, ThirdPartyAddressParams, PoolRegistrationParams
+from input_files.signTx import CertificateType, CredentialParamsType, DRepParamsType, TxOutputDestinationType
+from input_files.signTx import TxAuxiliaryDataType, TxAuxiliaryDataCIP36, CIP36VoteDelegationType
+from input_files.signTx import TransactionSigningMode, DatumType, MAX_SIGN_TX_CHUNK_SIZE
+from input_files.signTx import DRepUpdateParams, DRepRegistrationParams, StakeRegistrationConwayParams
+from input_files.signTx import StakeRegistrationParams, StakeDelegationParams
+from input_files.signTx import ResignCommitteeParams, AuthorizeCommitteeParams, VoteDelegationParams
+
+from utils import gather_witness_paths
+
+
+class NavScenario(Enum):
+    """Scenarios of the NavigateWithScenario used on the touch devices"""
+    ADDRESS_REVIEW_APPROVE = 1
+    REVIEW_APPROVE = 2
+
+
+@dataclass(frozen=True)
+class NavStep:
+    """Navigation to replay while an APDU is processed"""
+    moves: Tuple[NavInsID, ...] = ()
+    # When set, the scenario is run instead of the moves
+    scenario: Optional[NavScenario] = None
+    screenChange: bool = True
+
+    def replay(self, navigator: Navigator, scenario_navigator: NavigateWithScenario) -> None:
+        """Replay the navigation
+
+        Args:
+            navigator (Navigator): The navigator instance
+            scenario_navigator (NavigateWithScenario): The scenario navigator instance
+        """
+
+        if self.scenario == NavScenario.ADDRESS_REVIEW_APPROVE:
+            scenario_navigator.address_review_approve(do_comparison=False)
+        elif self.scenario == NavScenario.REVIEW_APPROVE:
+            scenario_navigator.review_approve(do_comparison=False)
+        else:
+            navigator.navigate(list(self.moves), screen_change_after_last_instruction=self.screenChange)
+
+
+# Navigation step of each Sign TX APDU, None for the APDUs without user interaction
+NavPlan = Tuple[Optional[NavStep], ...]
+
+_ADDRESS_REVIEW = NavStep(scenario=NavScenario.ADDRESS_REVIEW_APPROVE)
+_REVIEW = NavStep(scenario=NavScenario.REVIEW_APPROVE)
+
+# Called after each exchange of drive_sign_tx: APDU, navigation step, response, exchange duration in s
+ExchangeCallback = Callable[[SignTxApdu, Optional[NavStep], RAPDU, float], None]
+
+_plans: Dict[Tuple[Firmware, str], NavPlan] = {}
+
+# Builder of the Sign TX APDUs sequence
+_cmd_builder = CommandBuilder()
+
+
+def plan_sign_tx(firmware: Firmware, testCase: SignTxTestCase) -> NavPlan:
+    """Navigation plan of a Sign TX test case, computed once per firmware and test case
+
+    Args:
+        firmware (Firmware): The firmware version
+        testCase (SignTxTestCase): The test case
+
+    Returns:
+        The navigation steps, aligned with the APDUs of CommandBuilder.iter_sign_tx
+    """
+
+    key = (firmware, testCase.name)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = tuple(_planSignTx(firmware, testCase))
+        _plans[key] = plan
+    return plan
+
+
+def drive_sign_tx(firmware: Firmware,
+                  client: CommandSender,
+                  navigator: Navigator,
+                  scenario_navigator: NavigateWithScenario,
+                  testCase: SignTxTestCase,
+                  witnessPaths: List[str],
+                  onExchange: Optional[ExchangeCallback] = None) -> Tuple[bytes, List[bytes]]:
+    """Send the Sign TX APDUs of a test case, replaying its navigation plan
+
+    Every response is checked to be a success.
+
+    Args:
+        firmware (Firmware): The firmware version
+        client (CommandSender): The command sender
+        navigator (Navigator): The navigator instance
+        scenario_navigator (NavigateWithScenario): The scenario navigator instance
+        testCase (SignTxTestCase): The test case
+        witnessPaths (List[str]): The unique witness paths
+        onExchange (Optional[ExchangeCallback]): Called after each exchange
+
+    Returns:
+        The CONFIRM response (the TX hash) and the WITNESS responses
+    """
+
+    plan = plan_sign_tx(firmware, testCase)
+    apdus = list(_cmd_builder.iter_sign_tx(testCase, witnessPaths))
+    assert len(apdus) == len(plan)
+
+    responses: List[bytes] = []
+    for interactive, exchanges in groupby(zip(apdus, plan), key=lambda exchange: exchange[0].interactive):
+        if not interactive:
+            # the APDUs never waiting for the user, up to the next interactive one, are sent back to back
+            group = []
+            for signTxApdu, step in exchanges:
+                assert step is None, f"Navigation planned on a non interactive APDU: {signTxApdu.apdu.hex()}"
+                group.append(signTxApdu)
+            sendTimes: List[float] = []
+            rapdus = client.exchange_many(_timedApdus(group, sendTimes))
+            sendTimes.append(time.perf_counter())
+            # Check the status
+            assert [rapdu.status for rapdu in rapdus] == [Errors.SW_SUCCESS] * len(group)
+            for index, (signTxApdu, response) in enumerate(zip(group, rapdus)):
+                responses.append(response.data)
+                if onExchange is not None:
+                    onExchange(signTxApdu, None, response, sendTimes[index + 1] - sendTimes[index])
+            continue
+        for signTxApdu, step in exchanges:
+            start = time.perf_counter()
+            if step is None:
+                # nothing displayed for this test case, the app answers at once
+                response = client.exchange_raw(signTxApdu.apdu)
+            else:
+                with client.exchange_async_raw(signTxApdu.apdu):
+                    step.replay(navigator, scenario_navigator)
+                response = client.get_async_response()
+            duration = time.perf_counter() - start
+            # Check the status
+            assert response and response.status == Errors.SW_SUCCESS
+            responses.append(response.data)
+            if onExchange is not None:
+                onExchange(signTxApdu, step, response, duration)
+
+    nbWitnesses = len(witnessPaths)
+    return responses[len(responses) - nbWitnesses - 1], responses[len(responses) - nbWitnesses:]
+
+
+def _timedApdus(group: List[SignTxApdu], sendTimes: List[float]) -> Iterator[bytes]:
+    """APDUs of a group, noting the time each one is taken to be sent, that is once the previous one is answered"""
+
+    for signTxApdu in group:
+        sendTimes.append(time.perf_counter())
+        yield signTxApdu.apdu
+
+
+def _navigate(moves: List[NavInsID], screenChange: bool = True) -> Optional[NavStep]:
+    """Navigation step of a moves list, None if there is nothing to navigate"""
+
+    return NavStep(tuple(moves), screenChange=screenChange) if len(moves) > 0 else None
+
+
+def _hasSimpleMultisig(testCase: SignTxTestCase) -> bool:
+    """Multisig transaction without any certificate nor withdrawal"""
+
+    return testCase.signingMode == TransactionSigningMode.MULTISIG_TRANSACTION and \
+        len(testCase.tx.certificates) == 0 and len(testCase.tx.withdrawals) == 0
+
+
+def _planSignTx(firmware: Firmware, testCase: SignTxTestCase) -> Iterator[Optional[NavStep]]:
+    """Navigation steps of a Sign TX test case, in the APDUs order"""
+
+    tx = testCase.tx
+    # INIT
+    yield _planInit(firmware, testCase)
+    # AUX DATA
+    yield from _planAuxData(firmware, testCase)
+    # INPUTS
+    yield from [None] * len(tx.inputs)
+    # OUTPUTS
+    for txOutput in tx.outputs:
+        yield from _planOutput(firmware, testCase, txOutput)
+    # FEE
+    yield _planFee(firmware, testCase)
+    # TTL
+    if tx.ttl is not None:
+        yield None
+    # CERTIFICATES
+    for certificate in tx.certificates:
+        yield _planCertificate(firmware, testCase, certificate)
+        if isinstance(certificate.params, PoolRegistrationParams):
+            yield from _planPoolRegistration(firmware, testCase, certificate.params)
+    # WITHDRAWALS
+    yield from [None] * len(tx.withdrawals)
+    # VALIDITY START
+    if tx.validityIntervalStart is not None:
+        yield None
+    # MINT
+    if len(tx.mint) > 0:
+        mintMoves = [NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.SWIPE_CENTER_TO_LEFT] * 2
+        yield _navigate(mintMoves)
+        yield from _planTokenBundle(firmware, tx.mint, True)
+        yield _navigate(mintMoves) if firmware.is_nano else _REVIEW
+    # SCRIPT DATA HASH
+    if tx.scriptDataHash is not None:
+        yield None
+    # COLLATERAL INPUTS, REQUIRED SIGNERS
+    yield from [None] * (len(tx.collateralInputs) + len(tx.requiredSigners))
+    # COLLATERAL OUTPUT
+    if tx.collateralOutput is not None:
+        yield from _planCollateralOutput(firmware, testCase, tx.collateralOutput)
+    # TOTAL COLLATERAL
+    if tx.totalCollateral:
+        yield _navigate([NavInsID.BOTH_CLICK]) if firmware.is_nano else None
+    # REFERENCE INPUTS
+    yield from [None] * len(tx.referenceInputs)
+    # VOTING PROCEDURES
+    for votingProcedure in tx.votingProcedures:
+        yield _planVoterVotes(firmware, votingProcedure)
+    # TREASURY, DONATION
+    for amount in (tx.treasury, tx.donation):
+        if amount is not None:
+            yield _navigate([NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.TAPPABLE_CENTER_TAP])
+    # CONFIRM
+    if firmware.is_nano:
+        moves = []
+        if testCase.signingMode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+        moves += [NavInsID.BOTH_CLICK]
+        yield _navigate(moves)
+    else:
+        yield _REVIEW
+    # WITNESSES
+    for path in gather_witness_paths(testCase):
+        yield _planWitness(firmware, testCase, path)
+
+
+def _planInit(firmware: Firmware, testCase: SignTxTestCase) -> Optional[NavStep]:
+    """Sign TX INIT"""
+
+    moves = []
+    if firmware.is_nano:
+        moves += [NavInsID.BOTH_CLICK]
+        if testCase.tx.network.networkId == NetworkIds.TESTNET:
+            moves += [NavInsID.BOTH_CLICK]
+        if len(testCase.tx.outputs) == 0 and testCase.tx.scriptDataHash is None:
+            moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+        if testCase.signingMode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            moves += [NavInsID.BOTH_CLICK]
+            if testCase.tx.scriptDataHash is None:
+                moves += [NavInsID.BOTH_CLICK] * 2
+    else:
+        moves += [NavInsID.SWIPE_CENTER_TO_LEFT]
+        if len(testCase.tx.outputs) == 0:
+            moves += [NavInsID.SWIPE_CENTER_TO_LEFT]
+        if testCase.signingMode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            moves += [NavInsID.SWIPE_CENTER_TO_LEFT] * 3
+    return _navigate(moves)
+
+
+def _planAuxData(firmware: Firmware, testCase: SignTxTestCase) -> Iterator[Optional[NavStep]]:
+    """Sign TX AUX DATA"""
+
+    auxData = testCase.tx.auxiliaryData
+    if auxData is None:
+        return
+    if auxData.type != TxAuxiliaryDataType.CIP36_REGISTRATION:
+        yield None
+        return
+    yield _navigate([NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.SWIPE_CENTER_TO_LEFT])
+
+    assert isinstance(auxData.params, TxAuxiliaryDataCIP36)
+    # INIT
+    yield None
+    # VOTE KEY or DELEGATIONS
+    if auxData.params.voteKey:
+        yield _navigate([NavInsID.RIGHT_CLICK, NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.SWIPE_CENTER_TO_LEFT])
+    else:
+        for delegation in auxData.params.delegations:
+            if firmware.is_nano:
+                moves = [NavInsID.RIGHT_CLICK, NavInsID.BOTH_CLICK]
+            else:
+                moves = [NavInsID.SWIPE_CENTER_TO_LEFT]
+                if delegation.type == CIP36VoteDelegationType.PATH:
+                    moves += [NavInsID.TAPPABLE_CENTER_TAP]
+            yield _navigate(moves)
+    # STAKING
+    yield _navigate([NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.SWIPE_CENTER_TO_LEFT])
+    # PAYMENT
+    if firmware.is_nano:
+        moves = [NavInsID.RIGHT_CLICK, NavInsID.BOTH_CLICK]
+    else:
+        moves = [NavInsID.SWIPE_CENTER_TO_LEFT]
+        if testCase.tx.validityIntervalStart is None:
+            moves += [NavInsID.SWIPE_CENTER_TO_LEFT]
+        if auxData.params.paymentDestination.type == TxOutputDestinationType.THIRD_PARTY:
+            moves += [NavInsID.SWIPE_CENTER_TO_LEFT]
+    yield _navigate(moves)
+    # NONCE
+    yield _navigate([NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.SWIPE_CENTER_TO_LEFT])
+    # VOTING PURPOSE
+    yield None
+    # CONFIRM
+    yield _navigate([NavInsID.BOTH_CLICK], screenChange=False) if firmware.is_nano else _ADDRESS_REVIEW
+
+
+def _planOutputBasic(firmware: Firmware, testCase: SignTxTestCase, txOutput: TxOutput) -> Optional[NavStep]:
+    """Sign TX OUTPUT basic data"""
+
+    moves: List[NavInsID] = []
+    destination = txOutput.destination.params
+    if testCase.txBody == "":
+        pass
+    elif testCase.tx.auxiliaryData is not None and \
+        testCase.tx.auxiliaryData.type == TxAuxiliaryDataType.CIP36_REGISTRATION:
+        pass
+    elif isinstance(destination, ThirdPartyAddressParams):
+        if firmware.is_nano:
+            if _hasSimpleMultisig(testCase):
+                moves += [NavInsID.RIGHT_CLICK]
+            if testCase.signingMode != TransactionSigningMode.POOL_REGISTRATION_AS_OWNER:
+                moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK] * 2
+            if _hasSimpleMultisig(testCase):
+                moves += [NavInsID.BOTH_CLICK]
+        else:
+            if testCase.tx.network.networkId == NetworkIds.TESTNET:
+                moves = [NavInsID.TAPPABLE_CENTER_TAP]
+            if txOutput.datum is None:
+                moves += [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT]
+            if _hasSimpleMultisig(testCase):
+                moves += [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT]
+            if firmware == Firmware.FLEX and txOutput.amount > 10000000:
+                moves += [NavInsID.TAPPABLE_CENTER_TAP]
+    elif isinstance(destination, DeriveAddressTestCase):
+        if destination.addrType == AddressType.POINTER_KEY:
+            if firmware.is_nano:
+                moves = [NavInsID.BOTH_CLICK] * 3 + [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK] * 2
+            else:
+                moves = [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT] + [NavInsID.TAPPABLE_CENTER_TAP] * 2
+        elif destination.addrType == AddressType.ENTERPRISE_KEY:
+            if firmware.is_nano:
+                moves = [NavInsID.BOTH_CLICK] * 5
+            else:
+                moves = [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT] + [NavInsID.TAPPABLE_CENTER_TAP] * 2
+        elif testCase.tx.auxiliaryData is not None:
+            if firmware.is_nano:
+                moves = [NavInsID.BOTH_CLICK] * 3 + [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK] * 2
+            else:
+                moves = [NavInsID.SWIPE_CENTER_TO_LEFT] + [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.TAPPABLE_CENTER_TAP]
+        elif not destination.stakingValue.startswith("m/"):
+            if firmware.is_nano:
+                moves = [NavInsID.BOTH_CLICK] * 2 + [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+                moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK] * 2
+            else:
+                moves = [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT] + [NavInsID.TAPPABLE_CENTER_TAP] * 2
+    return _navigate(moves)
+
+
+def _planOutput(firmware: Firmware, testCase: SignTxTestCase, txOutput: TxOutput) -> Iterator[Optional[NavStep]]:
+    """Sign TX OUTPUT, with its token bundle, datum and reference script"""
+
+    yield _planOutputBasic(firmware, testCase, txOutput)
+
+    # TOKEN BUNDLE
+    withNav = txOutput.destination.type == TxOutputDestinationType.THIRD_PARTY
+    yield from _planTokenBundle(firmware, txOutput.tokenBundle, withNav)
+
+    # DATUM, and its additional chunks
+    if txOutput.datum is not None:
+        yield None
+        if txOutput.datum.type == DatumType.INLINE:
+            yield from [None] * _nbAdditionalChunks(txOutput.datum.datumHex)
+
+    # REFERENCE SCRIPT, and its additional chunks
+    if isinstance(txOutput, TxOutputBabbage) and txOutput.referenceScriptHex is not None:
+        yield None
+        yield from [None] * _nbAdditionalChunks(txOutput.referenceScriptHex)
+
+    # CONFIRM
+    if _hasSimpleMultisig(testCase) or (len(txOutput.tokenBundle) > 0 and withNav):
+        yield _navigate([NavInsID.BOTH_CLICK]) if firmware.is_nano else _ADDRESS_REVIEW
+    else:
+        yield None
+
+
+def _nbAdditionalChunks(dataHex: str) -> int:
+    """Number of chunks following the first one, sent with the header"""
+
+    chunkHexSize = MAX_SIGN_TX_CHUNK_SIZE * 2
+    return max(0, (len(dataHex) - 1) // chunkHexSize)
+
+
+def _planTokenBundle(firmware: Firmware, assetGroups: List[AssetGroup], withNav: bool) -> Iterator[Optional[NavStep]]:
+    """Sign TX TOKEN BUNDLE, for outputs, mint or collateral output"""
+
+    tokenStep = _navigate([NavInsID.BOTH_CLICK] * 2 if firmware.is_nano else [NavInsID.TAPPABLE_CENTER_TAP] * 2)
+    for assetGroup in assetGroups:
+        yield None if firmware.is_nano else _navigate([NavInsID.SWIPE_CENTER_TO_LEFT])
+        yield from [tokenStep if withNav else None] * len(assetGroup.tokens)
+
+
+def _planFee(firmware: Firmware, testCase: SignTxTestCase) -> Optional[NavStep]:
+    """Sign TX FEE"""
+
+    moves = []
+    if firmware.is_nano:
+        if testCase.signingMode != TransactionSigningMode.POOL_REGISTRATION_AS_OWNER:
+            moves += [NavInsID.BOTH_CLICK]
+        if testCase.tx.fee > 5 * 1000000:
+            moves += [NavInsID.BOTH_CLICK]
+    else:
+        if testCase.tx.fee > 5 * 1000000:
+            moves += [NavInsID.SWIPE_CENTER_TO_LEFT]
+        else:
+            moves += [NavInsID.TAPPABLE_CENTER_TAP]
+    return _navigate(moves)
+
+
+def _planCertificate(firmware: Firmware, testCase: SignTxTestCase, certificate: Certificate) -> Optional[NavStep]:
+    """Sign TX CERTIFICATE"""
+
+    if not firmware.is_nano:
+        if certificate.type == CertificateType.STAKE_POOL_REGISTRATION:
+            return _navigate([NavInsID.SWIPE_CENTER_TO_LEFT])
+        return _ADDRESS_REVIEW
+
+    stakingCertificates = (CertificateType.STAKE_REGISTRATION,
+                           CertificateType.STAKE_DEREGISTRATION,
+                           CertificateType.STAKE_DELEGATION)
+    params = certificate.params
+    moves = []
+    if testCase.signingMode == TransactionSigningMode.MULTISIG_TRANSACTION:
+        if certificate.type in stakingCertificates:
+            moves += [NavInsID.BOTH_CLICK]
+            if isinstance(params, (StakeRegistrationParams, StakeDelegationParams)) and \
+                params.stakeCredential.type == CredentialParamsType.KEY_PATH:
+                moves += [NavInsID.BOTH_CLICK]
+            moves += [NavInsID.RIGHT_CLICK]
+    if certificate.type == CertificateType.STAKE_POOL_RETIREMENT:
+        moves += [NavInsID.RIGHT_CLICK]
+    moves += [NavInsID.BOTH_CLICK]
+    if testCase.signingMode == TransactionSigningMode.MULTISIG_TRANSACTION:
+        if certificate.type not in stakingCertificates:
+            moves += [NavInsID.BOTH_CLICK]
+    else:
+        moves += [NavInsID.BOTH_CLICK]
+    if isinstance(params, (AuthorizeCommitteeParams, ResignCommitteeParams)) and \
+        params.coldCredential.type != CredentialParamsType.KEY_PATH:
+        moves += [NavInsID.RIGHT_CLICK]
+    if isinstance(params, AuthorizeCommitteeParams) and \
+        params.hotCredential.type != CredentialParamsType.KEY_PATH:
+        moves += [NavInsID.RIGHT_CLICK]
+    if certificate.type == CertificateType.AUTHORIZE_COMMITTEE_HOT:
+        moves += [NavInsID.BOTH_CLICK]
+    if isinstance(params, VoteDelegationParams):
+        if params.dRep.type in (DRepParamsType.KEY_HASH, DRepParamsType.SCRIPT_HASH):
+            moves += [NavInsID.RIGHT_CLICK]
+        moves += [NavInsID.BOTH_CLICK]
+    if isinstance(params, DRepUpdateParams):
+        moves += [NavInsID.BOTH_CLICK]
+    if isinstance(params, (StakeRegistrationConwayParams, DRepRegistrationParams)):
+        moves += [NavInsID.BOTH_CLICK]
+    anchor = None
+    if isinstance(params, (ResignCommitteeParams, DRepRegistrationParams, DRepUpdateParams)):
+        anchor = params.anchor
+    if anchor is not None and len(anchor.url) > 50:
+        # For URL, navigation depends on url length :(
+        moves += [NavInsID.RIGHT_CLICK] * 2
+    if certificate.type == CertificateType.RESIGN_COMMITTEE_COLD:
+        moves += [NavInsID.BOTH_CLICK]
+    if anchor is not None:
+        moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+    moves += [NavInsID.BOTH_CLICK]
+    return _navigate(moves)
+
+
+def _planPoolRegistration(firmware: Firmware,
+                          testCase: SignTxTestCase,
+                          pool: PoolRegistrationParams) -> Iterator[Optional[NavStep]]:
+    """Sign TX additional data of a pool registration certificate"""
+
+    isOperator = testCase.signingMode == TransactionSigningMode.POOL_REGISTRATION_AS_OPERATOR
+    confirmStep = _navigate([NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.TAPPABLE_CENTER_TAP])
+    # INIT
+    if firmware.is_nano:
+        yield _navigate([NavInsID.BOTH_CLICK])
+    else:
+        yield _navigate([NavInsID.SWIPE_CENTER_TO_LEFT] * (2 if isOperator else 1))
+    # POOL KEY, the pool id being displayed on Nano before the response
+    yield _navigate([NavInsID.BOTH_CLICK]) if firmware.is_nano else None
+    # VRF
+    if firmware.is_nano:
+        yield _navigate([NavInsID.BOTH_CLICK])
+    else:
+        yield _navigate([NavInsID.TAPPABLE_CENTER_TAP] if isOperator else [])
+    # FINANCIALS, REWARD ACCOUNT, OWNERS, RELAYS
+    yield from [confirmStep] * (2 + len(pool.poolOwners) + len(pool.relays))
+    # METADATA
+    moves = [NavInsID.BOTH_CLICK] if firmware.is_nano else [NavInsID.TAPPABLE_CENTER_TAP]
+    if len(pool.poolOwners) <= 1 and len(pool.relays) <= 1 and pool.metadata is not None:
+        moves += [NavInsID.TAPPABLE_CENTER_TAP]
+    elif len(pool.poolOwners) == 2 and len(pool.relays) == 1 and firmware == Firmware.STAX:
+        moves += [NavInsID.TAPPABLE_CENTER_TAP]
+    yield _navigate(moves)
+    # CONFIRM
+    if len(pool.relays) == 0:
+        yield _navigate([NavInsID.BOTH_CLICK]) if firmware.is_nano else _REVIEW
+    else:
+        yield None
+
+
+def _planCollateralOutput(firmware: Firmware,
+                          testCase: SignTxTestCase,
+                          txOutput: TxOutput) -> Iterator[Optional[NavStep]]:
+    """Sign TX COLLATERAL OUTPUT, with its token bundle"""
+
+    # BASIC DATA
+    moves = []
+    if testCase.txBody == "":
+        pass
+    elif firmware.is_nano:
+        moves += [NavInsID.BOTH_CLICK] + [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+    else:
+        moves += [NavInsID.TAPPABLE_CENTER_TAP] + [NavInsID.SWIPE_CENTER_TO_LEFT]
+        if testCase.tx.totalCollateral is None:
+            moves += [NavInsID.TAPPABLE_CENTER_TAP] * 2
+    yield _navigate(moves)
+
+    # TOKEN BUNDLE
+    yield from _planTokenBundle(firmware, txOutput.tokenBundle, True)
+
+    # CONFIRM
+    if testCase.tx.totalCollateral is not None or txOutput.destination.type == TxOutputDestinationType.THIRD_PARTY:
+        yield None
+    else:
+        yield _navigate([NavInsID.BOTH_CLICK]) if firmware.is_nano else _ADDRESS_REVIEW
+
+
+def _planVoterVotes(firmware: Firmware, votingProcedure: VoterVotes) -> Optional[NavStep]:
+    """Sign TX VOTING PROCEDURE"""
+
+    if not firmware.is_nano:
+        return _ADDRESS_REVIEW
+    # Vote
+    moves = [NavInsID.BOTH_CLICK]
+    # Voter Key / Path
+    if not votingProcedure.voter.keyValue.startswith("m/"):
+        moves += [NavInsID.RIGHT_CLICK]
+    moves += [NavInsID.BOTH_CLICK]
+    # Action Tx Hash
+    moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+    # Action Index + Vote + Anchor
+    moves += [NavInsID.BOTH_CLICK] * 3
+    if votingProcedure.votes[0].votingProcedure.anchor is not None:
+        # Anchor tx Hash data
+        moves += [NavInsID.RIGHT_CLICK] + [NavInsID.BOTH_CLICK]
+    # Confirm
+    moves += [NavInsID.BOTH_CLICK]
+    return _navigate(moves)
+
+
+def _planWitness(firmware: Firmware, testCase: SignTxTestCase, path: str) -> Optional[NavStep]:
+    """Sign TX WITNESS"""
+
+    moves = []
+    pathElements = path.replace("'","").split("/") # Remove Hardened info
+    if int(pathElements[1]) > 1852 or (len(pathElements) > 4 and int(pathElements[4]) > 2):
+        moves += [NavInsID.BOTH_CLICK] * 2
+    elif testCase.tx.auxiliaryData is not None:
+        if testCase.tx.auxiliaryData.type == TxAuxiliaryDataType.CIP36_REGISTRATION:
+            pass
+        elif isinstance(testCase.tx.outputs[0].destination.params, ThirdPartyAddressParams):
+            pass
+        else:
+            moves += [NavInsID.BOTH_CLICK] * 3
+    elif testCase.signingMode == TransactionSigningMode.PLUTUS_TRANSACTION:
+        moves += [NavInsID.BOTH_CLICK] * 2
+    elif testCase.signingMode in (TransactionSigningMode.POOL_REGISTRATION_AS_OWNER,
+                                  TransactionSigningMode.POOL_REGISTRATION_AS_OPERATOR):
+        moves += [NavInsID.BOTH_CLICK]
+
+    if len(moves) == 0:
+        return None
+    return _navigate(moves) if firmware.is_nano else _ADDRESS_REVIEW
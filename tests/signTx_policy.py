@@ -0,0 +1,1245 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a host-side simulator of the Sign TX security policies.
+
+It ports the decisions of src/securityPolicy/securityPolicy.c, and the path classification
+of src/crypto/bip44.c they rely on, to the Sign TX test case dataclasses.
+The elements of a test case are classified in the order of CommandBuilder.iter_sign_tx,
+with the same state as the app (signing mode, single account, pool owner, mint...),
+so a transaction the app would reject by policy can be detected without any device.
+
+The app is assumed to be the full app (not XS), in expert mode only if requested.
+Data validations done by the app before the policies (SW_INVALID_DATA) are not simulated.
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+from application_client.app_def import AddressType
+
+from input_files.signTx import SignTxTestCase, Transaction, TxOutput, TxOutputBabbage, Certificate
+from input_files.signTx import DeriveAddressTestCase, ThirdPartyAddressParams, TxOutputDestination
+from input_files.signTx import PoolRegistrationParams, PoolRetirementParams, PoolKeyType, CredentialParams
+from input_files.signTx import CertificateType, CredentialParamsType, DRepParamsType, TxOutputDestinationType
+from input_files.signTx import TxAuxiliaryDataType, TxAuxiliaryDataCIP36, CIP36VoteDelegationType
+from input_files.signTx import CIP36VoteRegistrationFormat, TransactionSigningMode, TxRequiredSignerType
+from input_files.signTx import VoterType, VoterVotes, RequiredSigner
+from input_files.signTx import StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams
+from input_files.signTx import VoteDelegationParams, AuthorizeCommitteeParams, ResignCommitteeParams
+from input_files.signTx import DRepRegistrationParams, DRepUpdateParams
+
+from key_derivation import HARDENED, parse_path
+
+from utils import gather_witness_paths
+
+
+class SecurityPolicy(IntEnum):
+    """Security policies, as in src/securityPolicy/securityPolicyType.h"""
+    DENY = 1
+    ALLOW = 2   # POLICY_ALLOW_WITHOUT_PROMPT
+    PROMPT = 3  # POLICY_PROMPT_BEFORE_RESPONSE
+    WARN = 4    # POLICY_PROMPT_WARN_UNUSUAL
+    SHOW = 5    # POLICY_SHOW_BEFORE_RESPONSE
+
+
+@dataclass(frozen=True)
+class PolicyDecision:
+    """Security policy applied by the app to an element of the transaction"""
+    element: str
+    policy: SecurityPolicy
+
+
+# =================
+# BIP44 paths (src/crypto/bip44.c)
+# =================
+
+Path = Tuple[int, ...]
+
+PURPOSE_BYRON = 44
+PURPOSE_SHELLEY = 1852
+PURPOSE_MULTISIG = 1854
+PURPOSE_MINT = 1855
+PURPOSE_POOL_COLD_KEY = 1853
+PURPOSE_CVOTE_KEY = 1694
+ADA_COIN_TYPE = 1815
+
+CHAIN_EXTERNAL = 0
+CHAIN_INTERNAL = 1
+CHAIN_STAKING_KEY = 2
+CHAIN_DREP_KEY = 3
+CHAIN_COMMITTEE_COLD_KEY = 4
+CHAIN_COMMITTEE_HOT_KEY = 5
+
+MAX_REASONABLE_ACCOUNT = 100
+MAX_REASONABLE_ADDRESS = 1000000
+MAX_REASONABLE_COLD_KEY_INDEX = 1000000
+MAX_REASONABLE_MINT_POLICY_INDEX = 1000000
+
+
+class PathType(IntEnum):
+    """Path types, as in bip44_path_type_t"""
+    ORDINARY_ACCOUNT = 0
+    MULTISIG_ACCOUNT = 1
+    ORDINARY_PAYMENT_KEY = 2
+    MULTISIG_PAYMENT_KEY = 3
+    ORDINARY_STAKING_KEY = 4
+    MULTISIG_STAKING_KEY = 5
+    DREP_KEY = 6
+    COMMITTEE_COLD_KEY = 7
+    COMMITTEE_HOT_KEY = 8
+    MINT_KEY = 9
+    POOL_COLD_KEY = 10
+    CVOTE_ACCOUNT = 11
+    CVOTE_KEY = 12
+    INVALID = 13
+
+
+def _isHardened(value: int) -> bool:
+    return value & HARDENED != 0
+
+
+def _hasPrefix(path: Path, purpose: int) -> bool:
+    return len(path) > 1 and path[0] == purpose | HARDENED and path[1] == ADA_COIN_TYPE | HARDENED
+
+
+def _hasOrdinaryWalletKeyPrefix(path: Path) -> bool:
+    return _hasPrefix(path, PURPOSE_BYRON) or _hasPrefix(path, PURPOSE_SHELLEY)
+
+
+def _isChainKeyPath(path: Path, purpose: int, chain: int) -> bool:
+    """m / purpose' / 1815' / account' / chain / address, as bip44_isOrdinaryStakingKeyPath and alike"""
+
+    return len(path) == 5 and _hasPrefix(path, purpose) and _isHardened(path[2]) \
+        and path[3] == chain and not _isHardened(path[4])
+
+
+def _isOrdinaryStakingKeyPath(path: Path) -> bool:
+    return _isChainKeyPath(path, PURPOSE_SHELLEY, CHAIN_STAKING_KEY)
+
+
+def _isMultidelegationStakingKeyPath(path: Path) -> bool:
+    return (_isOrdinaryStakingKeyPath(path) or _isChainKeyPath(path, PURPOSE_MULTISIG, CHAIN_STAKING_KEY)) \
+        and path[4] > 0
+
+
+def _isDRepKeyPath(path: Path) -> bool:
+    return _isChainKeyPath(path, PURPOSE_SHELLEY, CHAIN_DREP_KEY)
+
+
+def _isCommitteeColdKeyPath(path: Path) -> bool:
+    return _isChainKeyPath(path, PURPOSE_SHELLEY, CHAIN_COMMITTEE_COLD_KEY)
+
+
+def _isCommitteeHotKeyPath(path: Path) -> bool:
+    return _isChainKeyPath(path, PURPOSE_SHELLEY, CHAIN_COMMITTEE_HOT_KEY)
+
+
+def _isMintKeyPath(path: Path) -> bool:
+    return len(path) == 3 and _hasPrefix(path, PURPOSE_MINT) and _isHardened(path[2])
+
+
+def _isPoolColdKeyPath(path: Path) -> bool:
+    return len(path) == 4 and _hasPrefix(path, PURPOSE_POOL_COLD_KEY) \
+        and path[2] == 0 | HARDENED and _isHardened(path[3])
+
+
+def _isCVoteKeyPath(path: Path) -> bool:
+    return len(path) == 5 and _hasPrefix(path, PURPOSE_CVOTE_KEY) and _isHardened(path[2]) \
+        and path[3] == 0 and not _isHardened(path[4])
+
+
+def _classifyOrdinaryWalletPath(path: Path) -> PathType:
+    if len(path) < 3 or not _isHardened(path[2]):
+        return PathType.INVALID
+    if len(path) == 3:
+        return PathType.ORDINARY_ACCOUNT
+    if len(path) != 5:
+        return PathType.INVALID
+    # The app reads the chain type into a byte
+    chainType = path[3] & 0xFF
+    if chainType in (CHAIN_EXTERNAL, CHAIN_INTERNAL):
+        # Hardened address indexes are allowed for legacy reasons (see bip44_isPathReasonable)
+        return PathType.ORDINARY_PAYMENT_KEY
+    checks = {
+        CHAIN_STAKING_KEY: (_isOrdinaryStakingKeyPath, PathType.ORDINARY_STAKING_KEY),
+        CHAIN_DREP_KEY: (_isDRepKeyPath, PathType.DREP_KEY),
+        CHAIN_COMMITTEE_COLD_KEY: (_isCommitteeColdKeyPath, PathType.COMMITTEE_COLD_KEY),
+        CHAIN_COMMITTEE_HOT_KEY: (_isCommitteeHotKeyPath, PathType.COMMITTEE_HOT_KEY),
+    }
+    if chainType not in checks:
+        return PathType.INVALID
+    check, pathType = checks[chainType]
+    return pathType if check(path) else PathType.INVALID
+
+
+def _classifyMultisigWalletPath(path: Path) -> PathType:
+    if len(path) < 3 or not _isHardened(path[2]):
+        return PathType.INVALID
+    if len(path) == 3:
+        return PathType.MULTISIG_ACCOUNT
+    if len(path) != 5:
+        return PathType.INVALID
+    chainType = path[3] & 0xFF
+    if chainType == CHAIN_EXTERNAL:
+        # address index must not be hardened (CIP 1854)
+        return PathType.INVALID if _isHardened(path[4]) else PathType.MULTISIG_PAYMENT_KEY
+    if chainType == CHAIN_STAKING_KEY and _isChainKeyPath(path, PURPOSE_MULTISIG, CHAIN_STAKING_KEY):
+        return PathType.MULTISIG_STAKING_KEY
+    return PathType.INVALID
+
+
+def _classifyCVotePath(path: Path) -> PathType:
+    if len(path) < 3 or not _isHardened(path[2]):
+        return PathType.INVALID
+    if len(path) == 3:
+        return PathType.CVOTE_ACCOUNT
+    if len(path) == 5 and _isCVoteKeyPath(path):
+        return PathType.CVOTE_KEY
+    return PathType.INVALID
+
+
+@lru_cache(maxsize=None)
+def classify_path(path: Path) -> PathType:
+    """Classify a path, as bip44_classifyPath
+
+    Args:
+        path (Path): The parsed path
+
+    Returns:
+        The path type
+    """
+
+    if _hasOrdinaryWalletKeyPrefix(path):
+        return _classifyOrdinaryWalletPath(path)
+    if _hasPrefix(path, PURPOSE_MULTISIG):
+        return _classifyMultisigWalletPath(path)
+    if _hasPrefix(path, PURPOSE_MINT):
+        return PathType.MINT_KEY if _isMintKeyPath(path) else PathType.INVALID
+    if _hasPrefix(path, PURPOSE_POOL_COLD_KEY):
+        return PathType.POOL_COLD_KEY if _isPoolColdKeyPath(path) else PathType.INVALID
+    if _hasPrefix(path, PURPOSE_CVOTE_KEY):
+        return _classifyCVotePath(path)
+    return PathType.INVALID
+
+
+def _hasReasonableAccount(path: Path) -> bool:
+    return len(path) > 2 and _isHardened(path[2]) and path[2] & ~HARDENED <= MAX_REASONABLE_ACCOUNT
+
+
+def _hasReasonableAddress(path: Path) -> bool:
+    return len(path) > 4 and path[4] <= MAX_REASONABLE_ADDRESS
+
+
+def is_path_reasonable(path: Path) -> bool:
+    """Check whether a path is not unusual, as bip44_isPathReasonable
+
+    Args:
+        path (Path): The parsed path, of a valid type
+
+    Returns:
+        True if the path is reasonable
+    """
+
+    pathType = classify_path(path)
+    if pathType in (PathType.ORDINARY_ACCOUNT, PathType.MULTISIG_ACCOUNT, PathType.CVOTE_ACCOUNT):
+        return _hasReasonableAccount(path)
+    if pathType in (PathType.ORDINARY_PAYMENT_KEY, PathType.MULTISIG_PAYMENT_KEY,
+                    PathType.ORDINARY_STAKING_KEY, PathType.MULTISIG_STAKING_KEY, PathType.CVOTE_KEY):
+        return _hasReasonableAccount(path) and _hasReasonableAddress(path)
+    if pathType in (PathType.DREP_KEY, PathType.COMMITTEE_COLD_KEY, PathType.COMMITTEE_HOT_KEY):
+        # strongly recommended in CIP-0105 to only use 0 as address
+        return _hasReasonableAccount(path) and _hasReasonableAddress(path) and path[4] == 0
+    if pathType == PathType.MINT_KEY:
+        return path[2] & ~HARDENED <= MAX_REASONABLE_MINT_POLICY_INDEX
+    if pathType == PathType.POOL_COLD_KEY:
+        return path[3] & ~HARDENED <= MAX_REASONABLE_COLD_KEY_INDEX
+    # the app asserts it is not called for invalid paths
+    return False
+
+
+# =================
+# Addresses (src/addressUtils)
+# =================
+
+MAXIMUM_NETWORK_ID = 0x0F
+MAINNET_NETWORK_ID = 1
+TESTNET_NETWORK_ID = 0
+MAINNET_PROTOCOL_MAGIC = 764824073
+TESTNET_PROTOCOL_MAGICS = (1097911063, 1, 2)  # legacy, preprod, preview
+
+KEY_HASH_LENGTH = 28
+SCRIPT_HASH_LENGTH = 28
+
+# Byron address attribute holding the protocol magic
+PROTOCOL_MAGIC_ADDRESS_ATTRIBUTE_KEY = 2
+
+SHELLEY_ADDRESS_TYPES = (
+    AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_KEY,
+    AddressType.BASE_PAYMENT_KEY_STAKE_SCRIPT,
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_SCRIPT,
+    AddressType.POINTER_KEY,
+    AddressType.POINTER_SCRIPT,
+    AddressType.ENTERPRISE_KEY,
+    AddressType.ENTERPRISE_SCRIPT,
+    AddressType.REWARD_KEY,
+    AddressType.REWARD_SCRIPT,
+)
+
+# Address types with a payment part given by path (determinePaymentChoice == PAYMENT_PATH)
+PAYMENT_PATH_ADDRESS_TYPES = (
+    AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+    AddressType.BASE_PAYMENT_KEY_STAKE_SCRIPT,
+    AddressType.POINTER_KEY,
+    AddressType.ENTERPRISE_KEY,
+    AddressType.BYRON,
+)
+
+# Address types with a payment part given by script hash (determinePaymentChoice == PAYMENT_SCRIPT_HASH)
+PAYMENT_SCRIPT_ADDRESS_TYPES = (
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_KEY,
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_SCRIPT,
+    AddressType.POINTER_SCRIPT,
+    AddressType.ENTERPRISE_SCRIPT,
+)
+
+# Expected length of the address bytes, for the types it is meaningful for
+ADDRESS_SIZES: Dict[int, int] = {
+    AddressType.BASE_PAYMENT_KEY_STAKE_KEY: 1 + KEY_HASH_LENGTH + KEY_HASH_LENGTH,
+    AddressType.BASE_PAYMENT_KEY_STAKE_SCRIPT: 1 + KEY_HASH_LENGTH + SCRIPT_HASH_LENGTH,
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_KEY: 1 + SCRIPT_HASH_LENGTH + KEY_HASH_LENGTH,
+    AddressType.BASE_PAYMENT_SCRIPT_STAKE_SCRIPT: 1 + SCRIPT_HASH_LENGTH + SCRIPT_HASH_LENGTH,
+    AddressType.ENTERPRISE_KEY: 1 + KEY_HASH_LENGTH,
+    AddressType.ENTERPRISE_SCRIPT: 1 + SCRIPT_HASH_LENGTH,
+}
+
+# Address types accepted for a collateral return output (payment controlled by key)
+COLLATERAL_OUTPUT_ADDRESS_TYPES = (
+    AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+    AddressType.BASE_PAYMENT_KEY_STAKE_SCRIPT,
+    AddressType.POINTER_KEY,
+    AddressType.ENTERPRISE_KEY,
+)
+
+
+def _cborHead(data: bytes, offset: int) -> Tuple[int, int, int]:
+    """Parse a CBOR data item head
+
+    Returns:
+        Tuple of the major type, the value (or length) and the offset of the item content
+    """
+
+    majorType, info = data[offset] >> 5, data[offset] & 0x1F
+    if info < 24:
+        return majorType, info, offset + 1
+    size = 1 << (info - 24)
+    return majorType, int.from_bytes(data[offset + 1:offset + 1 + size], "big"), offset + 1 + size
+
+
+def _byronProtocolMagic(address: bytes) -> int:
+    """Protocol magic of a Byron address, as extractProtocolMagic"""
+
+    # [ #6.24(bytes .cbor [ root, { * uint => bytes }, type ]), crc ]
+    _, _, offset = _cborHead(address, 0)
+    _, _, offset = _cborHead(address, offset)
+    _, _, offset = _cborHead(address, offset)
+    _, _, offset = _cborHead(address, offset)
+    _, rootSize, offset = _cborHead(address, offset)
+    _, nbAttributes, offset = _cborHead(address, offset + rootSize)
+    for _ in range(nbAttributes):
+        _, key, offset = _cborHead(address, offset)
+        _, valueSize, offset = _cborHead(address, offset)
+        if key == PROTOCOL_MAGIC_ADDRESS_ATTRIBUTE_KEY:
+            return _cborHead(address, offset)[1]
+        offset += valueSize
+    # mainnet addresses do not contain protocol magic
+    return MAINNET_PROTOCOL_MAGIC
+
+
+def _stakingPath(params: DeriveAddressTestCase) -> Optional[Path]:
+    """Staking key path of address params, if the staking part is given by path (see CommandBuilder)"""
+
+    if params.addrType not in (AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+                               AddressType.BASE_PAYMENT_SCRIPT_STAKE_KEY,
+                               AddressType.REWARD_KEY):
+        return None
+    if not params.stakingValue.startswith("m/"):
+        return None
+    return parse_path(params.stakingValue)
+
+
+def _isValidAddressParams(params: DeriveAddressTestCase) -> bool:
+    """isValidAddressParams, the staking choice being consistent as serialized by the CommandBuilder"""
+
+    if params.addrType != AddressType.BYRON and params.netDesc.networkId > MAXIMUM_NETWORK_ID:
+        return False
+    stakingPath = _stakingPath(params)
+    if stakingPath is not None and classify_path(stakingPath) != PathType.ORDINARY_STAKING_KEY:
+        return False
+    if params.addrType in PAYMENT_PATH_ADDRESS_TYPES:
+        if not params.spendingValue.startswith("m/"):
+            return False
+        paymentPath = parse_path(params.spendingValue)
+        if classify_path(paymentPath) != PathType.ORDINARY_PAYMENT_KEY:
+            return False
+        purpose = PURPOSE_BYRON if params.addrType == AddressType.BYRON else PURPOSE_SHELLEY
+        return _hasPrefix(paymentPath, purpose)
+    return True
+
+
+def _isStandardBaseAddress(params: DeriveAddressTestCase) -> bool:
+    """Stake key path has the same account as the payment key path, as is_standard_base_address"""
+
+    if params.addrType != AddressType.BASE_PAYMENT_KEY_STAKE_KEY:
+        return False
+    stakingPath = _stakingPath(params)
+    if stakingPath is None:
+        return False
+    paymentPath = parse_path(params.spendingValue)
+    if classify_path(paymentPath) != PathType.ORDINARY_PAYMENT_KEY or not is_path_reasonable(paymentPath):
+        return False
+    if classify_path(stakingPath) != PathType.ORDINARY_STAKING_KEY or not is_path_reasonable(stakingPath):
+        return False
+    # most SW wallets do not use multidelegation
+    if _isMultidelegationStakingKeyPath(stakingPath):
+        return False
+    return stakingPath[2] == paymentPath[2]
+
+
+def _destinationAddressType(destination: TxOutputDestination) -> int:
+    if isinstance(destination.params, DeriveAddressTestCase):
+        return destination.params.addrType
+    assert isinstance(destination.params, ThirdPartyAddressParams)
+    return bytes.fromhex(destination.params.addressHex)[0] >> 4
+
+
+def _needsMissingDatumWarning(txOutput: TxOutput) -> bool:
+    return _destinationAddressType(txOutput.destination) in PAYMENT_SCRIPT_ADDRESS_TYPES and txOutput.datum is None
+
+
+def _hasRefScript(txOutput: TxOutput) -> bool:
+    return isinstance(txOutput, TxOutputBabbage) and txOutput.referenceScriptHex is not None
+
+
+# =================
+# Sign TX policies (src/securityPolicy/securityPolicy.c)
+# =================
+
+# Certificates on a stake credential (policyForSignTxCertificateStaking)
+STAKING_CERTIFICATES = (
+    CertificateType.STAKE_REGISTRATION,
+    CertificateType.STAKE_REGISTRATION_CONWAY,
+    CertificateType.STAKE_DEREGISTRATION,
+    CertificateType.STAKE_DEREGISTRATION_CONWAY,
+    CertificateType.STAKE_DELEGATION,
+)
+
+POOL_REGISTRATION_MODES = (
+    TransactionSigningMode.POOL_REGISTRATION_AS_OWNER,
+    TransactionSigningMode.POOL_REGISTRATION_AS_OPERATOR,
+)
+
+
+class _SignTxPolicies:
+    """Security policies of a Sign TX test case, with the state kept by the app along the transaction"""
+
+    def __init__(self, testCase: SignTxTestCase, expertMode: bool) -> None:
+        self.testCase = testCase
+        self.tx: Transaction = testCase.tx
+        self.mode = testCase.signingMode
+        self.expertMode = expertMode
+        # Single account security model (violatesSingleAccountOrStoreIt)
+        self.account: Optional[int] = None
+        self.isByronAccount = False
+        # Pool owner given by path, to be witnessed in POOL_REGISTRATION_AS_OWNER
+        self.poolOwnerPath: Optional[Path] = None
+
+
+    def _showIfExpert(self) -> SecurityPolicy:
+        return SecurityPolicy.SHOW if self.expertMode else SecurityPolicy.ALLOW
+
+
+    def _violatesSingleAccountOrStoreIt(self, path: Path) -> bool:
+        isByron = _hasPrefix(path, PURPOSE_BYRON)
+        if self.account is None:
+            self.account = path[2]
+            self.isByronAccount = isByron
+            return False
+        if path[2] != self.account:
+            return True
+        # Byron and Shelley paths can only be combined on the account 0
+        return isByron != self.isByronAccount and self.account != 0 | HARDENED
+
+
+    def decisions(self) -> Iterator[PolicyDecision]:
+        """Security policies of the transaction elements, in the order of CommandBuilder.iter_sign_tx"""
+
+        tx = self.tx
+        yield PolicyDecision("init", self.signTxInit())
+        if tx.auxiliaryData is not None:
+            yield from self._auxData()
+        for index in range(len(tx.inputs)):
+            yield PolicyDecision(f"input {index}", self.signTxInput())
+        for index, txOutput in enumerate(tx.outputs):
+            yield from self._output(f"output {index}", txOutput)
+        yield PolicyDecision("fee", self.signTxFee())
+        if tx.ttl is not None:
+            yield PolicyDecision("ttl", self._showIfExpert())
+        for index, certificate in enumerate(tx.certificates):
+            yield from self._certificate(f"certificate {index}", certificate)
+        for index, withdrawal in enumerate(tx.withdrawals):
+            yield PolicyDecision(f"withdrawal {index}", self.signTxWithdrawal(withdrawal.stakeCredential))
+        if tx.validityIntervalStart is not None:
+            yield PolicyDecision("validity interval start", self._showIfExpert())
+        if len(tx.mint) > 0:
+            mintPolicy = self.signTxMintInit()
+            yield PolicyDecision("mint", mintPolicy)
+            yield PolicyDecision("mint confirm", self.signTxMintConfirm(mintPolicy))
+        if tx.scriptDataHash is not None:
+            yield PolicyDecision("script data hash", self.signTxScriptDataHash())
+        for index in range(len(tx.collateralInputs)):
+            yield PolicyDecision(f"collateral input {index}", self.signTxCollateralInput())
+        for index, signer in enumerate(tx.requiredSigners):
+            yield PolicyDecision(f"required signer {index}", self.signTxRequiredSigner(signer))
+        if tx.collateralOutput is not None:
+            yield from self._collateralOutput(tx.collateralOutput)
+        if tx.totalCollateral is not None:
+            yield PolicyDecision("total collateral", SecurityPolicy.SHOW)
+        for index in range(len(tx.referenceInputs)):
+            yield PolicyDecision(f"reference input {index}", self.signTxReferenceInput())
+        for index, voterVotes in enumerate(tx.votingProcedures):
+            yield PolicyDecision(f"voting procedure {index}", self.signTxVotingProcedure(voterVotes))
+        if tx.treasury is not None:
+            yield PolicyDecision("treasury", SecurityPolicy.SHOW)
+        if tx.donation is not None:
+            yield PolicyDecision("donation", SecurityPolicy.SHOW)
+        yield PolicyDecision("confirm", SecurityPolicy.PROMPT)
+        for path in gather_witness_paths(self.testCase):
+            yield PolicyDecision(f"witness {path}", self.signTxWitness(parse_path(path)))
+
+
+    def signTxInit(self) -> SecurityPolicy:
+        """policyForSignTxInit"""
+
+        tx, mode = self.tx, self.mode
+        networkId, protocolMagic = tx.network.networkId, tx.network.protocol
+        if networkId > MAXIMUM_NETWORK_ID:
+            return SecurityPolicy.DENY
+        # Deny shelley mainnet with weird byron protocol magic
+        if networkId == MAINNET_NETWORK_ID and protocolMagic != MAINNET_PROTOCOL_MAGIC:
+            return SecurityPolicy.DENY
+
+        # certain combinations of tx body elements are forbidden
+        if mode in POOL_REGISTRATION_MODES:
+            if len(tx.certificates) != 1 or len(tx.withdrawals) > 0 or len(tx.mint) > 0:
+                return SecurityPolicy.DENY
+            # no Plutus elements, voting, treasuries and donations for pool registrations
+            if any(element is not None for element in (tx.scriptDataHash, tx.collateralOutput, tx.totalCollateral,
+                                                        tx.treasury, tx.donation)):
+                return SecurityPolicy.DENY
+            if len(tx.collateralInputs) + len(tx.requiredSigners) + len(tx.referenceInputs) \
+                    + len(tx.votingProcedures) > 0:
+                return SecurityPolicy.DENY
+        elif mode in (TransactionSigningMode.ORDINARY_TRANSACTION, TransactionSigningMode.MULTISIG_TRANSACTION):
+            # collateral and reference inputs are allowed only in PLUTUS_TX
+            if len(tx.collateralInputs) > 0 or tx.collateralOutput is not None \
+                    or tx.totalCollateral is not None or len(tx.referenceInputs) > 0:
+                return SecurityPolicy.DENY
+        else:
+            # Plutus script cannot be executed without collateral inputs and script data hash,
+            # and the user is warned about Plutus script execution itself
+            return SecurityPolicy.WARN
+
+        if not self._isTxNetworkIdVerifiable():
+            return SecurityPolicy.WARN
+        if not self._isNetworkUsual(networkId, protocolMagic):
+            return SecurityPolicy.WARN
+        # running script warning
+        if len(tx.collateralInputs) > 0:
+            return SecurityPolicy.WARN
+        return SecurityPolicy.PROMPT
+
+
+    def _isTxNetworkIdVerifiable(self) -> bool:
+        tx = self.tx
+        if tx.includeNetworkId is not None or len(tx.outputs) > 0 or len(tx.withdrawals) > 0:
+            return True
+        # pool registration certificate contains pool reward account
+        return self.mode in POOL_REGISTRATION_MODES
+
+
+    @staticmethod
+    def _isNetworkUsual(networkId: int, protocolMagic: int) -> bool:
+        if networkId == MAINNET_NETWORK_ID and protocolMagic == MAINNET_PROTOCOL_MAGIC:
+            return True
+        return networkId == TESTNET_NETWORK_ID and protocolMagic in TESTNET_PROTOCOL_MAGICS
+
+
+    def signTxInput(self) -> SecurityPolicy:
+        """policyForSignTxInput"""
+
+        # inputs are not interchangeable for Plutus scripts
+        if self.mode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            return self._showIfExpert()
+        return SecurityPolicy.ALLOW
+
+
+    # ---------------- Auxiliary data ----------------
+
+    def _auxData(self) -> Iterator[PolicyDecision]:
+        auxData = self.tx.auxiliaryData
+        assert auxData is not None
+        if auxData.type == TxAuxiliaryDataType.ARBITRARY_HASH:
+            yield PolicyDecision("auxiliary data", self._showIfExpert())
+            return
+
+        # the policy for the initial prompt, details of the registration are governed by separate policies
+        yield PolicyDecision("auxiliary data", SecurityPolicy.SHOW)
+        cip36 = auxData.params
+        assert isinstance(cip36, TxAuxiliaryDataCIP36)
+        if cip36.voteKey:
+            isPath = cip36.voteKey.startswith("m/")
+            yield PolicyDecision("vote key", self._voteKey(cip36.format, cip36.voteKey, isPath))
+        else:
+            for index, delegation in enumerate(cip36.delegations):
+                isPath = delegation.type == CIP36VoteDelegationType.PATH
+                yield PolicyDecision(f"delegation {index}",
+                                     self._voteKey(cip36.format, delegation.votingKeyPath, isPath))
+        yield PolicyDecision("staking key", self.cVoteRegistrationStakingKey(parse_path(cip36.stakingPath)))
+        yield PolicyDecision("payment destination", self.cVoteRegistrationPaymentDestination(cip36.paymentDestination))
+        yield PolicyDecision("nonce", SecurityPolicy.SHOW)
+        # since it will only be used for Catalyst, the voting purpose is not shown to non-experts
+        yield PolicyDecision("voting purpose", self._showIfExpert())
+        yield PolicyDecision("auxiliary data confirm", SecurityPolicy.PROMPT)
+
+
+    @staticmethod
+    def _voteKey(registrationFormat: CIP36VoteRegistrationFormat, voteKey: str, isPath: bool) -> SecurityPolicy:
+        """policyForCVoteRegistrationVoteKeyPath or policyForCVoteRegistrationVoteKey"""
+
+        if not isPath:
+            return SecurityPolicy.SHOW
+        path = parse_path(voteKey)
+        # encourages people to use the new format, so that support for CIP15 could be dropped sooner
+        if registrationFormat != CIP36VoteRegistrationFormat.CIP_36:
+            return SecurityPolicy.DENY
+        if classify_path(path) != PathType.CVOTE_KEY:
+            return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+
+
+    @staticmethod
+    def cVoteRegistrationStakingKey(path: Path) -> SecurityPolicy:
+        """policyForCVoteRegistrationStakingKey"""
+
+        if not _isOrdinaryStakingKeyPath(path):
+            return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+
+
+    def cVoteRegistrationPaymentDestination(self, destination: TxOutputDestination) -> SecurityPolicy:
+        """policyForCVoteRegistrationPaymentDestination"""
+
+        networkId = self.tx.network.networkId
+        if isinstance(destination.params, DeriveAddressTestCase):
+            params = destination.params
+            if not _isValidAddressParams(params) or params.addrType not in SHELLEY_ADDRESS_TYPES:
+                return SecurityPolicy.DENY
+            if params.netDesc.networkId != networkId:
+                return SecurityPolicy.DENY
+            # the address is sure to belong to the device, warn for unusual ones
+            return SecurityPolicy.SHOW if _isStandardBaseAddress(params) else SecurityPolicy.WARN
+
+        assert isinstance(destination.params, ThirdPartyAddressParams)
+        header = bytes.fromhex(destination.params.addressHex)[0]
+        if header >> 4 not in SHELLEY_ADDRESS_TYPES or header & 0x0F != networkId:
+            return SecurityPolicy.DENY
+        # the owner of the address is unknown
+        return SecurityPolicy.WARN
+
+
+    # ---------------- Outputs ----------------
+
+    def _output(self, element: str, txOutput: TxOutput) -> Iterator[PolicyDecision]:
+        if isinstance(txOutput.destination.params, DeriveAddressTestCase):
+            policy = self.signTxOutputAddressParams(txOutput, txOutput.destination.params)
+        else:
+            policy = self.signTxOutputAddressBytes(txOutput)
+        yield PolicyDecision(element, policy)
+        if policy == SecurityPolicy.DENY:
+            return
+        # datum and reference script are shown to experts only, if the output is shown
+        innerPolicy = SecurityPolicy.ALLOW if policy == SecurityPolicy.ALLOW else self._showIfExpert()
+        if txOutput.datum is not None:
+            yield PolicyDecision(f"{element} datum", innerPolicy)
+        if _hasRefScript(txOutput):
+            yield PolicyDecision(f"{element} reference script", innerPolicy)
+        yield PolicyDecision(f"{element} confirm", self.signTxOutputConfirm(policy, txOutput))
+
+
+    def _isAddressBytesSuitableForTxOutput(self, address: bytes) -> bool:
+        """is_addressBytes_suitable_for_tx_output"""
+
+        addressType = address[0] >> 4
+        if addressType in (AddressType.REWARD_KEY, AddressType.REWARD_SCRIPT):
+            # outputs may not contain reward addresses
+            return False
+        if addressType == AddressType.BYRON:
+            if _byronProtocolMagic(address) != self.tx.network.protocol:
+                return False
+        elif address[0] & 0x0F != self.tx.network.networkId:
+            return False
+        return ADDRESS_SIZES.get(addressType, len(address)) == len(address)
+
+
+    def _isAddressParamsSuitableForTxOutput(self, params: DeriveAddressTestCase) -> bool:
+        """is_addressParams_suitable_for_tx_output"""
+
+        if not _isValidAddressParams(params):
+            return False
+        if params.addrType in (AddressType.REWARD_KEY, AddressType.REWARD_SCRIPT):
+            # outputs must not contain reward addresses
+            return False
+        if params.addrType == AddressType.BYRON:
+            if params.netDesc.protocol != self.tx.network.protocol:
+                return False
+        elif params.netDesc.networkId != self.tx.network.networkId:
+            return False
+        # the essence of a change output: money stays on an address where payment is fully controlled by the device
+        if params.addrType not in PAYMENT_PATH_ADDRESS_TYPES:
+            return False
+        return not self._violatesSingleAccountOrStoreIt(parse_path(params.spendingValue))
+
+
+    def _containsForbiddenPlutusElements(self, txOutput: TxOutput) -> bool:
+        # no Plutus elements for pool registration
+        return (txOutput.datum is not None or _hasRefScript(txOutput)) and self.mode in POOL_REGISTRATION_MODES
+
+
+    def signTxOutputAddressBytes(self, txOutput: TxOutput) -> SecurityPolicy:
+        """policyForSignTxOutputAddressBytes"""
+
+        assert isinstance(txOutput.destination.params, ThirdPartyAddressParams)
+        if not self._isAddressBytesSuitableForTxOutput(bytes.fromhex(txOutput.destination.params.addressHex)):
+            return SecurityPolicy.DENY
+        if self._containsForbiddenPlutusElements(txOutput):
+            return SecurityPolicy.DENY
+        if self.mode == TransactionSigningMode.POOL_REGISTRATION_AS_OWNER:
+            # all the funds are provided by the operator, outputs are irrelevant to the owner
+            return SecurityPolicy.ALLOW
+        # utxo on a Plutus script address without datum hash is unspendable
+        if _needsMissingDatumWarning(txOutput):
+            return SecurityPolicy.WARN
+        # third-party output addresses are always shown
+        return SecurityPolicy.SHOW
+
+
+    def signTxOutputAddressParams(self, txOutput: TxOutput, params: DeriveAddressTestCase) -> SecurityPolicy:
+        """policyForSignTxOutputAddressParams"""
+
+        if not self._isAddressParamsSuitableForTxOutput(params):
+            return SecurityPolicy.DENY
+        if self._containsForbiddenPlutusElements(txOutput):
+            return SecurityPolicy.DENY
+        if self.mode in (TransactionSigningMode.ORDINARY_TRANSACTION,
+                         TransactionSigningMode.POOL_REGISTRATION_AS_OPERATOR):
+            # unusual paths or payment and staking path mismatch
+            if not _isStandardBaseAddress(params):
+                return SecurityPolicy.SHOW
+            # outputs (eUTXOs) with datum or ref script are not interchangeable
+            if txOutput.datum is not None or _hasRefScript(txOutput):
+                return self._showIfExpert()
+            # it is safe to hide the remaining change outputs
+            return SecurityPolicy.ALLOW
+        if self.mode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            # the output could affect script validation so it must not be entirely hidden
+            return self._showIfExpert()
+        # multisig outputs should be given as external addresses,
+        # and owners are not shown the outputs, so they would be unaware of the derived addresses
+        return SecurityPolicy.DENY
+
+
+    def signTxOutputConfirm(self, outputPolicy: SecurityPolicy, txOutput: TxOutput) -> SecurityPolicy:
+        """policyForSignTxOutputConfirm"""
+
+        if outputPolicy == SecurityPolicy.WARN:
+            return SecurityPolicy.PROMPT
+        if outputPolicy == SecurityPolicy.SHOW:
+            # the output was shown with (possibly many) included items,
+            # so that the user may abort the transaction sooner
+            if len(txOutput.tokenBundle) > 0:
+                return SecurityPolicy.PROMPT
+            if (txOutput.datum is not None or _hasRefScript(txOutput)) and self.expertMode:
+                return SecurityPolicy.PROMPT
+        return SecurityPolicy.ALLOW
+
+
+    def signTxFee(self) -> SecurityPolicy:
+        """policyForSignTxFee"""
+
+        # fees are paid by the operator and are thus irrelevant for owners
+        if self.mode == TransactionSigningMode.POOL_REGISTRATION_AS_OWNER:
+            return SecurityPolicy.ALLOW
+        return SecurityPolicy.SHOW
+
+
+    # ---------------- Certificates ----------------
+
+    def _certificate(self, element: str, certificate: Certificate) -> Iterator[PolicyDecision]:
+        policy = self.signTxCertificate(certificate.type)
+        if policy == SecurityPolicy.DENY:
+            yield PolicyDecision(element, policy)
+            return
+        params = certificate.params
+        if certificate.type in STAKING_CERTIFICATES:
+            assert isinstance(params, (StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams))
+            policy = self._certificateStakeCredential(params.stakeCredential)
+        elif certificate.type == CertificateType.VOTE_DELEGATION:
+            assert isinstance(params, VoteDelegationParams)
+            policy = self.signTxCertificateVoteDelegation(params)
+        elif certificate.type == CertificateType.AUTHORIZE_COMMITTEE_HOT:
+            assert isinstance(params, AuthorizeCommitteeParams)
+            policy = self.signTxCertificateCommitteeAuth(params.coldCredential, params.hotCredential)
+        elif certificate.type == CertificateType.RESIGN_COMMITTEE_COLD:
+            assert isinstance(params, ResignCommitteeParams)
+            policy = self._certificateCommitteeColdCredential(params.coldCredential)
+        elif certificate.type in (CertificateType.DREP_REGISTRATION,
+                                  CertificateType.DREP_DEREGISTRATION,
+                                  CertificateType.DREP_UPDATE):
+            assert isinstance(params, (DRepRegistrationParams, DRepUpdateParams))
+            policy = self.signTxCertificateDRep(params.dRepCredential)
+        elif certificate.type == CertificateType.STAKE_POOL_RETIREMENT:
+            assert isinstance(params, PoolRetirementParams)
+            policy = self.signTxCertificateStakePoolRetirement(params.poolKeyPath)
+        else:
+            assert isinstance(params, PoolRegistrationParams)
+            yield from self._poolRegistration(element, params)
+            return
+        yield PolicyDecision(element, policy)
+
+
+    def signTxCertificate(self, certificateType: CertificateType) -> SecurityPolicy:
+        """policyForSignTxCertificate, the generic policy deciding if the certificate type is allowed"""
+
+        isPoolRegistration = certificateType == CertificateType.STAKE_POOL_REGISTRATION
+        if self.mode in POOL_REGISTRATION_MODES:
+            # only pool registration is allowed
+            return SecurityPolicy.ALLOW if isPoolRegistration else SecurityPolicy.DENY
+        if isPoolRegistration:
+            # pool registration is allowed only in POOL_REGISTRATION signing modes
+            return SecurityPolicy.DENY
+        if self.mode == TransactionSigningMode.MULTISIG_TRANSACTION \
+                and certificateType == CertificateType.STAKE_POOL_RETIREMENT:
+            # pool retirement is impossible with multisig keys
+            return SecurityPolicy.DENY
+        return SecurityPolicy.ALLOW
+
+
+    def _forbiddenCredential(self, credential: CredentialParams) -> bool:
+        """_forbiddenCredential, for credentials witnessed in the transaction"""
+
+        if self.mode == TransactionSigningMode.MULTISIG_TRANSACTION:
+            # everything is expected to be governed by native scripts
+            return credential.type != CredentialParamsType.SCRIPT_HASH
+        if self.mode == TransactionSigningMode.ORDINARY_TRANSACTION:
+            # keys must be given by path, otherwise the user does not know if the hash corresponds to his keys
+            return credential.type != CredentialParamsType.KEY_PATH
+        # Plutus transactions are too complex for a HW wallet to understand
+        return False
+
+
+    def _certificateCredential(self, credential: CredentialParams, isPathValid) -> SecurityPolicy:
+        """Credential witnessed by a certificate, its path being checked by isPathValid"""
+
+        if self._forbiddenCredential(credential):
+            return SecurityPolicy.DENY
+        if credential.type == CredentialParamsType.KEY_PATH:
+            assert credential.keyValue is not None
+            path = parse_path(credential.keyValue)
+            if not isPathValid(path) or self._violatesSingleAccountOrStoreIt(path):
+                return SecurityPolicy.DENY
+        return SecurityPolicy.PROMPT
+
+
+    def _certificateStakeCredential(self, credential: CredentialParams) -> SecurityPolicy:
+        """_policyForSignTxCertificateStakeCredential"""
+
+        return self._certificateCredential(credential, _isOrdinaryStakingKeyPath)
+
+
+    def _certificateCommitteeColdCredential(self, credential: CredentialParams) -> SecurityPolicy:
+        """policyForSignTxCertificateCommitteeResign"""
+
+        return self._certificateCredential(credential, _isCommitteeColdKeyPath)
+
+
+    def signTxCertificateVoteDelegation(self, params: VoteDelegationParams) -> SecurityPolicy:
+        """policyForSignTxCertificateVoteDelegation"""
+
+        # DRep can be anything, but if given by key path, it should be a valid path
+        if params.dRep.type == DRepParamsType.KEY_PATH:
+            assert params.dRep.keyValue is not None
+            if not _isDRepKeyPath(parse_path(params.dRep.keyValue)):
+                return SecurityPolicy.DENY
+        return self._certificateStakeCredential(params.stakeCredential)
+
+
+    def signTxCertificateCommitteeAuth(self, coldCredential: CredentialParams,
+                                       hotCredential: CredentialParams) -> SecurityPolicy:
+        """policyForSignTxCertificateCommitteeAuth"""
+
+        policy = self._certificateCommitteeColdCredential(coldCredential)
+        if policy == SecurityPolicy.DENY:
+            return policy
+        # hot keys given by hash might be governed outside of this device
+        if hotCredential.type == CredentialParamsType.KEY_PATH:
+            assert hotCredential.keyValue is not None
+            if not _isCommitteeHotKeyPath(parse_path(hotCredential.keyValue)):
+                return SecurityPolicy.DENY
+        return SecurityPolicy.PROMPT
+
+
+    def signTxCertificateDRep(self, credential: CredentialParams) -> SecurityPolicy:
+        """policyForSignTxCertificateDRep"""
+
+        return self._certificateCredential(credential, _isDRepKeyPath)
+
+
+    def signTxCertificateStakePoolRetirement(self, poolKeyPath: str) -> SecurityPolicy:
+        """policyForSignTxCertificateStakePoolRetirement"""
+
+        # pool retirement may only be present in ORDINARY_TX signing mode (the app asserts otherwise),
+        # the path should be a valid pool cold key path
+        if self.mode != TransactionSigningMode.ORDINARY_TRANSACTION:
+            return SecurityPolicy.DENY
+        if not poolKeyPath.startswith("m/") or not _isPoolColdKeyPath(parse_path(poolKeyPath)):
+            return SecurityPolicy.DENY
+        return SecurityPolicy.PROMPT
+
+
+    def _poolRegistration(self, element: str, pool: PoolRegistrationParams) -> Iterator[PolicyDecision]:
+        """Stake pool registration certificate, and its additional data"""
+
+        isOwner = self.mode == TransactionSigningMode.POOL_REGISTRATION_AS_OWNER
+        # there should be exactly one owner given by path for which a witness is provided
+        policy = SecurityPolicy.DENY if isOwner and len(pool.poolOwners) == 0 else SecurityPolicy.ALLOW
+        yield PolicyDecision(element, policy)
+        if policy == SecurityPolicy.DENY:
+            return
+
+        # owner should see a hash, operator should see a path
+        poolIdType = PoolKeyType.THIRD_PARTY if isOwner else PoolKeyType.DEVICE_OWNED
+        yield PolicyDecision(f"{element} pool id",
+                             SecurityPolicy.SHOW if pool.poolKey.type == poolIdType else SecurityPolicy.DENY)
+        # not interesting for an owner
+        yield PolicyDecision(f"{element} vrf key", SecurityPolicy.ALLOW if isOwner else SecurityPolicy.SHOW)
+        yield PolicyDecision(f"{element} reward account", SecurityPolicy.SHOW)
+
+        numOwnersGivenByPath = 0
+        for index, owner in enumerate(pool.poolOwners):
+            policy = SecurityPolicy.SHOW
+            if owner.type == PoolKeyType.DEVICE_OWNED:
+                path = parse_path(owner.key)
+                numOwnersGivenByPath += 1
+                self.poolOwnerPath = path
+                # when path is present, it should be a valid staking path
+                if not _isOrdinaryStakingKeyPath(path) or self._violatesSingleAccountOrStoreIt(path):
+                    policy = SecurityPolicy.DENY
+                # operator should receive owners given by hash
+                elif not isOwner:
+                    policy = SecurityPolicy.DENY
+            if isOwner and numOwnersGivenByPath > 1:
+                policy = SecurityPolicy.DENY
+            yield PolicyDecision(f"{element} owner {index}", policy)
+            if policy == SecurityPolicy.DENY:
+                return
+
+        for index in range(len(pool.relays)):
+            yield PolicyDecision(f"{element} relay {index}", SecurityPolicy.ALLOW if isOwner else SecurityPolicy.SHOW)
+        yield PolicyDecision(f"{element} metadata", SecurityPolicy.SHOW)
+        # notify the user if there are no owners and/or relays
+        noOwnersOrRelays = len(pool.poolOwners) == 0 or len(pool.relays) == 0
+        yield PolicyDecision(f"{element} confirm", SecurityPolicy.PROMPT if noOwnersOrRelays else SecurityPolicy.ALLOW)
+
+
+    # ---------------- Other body elements ----------------
+
+    def signTxWithdrawal(self, credential: CredentialParams) -> SecurityPolicy:
+        """policyForSignTxWithdrawal"""
+
+        if credential.type == CredentialParamsType.KEY_PATH:
+            assert credential.keyValue is not None
+            path = parse_path(credential.keyValue)
+            if not _isOrdinaryStakingKeyPath(path) or self._violatesSingleAccountOrStoreIt(path):
+                return SecurityPolicy.DENY
+            # script hash is expected for multisig txs
+            allowedModes: Tuple[TransactionSigningMode, ...] = (TransactionSigningMode.ORDINARY_TRANSACTION,
+                                                                TransactionSigningMode.PLUTUS_TRANSACTION)
+        elif credential.type == CredentialParamsType.KEY_HASH:
+            # key path is expected for ordinary txs, script hash for multisig txs
+            allowedModes = (TransactionSigningMode.PLUTUS_TRANSACTION,)
+        else:
+            # key path is expected for ordinary txs
+            allowedModes = (TransactionSigningMode.MULTISIG_TRANSACTION, TransactionSigningMode.PLUTUS_TRANSACTION)
+        return self._showIfExpert() if self.mode in allowedModes else SecurityPolicy.DENY
+
+
+    def signTxMintInit(self) -> SecurityPolicy:
+        """policyForSignTxMintInit"""
+
+        # in POOL_REGISTRATION signing modes, the mint is rejected by the init policy
+        return SecurityPolicy.DENY if self.mode in POOL_REGISTRATION_MODES else SecurityPolicy.SHOW
+
+
+    @staticmethod
+    def signTxMintConfirm(mintPolicy: SecurityPolicy) -> SecurityPolicy:
+        """policyForSignTxMintConfirm"""
+
+        # all minted tokens were shown, show a final confirmation prompt as well
+        return SecurityPolicy.PROMPT if mintPolicy == SecurityPolicy.SHOW else SecurityPolicy.ALLOW
+
+
+    def signTxScriptDataHash(self) -> SecurityPolicy:
+        """policyForSignTxScriptDataHash"""
+
+        return SecurityPolicy.DENY if self.mode in POOL_REGISTRATION_MODES else self._showIfExpert()
+
+
+    def signTxCollateralInput(self) -> SecurityPolicy:
+        """policyForSignTxCollateralInput"""
+
+        # collateral inputs allowed only if Plutus script is to be executed
+        if self.mode != TransactionSigningMode.PLUTUS_TRANSACTION:
+            return SecurityPolicy.DENY
+        # safe to hide if total collateral is given
+        if self.tx.totalCollateral is None and self.expertMode:
+            return SecurityPolicy.SHOW
+        return SecurityPolicy.ALLOW
+
+
+    def signTxRequiredSigner(self, signer: RequiredSigner) -> SecurityPolicy:
+        """policyForSignTxRequiredSigner"""
+
+        if self.mode in POOL_REGISTRATION_MODES:
+            return SecurityPolicy.DENY
+        if signer.type == TxRequiredSignerType.PATH:
+            path = parse_path(signer.addressHex)
+            pathType = classify_path(path)
+            if pathType in (PathType.ORDINARY_ACCOUNT, PathType.ORDINARY_PAYMENT_KEY, PathType.ORDINARY_STAKING_KEY):
+                allowed = _hasPrefix(path, PURPOSE_SHELLEY)
+            else:
+                allowed = pathType not in (PathType.POOL_COLD_KEY, PathType.CVOTE_ACCOUNT,
+                                           PathType.CVOTE_KEY, PathType.INVALID)
+            if not allowed:
+                return SecurityPolicy.DENY
+        return self._showIfExpert()
+
+
+    def _collateralOutput(self, txOutput: TxOutput) -> Iterator[PolicyDecision]:
+        if isinstance(txOutput.destination.params, DeriveAddressTestCase):
+            policy = self.signTxCollateralOutputAddressParams(txOutput, txOutput.destination.params)
+        else:
+            policy = self.signTxCollateralOutputAddressBytes(txOutput)
+        yield PolicyDecision("collateral output", policy)
+        if policy == SecurityPolicy.DENY:
+            return
+
+        isShown = policy != SecurityPolicy.ALLOW
+        # for non-change outputs, control over the collateral tokens is potentially transferred to another party
+        lossOfControl = txOutput.destination.type != TxOutputDestinationType.DEVICE_OWNED
+        yield PolicyDecision("collateral output tokens",
+                             SecurityPolicy.SHOW if isShown and lossOfControl and self.expertMode
+                             else SecurityPolicy.ALLOW)
+        # ADA amount is calculable from total collateral
+        yield PolicyDecision("collateral output ADA amount",
+                             SecurityPolicy.SHOW if isShown and self.tx.totalCollateral is None and self.expertMode
+                             else SecurityPolicy.ALLOW)
+        if policy == SecurityPolicy.WARN or (policy == SecurityPolicy.SHOW and len(txOutput.tokenBundle) > 0):
+            yield PolicyDecision("collateral output confirm", SecurityPolicy.PROMPT)
+        else:
+            yield PolicyDecision("collateral output confirm", SecurityPolicy.ALLOW)
+
+
+    def _collateralOutputDenied(self, txOutput: TxOutput) -> bool:
+        """Common checks of the collateral return output, whatever its destination"""
+
+        if _destinationAddressType(txOutput.destination) not in COLLATERAL_OUTPUT_ADDRESS_TYPES:
+            return True
+        return txOutput.datum is not None or _hasRefScript(txOutput)
+
+
+    def signTxCollateralOutputAddressBytes(self, txOutput: TxOutput) -> SecurityPolicy:
+        """policyForSignTxCollateralOutputAddressBytes"""
+
+        assert isinstance(txOutput.destination.params, ThirdPartyAddressParams)
+        if not self._isAddressBytesSuitableForTxOutput(bytes.fromhex(txOutput.destination.params.addressHex)):
+            return SecurityPolicy.DENY
+        if self._collateralOutputDenied(txOutput) or self.mode != TransactionSigningMode.PLUTUS_TRANSACTION:
+            return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW
+
+
+    def signTxCollateralOutputAddressParams(self, txOutput: TxOutput, params: DeriveAddressTestCase) -> SecurityPolicy:
+        """policyForSignTxCollateralOutputAddressParams"""
+
+        if not self._isAddressParamsSuitableForTxOutput(params):
+            return SecurityPolicy.DENY
+        if self._collateralOutputDenied(txOutput) or self.mode != TransactionSigningMode.PLUTUS_TRANSACTION:
+            return SecurityPolicy.DENY
+        if self.tx.totalCollateral is None:
+            # collateral output ADA must be shown, so the whole output must be shown
+            return SecurityPolicy.SHOW
+        # change outputs can be hidden
+        return SecurityPolicy.ALLOW if _isStandardBaseAddress(params) else SecurityPolicy.SHOW
+
+
+    def signTxReferenceInput(self) -> SecurityPolicy:
+        """policyForSignTxReferenceInput"""
+
+        if self.mode != TransactionSigningMode.PLUTUS_TRANSACTION:
+            return SecurityPolicy.DENY
+        return self._showIfExpert()
+
+
+    def signTxVotingProcedure(self, voterVotes: VoterVotes) -> SecurityPolicy:
+        """policyForSignTxVotingProcedure, the voter determining the witnesses"""
+
+        voter = voterVotes.voter
+        if self.mode == TransactionSigningMode.ORDINARY_TRANSACTION:
+            # keys must be given by path, otherwise the user does not know if the hash corresponds to his keys
+            pathChecks = {
+                VoterType.COMMITTEE_KEY_PATH: _isCommitteeHotKeyPath,
+                VoterType.DREP_KEY_PATH: _isDRepKeyPath,
+                VoterType.STAKE_POOL_KEY_PATH: _isPoolColdKeyPath,
+            }
+            if voter.type not in pathChecks or not pathChecks[voter.type](parse_path(voter.keyValue)):
+                return SecurityPolicy.DENY
+        elif self.mode == TransactionSigningMode.MULTISIG_TRANSACTION:
+            # everything is expected to be governed by native scripts
+            if voter.type not in (VoterType.COMMITTEE_SCRIPT_HASH, VoterType.DREP_SCRIPT_HASH):
+                return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW
+
+
+    # ---------------- Witnesses ----------------
+
+    def signTxWitness(self, path: Path) -> SecurityPolicy:
+        """policyForSignTxWitness"""
+
+        if self.mode == TransactionSigningMode.ORDINARY_TRANSACTION:
+            return self._ordinaryWitness(path)
+        if self.mode == TransactionSigningMode.MULTISIG_TRANSACTION:
+            return self._multisigWitness(path)
+        if self.mode == TransactionSigningMode.PLUTUS_TRANSACTION:
+            return self._plutusWitness(path)
+        if self.mode == TransactionSigningMode.POOL_REGISTRATION_AS_OWNER:
+            return self._poolRegistrationOwnerWitness(path)
+        return self._poolRegistrationOperatorWitness(path)
+
+
+    def _mintWitness(self) -> SecurityPolicy:
+        # let the user know which mint key is used
+        return SecurityPolicy.SHOW if len(self.tx.mint) > 0 else SecurityPolicy.DENY
+
+
+    def _ordinaryWitness(self, path: Path) -> SecurityPolicy:
+        pathType = classify_path(path)
+        if pathType in (PathType.ORDINARY_PAYMENT_KEY, PathType.ORDINARY_STAKING_KEY):
+            # ordinary key paths can be hidden if they are not unusual
+            if self._violatesSingleAccountOrStoreIt(path):
+                return SecurityPolicy.DENY
+            if not is_path_reasonable(path):
+                return SecurityPolicy.WARN
+            return self._showIfExpert()
+        if pathType in (PathType.DREP_KEY, PathType.COMMITTEE_COLD_KEY, PathType.COMMITTEE_HOT_KEY):
+            # used to sign certificates and voting procedures, better to show them
+            if self._violatesSingleAccountOrStoreIt(path):
+                return SecurityPolicy.DENY
+            return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+        if pathType == PathType.POOL_COLD_KEY:
+            # let the user know the SW wallet wants to sign with the stake pool key
+            return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+        if pathType == PathType.MINT_KEY:
+            return self._mintWitness()
+        # multisig keys forbidden
+        return SecurityPolicy.DENY
+
+
+    def _multisigWitness(self, path: Path) -> SecurityPolicy:
+        pathType = classify_path(path)
+        if pathType in (PathType.MULTISIG_PAYMENT_KEY, PathType.MULTISIG_STAKING_KEY):
+            # multisig UTXOs sharing a signer are not necessarily interchangeable, so they are always shown
+            return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+        if pathType == PathType.MINT_KEY:
+            return self._mintWitness()
+        # ordinary, pool cold, DRep and committee keys forbidden
+        return SecurityPolicy.DENY
+
+
+    def _plutusWitness(self, path: Path) -> SecurityPolicy:
+        pathType = classify_path(path)
+        if pathType in (PathType.ORDINARY_PAYMENT_KEY, PathType.ORDINARY_STAKING_KEY,
+                        PathType.MULTISIG_PAYMENT_KEY, PathType.MULTISIG_STAKING_KEY,
+                        PathType.DREP_KEY, PathType.COMMITTEE_COLD_KEY, PathType.COMMITTEE_HOT_KEY):
+            # any path is allowed, but it must be shown
+            return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+        if pathType == PathType.MINT_KEY:
+            return SecurityPolicy.SHOW
+        return SecurityPolicy.DENY
+
+
+    def _poolRegistrationOwnerWitness(self, path: Path) -> SecurityPolicy:
+        # the witness path must be the one of the owner given by path,
+        # otherwise it might witness owners given by key hash
+        if classify_path(path) != PathType.ORDINARY_STAKING_KEY or path != self.poolOwnerPath:
+            return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+
+
+    @staticmethod
+    def _poolRegistrationOperatorWitness(path: Path) -> SecurityPolicy:
+        # only ordinary payment key paths (because of inputs) and pool cold key path are allowed
+        if classify_path(path) not in (PathType.ORDINARY_PAYMENT_KEY, PathType.POOL_COLD_KEY):
+            return SecurityPolicy.DENY
+        return SecurityPolicy.SHOW if is_path_reasonable(path) else SecurityPolicy.WARN
+
+
+def iter_sign_tx_policies(testCase: SignTxTestCase, expertMode: bool = False) -> Iterator[PolicyDecision]:
+    """Security policies applied by the app to the elements of a transaction
+
+    The elements are classified in the order of CommandBuilder.iter_sign_tx,
+    up to the first one denied, on which the app stops with SW_REJECTED_BY_POLICY.
+
+    Args:
+        testCase (SignTxTestCase): The test case
+        expertMode (bool): Whether the app is in expert mode
+
+    Returns:
+        Iterator on the security policy of each element
+    """
+
+    for decision in _SignTxPolicies(testCase, expertMode).decisions():
+        yield decision
+        if decision.policy == SecurityPolicy.DENY:
+            return
+
+
+def sign_tx_denial(testCase: SignTxTestCase, expertMode: bool = False) -> Optional[PolicyDecision]:
+    """Check whether the app would reject a transaction by policy
+
+    Args:
+        testCase (SignTxTestCase): The test case
+        expertMode (bool): Whether the app is in expert mode
+
+    Returns:
+        The denied element, None if the transaction is not rejected by policy
+    """
+
+    for decision in iter_sign_tx_policies(testCase, expertMode):
+        if decision.policy == SecurityPolicy.DENY:
+            return decision
+    return None
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the account discovery, run without any device.
+A synthetic wallet of the Speculos seed is discovered with the keys given by utils.derive_many:
+the scan of a chain must end after the gap limit, and the discovery at the first unused account.
+"""
+
+from typing import Dict, List, Set, Tuple
+import pytest
+
+from application_client.app_def import AddressType, Mainnet
+
+from input_files.derive_address import DeriveAddressTestCase
+
+from account_discovery import AccountDiscovery, CHAIN_EXTERNAL, CHAIN_INTERNAL, account_path
+from utils import derive_address_bytes, derive_many
+
+_GAP_LIMIT = 5
+
+
+def _address(account: int, chain: int, index: int) -> bytes:
+    """Base address of an account key, derived from the seed"""
+
+    return derive_address_bytes(DeriveAddressTestCase("", Mainnet, AddressType.BASE_PAYMENT_KEY_STAKE_KEY,
+                                                      f"{account_path(account)}/{chain}/{index}",
+                                                      f"{account_path(account)}/2/0"))
+
+
+def _discover(used: List[Tuple[int, int, int]], accountBatchSize: int = 1) -> Tuple[Dict[str, bytes], int]:
+    """Discover the wallet whose used keys are given as (account, chain, index)
+
+    Returns:
+        The discovered addresses by path, and the number of addresses checked
+    """
+
+    usedAddresses: Set[bytes] = {_address(*key) for key in used}
+    checked: List[bytes] = []
+
+    def isUsed(address: bytes) -> bool:
+        checked.append(address)
+        return address in usedAddresses
+
+    accounts = AccountDiscovery(derive_many, Mainnet, isUsed, _GAP_LIMIT, accountBatchSize).discover()
+    discovered = {address.path: address.address for account in accounts for addresses in account.addresses.values()
+                  for address in addresses}
+    return discovered, len(checked)
+
+
+def _paths(used: List[Tuple[int, int, int]]) -> Set[str]:
+    return {f"{account_path(account)}/{chain}/{index}" for account, chain, index in used}
+
+
+@pytest.mark.parametrize("accountBatchSize", [1, 3])
+def test_account_discovery(accountBatchSize: int) -> None:
+    """Check the used addresses are discovered, whatever the number of account keys per session"""
+
+    used = [(0, CHAIN_EXTERNAL, 0), (0, CHAIN_EXTERNAL, 3), (0, CHAIN_INTERNAL, 1), (1, CHAIN_INTERNAL, 4)]
+    discovered, _ = _discover(used, accountBatchSize)
+    assert discovered == {f"{account_path(account)}/{chain}/{index}": _address(account, chain, index)
+                          for account, chain, index in used}
+
+
+def test_account_discovery_gap_limit() -> None:
+    """Check the scan of a chain ends after gap limit unused addresses"""
+
+    # within the gap of index 3, then just beyond the gap of index 7
+    used = [(0, CHAIN_EXTERNAL, 3), (0, CHAIN_EXTERNAL, 7), (0, CHAIN_EXTERNAL, 7 + _GAP_LIMIT + 1)]
+    discovered, checked = _discover(used)
+    assert set(discovered) == _paths(used[:2])
+    # account 0: external chain up to 7 + gap limit, empty internal chain; then the empty account 1
+    assert checked == (8 + _GAP_LIMIT) + _GAP_LIMIT + 2 * _GAP_LIMIT
+
+
+def test_account_discovery_unused_account() -> None:
+    """Check the discovery stops at the first account without any used address"""
+
+    used = [(0, CHAIN_EXTERNAL, 0), (2, CHAIN_EXTERNAL, 0)]
+    discovered, checked = _discover(used, accountBatchSize=3)
+    assert set(discovered) == _paths(used[:1])
+    assert checked == (1 + _GAP_LIMIT) + _GAP_LIMIT + 2 * _GAP_LIMIT
+
+
+def test_account_discovery_empty_wallet() -> None:
+    """Check an empty wallet only scans the first account"""
+
+    assert _discover([]) == ({}, 2 * _GAP_LIMIT)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the bulk address codec, run without any device.
+The codec is checked against the device encoder test vectors (src/test/bech32_test.c and
+src/test/base58_test.c), the bech32 addresses noted in the Sign TX fixtures, and bip_utils.
+"""
+
+from pathlib import Path
+from typing import Callable, List, Tuple
+import hashlib
+import re
+import pytest
+
+from bip_utils.bech32 import Bech32Encoder
+
+from application_client.address_codec import decode_many, encode_addresses, encode_bech32_many
+from application_client.address_codec import decode_bech32, encode_base58_many, decode_base58
+
+# (hrp, payload, bech32) of src/test/bech32_test.c
+# cspell:disable
+BECH32_VECTORS = [
+    ("a", "", "a12uel5l"),
+    ("an83characterlonghumanreadablepartthatcontainsthenumber1andtheexcludedcharactersbio", "",
+     "an83characterlonghumanreadablepartthatcontainsthenumber1andtheexcludedcharactersbio1tt5tgs"),
+    ("abcdef", "00443214c74254b635cf84653a56d7c675be77df", "abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxw"),
+    ("1", "00" * 51, "11" + "q" * 82 + "c8247j"),
+    ("split", "c5f38b70305f519bf66d85fb6cf03058f3dde463ecd7918f2dc743918f2d",
+     "split1checkupstagehandshakeupstreamerranterredcaperred2y9e3w"),
+    ("addr",
+     "009493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e32c728d3861e164cab28cb8f006448139c8f1740ffb8e7aa9e5232dc",
+     "addr1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3jcu5d8ps7zex2k2xt3uqxgjqnnj83ws8lhrn648jjxtwqcyl47r"),
+]
+
+# (payload, base58) of src/test/base58_test.c
+BASE58_VECTORS = [
+    ("", ""),
+    ("ab", "3x"),
+    ("16", "P"),
+    ("f2", "5B"),
+    ("a1b3", "DJi"),
+    ("25b6", "3sT"),  # codespell:ignore
+    ("ffff", "LUv"),
+    ("0000", "11"),
+    ("82d818582183581ce63175c654dfd93a9290342a067158dc0f57a1108ddbd8cace3839bda0001a0a0e41ce",
+     "Ae2tdPwUPEZKmwoy3AU3cXb5Chnasj6mvVNxV1H11997q3VW5ihbSfQwGpm"),
+    ("82d818583983581c07d99d3987090111d70b83e21c1db61acdb659d45cc1b5769a77ae11a1015655c94dbc8f2"
+     "a15f95499becfbf9f2de442bce11eacd1001abd57ca7a",
+     "4swhHtxKapQbj3TZEipgtp7NQzcRWDYqCxXYoPQWjGyHmhxS1w1TjUEszCQT1sQucGwmPQMYdv1FYs3d51KgoubviPBf"),
+    ("00000000ab", "11113x"),
+    ("00000000df256631", "11116hpoSQ"),
+    ("2536000000", "5CVj3Vq"),
+    ("0000000000361200000000", "11111TvgAkW5V"),
+]
+# cspell:enable
+
+
+def _fixtureAddresses() -> List[Tuple[bytes, str]]:
+    """Raw and bech32 addresses noted together in the Sign TX fixtures"""
+
+    source = (Path(__file__).parent / "input_files" / "signTx.py").read_text()
+    pattern = r"# bech32 (\w+)\s*\n\s*ThirdPartyAddressParams\(\"([0-9a-f]+)\"\)"
+    return [(bytes.fromhex(addressHex), bech32) for bech32, addressHex in re.findall(pattern, source)]
+
+
+@pytest.mark.parametrize("hrp, payloadHex, expected", BECH32_VECTORS)
+def test_bech32_vectors(hrp: str, payloadHex: str, expected: str) -> None:
+    """Check the bech32 encoding of the device test vectors"""
+
+    assert encode_bech32_many(hrp, [bytes.fromhex(payloadHex)]) == [expected]
+    assert decode_bech32(expected) == (hrp, bytes.fromhex(payloadHex))
+
+
+@pytest.mark.parametrize("payloadHex, expected", BASE58_VECTORS)
+def test_base58_vectors(payloadHex: str, expected: str) -> None:
+    """Check the base58 encoding of the device test vectors"""
+
+    assert encode_base58_many([bytes.fromhex(payloadHex)]) == [expected]
+    assert decode_base58(expected) == bytes.fromhex(payloadHex)
+
+
+def test_fixture_addresses() -> None:
+    """Check the addresses of the Sign TX fixtures, encoded and decoded as a batch"""
+
+    fixtures = _fixtureAddresses()
+    assert len(fixtures) > 0
+    assert encode_addresses(address for address, _ in fixtures) == [bech32 for _, bech32 in fixtures]
+    assert decode_many(bech32 for _, bech32 in fixtures) == [address for address, _ in fixtures]
+
+
+def test_addresses_batch() -> None:
+    """Check a batch of base addresses against bip_utils, mainnet and testnet"""
+
+    addresses = [bytes([index & 1]) + hashlib.blake2b(index.to_bytes(4, "big"), digest_size=56).digest()
+                 for index in range(1000)]
+    encoded = encode_addresses(addresses)
+    assert encoded == [Bech32Encoder.Encode("addr" if address[0] & 1 else "addr_test", address) for address in addresses]
+    assert decode_many(encoded) == addresses
+
+
+def test_empty_address() -> None:
+    """Check an empty raw address is rejected"""
+
+    with pytest.raises(ValueError, match="Empty address"):
+        encode_addresses([bytes(29), b""])
+
+
+@pytest.mark.parametrize("change", [lambda address: address[:-1] + "q",
+                                    lambda address: address[:-1] + "b",
+                                    lambda address: address[:-1] + "é",
+                                    lambda address: address[:8] + address[8:].upper(),
+                                    lambda address: address[:-7] + address[-6:]],
+                         ids=["checksum", "character", "non ascii", "case", "length"])
+def test_invalid_address_batch(change: Callable[[str], str]) -> None:
+    """Check an invalid address of a batch is reported"""
+
+    addresses = encode_addresses(bytes([1]) + bytes([index]) * 56 for index in range(8))
+    addresses[3] = change(addresses[3])
+    with pytest.raises(ValueError):
+        decode_many(addresses)
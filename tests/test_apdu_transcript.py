@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side tests of the APDU transcripts, run without any device
+"""
+
+from pathlib import Path
+from typing import List
+import time
+import pytest
+
+from application_client.app_def import Errors
+from application_client.apdu_transcript import TranscriptExchange, TranscriptRecorder, read_transcript
+
+
+_EXCHANGES = [
+    (bytes.fromhex("d700000000"), Errors.SW_SUCCESS, bytes.fromhex("07000000"), False),
+    (bytes.fromhex("d7ff000000"), Errors.SW_UNKNOWN_INS, b"", False),
+    (bytes.fromhex("d721010005") + bytes(5), Errors.SW_SUCCESS, b"", True),
+    (bytes.fromhex("d724010000") + bytes(255), Errors.SW_SUCCESS, bytes(range(256)) * 2, False),
+]
+
+
+def _record(path: Path, exchanges: list) -> None:
+    with TranscriptRecorder(path) as recorder:
+        for command, status, data, interactive in exchanges:
+            sentNs = time.monotonic_ns()
+            recorder.record(command, status, data, sentNs, time.monotonic_ns(), interactive)
+
+
+def _check(transcript: List[TranscriptExchange], session: int, exchanges: list) -> None:
+    assert [(exchange.command, exchange.status, exchange.data, exchange.interactive) for exchange in transcript] == exchanges
+    assert all(exchange.session == session for exchange in transcript)
+    assert all(exchange.receivedNs >= exchange.sentNs for exchange in transcript)
+
+
+def test_transcript_round_trip(tmp_path: Path) -> None:
+    """Check the recorded exchanges are read back, session by session"""
+
+    path = tmp_path / "transcript.apdu"
+    _record(path, _EXCHANGES)
+    _record(path, _EXCHANGES[:2])
+
+    transcript = read_transcript(path)
+    _check(transcript[:len(_EXCHANGES)], 0, _EXCHANGES)
+    _check(transcript[len(_EXCHANGES):], 1, _EXCHANGES[:2])
+
+
+@pytest.mark.parametrize("cut", [1, 5, 23, 24, 300])
+def test_transcript_append_after_cut(tmp_path: Path, cut: int) -> None:
+    """Check a recording interrupted inside its last record loses only that record, even once appended to"""
+
+    path = tmp_path / "transcript.apdu"
+    _record(path, _EXCHANGES)
+    content = path.read_bytes()
+    path.write_bytes(content[:-cut])
+    _check(read_transcript(path), 0, _EXCHANGES[:-1])
+
+    _record(path, _EXCHANGES[:3])
+    transcript = read_transcript(path)
+    _check(transcript[:len(_EXCHANGES) - 1], 0, _EXCHANGES[:-1])
+    _check(transcript[len(_EXCHANGES) - 1:], 1, _EXCHANGES[:3])
+
+
+def test_transcript_invalid_record(tmp_path: Path) -> None:
+    """Check a file which is not a transcript is rejected, and left untouched"""
+
+    path = tmp_path / "transcript.apdu"
+    path.write_bytes(b"not a transcript")
+    with pytest.raises(ValueError):
+        read_transcript(path)
+    with pytest.raises(ValueError):
+        TranscriptRecorder(path)
+    assert path.read_bytes() == b"not a transcript"
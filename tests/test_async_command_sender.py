@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides Ragger tests for the asyncio command sender, talking to the Speculos APDU port
+"""
+
+import asyncio
+import pytest
+
+from ragger.backend import BackendInterface, SpeculosBackend
+
+from application_client.app_def import Errors
+from application_client.async_command_sender import AsyncCommandSender
+from application_client.command_sender import CommandSender
+from application_client.command_builder import CommandBuilder, P1Type
+
+from input_files.pubkey import testsShelleyUsualNoConfirm
+
+from utils import derive_many
+
+
+def _apduPort(backend: BackendInterface) -> int:
+    if not isinstance(backend, SpeculosBackend):
+        pytest.skip("Only on Speculos, the asyncio sender talking to its APDU port")
+    # The APDU port is picked by Ragger when Speculos is started
+    return backend._apdu_port  # pylint: disable=protected-access
+
+
+def test_async_version(backend: BackendInterface) -> None:
+    """Check the asyncio sender gets the same Version and Serial as the synchronous one"""
+
+    port = _apduPort(backend)
+    client = CommandSender(backend)
+
+    async def run() -> None:
+        async with AsyncCommandSender(port=port) as asyncClient:
+            assert await asyncClient.get_version() == client.get_version()
+            assert await asyncClient.get_serial() == client.get_serial()
+            rapdu = await asyncClient.send_raw(0xD7, 0xFF, 0x00, 0x00, b"")
+            assert rapdu.status == Errors.SW_UNKNOWN_INS
+
+    asyncio.run(run())
+
+
+def test_async_pubkeys(backend: BackendInterface) -> None:
+    """Check Public Keys without confirmation, sent back to back"""
+
+    port = _apduPort(backend)
+    builder = CommandBuilder()
+    paths = [testCase.path for testCase in testsShelleyUsualNoConfirm]
+
+    async def run() -> None:
+        async with AsyncCommandSender(port=port) as asyncClient:
+            rapdus = await asyncClient.exchange_many(builder.get_pubkey(P1Type.P1_KEY_INIT, path) for path in paths)
+        assert [rapdu.status for rapdu in rapdus] == [Errors.SW_SUCCESS] * len(paths)
+        assert [(path, rapdu.data[:32], rapdu.data[32:]) for path, rapdu in zip(paths, rapdus)] == derive_many(paths)
+
+    asyncio.run(run())
+
+
+def test_async_get_pubkeys(backend: BackendInterface) -> None:
+    """Check Get Public Keys returns the same keys as the synchronous sender"""
+
+    port = _apduPort(backend)
+    paths = [testCase.path for testCase in testsShelleyUsualNoConfirm]
+
+    async def run() -> None:
+        async with AsyncCommandSender(port=port) as asyncClient:
+            assert await asyncClient.get_pubkeys(paths[:1]) == CommandSender(backend).get_pubkeys(paths[:1])
+            # a single key of each session, the multiple keys sessions requiring a confirmation
+            assert [key for path in paths for key in await asyncClient.get_pubkeys([path])] == derive_many(paths)
+
+    asyncio.run(run())
+
+
+def test_async_get_pubkeys_empty() -> None:
+    """Check Get Public Keys rejects an empty session, before any exchange"""
+
+    with pytest.raises(ValueError, match="At least one derivation path"):
+        asyncio.run(AsyncCommandSender().get_pubkeys([]))
+
+
+def test_async_exchange_raw(backend: BackendInterface) -> None:
+    """Check the prebuilt APDUs exchanges, awaited directly or as a task"""
+
+    port = _apduPort(backend)
+    builder = CommandBuilder()
+    version = CommandSender(backend).get_version()
+
+    async def run() -> None:
+        async with AsyncCommandSender(port=port) as asyncClient:
+            rapdu = await asyncClient.exchange_raw(builder.get_version())
+            assert (rapdu.status, rapdu.data) == (Errors.SW_SUCCESS, version)
+            task = asyncClient.exchange_async_raw(builder.get_version())
+            rapdu = await task
+            assert (rapdu.status, rapdu.data) == (Errors.SW_SUCCESS, version)
+
+    asyncio.run(run())
+
+
+def test_async_cancel(backend: BackendInterface) -> None:
+    """Check a cancelled exchange closes the connection, instead of desynchronizing the next ones"""
+
+    port = _apduPort(backend)
+    serial = CommandSender(backend).get_serial()
+
+    async def run() -> None:
+        async with AsyncCommandSender(port=port) as asyncClient:
+            # cancelled before the response could be read
+            task = asyncio.ensure_future(asyncClient.get_version())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            with pytest.raises(ConnectionError):
+                await asyncClient.get_serial()
+            # the pending response is dropped along with the former connection
+            await asyncClient.connect()
+            assert await asyncClient.get_serial() == serial
+
+    asyncio.run(run())
@@ -15,6 +15,7 @@ from ragger.error import ExceptionRAPDU
 
 from application_client.app_def import Errors
 from application_client.command_sender import CommandSender
+from application_client.native_script_hash_builder import NativeScriptHasher
 
 from input_files.derive_native_script import ValidNativeScriptTestCases, ValidNativeScriptTestCase
 from input_files.derive_native_script import NativeScript, NativeScriptType
@@ -22,7 +23,11 @@ from input_files.derive_native_script import NativeScriptParamsPubkey, NativeScr
 from input_files.derive_native_script import NativeScriptParamsScripts, NativeScriptParamsNofK
 from input_files.derive_native_script import InvalidScriptTestCases
 
-from utils import idTestFunc
+from utils import idTestFunc, get_device_key_hash
+
+
+# Host side hasher of the expected native script hashes
+_hasher = NativeScriptHasher(get_device_key_hash)
 
 
 @pytest.mark.parametrize(
@@ -180,6 +185,7 @@ def _deriveNativeScriptHash_finishWholeNativeScript(firmware: Firmware,
     assert response and response.status == Errors.SW_SUCCESS
     # Check the response
     assert response.data.hex() == testCase.expected.hash
+    assert response.data == _hasher.hash(testCase.script)
     # TODO: Generate the payload and verify the signature
 
 
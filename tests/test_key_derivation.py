@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the soft derivation, run without any device.
+The keys derived from an account extended public key must be the ones derived from the seed,
+as returned by the device.
+"""
+
+import pytest
+
+from key_derivation import ExtendedPublicKey, HARDENED, derive_child, derive_path, derive_range
+from key_derivation import parse_path
+from utils import get_device_pubkey
+
+
+def _node(path: str) -> ExtendedPublicKey:
+    publicKey, chainCode = get_device_pubkey(path)
+    return ExtendedPublicKey(publicKey, bytes.fromhex(chainCode))
+
+
+@pytest.mark.parametrize("accountPath", ["m/1852'/1815'/0'", "m/1852'/1815'/7'", "m/1854'/1815'/0'", "m/44'/1815'/1'"])
+@pytest.mark.parametrize("chain", [0, 1, 2])
+def test_derive_range(accountPath: str, chain: int) -> None:
+    """Check a range of addresses against the seed derivation"""
+
+    nodes = derive_range(_node(accountPath), (chain,), 0, 20)
+    assert nodes == [_node(f"{accountPath}/{chain}/{index}") for index in range(20)]
+
+
+@pytest.mark.parametrize("indexes", [(0,), (0, 0), (1, 19), (2, 0), (0, HARDENED - 1), (5, 6, 7)])
+def test_derive_path(indexes: tuple) -> None:
+    """Check the descendants of an account against the seed derivation"""
+
+    accountPath = "m/1852'/1815'/0'"
+    path = accountPath + "".join(f"/{index}" for index in indexes)
+    assert derive_path(_node(accountPath), indexes) == _node(path)
+
+
+def test_derive_hardened() -> None:
+    """Check the hardened children are rejected"""
+
+    with pytest.raises(ValueError):
+        derive_child(_node("m/1852'/1815'/0'"), HARDENED)
+
+
+@pytest.mark.parametrize("path, indexes", [
+    ("m/1852'/1815'/0'/0/1", (1852 | HARDENED, 1815 | HARDENED, HARDENED, 0, 1)),
+    ("m/44h/1815h/1h", (44 | HARDENED, 1815 | HARDENED, 1 | HARDENED)),
+    ("m", ()),
+])
+def test_parse_path(path: str, indexes: tuple) -> None:
+    """Check the hardened elements are marked, whatever their notation"""
+
+    assert parse_path(path) == indexes
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the native script hash engines, run without any device.
+The tree hasher and the builder mirroring the device must both return the fixture hashes,
+agree on the trees sharing their subscripts, and reject the scripts rejected by the device.
+"""
+
+import pytest
+
+from input_files.derive_native_script import ValidNativeScriptTestCases, ValidNativeScriptTestCase
+from input_files.derive_native_script import NativeScript, NativeScriptType
+from input_files.derive_native_script import NativeScriptParamsPubkey, NativeScriptParamsScripts
+from input_files.derive_native_script import NativeScriptParamsNofK, NativeScriptParamsInvalid
+
+from application_client.native_script_hash_builder import NativeScriptHashBuilder, NativeScriptHasher
+from application_client.native_script_hash_builder import MAX_SCRIPT_DEPTH, feed_native_script
+
+from utils import idTestFunc, get_device_key_hash
+
+
+def _builderHash(script: NativeScript) -> bytes:
+    builder = NativeScriptHashBuilder()
+    feed_native_script(builder, script, get_device_key_hash)
+    return builder.finalize()
+
+
+def _pubkey(index: int) -> NativeScript:
+    return NativeScript(NativeScriptType.PUBKEY_THIRD_PARTY, NativeScriptParamsPubkey(index.to_bytes(28, "big").hex()))
+
+
+def _nested(depth: int) -> NativeScript:
+    """Script of the given nesting depth, alternating the complex script types"""
+
+    script = _pubkey(0)
+    for level in range(depth - 1):
+        if level % 3 == 0:
+            script = NativeScript(NativeScriptType.ANY, NativeScriptParamsScripts([script, _pubkey(level + 1)]))
+        elif level % 3 == 1:
+            script = NativeScript(NativeScriptType.ALL, NativeScriptParamsScripts([_pubkey(level + 1), script]))
+        else:
+            script = NativeScript(NativeScriptType.N_OF_K, NativeScriptParamsNofK(1, [script, _pubkey(level + 1)]))
+    return script
+
+
+@pytest.mark.parametrize("testCase", ValidNativeScriptTestCases, ids=idTestFunc)
+def test_native_script_hash(testCase: ValidNativeScriptTestCase) -> None:
+    """Check both engines return the fixture hash"""
+
+    assert NativeScriptHasher(get_device_key_hash).hash(testCase.script).hex() == testCase.expected.hash
+    assert _builderHash(testCase.script).hex() == testCase.expected.hash
+
+
+def test_native_script_hash_shared() -> None:
+    """Check the hasher caching the shared subscripts agrees with the builder"""
+
+    committee = NativeScript(NativeScriptType.N_OF_K, NativeScriptParamsNofK(2, [_pubkey(key) for key in range(3)]))
+    deadline = NativeScript(NativeScriptType.INVALID_HEREAFTER, NativeScriptParamsInvalid(100_000))
+    policies = [NativeScript(NativeScriptType.ALL,
+                             NativeScriptParamsScripts([deadline, committee, NativeScript(NativeScriptType.ANY,
+                                                        NativeScriptParamsScripts([committee] * count))]))
+                for count in range(1, 4)]
+
+    hasher = NativeScriptHasher(get_device_key_hash)
+    assert [hasher.hash(policy) for policy in policies] == [_builderHash(policy) for policy in policies]
+    # a hit of the cache returns the same hash as a cold one
+    assert [hasher.hash(policy) for policy in policies] == [NativeScriptHasher(get_device_key_hash).hash(policy)
+                                                             for policy in policies]
+
+
+def test_native_script_hash_nested() -> None:
+    """Check both engines agree on the deepest script accepted by the device, and reject a deeper one"""
+
+    script = _nested(MAX_SCRIPT_DEPTH)
+    assert NativeScriptHasher(get_device_key_hash).hash(script) == _builderHash(script)
+    with pytest.raises(ValueError, match="MAX_SCRIPT_DEPTH"):
+        _builderHash(_nested(MAX_SCRIPT_DEPTH + 1))
+
+
+def test_native_script_hash_invalid_n_of_k() -> None:
+    """Check an N_OF_K script requiring more scripts than it contains is rejected"""
+
+    script = NativeScript(NativeScriptType.N_OF_K, NativeScriptParamsNofK(3, [_pubkey(0), _pubkey(1)]))
+    with pytest.raises(ValueError, match="N_OF_K"):
+        NativeScriptHasher(get_device_key_hash).hash(script)
@@ -22,7 +22,7 @@ from input_files.pubkey import PubKeyTestCase
 from input_files.pubkey import rejectTestCases, testsShelleyUsualNoConfirm, testsCVoteKeysNoConfirm
 from input_files.pubkey import byronTestCases, testsShelleyUsual, testsShelleyUnusual, testsColdKeys, testsCVoteKeys
 
-from utils import idTestFunc, get_device_pubkey
+from utils import idTestFunc, get_device_pubkey, derive_many
 
 @pytest.mark.parametrize(
     "testCase",
@@ -86,31 +86,24 @@ def test_pubkey_several(firmware: Firmware,
     else:
         nav_inst = NavInsID.SWIPE_CENTER_TO_LEFT
         valid_instr = [NavInsID.USE_CASE_ADDRESS_CONFIRMATION_CONFIRM]
-    p1 = P1Type.P1_KEY_INIT
-    remainingKeysData = len(testCase) - 1
-    for test in testCase:
-        # Send the APDU
-        with client.get_pubkey_async(p1, test.path, remainingKeysData):
-            if p1 == P1Type.P1_KEY_INIT:
-                navigator.navigate(valid_instr,
-                                   screen_change_after_last_instruction=False)
-            if test.nav_with_several:
-                if firmware.is_nano:
-                    navigator.navigate_until_text(nav_inst, valid_instr, "Confirm")
-                else:
-                    navigator.navigate_until_text(nav_inst, valid_instr, "Confirm",
-                                   screen_change_after_last_instruction=False)
+
+    def navigate(index: int) -> None:
+        if index == 0:
+            navigator.navigate(valid_instr,
+                               screen_change_after_last_instruction=False)
+        if testCase[index].nav_with_several:
+            if firmware.is_nano:
+                navigator.navigate_until_text(nav_inst, valid_instr, "Confirm")
             else:
-                pass
-        # Check the status (Asynchronous)
-        response = client.get_async_response()
-        assert response and response.status == Errors.SW_SUCCESS
+                navigator.navigate_until_text(nav_inst, valid_instr, "Confirm",
+                               screen_change_after_last_instruction=False)
 
-        # Check the response
-        _check_pubkey_result(response.data, test.path)
+    # Send the APDUs, in a single session
+    paths = [test.path for test in testCase]
+    keys = client.get_pubkeys(paths, navigate)
 
-        remainingKeysData = 0
-        p1 = P1Type.P1_KEY_NEXT
+    # Check the responses
+    assert keys == derive_many(paths)
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the replay of an APDU transcript, as a regression and latency benchmark.
+
+A session is recorded once, all the command senders appending their exchanges to the transcript:
+    pytest test_signOpCert.py test_version.py --device nanox --transcript session.apdu
+Then it is replayed at full speed, any response differing from the recorded one failing the test,
+with the latencies compared by instruction on the console:
+    pytest -s test_replay_transcript.py --device nanox --replay_transcript session.apdu
+
+The exchanges waiting for a user interaction are approved by the navigation of their instruction
+(see _NAVIGATIONS). Only the instructions with a single fixed prompt can be replayed this way:
+a transcript holding interactive exchanges of another instruction, such as Sign TX whose prompts
+depend on the transaction, is rejected before anything is sent.
+"""
+
+from typing import Callable, Dict
+import pytest
+
+from ragger.backend import BackendInterface
+from ragger.firmware import Firmware
+from ragger.navigator import Navigator
+from ragger.navigator.navigation_scenario import NavigateWithScenario
+
+from application_client.app_def import InsType
+from application_client.apdu_transcript import APDU_INS_OFFSET, TranscriptExchange, ReplayResult
+from application_client.apdu_transcript import read_transcript, replay_transcript
+
+from test_signOpCert import navigate_opCert
+
+
+# Approval of the interactive exchanges, by instruction
+_NAVIGATIONS: Dict[int, Callable[[Firmware, Navigator, NavigateWithScenario], None]] = {
+    InsType.SIGN_OP_CERT: navigate_opCert,
+}
+
+
+def _insName(ins: int) -> str:
+    return InsType(ins).name if ins in InsType.__members__.values() else f"ins={ins:#04x}"
+
+
+def _report(result: ReplayResult) -> None:
+    """Print the replay duration, and the recorded and replayed latencies by instruction"""
+
+    print(f"\n{result.exchanges} exchanges replayed in {result.durationNs / 1e9:.2f} s, "
+          f"{len(result.mismatches)} mismatches")
+    print(f"  {'instruction':<32}{'APDUs':>8}{'recorded ms':>14}{'replayed ms':>14}")
+    for ins, latency in sorted(result.latencies.items()):
+        print(f"  {_insName(ins):<32}{latency.exchanges:>8}"
+              f"{latency.recordedNs / latency.exchanges / 1e6:>14.2f}{latency.replayedNs / latency.exchanges / 1e6:>14.2f}")
+
+
+def test_replay_transcript(firmware: Firmware,
+                           backend: BackendInterface,
+                           navigator: Navigator,
+                           scenario_navigator: NavigateWithScenario,
+                           request: pytest.FixtureRequest) -> None:
+    """Replay a recorded transcript, diffing the responses"""
+
+    path = request.config.getoption("replay_transcript")
+    if path is None:
+        pytest.skip("Only run with --replay_transcript")
+
+    exchanges = read_transcript(path)
+    if not exchanges:
+        pytest.skip(f"No exchange recorded in {path}")
+    unsupported = {exchange.command[APDU_INS_OFFSET] for exchange in exchanges
+                   if exchange.interactive and exchange.command[APDU_INS_OFFSET] not in _NAVIGATIONS}
+    if unsupported:
+        pytest.fail("No replay navigation for the interactive exchanges of "
+                    + ", ".join(_insName(ins) for ins in sorted(unsupported)))
+
+    def navigate(exchange: TranscriptExchange) -> None:
+        _NAVIGATIONS[exchange.command[APDU_INS_OFFSET]](firmware, navigator, scenario_navigator)
+
+    result = replay_transcript(backend, exchanges, navigate)
+    _report(result)
+    for mismatch in result.mismatches:
+        print(f"  #{mismatch.index} {mismatch.exchange.command.hex()}: "
+              f"{mismatch.status:#06x} {mismatch.data.hex()} "
+              f"instead of {mismatch.exchange.status:#06x} {mismatch.exchange.data.hex()}")
+    assert not result.mismatches
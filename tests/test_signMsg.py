@@ -5,7 +5,8 @@
 This module provides Ragger tests for Sign Message check
 """
 
-from hashlib import blake2b
+from pathlib import Path
+import hashlib
 import pytest
 import cbor
 
@@ -15,15 +16,21 @@ from ragger.navigator import Navigator, NavInsID
 from ragger.navigator.navigation_scenario import NavigateWithScenario
 
 from application_client.app_def import Errors, AddressType, Mainnet
-from application_client.command_sender import CommandSender
+from application_client.command_sender import CommandSender, CIP8_MSG_HASH_LENGTH
 
-from input_files.signMsg import signMsgTestCases, SignMsgTestCase, MessageAddressFieldType
+from input_files.signMsg import signMsgTestCases, SignMsgTestCase, MessageAddressFieldType, MessageData, NavigationData
+from input_files.signMsg import message_size, open_message
+from input_files.signMsg import MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE, MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE
+from input_files.signMsg import MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE
 
 from test_derive_address import DeriveAddressTestCase
 
 from utils import pop_sized_buf_from_buffer, pop_size_prefixed_buf_from_buf
 from utils import idTestFunc, get_device_pubkey, verify_signature, derive_address
 
+# Size of the message streamed from a file, hashed by the device
+LARGE_MESSAGE_SIZE = 256 * 1024
+
 
 @pytest.mark.parametrize(
     "testCase",
@@ -37,6 +44,49 @@ def test_sign_message(firmware: Firmware,
                       testCase: SignMsgTestCase) -> None:
     """Check Sign Message"""
 
+    _run_sign_message(firmware, backend, navigator, scenario_navigator, testCase)
+
+
+def test_sign_message_from_file(firmware: Firmware,
+                                backend: BackendInterface,
+                                navigator: Navigator,
+                                scenario_navigator: NavigateWithScenario,
+                                tmp_path: Path) -> None:
+    """Check Sign Message of a large hashed message, streamed from a file"""
+
+    if firmware.is_nano:
+        pytest.skip("Not supported yet on Nano because Navigation should be reviewed")
+
+    path = tmp_path / "message.bin"
+    with open(path, "wb") as file:
+        for index in range(LARGE_MESSAGE_SIZE // 256):
+            file.write(bytes((index + offset) & 0xFF for offset in range(256)))
+    testCase = SignMsgTestCase("Large hashed message streamed from a file",
+                               MessageData("",
+                                           "m/1852'/1815'/0'/0/1",
+                                           True,
+                                           False,
+                                           MessageAddressFieldType.KEY_HASH,
+                                           message=path),
+                               NavigationData([], [], []))
+    _run_sign_message(firmware, backend, navigator, scenario_navigator, testCase)
+
+
+def _run_sign_message(firmware: Firmware,
+                      backend: BackendInterface,
+                      navigator: Navigator,
+                      scenario_navigator: NavigateWithScenario,
+                      testCase: SignMsgTestCase) -> None:
+    """Run the Sign Message steps, and check the response
+
+    Args:
+        firmware (Firmware): The firmware version
+        backend (BackendInterface): The backend instance
+        navigator (Navigator): The navigator instance
+        scenario_navigator (NavigateWithScenario): The scenario navigator instance
+        testCase (SignMsgTestCase): The test case
+    """
+
     # Use the app interface instead of raw interface
     client = CommandSender(backend)
 
@@ -94,17 +144,17 @@ def _signMsg_chunk(firmware: Firmware,
         testCase (SignMsgTestCase): The test case
     """
 
-    with client.sign_msg_chunk(testCase):
+    with client.sign_msg_chunk(testCase) as stream:
         if firmware.is_nano:
             if firmware == Firmware.NANOS:
                 moves = [NavInsID.BOTH_CLICK]
-                if testCase.msgData.messageHex:
+                if message_size(testCase.msgData) > 0:
                     moves += [NavInsID.BOTH_CLICK]
             else:
                 moves = testCase.nav.chunk
             navigator.navigate(moves)
         else:
-            if len(testCase.msgData.messageHex) > 0:
+            if message_size(testCase.msgData) > 0:
                 backend.wait_for_text_not_on_screen("Processing")
             navigator.navigate([NavInsID.TAPPABLE_CENTER_TAP],
                                screen_change_before_first_instruction=False,
@@ -112,6 +162,23 @@ def _signMsg_chunk(firmware: Firmware,
     # Check the status (Asynchronous)
     response = client.get_async_response()
     assert response and response.status == Errors.SW_SUCCESS
+    # Check the outcome of the streamed chunks
+    assert stream.numChunks == _expected_num_chunks(testCase.msgData)
+    with open_message(testCase.msgData) as message:
+        if testCase.msgData.hashPayload:
+            assert stream.msgHash == hashlib.blake2b(message, digest_size=CIP8_MSG_HASH_LENGTH).digest()
+        else:
+            assert stream.msgHash is None
+
+
+def _expected_num_chunks(msgData: MessageData) -> int:
+    """Number of CHUNK APDUs of a message: the displayed first chunk, then the hidden ones"""
+
+    size = message_size(msgData)
+    firstChunkSize = MAX_CIP8_MSG_FIRST_CHUNK_ASCII_SIZE if msgData.isAscii else MAX_CIP8_MSG_FIRST_CHUNK_HEX_SIZE
+    if size <= firstChunkSize:
+        return 1
+    return 1 + (size - firstChunkSize + MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE - 1) // MAX_CIP8_MSG_HIDDEN_CHUNK_SIZE
 
 
 def _signMsg_confirm(firmware: Firmware,
@@ -190,6 +257,7 @@ def _generate_payload(testCase: SignMsgTestCase, addressField: bytes) -> bytes:
 
     Args:
         testCase (SignMsgTestCase): The test case
+        addressField (bytes): The address field returned by the device
 
     Return:
         The payload
@@ -204,10 +272,11 @@ def _generate_payload(testCase: SignMsgTestCase, addressField: bytes) -> bytes:
     array.append("Signature1")
     array.append(cbor.cbor.dumps_dict(dico))
     array.append(b'')
-    if testCase.msgData.hashPayload:
-        msgHash = blake2b(bytes.fromhex(testCase.msgData.messageHex), digest_size=28).hexdigest()
-        array.append(bytes.fromhex(msgHash))
-    else:
-        array.append(bytes.fromhex(testCase.msgData.messageHex))
+    with open_message(testCase.msgData) as message:
+        if testCase.msgData.hashPayload:
+            array.append(hashlib.blake2b(message, digest_size=CIP8_MSG_HASH_LENGTH).digest())
+        else:
+            # non hashed messages fit in a single chunk
+            array.append(message.tobytes())
 
     return cbor.cbor.dumps_array(array)
@@ -39,18 +39,9 @@ def test_opCert(firmware: Firmware,
     # Use the app interface instead of raw interface
     client = CommandSender(backend)
 
-    if firmware.is_nano:
-        moves = []
-        moves += [NavInsID.BOTH_CLICK] * 3
-        moves += [NavInsID.RIGHT_CLICK]
-        moves += [NavInsID.BOTH_CLICK] * 4
-
     # Send the INIT APDU
     with client.sign_opCert(testCase):
-        if firmware.is_nano:
-            navigator.navigate(moves)
-        else:
-            scenario_navigator.review_approve(do_comparison=False)
+        navigate_opCert(firmware, navigator, scenario_navigator)
     # Check the status (Asynchronous)
     response = client.get_async_response()
     assert response and response.status == Errors.SW_SUCCESS
@@ -62,3 +53,22 @@ def test_opCert(firmware: Firmware,
     msg += testCase.opCert.kesPeriod.to_bytes(8, 'big')
 
     verify_signature(testCase.opCert.path, response.data, msg)
+
+
+def navigate_opCert(firmware: Firmware, navigator: Navigator, scenario_navigator: NavigateWithScenario) -> None:
+    """Approve the Operational Certificate (also used by test_replay_transcript.py)
+
+    Args:
+        firmware (Firmware): The firmware version
+        navigator (Navigator): The navigator instance
+        scenario_navigator (NavigateWithScenario): The scenario navigator instance
+    """
+
+    if firmware.is_nano:
+        moves = []
+        moves += [NavInsID.BOTH_CLICK] * 3
+        moves += [NavInsID.RIGHT_CLICK]
+        moves += [NavInsID.BOTH_CLICK] * 4
+        navigator.navigate(moves)
+    else:
+        scenario_navigator.review_approve(do_comparison=False)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the Sign TX navigation plans, run without any device.
+The plans must only navigate on the APDUs tagged interactive by CommandBuilder.iter_sign_tx,
+the other ones being sent back to back by drive_sign_tx.
+The plans of signTx_navigation.py and the policies of signTx_policy.py are two independent ports
+of the app decisions: on Nano, every element the app displays (SHOW, PROMPT and WARN policies)
+waits for the user before the response, so its APDU must have a navigation step.
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+import re
+import pytest
+
+from ragger.firmware import Firmware
+
+from application_client.app_def import Errors
+from application_client.command_builder import CommandBuilder, P1Type, P2Type
+
+from input_files.signTx import SignTxTestCase, signTxTestCases
+from signTx_navigation import plan_sign_tx
+from signTx_policy import SecurityPolicy, iter_sign_tx_policies
+from utils import idTestFunc, gather_witness_paths
+
+
+# APDU (P1, P2) of each kind of policy element, P2 being None when any
+_ELEMENT_APDUS: Dict[str, Tuple[int, Optional[int]]] = {
+    "init": (P1Type.P1_INIT, None),
+    "auxiliary data": (P1Type.P1_AUX_DATA, 0x00),
+    "vote key": (P1Type.P1_AUX_DATA, P2Type.P2_VOTE_KEY),
+    "delegation": (P1Type.P1_AUX_DATA, P2Type.P2_DELEGATION),
+    "staking key": (P1Type.P1_AUX_DATA, P2Type.P2_STAKING_KEY),
+    "payment destination": (P1Type.P1_AUX_DATA, P2Type.P2_PAYMENT_ADDRESS),
+    "nonce": (P1Type.P1_AUX_DATA, P2Type.P2_NONCE),
+    "voting purpose": (P1Type.P1_AUX_DATA, P2Type.P2_VOTING_PURPOSE),
+    "auxiliary data confirm": (P1Type.P1_AUX_DATA, P2Type.P2_AUX_CONFIRM),
+    "input": (P1Type.P1_INPUTS, None),
+    "output": (P1Type.P1_OUTPUTS, P2Type.P2_BASIC_DATA),
+    "output datum": (P1Type.P1_OUTPUTS, P2Type.P2_DATUM),
+    "output reference script": (P1Type.P1_OUTPUTS, P2Type.P2_SCRIPT),
+    "output confirm": (P1Type.P1_OUTPUTS, P2Type.P2_CONFIRM),
+    "fee": (P1Type.P1_FEE, None),
+    "ttl": (P1Type.P1_TTL, None),
+    "certificate": (P1Type.P1_CERTIFICATES, 0x00),
+    "certificate pool id": (P1Type.P1_CERTIFICATES, P2Type.P2_POOL_KEY),
+    "certificate vrf key": (P1Type.P1_CERTIFICATES, P2Type.P2_VRF_KEY),
+    "certificate reward account": (P1Type.P1_CERTIFICATES, P2Type.P2_REWARD_ACCOUNT),
+    "certificate owner": (P1Type.P1_CERTIFICATES, P2Type.P2_OWNERS),
+    "certificate relay": (P1Type.P1_CERTIFICATES, P2Type.P2_RELAYS),
+    "certificate metadata": (P1Type.P1_CERTIFICATES, P2Type.P2_METADATA),
+    "certificate confirm": (P1Type.P1_CERTIFICATES, P2Type.P2_CERT_CONFIRM),
+    "withdrawal": (P1Type.P1_WITHDRAWALS, None),
+    "validity interval start": (P1Type.P1_VALIDITY_INTERVAL_START, None),
+    "mint": (P1Type.P1_MINT, P2Type.P2_BASIC_DATA),
+    "mint confirm": (P1Type.P1_MINT, P2Type.P2_CONFIRM),
+    "script data hash": (P1Type.P1_SCRIPT_DATA_HASH, None),
+    "collateral input": (P1Type.P1_COLLATERAL_INPUTS, None),
+    "required signer": (P1Type.P1_REQUIRED_SIGNERS, None),
+    "collateral output": (P1Type.P1_COLLATERAL_OUTPUT, P2Type.P2_BASIC_DATA),
+    "collateral output confirm": (P1Type.P1_COLLATERAL_OUTPUT, P2Type.P2_CONFIRM),
+    "total collateral": (P1Type.P1_TOTAL_COLLATERAL, None),
+    "reference input": (P1Type.P1_REFERENCE_INPUTS, None),
+    "voting procedure": (P1Type.P1_VOTING_PROCEDURES, None),
+    "treasury": (P1Type.P1_TREASURY, None),
+    "donation": (P1Type.P1_DONATION, None),
+    "confirm": (P1Type.P1_TX_CONFIRM, None),
+    "witness": (P1Type.P1_TX_WITNESSES, None),
+}
+
+# Policies decided along the collateral output basic data, without APDU of their own
+_WITHOUT_APDU = ("collateral output tokens", "collateral output ADA amount")
+
+_builder = CommandBuilder()
+
+
+def _displayedApdus(testCase: SignTxTestCase) -> Iterator[Tuple[int, str]]:
+    """Index of the APDU of each element displayed by the app, with the element"""
+
+    apdus = list(_builder.iter_sign_tx(testCase, gather_witness_paths(testCase)))
+    index = 0
+    for decision in iter_sign_tx_policies(testCase):
+        # the element kind: its name without the indexes and paths
+        kind = re.sub(r" (\d+|m/\S+)", "", decision.element)
+        if kind in _WITHOUT_APDU:
+            continue
+        p1, p2 = _ELEMENT_APDUS[kind]
+        while apdus[index].apdu[2] != p1 or (p2 is not None and apdus[index].apdu[3] != p2):
+            index += 1
+        if decision.policy in (SecurityPolicy.SHOW, SecurityPolicy.PROMPT, SecurityPolicy.WARN):
+            yield index, decision.element
+        index += 1
+
+
+_TEST_CASES = list({testCase.name: testCase for testCase in signTxTestCases
+                    if testCase.expected_sw == Errors.SW_SUCCESS}.values())
+
+
+@pytest.mark.parametrize("testCase", _TEST_CASES, ids=idTestFunc)
+@pytest.mark.parametrize("anyFirmware", list(Firmware), ids=lambda firmware: firmware.name)
+def test_signTx_plan_interactive(testCase: SignTxTestCase, anyFirmware: Firmware) -> None:
+    """Check the plan only navigates on the APDUs tagged interactive"""
+
+    apdus = _builder.iter_sign_tx(testCase, gather_witness_paths(testCase))
+    plan = plan_sign_tx(anyFirmware, testCase)
+    assert [signTxApdu.apdu.hex() for signTxApdu, step in zip(apdus, plan)
+            if step is not None and not signTxApdu.interactive] == []
+
+
+@pytest.mark.parametrize("testCase", _TEST_CASES, ids=idTestFunc)
+# not the firmware fixture, the check being run for each Nano whatever the --device option
+@pytest.mark.parametrize("nanoFirmware", [Firmware.NANOX, Firmware.NANOSP], ids=lambda firmware: firmware.name)
+def test_signTx_plan_policies(testCase: SignTxTestCase, nanoFirmware: Firmware) -> None:
+    """Check the plan navigates on every APDU whose element is displayed by the app
+
+    Only the Nano devices are checked: the touch devices gather several elements on a page,
+    the APDU completing it being the one waiting for the user.
+    """
+
+    plan = plan_sign_tx(nanoFirmware, testCase)
+    missing = [element for index, element in _displayedApdus(testCase) if plan[index] is None]
+    assert not missing
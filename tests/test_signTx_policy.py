@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the Sign TX security policies, run without any device.
+The policies simulated by signTx_policy.py must agree with the status expected by the fixtures,
+so that a drift from src/securityPolicy.c is caught.
+The policy of each element is also checked for a few transactions, covering the four non-denying policies.
+"""
+
+from typing import Dict, List, Tuple
+import pytest
+
+from application_client.app_def import Errors
+
+from input_files.signTx import SignTxTestCase, signTxTestCases
+from signTx_policy import SecurityPolicy, iter_sign_tx_policies, sign_tx_denial
+from utils import idTestFunc
+
+
+@pytest.mark.parametrize(
+    "testCase",
+    # Parsing errors (SW_INVALID_DATA) are detected by the app before the policies
+    [testCase for testCase in signTxTestCases
+     if testCase.expected_sw in (Errors.SW_SUCCESS, Errors.SW_REJECTED_BY_POLICY)],
+    ids=idTestFunc
+)
+@pytest.mark.parametrize("expertMode", [False, True], ids=["normal", "expert"])
+def test_signTx_policy(testCase: SignTxTestCase, expertMode: bool) -> None:
+    """Check the simulated policies reject the transactions rejected by the app"""
+
+    denial = sign_tx_denial(testCase, expertMode)
+    assert (denial is not None) == (testCase.expected_sw == Errors.SW_REJECTED_BY_POLICY), denial
+
+
+ALLOW, PROMPT, WARN, SHOW = SecurityPolicy.ALLOW, SecurityPolicy.PROMPT, SecurityPolicy.WARN, SecurityPolicy.SHOW
+
+# Policy of each element, in the normal mode
+_ELEMENT_POLICIES: Dict[str, List[Tuple[str, SecurityPolicy]]] = {
+    # the change output, on an account of the signing path, is not displayed
+    "Sign tx with change base address with staking path": [
+        ("init", PROMPT), ("input 0", ALLOW), ("output 0", SHOW), ("output 0 confirm", ALLOW),
+        ("output 1", ALLOW), ("output 1 confirm", ALLOW), ("fee", SHOW), ("ttl", ALLOW), ("confirm", PROMPT),
+        ("witness m/44'/1815'/0'/0/0", ALLOW),
+    ],
+    # the witness of an unusual account is warned about
+    "Sign tx with non-reasonable account and address": [
+        ("init", PROMPT), ("auxiliary data", ALLOW), ("input 0", ALLOW), ("output 0", SHOW), ("output 0 confirm", ALLOW),
+        ("fee", SHOW), ("ttl", ALLOW), ("confirm", PROMPT), ("witness m/1852'/1815'/456'/0/0", WARN),
+    ],
+    # a multisig transaction: its script output is warned about, and its multisig witness shown
+    "Sign tx without change address with Shelley scripthash output": [
+        ("init", WARN), ("input 0", ALLOW), ("output 0", WARN), ("output 0 confirm", PROMPT),
+        ("fee", SHOW), ("ttl", ALLOW), ("confirm", PROMPT), ("witness m/1854'/1815'/0'/0/0", SHOW),
+    ],
+    # a Plutus transaction: its mint witness is shown
+    "Sign tx with mint path in a required signer": [
+        ("init", WARN), ("input 0", ALLOW), ("output 0", SHOW), ("output 0 confirm", ALLOW), ("fee", SHOW),
+        ("ttl", ALLOW), ("required signer 0", ALLOW), ("confirm", PROMPT),
+        ("witness m/1852'/1815'/0'/0/0", SHOW), ("witness m/1855'/1815'/0'", SHOW),
+    ],
+}
+
+# Elements whose policy changes in the expert mode, being shown instead of allowed
+_EXPERT_SHOWN: Dict[str, Tuple[str, ...]] = {
+    "Sign tx with change base address with staking path": ("ttl", "witness m/44'/1815'/0'/0/0"),
+    "Sign tx with non-reasonable account and address": ("auxiliary data", "ttl"),
+    "Sign tx without change address with Shelley scripthash output": ("ttl",),
+    "Sign tx with mint path in a required signer": ("input 0", "ttl", "required signer 0"),
+}
+
+
+@pytest.mark.parametrize("name", list(_ELEMENT_POLICIES))
+@pytest.mark.parametrize("expertMode", [False, True], ids=["normal", "expert"])
+def test_signTx_policy_elements(name: str, expertMode: bool) -> None:
+    """Check the policy of each element of a transaction"""
+
+    testCase = next(testCase for testCase in signTxTestCases if testCase.name == name)
+    expected = [(element, SHOW if expertMode and element in _EXPERT_SHOWN[name] else policy)
+                for element, policy in _ELEMENT_POLICIES[name]]
+    assert [(decision.element, decision.policy) for decision in iter_sign_tx_policies(testCase, expertMode)] == expected
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides a Sign TX throughput benchmark on large generated transactions.
+
+Each APDU exchange is timed and accounted to its stage (P1, and P2 for the token bundles
+and outputs), so the stages of signTx.c slowing down with the transaction size stand out.
+The exchanges waiting for a user interaction also include the navigation time,
+so they are reported apart from the device-side time.
+
+The tests are only run on request, with the report printed on the console:
+    pytest -s test_signTx_stress.py --device nanox --stress
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+import time
+import pytest
+
+from ragger.backend import BackendInterface
+from ragger.backend.interface import RAPDU
+from ragger.firmware import Firmware
+from ragger.navigator import Navigator
+from ragger.navigator.navigation_scenario import NavigateWithScenario
+
+from application_client.command_sender import CommandSender
+from application_client.command_builder import SignTxApdu, P1Type, P2Type
+
+from input_files.signTx import SignTxTestCase
+from input_files.signTx_stress import stressTestCases
+from signTx_navigation import NavStep, drive_sign_tx
+from utils import idTestFunc, encode_tx_body, gather_witness_paths
+
+_STAGES = {
+    P1Type.P1_INIT: "init",
+    P1Type.P1_AUX_DATA: "aux data",
+    P1Type.P1_INPUTS: "inputs",
+    P1Type.P1_OUTPUTS: "outputs",
+    P1Type.P1_FEE: "fee",
+    P1Type.P1_TTL: "ttl",
+    P1Type.P1_CERTIFICATES: "certificates",
+    P1Type.P1_WITHDRAWALS: "withdrawals",
+    P1Type.P1_VALIDITY_INTERVAL_START: "validity interval start",
+    P1Type.P1_MINT: "mint",
+    P1Type.P1_SCRIPT_DATA_HASH: "script data hash",
+    P1Type.P1_COLLATERAL_INPUTS: "collateral inputs",
+    P1Type.P1_REQUIRED_SIGNERS: "required signers",
+    P1Type.P1_TOTAL_COLLATERAL: "total collateral",
+    P1Type.P1_REFERENCE_INPUTS: "reference inputs",
+    P1Type.P1_COLLATERAL_OUTPUT: "collateral output",
+    P1Type.P1_VOTING_PROCEDURES: "voting procedures",
+    P1Type.P1_TREASURY: "treasury",
+    P1Type.P1_DONATION: "donation",
+    P1Type.P1_TX_CONFIRM: "confirm",
+    P1Type.P1_TX_WITNESSES: "witnesses",
+}
+
+# Sub-stages of the outputs, also used by the token bundles of the mint and collateral output
+_OUTPUT_STAGES = {
+    P2Type.P2_BASIC_DATA: "basic data",
+    P2Type.ASSET_GROUP: "asset group",
+    P2Type.TOKEN: "token",
+    P2Type.P2_DATUM: "datum",
+    P2Type.P2_DATUM_CHUNK: "datum chunk",
+    P2Type.P2_SCRIPT: "script",
+    P2Type.P2_SCRIPT_CHUNK: "script chunk",
+    P2Type.P2_CONFIRM: "confirm",
+}
+
+
+@dataclass
+class StageStats:
+    """Exchanges of a Sign TX stage"""
+    apdus: int = 0
+    # Command and response bytes, headers and status words included
+    nbBytes: int = 0
+    # Exchanges answered without user interaction
+    deviceApdus: int = 0
+    deviceTime: float = 0.0
+    # Exchanges waiting for a user interaction, navigation included
+    navigationTime: float = 0.0
+
+
+def _stage(apdu: bytes) -> str:
+    """Name the Sign TX stage of an APDU"""
+
+    p1, p2 = apdu[2], apdu[3]
+    stage = _STAGES.get(p1, f"p1={p1:#04x}")
+    if p1 in (P1Type.P1_OUTPUTS, P1Type.P1_MINT, P1Type.P1_COLLATERAL_OUTPUT):
+        stage += " / " + _OUTPUT_STAGES.get(p2, f"p2={p2:#04x}")
+    return stage
+
+
+def _report(name: str, stats: Dict[str, StageStats], totalTime: float) -> None:
+    """Print the stages statistics, and the overall throughput"""
+
+    apdus = sum(stage.apdus for stage in stats.values())
+    nbBytes = sum(stage.nbBytes for stage in stats.values())
+    deviceApdus = sum(stage.deviceApdus for stage in stats.values())
+    deviceTime = sum(stage.deviceTime for stage in stats.values())
+    print(f"\n{name}: {apdus} APDUs, {nbBytes} bytes in {totalTime:.2f} s")
+    print(f"  overall  {apdus / totalTime:>10,.1f} APDU/s {nbBytes / totalTime:>12,.1f} B/s")
+    if deviceTime > 0:
+        print(f"  device   {deviceApdus / deviceTime:>10,.1f} APDU/s (without user interaction)")
+    print(f"  {'stage':<32}{'APDUs':>8}{'bytes':>10}{'device ms/APDU':>16}{'navigation s':>14}")
+    for stage, stageStats in sorted(stats.items(), key=lambda item: -item[1].deviceTime):
+        perApdu = 1000 * stageStats.deviceTime / stageStats.deviceApdus if stageStats.deviceApdus else 0.0
+        print(f"  {stage:<32}{stageStats.apdus:>8}{stageStats.nbBytes:>10}"
+              f"{perApdu:>16.2f}{stageStats.navigationTime:>14.2f}")
+
+
+@pytest.mark.parametrize(
+    "testCase",
+    stressTestCases,
+    ids=idTestFunc
+)
+def test_signTx_stress(firmware: Firmware,
+                       backend: BackendInterface,
+                       navigator: Navigator,
+                       scenario_navigator: NavigateWithScenario,
+                       testCase: SignTxTestCase,
+                       appFlags: dict,
+                       request: pytest.FixtureRequest) -> None:
+    """Benchmark Sign TX on a large transaction"""
+
+    if not request.config.getoption("stress"):
+        pytest.skip("Only run with --stress")
+
+    if appFlags['isAppXS']:
+        pytest.skip("Not supported by 'AppXS' version")
+
+    # Use the app interface instead of raw interface
+    client = CommandSender(backend)
+
+    stats: Dict[str, StageStats] = {}
+
+    def account(signTxApdu: SignTxApdu, step: Optional[NavStep], response: RAPDU, duration: float) -> None:
+        stageStats = stats.setdefault(_stage(signTxApdu.apdu), StageStats())
+        stageStats.apdus += 1
+        # the response data is followed by the 2 bytes status word
+        stageStats.nbBytes += len(signTxApdu.apdu) + len(response.data) + 2
+        if step is None:
+            stageStats.deviceApdus += 1
+            stageStats.deviceTime += duration
+        else:
+            stageStats.navigationTime += duration
+
+    start = time.perf_counter()
+    data, _ = drive_sign_tx(firmware, client, navigator, scenario_navigator, testCase,
+                            gather_witness_paths(testCase), account)
+    _report(testCase.name, stats, time.perf_counter() - start)
+
+    # The CONFIRM response is the TX hash
+    assert data == encode_tx_body(testCase)[1]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the TX body decoder and of the chain replay,
+run without any device. The fixture TX bodies, decoded then encoded again by the reference
+TX body encoder, must be unchanged.
+"""
+
+from io import BytesIO
+from typing import Dict, List
+import pytest
+
+from application_client.app_def import NetworkDesc
+from application_client.tx_decoder import TxDecoder, iter_tx_bodies
+from application_client.tx_encoder import THIRD_PARTY_ENCODER
+from input_files.signTx import SignTxTestCase, TransactionSigningMode, signTxTestCases
+from input_files.signTx_chain import ChainReplayStats, iter_chain_test_cases
+
+
+def _fixtureBodies() -> Dict[str, NetworkDesc]:
+    """The distinct TX bodies of the fixtures, with their network"""
+
+    return {testCase.txBody: testCase.tx.network for testCase in signTxTestCases if testCase.txBody != ""}
+
+
+_BODIES = _fixtureBodies()
+_MAINNET_BODIES = [bytes.fromhex(bodyHex) for bodyHex, network in _BODIES.items() if network.networkId == 1]
+
+
+def _dump(bodies: List[bytes]) -> bytes:
+    """A chain dump holding the bodies: bare, in a transaction, in Byron and Shelley era blocks"""
+
+    # Array(4)[body, Map(0), true, null]
+    dump = bodies[0] + bytes([0x84]) + bodies[1] + bytes([0xA0, 0xF5, 0xF6])
+    # Array(2)[Unsigned[era], Array(5)[header, Array(n)[bodies], Array(n)[witnesses], Map(0), Array(0)]]
+    block = bytes([0x85, 0x82, 0x80, 0x40, 0x98, len(bodies) - 2]) + b"".join(bodies[2:])
+    block += bytes([0x98, len(bodies) - 2]) + bytes([0xA0]) * (len(bodies) - 2) + bytes([0xA0, 0x80])
+    return dump + bytes([0x82, 0x01]) + block + bytes([0x82, 0x06]) + block
+
+
+@pytest.mark.parametrize("bodyHex", list(_BODIES), ids=lambda bodyHex: bodyHex[:16])
+def test_tx_decoder_round_trip(bodyHex: str) -> None:
+    """Check a fixture TX body is unchanged once decoded and encoded again"""
+
+    tx, tagCborSets = TxDecoder(_BODIES[bodyHex]).decode(bytes.fromhex(bodyHex))
+    testCase = SignTxTestCase("decoded", tx, TransactionSigningMode.ORDINARY_TRANSACTION, "", tagCborSets)
+    assert THIRD_PARTY_ENCODER.encode(testCase)[0].hex() == bodyHex
+
+
+@pytest.mark.parametrize("chunkSize", [1, 7, 4096])
+def test_tx_bodies_stream(chunkSize: int) -> None:
+    """Check the TX bodies of a chain dump are found whatever the reads size, the Byron blocks being skipped"""
+
+    bodies = _MAINNET_BODIES[:12]
+    assert list(iter_tx_bodies(BytesIO(_dump(bodies)), chunkSize)) == bodies
+
+
+def test_chain_test_cases() -> None:
+    """Check every TX body of a chain dump gives a test case or a skip reason"""
+
+    stats = ChainReplayStats()
+    testCases = list(iter_chain_test_cases(BytesIO(_dump(_MAINNET_BODIES)), stats=stats))
+    assert stats.bodies == len(_MAINNET_BODIES)
+    assert stats.testCases == len(testCases) > 0
+    assert stats.testCases + sum(stats.skipped.values()) == stats.bodies
+    for testCase in testCases:
+        tx, _ = TxDecoder().decode(bytes.fromhex(testCase.txBody))
+        assert tx == testCase.tx
+
+
+# An empty array, an era wrapped block without block, a block without bodies
+_MALFORMED_ITEMS = [bytes.fromhex("80"), bytes.fromhex("8101"), bytes.fromhex("8180")]
+
+
+@pytest.mark.parametrize("item", _MALFORMED_ITEMS, ids=lambda item: item.hex())
+def test_tx_bodies_malformed(item: bytes) -> None:
+    """Check a truncated transaction or block is rejected as such"""
+
+    with pytest.raises(ValueError, match="Truncated"):
+        list(iter_tx_bodies(BytesIO(item)))
+
+
+def test_chain_test_cases_malformed() -> None:
+    """Check the malformed items of a chain dump are counted, the replay going on with the next ones"""
+
+    bodies = _MAINNET_BODIES[:4]
+    dump = b"".join(malformed + body for malformed, body in zip(_MALFORMED_ITEMS + [b""], bodies))
+    stats = ChainReplayStats()
+    testCases = list(iter_chain_test_cases(BytesIO(dump), stats=stats))
+    assert sum(stats.malformedItems.values()) == len(_MALFORMED_ITEMS)
+    assert stats.bodies == len(bodies)
+    assert stats.testCases == len(testCases)
+    assert stats.testCases + sum(stats.skipped.values()) == stats.bodies
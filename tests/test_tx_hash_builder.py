@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: 2024 Ledger SAS
+# SPDX-License-Identifier: LicenseRef-LEDGER
+"""
+This module provides the host side checks of the TX hash builder, run without any device.
+The builder, driven as the device one, must produce the body of the reference TX body encoder,
+and reject the calls rejected by the device.
+"""
+
+from typing import Callable, List, Optional, Tuple
+import pytest
+
+from input_files.signTx import Transaction, TxInput, TxOutputBabbage, TxOutputDestination, TxOutputDestinationType
+from input_files.signTx import ThirdPartyAddressParams, AssetGroup, Token, Datum, DatumType, TxOutputFormat
+from input_files.signTx import RequiredSigner, TxRequiredSignerType, TxOutput, TxAuxiliaryDataHash
+from input_files.signTx import Certificate, CertificateType, CredentialParams, CredentialParamsType
+from input_files.signTx import DRepParams, DRepParamsType, AnchorParams, VoterType, PoolKey, PoolKeyType
+from input_files.signTx import StakeRegistrationParams, StakeRegistrationConwayParams, StakeDelegationParams
+from input_files.signTx import VoteDelegationParams, AuthorizeCommitteeParams, ResignCommitteeParams
+from input_files.signTx import DRepRegistrationParams, DRepUpdateParams, PoolRetirementParams
+from input_files.signTx import PoolRegistrationParams, Relay, RelayType
+from input_files.signTx import SingleHostIpAddrRelayParams, SingleHostHostnameRelayParams, MultiHostRelayParams
+from input_files.signTx import SignTxTestCase, signTxTestCases
+
+from application_client.app_def import Errors, Mainnet
+from application_client.tx_encoder import THIRD_PARTY_ENCODER
+from application_client.tx_hash_builder import CborHashWriter, TxHashBuilder, TxOutputDescription
+from application_client.tx_hash_builder import Credential, CredentialType, DRep, Anchor, Voter, PoolRelay
+
+from utils import idTestFunc, get_device_key_hash, derive_address_bytes, encode_tx_body
+
+_ADDRESS = bytes.fromhex("01" + "11" * 28 + "22" * 28)
+_POLICY_ID = bytes(range(28))
+_DATUM = bytes.fromhex("d8799f4100ff") * 20
+_CHUNK_SIZE = 40
+_KEY_HASH = bytes(range(100, 128))
+_SCRIPT_DATA_HASH = bytes(range(32))
+
+
+def _txHash(i: int) -> bytes:
+    return i.to_bytes(32, "big")
+
+
+def _output(i: int) -> Tuple[int, bool, bool]:
+    """Synthetic output: (amount, withTokens, withDatum)"""
+
+    return 1_000_000 + i, i % 2 == 0, i % 4 == 0
+
+
+def _buildBody(numItems: int, tagCborSets: bool, withOptionals: bool) -> TxHashBuilder:
+    """Drive the builder as the device does for the synthetic body"""
+
+    builder = TxHashBuilder(numItems, numItems, tagCborSets, includeTtl=True,
+                            includeValidityIntervalStart=withOptionals, includeMint=withOptionals,
+                            includeScriptDataHash=withOptionals, numCollateralInputs=int(withOptionals),
+                            numRequiredSigners=int(withOptionals), includeNetworkId=withOptionals,
+                            includeTotalCollateral=withOptionals, numReferenceInputs=int(withOptionals),
+                            includeTreasury=withOptionals, includeDonation=withOptionals, keepData=True)
+    builder.enterInputs()
+    for i in range(numItems):
+        builder.addInput(_txHash(i), i & 0xFF)
+    builder.enterOutputs()
+    for amount, withTokens, withDatum in map(_output, range(numItems)):
+        builder.addOutputTopLevelData(TxOutputDescription(TxOutputFormat.MAP_BABBAGE, _ADDRESS, amount,
+                                                          numAssetGroups=int(withTokens), includeDatum=withDatum))
+        if withTokens:
+            builder.addOutputTokenGroup(_POLICY_ID, 1)
+            builder.addOutputToken(b"token", amount)
+        if withDatum:
+            builder.addOutputDatum(DatumType.INLINE, _DATUM[:_CHUNK_SIZE], len(_DATUM))
+            for offset in range(_CHUNK_SIZE, len(_DATUM), _CHUNK_SIZE):
+                builder.addOutputDatumInlineChunk(_DATUM[offset:offset + _CHUNK_SIZE])
+    builder.addFee(170_000)
+    builder.addTtl(50_000_000)
+    if withOptionals:
+        builder.addValidityIntervalStart(40_000_000)
+        builder.enterMint()
+        builder.addMintTopLevelData(1)
+        builder.addMintTokenGroup(_POLICY_ID, 2)
+        builder.addMintToken(b"burnt", -5)
+        builder.addMintToken(b"minted", 7)
+        builder.addScriptDataHash(_SCRIPT_DATA_HASH)
+        builder.enterCollateralInputs()
+        builder.addCollateralInput(_txHash(numItems), 1)
+        builder.enterRequiredSigners()
+        builder.addRequiredSigner(_KEY_HASH)
+        builder.addNetworkId(Mainnet.networkId)
+        builder.addTotalCollateral(5_000_000)
+        builder.enterReferenceInputs()
+        builder.addReferenceInput(_txHash(numItems + 1), 2)
+        builder.addTreasury(1_000)
+        builder.addDonation(2_000)
+    return builder
+
+
+def _transaction(numItems: int, withOptionals: bool) -> Transaction:
+    """The Transaction equivalent to the synthetic body"""
+
+    destination = TxOutputDestination(TxOutputDestinationType.THIRD_PARTY, ThirdPartyAddressParams(_ADDRESS.hex()))
+    tx = Transaction(
+        Mainnet,
+        [TxInput(_txHash(i).hex(), None, i & 0xFF) for i in range(numItems)],
+        [TxOutputBabbage(destination, amount,
+                         tokenBundle=[AssetGroup(_POLICY_ID.hex(), [Token(b"token".hex(), amount)])] if withTokens else [],
+                         datum=Datum(DatumType.INLINE, _DATUM.hex()) if withDatum else None)
+         for amount, withTokens, withDatum in map(_output, range(numItems))],
+        170_000,
+        ttl=50_000_000)
+    if withOptionals:
+        tx.validityIntervalStart = 40_000_000
+        tx.mint = [AssetGroup(_POLICY_ID.hex(), [Token(b"burnt".hex(), -5), Token(b"minted".hex(), 7)])]
+        tx.scriptDataHash = _SCRIPT_DATA_HASH.hex()
+        tx.collateralInputs = [TxInput(_txHash(numItems).hex(), None, 1)]
+        tx.requiredSigners = [RequiredSigner(TxRequiredSignerType.HASH, _KEY_HASH.hex())]
+        tx.includeNetworkId = True
+        tx.totalCollateral = 5_000_000
+        tx.referenceInputs = [TxInput(_txHash(numItems + 1).hex(), None, 2)]
+        tx.treasury = 1_000
+        tx.donation = 2_000
+    return tx
+
+
+@pytest.mark.parametrize("numItems", [1, 2, 5, 24, 100])
+@pytest.mark.parametrize("tagCborSets", [False, True], ids=["untagged", "tagged"])
+@pytest.mark.parametrize("withOptionals", [False, True], ids=["basic", "optionals"])
+def test_tx_hash_builder(numItems: int, tagCborSets: bool, withOptionals: bool) -> None:
+    """Check the builder against the reference TX body encoder"""
+
+    builder = _buildBody(numItems, tagCborSets, withOptionals)
+    digest = builder.finalize()
+    writer = CborHashWriter(keepData=True)
+    THIRD_PARTY_ENCODER.write(writer, _transaction(numItems, withOptionals), tagCborSets)
+    assert builder.getData().hex() == writer.getData().hex()
+    assert digest == writer.digest()
+
+
+def test_tx_hash_builder_ordering() -> None:
+    """Check the builder rejects the calls rejected by the device"""
+
+    builder = TxHashBuilder(2, 1)
+    builder.enterInputs()
+    builder.addInput(_txHash(0), 0)
+    with pytest.raises(ValueError, match="remainingInputs == 0"):
+        builder.enterOutputs()
+
+
+def test_tx_hash_builder_missing_item() -> None:
+    """Check the builder rejects a body missing an announced item"""
+
+    builder = TxHashBuilder(1, 0, includeTtl=True)
+    builder.enterInputs()
+    builder.addInput(_txHash(0), 0)
+    builder.enterOutputs()
+    builder.addFee(1)
+    with pytest.raises(ValueError):
+        builder.finalize()
+
+
+# ============================== FIXTURE TRANSACTIONS ==============================
+
+# Reward address header: (AddressType << 4) | networkId
+_REWARD_KEY_HEADER = 0xE0
+_REWARD_SCRIPT_HEADER = 0xF0
+
+# Voters given by a key path are sent to the builder with their key hash type
+_VOTER_KEY_PATH_TYPES = {
+    VoterType.COMMITTEE_KEY_PATH: VoterType.COMMITTEE_KEY_HASH,
+    VoterType.DREP_KEY_PATH: VoterType.DREP_KEY_HASH,
+    VoterType.STAKE_POOL_KEY_PATH: VoterType.STAKE_POOL_KEY_HASH,
+}
+
+
+def _hashOrKeyHash(value: str) -> bytes:
+    """Hash given as hex string, or key hash of a derivation path"""
+
+    return get_device_key_hash(value) if value.startswith("m/") else bytes.fromhex(value)
+
+
+def _poolKeyHash(poolKey: PoolKey) -> bytes:
+    """Key hash of a pool key or owner"""
+
+    return _hashOrKeyHash(poolKey.key) if poolKey.type == PoolKeyType.DEVICE_OWNED else bytes.fromhex(poolKey.key)
+
+
+def _credential(params: CredentialParams) -> Credential:
+    """Credential as received by the builder"""
+
+    assert params.keyValue is not None
+    if params.type == CredentialParamsType.SCRIPT_HASH:
+        return Credential(CredentialType.SCRIPT_HASH, bytes.fromhex(params.keyValue))
+    return Credential(CredentialType.KEY_HASH, _hashOrKeyHash(params.keyValue))
+
+
+def _dRep(params: DRepParams) -> DRep:
+    """DRep as received by the builder, a key path being given by its key hash"""
+
+    if params.keyValue is None:
+        return DRep(params.type)
+    dRepType = DRepParamsType.KEY_HASH if params.type == DRepParamsType.KEY_PATH else params.type
+    return DRep(dRepType, _hashOrKeyHash(params.keyValue))
+
+
+def _anchor(params: Optional[AnchorParams]) -> Optional[Anchor]:
+    return None if params is None else Anchor(params.url, bytes.fromhex(params.hashHex))
+
+
+def _chunks(data: bytes) -> List[bytes]:
+    return [data[offset:offset + _CHUNK_SIZE] for offset in range(0, len(data), _CHUNK_SIZE)]
+
+
+def _feedOutput(builder: TxHashBuilder,
+                txOutput: TxOutput,
+                addTopLevelData: Callable[[TxOutputDescription], None],
+                addTokenGroup: Callable[[bytes, int], None],
+                addToken: Callable[[bytes, int], None]) -> None:
+    """Give an output or the collateral output, the datum and script in chunks as the device"""
+
+    destination = txOutput.destination
+    if destination.type == TxOutputDestinationType.THIRD_PARTY:
+        assert isinstance(destination.params, ThirdPartyAddressParams)
+        address = bytes.fromhex(destination.params.addressHex)
+    else:
+        assert not isinstance(destination.params, ThirdPartyAddressParams)
+        address = derive_address_bytes(destination.params)
+    refScript = txOutput.referenceScriptHex if isinstance(txOutput, TxOutputBabbage) else None
+    addTopLevelData(TxOutputDescription(txOutput.format, address, txOutput.amount, len(txOutput.tokenBundle),
+                                        txOutput.datum is not None, refScript is not None))
+    for assetGroup in txOutput.tokenBundle:
+        addTokenGroup(bytes.fromhex(assetGroup.policyIdHex), len(assetGroup.tokens))
+        for token in assetGroup.tokens:
+            addToken(bytes.fromhex(token.assetNameHex), token.amount)
+    if txOutput.datum is not None:
+        datum = bytes.fromhex(txOutput.datum.datumHex)
+        if txOutput.datum.type == DatumType.HASH:
+            builder.addOutputDatum(DatumType.HASH, datum)
+        else:
+            firstChunk, *chunks = _chunks(datum) or [b""]
+            builder.addOutputDatum(DatumType.INLINE, firstChunk, len(datum))
+            for chunk in chunks:
+                builder.addOutputDatumInlineChunk(chunk)
+    if refScript is not None:
+        script = bytes.fromhex(refScript)
+        builder.addOutputReferenceScript(len(script))
+        for chunk in _chunks(script):
+            builder.addOutputReferenceScriptDataChunk(chunk)
+
+
+def _relay(relay: Relay) -> PoolRelay:
+    """Pool relay as received by the builder"""
+
+    params = relay.params
+    if relay.type == RelayType.SINGLE_HOST_IP_ADDR:
+        assert isinstance(params, SingleHostIpAddrRelayParams)
+        ipv4 = None if params.ipv4 is None else bytes(int(part) for part in params.ipv4.split("."))
+        ipv6 = None
+        if params.ipv6 is not None:
+            # the device reads the 4 big-endian uint32 in its native order
+            address = bytes.fromhex(params.ipv6.replace(":", ""))
+            ipv6 = b"".join(address[i:i + 4][::-1] for i in range(0, len(address), 4))
+        return PoolRelay(relay.type, params.portNumber, ipv4=ipv4, ipv6=ipv6)
+    if relay.type == RelayType.SINGLE_HOST_HOSTNAME:
+        assert isinstance(params, SingleHostHostnameRelayParams)
+        return PoolRelay(relay.type, params.portNumber, dnsName=params.dnsName)
+    assert isinstance(params, MultiHostRelayParams)
+    return PoolRelay(relay.type, dnsName=params.dnsName)
+
+
+def _feedPoolRegistration(builder: TxHashBuilder, pool: PoolRegistrationParams, tx: Transaction) -> None:
+    builder.poolRegistrationCertificateEnter(len(pool.poolOwners), len(pool.relays))
+    builder.poolRegistrationCertificatePoolKeyHash(_poolKeyHash(pool.poolKey))
+    builder.poolRegistrationCertificateVrfKeyHash(bytes.fromhex(pool.vrfKeyHashHex))
+    builder.poolRegistrationCertificateFinancials(pool.pledge, pool.cost, pool.margin.numerator, pool.margin.denominator)
+    if pool.rewardAccount.type == PoolKeyType.DEVICE_OWNED:
+        rewardAccount = bytes([_REWARD_KEY_HEADER | tx.network.networkId]) + _hashOrKeyHash(pool.rewardAccount.key)
+    else:
+        rewardAccount = bytes.fromhex(pool.rewardAccount.key)
+    builder.poolRegistrationCertificateRewardAccount(rewardAccount)
+    if len(pool.poolOwners) > 0:
+        builder.addPoolRegistrationCertificateEnterOwners()
+        for owner in pool.poolOwners:
+            builder.addPoolRegistrationCertificateAddOwner(_poolKeyHash(owner))
+    if len(pool.relays) > 0:
+        builder.addPoolRegistrationCertificateEnterRelays()
+        for relay in pool.relays:
+            builder.addPoolRegistrationCertificateAddRelay(_relay(relay))
+    if pool.metadata is None:
+        builder.addPoolRegistrationCertificateAddPoolMetadataNull()
+    else:
+        builder.addPoolRegistrationCertificateAddPoolMetadata(pool.metadata.metadataUrl,
+                                                              bytes.fromhex(pool.metadata.metadataHashHex))
+
+
+def _feedCertificate(builder: TxHashBuilder, certificate: Certificate, tx: Transaction) -> None:
+    params = certificate.params
+    if isinstance(params, StakeRegistrationParams):
+        builder.addCertificateStakingOld(certificate.type, _credential(params.stakeCredential))
+    elif isinstance(params, StakeRegistrationConwayParams):
+        builder.addCertificateStaking(certificate.type, _credential(params.stakeCredential), params.deposit)
+    elif isinstance(params, StakeDelegationParams):
+        builder.addCertificateStakeDelegation(_credential(params.stakeCredential), bytes.fromhex(params.poolKeyHash))
+    elif isinstance(params, VoteDelegationParams):
+        builder.addCertificateVoteDelegation(_credential(params.stakeCredential), _dRep(params.dRep))
+    elif isinstance(params, AuthorizeCommitteeParams):
+        builder.addCertificateCommitteeAuthHot(_credential(params.coldCredential), _credential(params.hotCredential))
+    elif isinstance(params, ResignCommitteeParams):
+        builder.addCertificateCommitteeResign(_credential(params.coldCredential), _anchor(params.anchor))
+    elif certificate.type == CertificateType.DREP_REGISTRATION:
+        assert isinstance(params, DRepRegistrationParams)
+        builder.addCertificateDRepRegistration(_credential(params.dRepCredential), params.deposit,
+                                               _anchor(params.anchor))
+    elif certificate.type == CertificateType.DREP_DEREGISTRATION:
+        assert isinstance(params, DRepRegistrationParams)
+        builder.addCertificateDRepDeregistration(_credential(params.dRepCredential), params.deposit)
+    elif isinstance(params, DRepUpdateParams):
+        builder.addCertificateDRepUpdate(_credential(params.dRepCredential), _anchor(params.anchor))
+    elif isinstance(params, PoolRetirementParams):
+        builder.addCertificatePoolRetirement(_hashOrKeyHash(params.poolKeyPath), params.retirementEpoch)
+    else:
+        assert isinstance(params, PoolRegistrationParams)
+        _feedPoolRegistration(builder, params, tx)
+
+
+def _feedTransaction(tx: Transaction, tagCborSets: bool) -> TxHashBuilder:
+    """Drive the builder as the device does for a fixture transaction"""
+
+    assert tx.auxiliaryData is None or isinstance(tx.auxiliaryData.params, TxAuxiliaryDataHash)
+    builder = TxHashBuilder(len(tx.inputs), len(tx.outputs), tagCborSets,
+                            includeTtl=tx.ttl is not None,
+                            numCertificates=len(tx.certificates),
+                            numWithdrawals=len(tx.withdrawals),
+                            includeAuxData=tx.auxiliaryData is not None,
+                            includeValidityIntervalStart=tx.validityIntervalStart is not None,
+                            includeMint=len(tx.mint) > 0,
+                            includeScriptDataHash=tx.scriptDataHash is not None,
+                            numCollateralInputs=len(tx.collateralInputs),
+                            numRequiredSigners=len(tx.requiredSigners),
+                            includeNetworkId=tx.includeNetworkId is not None,
+                            includeCollateralOutput=tx.collateralOutput is not None,
+                            includeTotalCollateral=tx.totalCollateral is not None,
+                            numReferenceInputs=len(tx.referenceInputs),
+                            numVotingProcedures=len(tx.votingProcedures),
+                            includeTreasury=tx.treasury is not None,
+                            includeDonation=tx.donation is not None,
+                            keepData=True)
+    builder.enterInputs()
+    for txInput in tx.inputs:
+        builder.addInput(bytes.fromhex(txInput.txHashHex), txInput.outputIndex)
+    builder.enterOutputs()
+    for txOutput in tx.outputs:
+        _feedOutput(builder, txOutput, builder.addOutputTopLevelData, builder.addOutputTokenGroup,
+                    builder.addOutputToken)
+    builder.addFee(tx.fee)
+    if tx.ttl is not None:
+        builder.addTtl(tx.ttl)
+    if len(tx.certificates) > 0:
+        builder.enterCertificates()
+        for certificate in tx.certificates:
+            _feedCertificate(builder, certificate, tx)
+    if len(tx.withdrawals) > 0:
+        builder.enterWithdrawals()
+        for withdrawal in tx.withdrawals:
+            credential = withdrawal.stakeCredential
+            header = _REWARD_SCRIPT_HEADER if credential.type == CredentialParamsType.SCRIPT_HASH else _REWARD_KEY_HEADER
+            builder.addWithdrawal(bytes([header | tx.network.networkId]) + _credential(credential).hash,
+                                  withdrawal.amount)
+    if tx.auxiliaryData is not None:
+        assert isinstance(tx.auxiliaryData.params, TxAuxiliaryDataHash)
+        builder.addAuxData(bytes.fromhex(tx.auxiliaryData.params.hashHex))
+    if tx.validityIntervalStart is not None:
+        builder.addValidityIntervalStart(tx.validityIntervalStart)
+    if len(tx.mint) > 0:
+        builder.enterMint()
+        builder.addMintTopLevelData(len(tx.mint))
+        for assetGroup in tx.mint:
+            builder.addMintTokenGroup(bytes.fromhex(assetGroup.policyIdHex), len(assetGroup.tokens))
+            for token in assetGroup.tokens:
+                builder.addMintToken(bytes.fromhex(token.assetNameHex), token.amount)
+    if tx.scriptDataHash is not None:
+        builder.addScriptDataHash(bytes.fromhex(tx.scriptDataHash))
+    if len(tx.collateralInputs) > 0:
+        builder.enterCollateralInputs()
+        for txInput in tx.collateralInputs:
+            builder.addCollateralInput(bytes.fromhex(txInput.txHashHex), txInput.outputIndex)
+    if len(tx.requiredSigners) > 0:
+        builder.enterRequiredSigners()
+        for signer in tx.requiredSigners:
+            builder.addRequiredSigner(_hashOrKeyHash(signer.addressHex))
+    if tx.includeNetworkId is not None:
+        builder.addNetworkId(tx.network.networkId)
+    if tx.collateralOutput is not None:
+        _feedOutput(builder, tx.collateralOutput, builder.addCollateralOutput, builder.addCollateralOutputTokenGroup,
+                    builder.addCollateralOutputToken)
+    if tx.totalCollateral is not None:
+        builder.addTotalCollateral(tx.totalCollateral)
+    if len(tx.referenceInputs) > 0:
+        builder.enterReferenceInputs()
+        for txInput in tx.referenceInputs:
+            builder.addReferenceInput(bytes.fromhex(txInput.txHashHex), txInput.outputIndex)
+    if len(tx.votingProcedures) > 0:
+        builder.enterVotingProcedures()
+        for voterVotes in tx.votingProcedures:
+            voter = voterVotes.voter
+            vote, = voterVotes.votes
+            builder.addVotingProcedure(Voter(_VOTER_KEY_PATH_TYPES.get(voter.type, voter.type),
+                                             _hashOrKeyHash(voter.keyValue)),
+                                       bytes.fromhex(vote.govActionId.txHashHex), vote.govActionId.govActionIndex,
+                                       vote.votingProcedure.vote, _anchor(vote.votingProcedure.anchor))
+    if tx.treasury is not None:
+        builder.addTreasury(tx.treasury)
+    if tx.donation is not None:
+        builder.addDonation(tx.donation)
+    return builder
+
+
+# The successful fixtures, except the CIP36 registrations whose hash includes a signature of the device
+_FIXTURES = list({testCase.name: testCase for testCase in signTxTestCases
+                  if testCase.expected_sw == Errors.SW_SUCCESS
+                  and (testCase.tx.auxiliaryData is None
+                       or isinstance(testCase.tx.auxiliaryData.params, TxAuxiliaryDataHash))}.values())
+
+
+@pytest.mark.parametrize("testCase", _FIXTURES, ids=idTestFunc)
+def test_tx_hash_builder_fixtures(testCase: SignTxTestCase) -> None:
+    """Check the builder against the reference TX body encoder on the Sign TX fixtures"""
+
+    builder = _feedTransaction(testCase.tx, testCase.options)
+    digest = builder.finalize()
+    body, bodyHash = encode_tx_body(testCase)
+    assert builder.getData().hex() == body.hex()
+    assert digest == bodyHash
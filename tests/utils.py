@@ -4,19 +4,22 @@
 """
 This module provides Ragger tests utility functions
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Iterable, List, Tuple, Union
 import re
 import hashlib
+import base58
 from bip_utils import Bip44, Bip44Coins, Bip44Changes, Bip39SeedGenerator
-from bip_utils.bip.bip32.bip32_path import Bip32Path, Bip32PathParser
+from bip_utils.bip.bip32.base import Bip32Base
 
 from ecdsa.curves import Ed25519
-from ecdsa.keys import VerifyingKey
-from ragger.bip import calculate_public_key_and_chaincode, CurveChoice
-from ragger.bip.seed import SPECULOS_MNEMONIC
+from ecdsa.keys import BadSignatureError, VerifyingKey
+from ragger.bip import CurveChoice
+from ragger.bip.seed import SPECULOS_MNEMONIC, GET_CURVE_OBJ
 
 from application_client.app_def import AddressType
+from application_client.tx_encoder import TxEncoder
 
 from input_files.cvote import CVoteTestCase
 from input_files.derive_address import DeriveAddressTestCase
@@ -24,11 +27,25 @@ from input_files.derive_native_script import ValidNativeScriptTestCase
 from input_files.pubkey import PubKeyTestCase
 from input_files.signOpCert import OpCertTestCase
 from input_files.signMsg import SignMsgTestCase
-from input_files.signTx import SignTxTestCase
+from input_files.signTx import SignTxTestCase, TransactionSigningMode, CertificateType, CredentialParamsType
+from input_files.signTx import TxOutputDestinationType, VoterType
+
+from key_derivation import parse_path
+
+# Optional faster Ed25519 backend (libsodium), ecdsa being used otherwise
+try:
+    from nacl.exceptions import BadSignatureError as NaclBadSignatureError
+    from nacl.signing import VerifyKey as NaclVerifyKey
+    HAS_NACL = True
+except ImportError:
+    HAS_NACL = False
 
 
 ROOT_SCREENSHOT_PATH = Path(__file__).parent.resolve()
 
+# Depth of the cached derivation nodes: m / purpose' / coin_type' / account'
+DERIVATION_NODE_CACHE_DEPTH = 3
+
 
 TestCases = Union[
     CVoteTestCase,
@@ -102,15 +119,9 @@ def derive_address(testCase: DeriveAddressTestCase) -> Union[bytes, str]:
 def _deriveAddressByron(testCase: DeriveAddressTestCase) -> str:
     """Derive the Byron address from the path"""
 
-   # Generate seed from mnemonic
-    seed_bytes = Bip39SeedGenerator(SPECULOS_MNEMONIC).Generate()
-
-    # Construct from seed
-    bip44_mst_ctx = Bip44.FromSeed(seed_bytes, Bip44Coins.CARDANO_BYRON_LEDGER)
-
-    # Derive the key for the specified path
-    bip32Path: Bip32Path = Bip32PathParser.Parse(testCase.spendingValue).ToList()
-    bip44_acc = bip44_mst_ctx.Purpose().Coin().Account(bip32Path[2])
+    # Derive the key for the specified path, from the cached coin context
+    bip32Path = parse_path(testCase.spendingValue)
+    bip44_acc = _bip44CoinContext(Bip44Coins.CARDANO_BYRON_LEDGER).Account(bip32Path[2])
     bip44_chg = bip44_acc.Change(Bip44Changes.CHAIN_EXT if bip32Path[3] == 0 else Bip44Changes.CHAIN_INT)
     bip44_addr = bip44_chg.AddressIndex(bip32Path[4])
 
@@ -118,6 +129,20 @@ def _deriveAddressByron(testCase: DeriveAddressTestCase) -> str:
     return bip44_addr.PublicKey().ToAddress()
 
 
+@lru_cache(maxsize=None)
+def _speculosSeed() -> bytes:
+    """Seed of the Speculos mnemonic, generated once (2048 rounds of PBKDF2)"""
+
+    return Bip39SeedGenerator(SPECULOS_MNEMONIC).Generate()
+
+
+@lru_cache(maxsize=None)
+def _bip44CoinContext(coin: Bip44Coins) -> Bip44:
+    """Bip44 context at the coin level (m/44'/coin'), built once per coin type"""
+
+    return Bip44.FromSeed(_speculosSeed(), coin).Purpose().Coin()
+
+
 def _deriveAddressShelley(testCase: DeriveAddressTestCase) -> bytes:
     """Derive the Shelley base address from the path"""
     key = f"{(int(testCase.addrType) << 4) | int(testCase.netDesc.networkId):02x}"
@@ -139,6 +164,146 @@ def _deriveAddressShelley(testCase: DeriveAddressTestCase) -> bytes:
     return bytes.fromhex(key)
 
 
+def get_device_key_hash(path: str) -> bytes:
+    """Retrieve the Key Hash of a path, as computed by the device
+
+    Args:
+        path (str): Derivation path
+
+    Returns:
+        The blake2b-224 hash of the Public Key
+    """
+    pk, _ = get_device_pubkey(path)
+    return hashlib.blake2b(pk, digest_size=28).digest()
+
+
+def derive_address_bytes(testCase: DeriveAddressTestCase) -> bytes:
+    """Derive an address from a test case, as raw bytes
+
+    Args:
+        testCase (DeriveAddressTestCase): The address parameters
+
+    Returns:
+        The address bytes, the Byron ones being base58 decoded
+    """
+    address = derive_address(testCase)
+    if isinstance(address, str):
+        return base58.b58decode(address)
+    return address
+
+
+_TX_ENCODER = TxEncoder(get_device_key_hash, derive_address_bytes)
+
+
+def encode_tx_body(testCase: SignTxTestCase) -> Tuple[bytes, bytes]:
+    """Serialize the TX body of a test case, as hashed by the device
+
+    Args:
+        testCase (SignTxTestCase): The test case
+
+    Returns:
+        Tuple of:
+            - The serialized TX body
+            - The TX body hash
+    """
+    return _TX_ENCODER.encode(testCase)
+
+
+def hash_tx_body(testCase: SignTxTestCase) -> bytes:
+    """Compute the TX body hash of a test case, without keeping the body
+
+    Args:
+        testCase (SignTxTestCase): The test case
+
+    Returns:
+        The TX body hash
+    """
+    return _TX_ENCODER.hash(testCase)
+
+
+def gather_witness_paths(testCase: SignTxTestCase) -> List[str]:
+    """Gather the witness paths
+
+    Args:
+        testCase (SignTxTestCase): The test case
+
+    Returns:
+        list: The list of unique witness paths
+    """
+
+    witnessPaths = []
+    if testCase.signingMode != TransactionSigningMode.MULTISIG_TRANSACTION:
+        # input witnesses
+        for txInput in testCase.tx.inputs:
+            if txInput.path is not None:
+                witnessPaths.append(txInput.path)
+
+        # certificate witnesses
+        if testCase.tx.certificates is not None:
+            for cert in testCase.tx.certificates:
+                if cert.type in (CertificateType.STAKE_DEREGISTRATION,
+                                 CertificateType.STAKE_REGISTRATION_CONWAY,
+                                 CertificateType.STAKE_DEREGISTRATION_CONWAY,
+                                 CertificateType.STAKE_DELEGATION,
+                                 CertificateType.VOTE_DELEGATION):
+                    if cert.params.stakeCredential.type == CredentialParamsType.KEY_PATH:
+                        witnessPaths.append(cert.params.stakeCredential.keyValue)
+
+                elif cert.type in (CertificateType.AUTHORIZE_COMMITTEE_HOT,
+                                   CertificateType.RESIGN_COMMITTEE_COLD):
+                    if cert.params.coldCredential is not None and \
+                        cert.params.coldCredential.type == CredentialParamsType.KEY_PATH:
+                        witnessPaths.append(cert.params.coldCredential.keyValue)
+
+                elif cert.type in (CertificateType.DREP_REGISTRATION,
+                                   CertificateType.DREP_DEREGISTRATION,
+                                   CertificateType.DREP_UPDATE):
+                    assert cert.params.dRepCredential is not None
+                    if cert.params.dRepCredential.type == CredentialParamsType.KEY_PATH:
+                        witnessPaths.append(cert.params.dRepCredential.keyValue)
+
+                elif cert.type == CertificateType.STAKE_POOL_RETIREMENT:
+                    assert cert.params.poolKeyPath is not None
+                    witnessPaths.append(cert.params.poolKeyPath)
+
+                elif cert.type == CertificateType.STAKE_POOL_REGISTRATION:
+                    for poolOwner in cert.params.poolOwners:
+                        if poolOwner.type == TxOutputDestinationType.THIRD_PARTY and \
+                            poolOwner.key.startswith("m/"):
+                            witnessPaths.append(poolOwner.key)
+                    if cert.params.poolKey.type == TxOutputDestinationType.THIRD_PARTY and \
+                        cert.params.poolKey.key.startswith("m/"):
+                        witnessPaths.append(cert.params.poolKey.key)
+
+        # withdrawal witnesses
+        for withdrawal in testCase.tx.withdrawals:
+            if withdrawal.stakeCredential.type == CredentialParamsType.KEY_PATH:
+                witnessPaths.append(withdrawal.stakeCredential.keyValue)
+
+        # required signers witnesses
+        for signer in testCase.tx.requiredSigners:
+            if signer.type == CredentialParamsType.KEY_PATH:
+                witnessPaths.append(signer.addressHex)
+
+        # collateral inputs witnesses
+        for collateral in testCase.tx.collateralInputs:
+            if collateral.path is not None:
+                witnessPaths.append(collateral.path)
+
+        # voting procedures witnesses
+        for voterVotes in testCase.tx.votingProcedures:
+            if voterVotes.voter.type in (VoterType.COMMITTEE_KEY_PATH,
+                                        VoterType.DREP_KEY_PATH,
+                                        VoterType.STAKE_POOL_KEY_PATH):
+                witnessPaths.append(voterVotes.voter.keyValue)
+
+    for path in testCase.additionalWitnessPaths:
+        witnessPaths.append(path)
+
+    # return uniqness preserving the order
+    return list(dict.fromkeys(witnessPaths))
+
+
 def _appenduint32(value: int) -> str:
     """Append a Variable Length uint32 to a buffer"""
 
@@ -157,17 +322,70 @@ def _appenduint32(value: int) -> str:
     return result
 
 
-def get_device_pubkey(path: str) -> Tuple[bytes, str]:
+def get_device_pubkey(path: str, curve: CurveChoice = CurveChoice.Ed25519Kholaw) -> Tuple[bytes, str]:
     """ Retrieve the Public Key
 
+    The derived keys are cached, as well as the account level nodes,
+    so that sibling paths only derive their last levels.
+
     Args:
         path (str): Derivation path
+        curve (CurveChoice): Derivation curve
 
     Returns:
         The Reference PK and the byte Chain Code
     """
-    ref_pk, ref_chain_code = calculate_public_key_and_chaincode(CurveChoice.Ed25519Kholaw, path)
-    return bytes.fromhex(ref_pk[2:]), ref_chain_code
+    return _derivePubkey(curve, path)
+
+
+@lru_cache(maxsize=4096)
+def _derivePubkey(curve: CurveChoice, path: str) -> Tuple[bytes, str]:
+    """Derive the Public Key and Chain Code of a path"""
+
+    indexes = parse_path(path)
+    node = _deriveNode(curve, indexes[:DERIVATION_NODE_CACHE_DEPTH])
+    for index in indexes[DERIVATION_NODE_CACHE_DEPTH:]:
+        node = node.ChildKey(index)
+    # Skip the public key prefix byte, as done with ragger calculate_public_key_and_chaincode
+    return node.PublicKey().RawUncompressed().ToBytes()[1:], node.ChainCode().ToHex()
+
+
+def derive_many(paths: Iterable[str], curve: CurveChoice = CurveChoice.Ed25519Kholaw) -> List[Tuple[str, bytes, bytes]]:
+    """ Retrieve the Public Keys of several paths, as returned by CommandSender.get_pubkeys
+
+    The parent node of each path is cached, so that consecutive addresses
+    of a same chain only derive their last level.
+
+    Args:
+        paths (Iterable[str]): Derivation paths
+        curve (CurveChoice): Derivation curve
+
+    Returns:
+        The path, Reference PK and byte Chain Code of each key
+    """
+
+    keys = []
+    for path in paths:
+        indexes = parse_path(path)
+        node = _deriveNode(curve, indexes[:-1]).ChildKey(indexes[-1])
+        keys.append((path, node.PublicKey().RawUncompressed().ToBytes()[1:], node.ChainCode().ToBytes()))
+    return keys
+
+
+@lru_cache(maxsize=256)
+def _deriveNode(curve: CurveChoice, indexes: Tuple[int, ...]) -> Bip32Base:
+    """Derive a node from the seed, reusing its cached parent nodes"""
+
+    if len(indexes) == 0:
+        return GET_CURVE_OBJ[curve].FromSeed(seed_bytes=_speculosSeed())
+    return _deriveNode(curve, indexes[:-1]).ChildKey(indexes[-1])
+
+
+def clear_derivation_caches() -> None:
+    """Forget the cached keys and nodes, so that the next derivations start from the seed"""
+
+    _derivePubkey.cache_clear()
+    _deriveNode.cache_clear()
 
 
 def verify_signature(path: str, signature: bytes, data: bytes) -> None:
@@ -179,9 +397,42 @@ def verify_signature(path: str, signature: bytes, data: bytes) -> None:
         data (bytes): The signed data
     """
 
+    verify_signatures_batch([(path, signature, data)])
+
+
+def verify_signatures_batch(signatures: Iterable[Tuple[str, bytes, bytes]]) -> None:
+    """Check the validity of several signatures, reporting all the invalid ones
+
+    Args:
+        signatures (Iterable[Tuple[str, bytes, bytes]]): The derivation path,
+            received signature and signed data of each signature
+    """
+
+    failures = [path for path, signature, data in signatures if not _check_signature(path, signature, data)]
+    assert len(failures) == 0, f"Invalid signature for path(s): {', '.join(failures)}"
+
+
+def _check_signature(path: str, signature: bytes, data: bytes) -> bool:
+    """Check a signature with the available Ed25519 backend"""
+
     ref_pk, _ = get_device_pubkey(path)
-    pk: VerifyingKey = VerifyingKey.from_string(ref_pk, curve=Ed25519)
-    assert pk.verify(signature, data, hashlib.sha512)
+    if HAS_NACL:
+        try:
+            NaclVerifyKey(ref_pk).verify(data, signature)
+        except (NaclBadSignatureError, ValueError):
+            return False
+        return True
+    try:
+        return _ecdsa_verifying_key(ref_pk).verify(signature, data, hashlib.sha512)
+    except (BadSignatureError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _ecdsa_verifying_key(pk: bytes) -> VerifyingKey:
+    """ecdsa verifying key, its creation being costly"""
+
+    return VerifyingKey.from_string(pk, curve=Ed25519)
 
 
 def verify_version(version: str) -> None:
@@ -2,6 +2,7 @@
 
 import json
 import hashlib
+import sys
 
 # WARNING --- make sure that:
 #     1. token tickers are meaningful and none is "(unknown decimals)"
@@ -16,13 +17,12 @@ def formatHexByte(b):
 def bytestringToC(bstr):
 	return "{ " + ", ".join([formatHexByte(b) for b in bstr]) + " }"
 
-def tokenLine(tokenEntry):
+def tokenFingerprint(tokenEntry):
 	subject = bytes.fromhex(tokenEntry["assetSubject"])
-	fingerprint = hashlib.blake2b(subject, digest_size=20).digest()
+	return hashlib.blake2b(subject, digest_size=20).digest()
 
-	policyId = subject[0:28]
-	assetName = subject[28:]
-	#print(f"{policyId.hex()},   {assetName.hex()},   {fingerprint.hex()},   {bytestringToC(policyId)},   {bytestringToC(assetName)}")
+def tokenLine(tokenEntry):
+	fingerprint = tokenFingerprint(tokenEntry)
 
 	if "ticker" in tokenEntry and len(tokenEntry["ticker"]) > 0:
 		ticker = tokenEntry["ticker"]
@@ -38,8 +38,22 @@ def tokenLine(tokenEntry):
 	line += " }"
 	return line
 
-allLines = ",\n".join([tokenLine(t) for t in registry])
+# the app looks up the tokens by binary search on the fingerprint,
+# so the entries must be sorted by fingerprint and unique
+entries = sorted(registry, key=tokenFingerprint)
+
+duplicates = [
+	f"{previous['assetSubject']} / {entry['assetSubject']}"
+	for previous, entry in zip(entries, entries[1:])
+	if tokenFingerprint(previous) == tokenFingerprint(entry)
+]
+if len(duplicates) > 0:
+	sys.exit("duplicate token fingerprints:\n" + "\n".join(duplicates))
+
+allLines = ",\n".join([tokenLine(t) for t in entries])
 
 outputFile = open('token_data.c', 'w')
+outputFile.write('// clang-format off\n')
 outputFile.write(allLines)
 outputFile.write('\n')
+outputFile.write('// clang-format on\n')
@@ -1,135 +1,135 @@
 // clang-format off
-{ { 0xf0, 0x3c, 0x3a, 0x14, 0x5f, 0xc4, 0x5a, 0x87, 0x3d, 0x99, 0x9e, 0x0e, 0xf0, 0xb5, 0x94, 0xd6, 0x81, 0xa2, 0x23, 0x8e }, 0, "HOSKY" },
-{ { 0xa9, 0x00, 0x98, 0x87, 0x1f, 0x11, 0x8e, 0x79, 0x4b, 0xb7, 0x23, 0x48, 0x9e, 0xb4, 0xe1, 0x33, 0xa8, 0x6b, 0xf3, 0x1d }, 6, "DRIP" },
-{ { 0xdd, 0x78, 0x55, 0x5b, 0x3a, 0x3a, 0x9e, 0x1b, 0x59, 0xfe, 0xd9, 0xc1, 0xbd, 0xa3, 0x84, 0xcb, 0xd5, 0x97, 0x0c, 0xe8 }, 6, "SUNDAE" },
-{ { 0xff, 0x07, 0x5c, 0xd6, 0x57, 0x82, 0x07, 0xb4, 0x85, 0x8b, 0x1f, 0x14, 0xb4, 0x8c, 0x0a, 0x15, 0x05, 0x46, 0x9d, 0x74 }, 0, "Tokhun" },
+{ { 0x04, 0x1b, 0x4b, 0x5d, 0x29, 0x10, 0x02, 0x07, 0x2a, 0xa1, 0xb9, 0x12, 0x07, 0x33, 0x5f, 0x27, 0xf8, 0x00, 0xb4, 0x3e }, 0, "$PURR" },
+{ { 0x04, 0x93, 0xf4, 0x95, 0x30, 0x89, 0x8e, 0x3d, 0xfe, 0x7d, 0xc0, 0x94, 0x3d, 0x19, 0xbc, 0x1b, 0xdc, 0xb3, 0x6e, 0x10 }, 6, "C3" },
+{ { 0x07, 0x1c, 0xe8, 0x95, 0xb6, 0xe5, 0xbc, 0x82, 0x48, 0xfd, 0x3c, 0x22, 0x23, 0x68, 0x6e, 0x42, 0x22, 0xa7, 0xd1, 0x2f }, 0, "BDOGE" },
+{ { 0x09, 0xf5, 0xcd, 0x55, 0x6b, 0x56, 0x25, 0xfd, 0xaf, 0xee, 0xa1, 0x0f, 0x08, 0xac, 0x54, 0xbf, 0x72, 0xf3, 0xa3, 0x2d }, 0, "PIGY" },
+{ { 0x0a, 0x8f, 0xea, 0xab, 0x0b, 0xcc, 0xa5, 0x88, 0x51, 0x7c, 0xa1, 0x02, 0xa2, 0x77, 0xb4, 0xa9, 0xb2, 0xaa, 0x6d, 0x2e }, 0, "CDFC5" },
+{ { 0x0a, 0xe3, 0xb4, 0x86, 0xe8, 0x5a, 0xf1, 0x50, 0xb4, 0x78, 0x1a, 0x13, 0x17, 0x1f, 0x27, 0x91, 0x4b, 0x3c, 0xb6, 0x1b }, 0, "TOKEN" },
+{ { 0x0b, 0xae, 0x47, 0x5b, 0xc6, 0xa5, 0x51, 0xe8, 0x94, 0x51, 0x68, 0x20, 0xaa, 0xd0, 0x1a, 0x51, 0x39, 0x5f, 0x32, 0x57 }, 0, "MILK" },
+{ { 0x0e, 0x33, 0xb8, 0xea, 0x4b, 0x9f, 0x7a, 0x3c, 0x9f, 0x81, 0x72, 0x1b, 0xbf, 0x7c, 0xfb, 0xa2, 0x5f, 0x51, 0x9e, 0x27 }, 0, "CHRLZ" },
+{ { 0x0e, 0x8b, 0x30, 0x28, 0xe0, 0xdc, 0x02, 0xda, 0xcf, 0x70, 0xc0, 0x27, 0xf2, 0x91, 0x16, 0x8a, 0x74, 0x86, 0x27, 0xb3 }, 6, "BLOOM" },
+{ { 0x0e, 0xc9, 0x9e, 0x17, 0x89, 0xa0, 0x23, 0xa9, 0xca, 0x55, 0xef, 0xce, 0xcf, 0xeb, 0x1e, 0xcf, 0x6e, 0x65, 0xfe, 0x6c }, 6, "FLAC" },
 { { 0x0e, 0xf6, 0x20, 0x25, 0x5d, 0xb7, 0x1b, 0x69, 0xad, 0xf4, 0xcf, 0x7e, 0xb6, 0x61, 0x90, 0x27, 0xa7, 0xa7, 0x4f, 0x05 }, 0, "SPACE" },
-{ { 0x69, 0x59, 0xee, 0x85, 0x69, 0x60, 0x4d, 0xe7, 0x65, 0x5f, 0xe9, 0xd2, 0xaa, 0x59, 0xc1, 0x1d, 0xa4, 0xad, 0xf6, 0x83 }, 6, "MIN" },
-{ { 0x70, 0xe6, 0x83, 0xea, 0x65, 0x80, 0xb4, 0xba, 0x35, 0xff, 0xce, 0xd9, 0xc6, 0xf0, 0x75, 0xe7, 0xf5, 0xb4, 0x37, 0x8c }, 6, "ASHIB" },
-{ { 0xbe, 0xfa, 0x40, 0x09, 0x14, 0x68, 0xfe, 0x2c, 0xd2, 0x73, 0x50, 0x29, 0xce, 0x23, 0x47, 0xa8, 0x51, 0x82, 0xd4, 0xab }, 6, "ADO" },
-{ { 0x2c, 0x2d, 0xdf, 0xbf, 0xa8, 0xef, 0xc9, 0x00, 0x05, 0x09, 0x36, 0xa2, 0x88, 0x3a, 0xc1, 0x16, 0x23, 0x78, 0x2a, 0xb7 }, 0, "$LOBSTER" },
-{ { 0xd2, 0x76, 0xf6, 0x5f, 0xce, 0x13, 0x18, 0xc3, 0x85, 0xfb, 0x55, 0x6e, 0xce, 0x88, 0xdc, 0x24, 0x01, 0xbf, 0x31, 0xee }, 0, "CDOG" },
-{ { 0xa2, 0xce, 0x9b, 0xe3, 0x4b, 0x2e, 0x03, 0x46, 0xbd, 0x60, 0xa5, 0x2b, 0x00, 0x08, 0x94, 0x6b, 0x54, 0xbc, 0x4c, 0x55 }, 0, "FIRE" },
-{ { 0x89, 0xec, 0xc4, 0x0d, 0x74, 0x79, 0x37, 0xa1, 0x28, 0xca, 0x89, 0xcc, 0xb7, 0x33, 0x4a, 0x85, 0x8a, 0x5c, 0xe7, 0xe8 }, 0, "BISON" },
-{ { 0x79, 0xde, 0xa8, 0x94, 0xf7, 0xee, 0xb9, 0x20, 0x7c, 0x9e, 0xfd, 0x3b, 0x57, 0x2f, 0x9a, 0xb3, 0xf7, 0x30, 0xab, 0x21 }, 0, "DEFS" },
-{ { 0xdf, 0x37, 0x63, 0x36, 0xdd, 0xf9, 0x77, 0x71, 0xd5, 0x3c, 0xc3, 0x12, 0x55, 0xf2, 0x78, 0x50, 0x1c, 0x53, 0x06, 0xa3 }, 0, "GROW" },
-{ { 0x52, 0xa4, 0xe7, 0x27, 0x57, 0xfc, 0x34, 0xed, 0x37, 0xfc, 0xda, 0x6d, 0x9e, 0x2c, 0xbc, 0x29, 0x71, 0xad, 0x97, 0x0b }, 0, "WOLF" },
-{ { 0xe8, 0x6c, 0xb8, 0x93, 0x45, 0x74, 0x89, 0x85, 0xec, 0xb5, 0x33, 0xf2, 0x8f, 0xdc, 0xd1, 0xa8, 0xcb, 0x6c, 0xcc, 0xd4 }, 0, "PAVIA" },
-{ { 0x9e, 0x16, 0xc1, 0x09, 0x3c, 0x5e, 0x67, 0x7b, 0xee, 0xe9, 0xea, 0xca, 0xcd, 0x81, 0x2e, 0xe3, 0x37, 0x78, 0x98, 0x87 }, 0, "BORGZ" },
-{ { 0x77, 0xa4, 0x9d, 0x81, 0xc1, 0x3e, 0xbe, 0xb4, 0xbf, 0x39, 0xe0, 0x35, 0xe9, 0xac, 0x54, 0x1a, 0xc1, 0x91, 0xae, 0xe2 }, 0, "MYTH" },
-{ { 0xa5, 0x26, 0x64, 0x02, 0x54, 0xee, 0x12, 0x9f, 0x25, 0xb7, 0xc1, 0xc7, 0xd9, 0xa5, 0xc4, 0xff, 0xa6, 0x0a, 0xfe, 0x43 }, 3, "STRIP" },
+{ { 0x0f, 0x08, 0xfb, 0x00, 0x3c, 0xe8, 0xe0, 0x40, 0x84, 0xd6, 0x0f, 0xca, 0xe4, 0x92, 0x0c, 0xc9, 0xb4, 0xaf, 0xbb, 0x6c }, 0, "HIS" },
+{ { 0x0f, 0x76, 0xf8, 0xdd, 0x1a, 0xba, 0xcf, 0xf4, 0xa4, 0xc3, 0x65, 0xa1, 0xfa, 0x64, 0x33, 0xb7, 0xac, 0x8d, 0x49, 0xc5 }, 6, "ENCS" },
 { { 0x13, 0x27, 0x18, 0xee, 0x54, 0xb0, 0x90, 0x65, 0xe1, 0x7e, 0x90, 0xe8, 0x09, 0x13, 0x29, 0xe1, 0x72, 0xeb, 0x29, 0x46 }, 6, "MELD" },
-{ { 0x97, 0x24, 0x0c, 0xdf, 0xd4, 0x25, 0xb9, 0x09, 0x05, 0x5c, 0x1f, 0x1d, 0x45, 0x4c, 0x53, 0x4d, 0x77, 0xb5, 0x2d, 0x88 }, 0, "QUID" },
-{ { 0xed, 0xf1, 0x52, 0x81, 0x0e, 0xcf, 0x78, 0x5e, 0x50, 0xb3, 0x80, 0x19, 0x9a, 0x2f, 0xaf, 0x88, 0x87, 0x78, 0xbb, 0x46 }, 6, "cbTHC" },
-{ { 0x55, 0xb3, 0xb8, 0xa7, 0x8c, 0x73, 0xdf, 0x8c, 0x35, 0xd5, 0xcc, 0x19, 0xe5, 0x81, 0xfa, 0xf7, 0xd6, 0x14, 0x6c, 0x4f }, 0, "DIBS" },
-{ { 0xbf, 0xa5, 0x0e, 0x48, 0x4b, 0xac, 0x0e, 0x1e, 0x07, 0x53, 0x18, 0x97, 0x71, 0x96, 0x77, 0xec, 0xbe, 0xf4, 0x6d, 0xd7 }, 6, "WMT" },
+{ { 0x13, 0xbb, 0x5c, 0x5d, 0xc5, 0x36, 0xfc, 0x67, 0x5b, 0xc8, 0xae, 0xb2, 0x92, 0xd4, 0x10, 0x92, 0x8f, 0x7d, 0xcd, 0xbe }, 6, "XRAY" },
+{ { 0x14, 0xba, 0x77, 0x29, 0x6f, 0x62, 0x73, 0xba, 0x60, 0x15, 0xbd, 0x7e, 0x75, 0xbf, 0x2d, 0x72, 0x4d, 0xb3, 0xcb, 0xa0 }, 6, "JPG" },
 { { 0x14, 0xe6, 0xf7, 0x53, 0x52, 0x14, 0xc4, 0x44, 0x4f, 0xe6, 0x40, 0x48, 0x7e, 0x89, 0x92, 0x44, 0x84, 0xc9, 0xe8, 0x1a }, 0, "HI" },
-{ { 0x76, 0x1c, 0x21, 0x96, 0x92, 0x7f, 0xe6, 0x9c, 0xef, 0x6e, 0x5c, 0x50, 0xed, 0x11, 0x4c, 0x1c, 0x6e, 0xbc, 0xc8, 0x83 }, 0, "BROOM" },
-{ { 0x9f, 0x33, 0x59, 0x36, 0x52, 0xfa, 0x49, 0xb6, 0x2f, 0xe9, 0x67, 0x4f, 0x8d, 0x1f, 0xae, 0x07, 0x03, 0xaa, 0xed, 0x8d }, 0, "BEAG" },
-{ { 0x5c, 0xc9, 0x71, 0x10, 0x51, 0x3e, 0xf4, 0x86, 0x1e, 0x27, 0x4f, 0x41, 0x16, 0x14, 0x04, 0x25, 0xeb, 0x77, 0x9f, 0x4b }, 0, "FGC" },
-{ { 0xe7, 0xeb, 0xb8, 0x68, 0xd3, 0xe2, 0x14, 0xce, 0xaf, 0xe9, 0x9c, 0x52, 0xb0, 0xc3, 0xbf, 0x76, 0x79, 0x2b, 0x6e, 0xd7 }, 0, "EUS" },
-{ { 0x3c, 0xf9, 0x38, 0xc0, 0xcf, 0x6b, 0x0a, 0x6a, 0xf5, 0xe6, 0xdf, 0x0b, 0x4f, 0x0c, 0x10, 0x23, 0xa7, 0x96, 0x7a, 0x8b }, 6, "KAIZEN" },
-{ { 0x73, 0x34, 0x4a, 0xe7, 0x92, 0x50, 0x73, 0x8f, 0x8b, 0xa7, 0xf5, 0x5b, 0x35, 0x7e, 0x5f, 0x25, 0xb9, 0xa5, 0x92, 0xbf }, 0, "CHERRY" },
-{ { 0x78, 0x4c, 0x13, 0xb8, 0xf4, 0xd6, 0xc1, 0xf4, 0x5f, 0x4e, 0x9f, 0x6b, 0xe4, 0x17, 0xa3, 0x0f, 0xe7, 0xb7, 0x6d, 0x47 }, 0, "ADAFOX" },
-{ { 0x8e, 0x42, 0x0c, 0xe1, 0x94, 0xca, 0x84, 0x04, 0x0b, 0xa6, 0x97, 0x1e, 0x6a, 0xb8, 0x16, 0xe3, 0xd7, 0x6e, 0xe9, 0xee }, 6, "LQ" },
-{ { 0x74, 0xcc, 0xe2, 0x52, 0xb5, 0x17, 0x0e, 0x94, 0x13, 0x2d, 0xa3, 0x2c, 0x15, 0x41, 0x31, 0x5d, 0x56, 0x5e, 0x85, 0x69 }, 0, "cNETA" },
-{ { 0x23, 0x3c, 0xf9, 0xe5, 0xd9, 0xfe, 0x70, 0x87, 0xf0, 0xeb, 0xef, 0x6d, 0xb3, 0xe3, 0x90, 0x26, 0x9e, 0x20, 0x64, 0x47 }, 0, "XT" },
-{ { 0x7d, 0x27, 0x72, 0x9c, 0xeb, 0x10, 0x85, 0x68, 0xb7, 0x96, 0xd0, 0xf3, 0xfe, 0x23, 0x45, 0x5b, 0x4a, 0x79, 0x76, 0x33 }, 6, "NEWM" },
-{ { 0x04, 0x1b, 0x4b, 0x5d, 0x29, 0x10, 0x02, 0x07, 0x2a, 0xa1, 0xb9, 0x12, 0x07, 0x33, 0x5f, 0x27, 0xf8, 0x00, 0xb4, 0x3e }, 0, "$PURR" },
-{ { 0xb9, 0x3d, 0x95, 0x0c, 0xaa, 0xa9, 0x09, 0x84, 0x38, 0x14, 0x4b, 0x32, 0x2b, 0x6f, 0x51, 0xc5, 0x28, 0xe1, 0x40, 0x38 }, 0, "PTC" },
-{ { 0xe2, 0x90, 0xc3, 0xfd, 0xe3, 0x5f, 0x7c, 0xd6, 0x2d, 0x58, 0x2c, 0x25, 0x7a, 0xc7, 0xab, 0x3d, 0x49, 0x8f, 0x96, 0x30 }, 0, "WDAY" },
-{ { 0x5f, 0x1e, 0x92, 0xd6, 0x67, 0x4e, 0x5c, 0xb9, 0x2f, 0x3e, 0x09, 0x68, 0x56, 0x30, 0x76, 0x27, 0x57, 0x13, 0x95, 0x90 }, 0, "MYST" },
-{ { 0x55, 0xdf, 0x7e, 0x8b, 0x8f, 0x95, 0x5a, 0xc6, 0x5a, 0xba, 0x1d, 0xc9, 0x84, 0xa3, 0xc2, 0xf9, 0x56, 0x57, 0xbe, 0x7f }, 6, "MINt" },
-{ { 0x0b, 0xae, 0x47, 0x5b, 0xc6, 0xa5, 0x51, 0xe8, 0x94, 0x51, 0x68, 0x20, 0xaa, 0xd0, 0x1a, 0x51, 0x39, 0x5f, 0x32, 0x57 }, 0, "MILK" },
-{ { 0xc1, 0x40, 0xcd, 0xae, 0x75, 0xd4, 0xe3, 0x27, 0x28, 0x3e, 0xda, 0x2b, 0x1e, 0x81, 0xb6, 0xbc, 0x6e, 0x64, 0xdc, 0x2a }, 6, "ETB" },
-{ { 0xc1, 0xb9, 0x94, 0x86, 0xca, 0xf1, 0x1a, 0xd8, 0x93, 0xb9, 0xcc, 0x59, 0x27, 0x0d, 0x22, 0x00, 0x71, 0xce, 0xd5, 0xeb }, 0, "SWEET" },
-{ { 0x0a, 0xe3, 0xb4, 0x86, 0xe8, 0x5a, 0xf1, 0x50, 0xb4, 0x78, 0x1a, 0x13, 0x17, 0x1f, 0x27, 0x91, 0x4b, 0x3c, 0xb6, 0x1b }, 0, "TOKEN" },
-{ { 0xbc, 0xca, 0x70, 0x17, 0x1f, 0xa6, 0x6f, 0x68, 0x0a, 0xe9, 0x3d, 0x42, 0x3b, 0xac, 0xac, 0x97, 0xcd, 0xa6, 0xd7, 0x91 }, 6, "RAT" },
-{ { 0xb4, 0x45, 0x60, 0xb8, 0xff, 0xb6, 0x9e, 0xf2, 0x80, 0x74, 0x14, 0x2e, 0x6c, 0xf3, 0x2e, 0xcb, 0xe6, 0xfc, 0x15, 0xd9 }, 0, "ADAX" },
-{ { 0xfc, 0x09, 0x66, 0xfe, 0x97, 0x60, 0x10, 0xfe, 0x99, 0x4e, 0xb8, 0x5e, 0x92, 0x88, 0x31, 0x06, 0x23, 0x15, 0x10, 0x97 }, 6, "BLC" },
-{ { 0x33, 0xc2, 0xc5, 0x94, 0xcc, 0xf0, 0x2b, 0xeb, 0x0d, 0x45, 0xa8, 0xa2, 0xcc, 0x7e, 0x44, 0xa8, 0x15, 0x16, 0xe4, 0x66 }, 0, "Pina" },
-{ { 0x87, 0xfa, 0x98, 0x6b, 0xf9, 0x96, 0x47, 0x9a, 0xa1, 0xc1, 0x5c, 0x58, 0xc3, 0x72, 0xfc, 0x17, 0xeb, 0x27, 0x09, 0xdf }, 5, "MKA" },
 { { 0x14, 0xff, 0x3e, 0x56, 0x0a, 0xe3, 0x23, 0x91, 0xcd, 0x49, 0xa2, 0xb1, 0x01, 0x6a, 0x1a, 0x0b, 0x07, 0x41, 0xa7, 0x4d }, 6, "VYFI" },
-{ { 0x38, 0x1e, 0xf2, 0xfb, 0x1d, 0x8d, 0xd7, 0x8e, 0x90, 0x78, 0x32, 0xca, 0x76, 0x3e, 0x47, 0x30, 0xe8, 0x46, 0xd7, 0xfd }, 0, "virus" },
-{ { 0x7d, 0x4b, 0xf1, 0x92, 0xd8, 0xfa, 0xf3, 0x67, 0xa8, 0xa2, 0x7d, 0xd2, 0x31, 0x4f, 0xca, 0x7d, 0xd8, 0x13, 0xc9, 0x5b }, 6, "PROXIE" },
-{ { 0x0e, 0x33, 0xb8, 0xea, 0x4b, 0x9f, 0x7a, 0x3c, 0x9f, 0x81, 0x72, 0x1b, 0xbf, 0x7c, 0xfb, 0xa2, 0x5f, 0x51, 0x9e, 0x27 }, 0, "CHRLZ" },
-{ { 0xea, 0x75, 0xb6, 0xf2, 0x1f, 0x34, 0x2f, 0x99, 0x4d, 0xe7, 0x88, 0xc0, 0x51, 0xd4, 0x52, 0xa0, 0x4e, 0xaa, 0x59, 0x6c }, 0, "RAD" },
+{ { 0x16, 0x94, 0xeb, 0x43, 0x8c, 0xac, 0x25, 0x6f, 0xaa, 0xb6, 0x92, 0x06, 0xa8, 0x6c, 0xeb, 0x48, 0xea, 0x17, 0xe1, 0x25 }, 6, "IAG" },
+{ { 0x17, 0x0e, 0xda, 0xf1, 0x25, 0xf9, 0x65, 0x60, 0x51, 0xb7, 0xbb, 0x52, 0x95, 0xbe, 0x38, 0xc0, 0xf9, 0xc6, 0x8d, 0x57 }, 0, "FIRE" },
+{ { 0x19, 0x1c, 0xc9, 0xfe, 0x2b, 0x45, 0xa7, 0xa9, 0x0a, 0x71, 0x1e, 0x10, 0xb8, 0x5a, 0x9d, 0x8b, 0x0c, 0x29, 0xbc, 0x82 }, 0, "TOOL" },
+{ { 0x1b, 0x4e, 0x44, 0x23, 0x7b, 0x3e, 0x88, 0x3f, 0x1d, 0x74, 0x06, 0x89, 0xcc, 0xe4, 0xd1, 0x5f, 0x63, 0xa1, 0x62, 0xf9 }, 6, "LOG" },
+{ { 0x1c, 0x77, 0x87, 0x8f, 0xb4, 0xe1, 0x40, 0x2e, 0xdf, 0xf5, 0x03, 0x40, 0x84, 0x0f, 0x80, 0x89, 0x00, 0x50, 0x68, 0x79 }, 0, "VIPER" },
+{ { 0x1e, 0x57, 0xbc, 0x89, 0xed, 0x20, 0xc5, 0x2f, 0x2d, 0xc1, 0x00, 0x99, 0xf1, 0x8f, 0x25, 0x76, 0xe3, 0x8b, 0xd4, 0x22 }, 0, "RON" },
+{ { 0x1e, 0xe2, 0x7e, 0xdf, 0xf4, 0x99, 0xcf, 0x88, 0xf0, 0x3a, 0x1e, 0xbc, 0x4f, 0x22, 0x6f, 0x4a, 0x4c, 0x07, 0x71, 0xde }, 6, "iUSD" },
+{ { 0x20, 0xee, 0xdc, 0xc7, 0xe1, 0x87, 0xd5, 0xa6, 0x0f, 0x6b, 0x35, 0x57, 0x24, 0x3b, 0x61, 0xfa, 0xa4, 0xe3, 0x61, 0x91 }, 0, "C4" },
+{ { 0x23, 0x3c, 0xf9, 0xe5, 0xd9, 0xfe, 0x70, 0x87, 0xf0, 0xeb, 0xef, 0x6d, 0xb3, 0xe3, 0x90, 0x26, 0x9e, 0x20, 0x64, 0x47 }, 0, "XT" },
+{ { 0x23, 0x54, 0xee, 0x7a, 0xa2, 0x5d, 0xb0, 0xc5, 0x8a, 0x74, 0x94, 0x2c, 0x3f, 0xb9, 0xe7, 0xa1, 0xa5, 0x24, 0x6a, 0xf5 }, 6, "LIFI" },
 { { 0x24, 0x5b, 0x57, 0x63, 0xc4, 0x1e, 0x81, 0x9e, 0x55, 0xaa, 0xe4, 0x50, 0x79, 0x41, 0xe8, 0x11, 0x35, 0x3b, 0xdf, 0xee }, 3, "CLAP" },
-{ { 0xd8, 0x79, 0xde, 0xfe, 0x51, 0xc6, 0x31, 0xe6, 0x27, 0x38, 0x82, 0x03, 0xe2, 0xe9, 0x6a, 0x6c, 0xf4, 0xa0, 0x2f, 0x18 }, 6, "GTCHI" },
-{ { 0x86, 0x78, 0x9a, 0x85, 0xd7, 0x73, 0x4c, 0x05, 0x8e, 0x02, 0xaf, 0x4c, 0x97, 0x2c, 0x61, 0x2d, 0x51, 0x66, 0xfe, 0xf8 }, 6, "GMBL" },
-{ { 0x0e, 0x8b, 0x30, 0x28, 0xe0, 0xdc, 0x02, 0xda, 0xcf, 0x70, 0xc0, 0x27, 0xf2, 0x91, 0x16, 0x8a, 0x74, 0x86, 0x27, 0xb3 }, 6, "BLOOM" },
-{ { 0xae, 0x19, 0x61, 0x6a, 0x36, 0x42, 0xe0, 0xb7, 0x07, 0xf7, 0x7c, 0xf5, 0x73, 0x51, 0x59, 0x15, 0x9f, 0x94, 0x22, 0xa9 }, 8, "REVU" },
-{ { 0xf9, 0xd2, 0x52, 0x1e, 0x3f, 0x5e, 0xd0, 0xd5, 0x79, 0x1f, 0x3e, 0x2c, 0xe8, 0xa4, 0xaf, 0xc4, 0x4d, 0x11, 0x13, 0x1c }, 0, "KOZ" },
-{ { 0x7f, 0x8f, 0x4c, 0xd6, 0x4c, 0x13, 0x71, 0x22, 0x35, 0x54, 0xf9, 0x96, 0xa9, 0xf6, 0xe5, 0x6c, 0x0e, 0xe6, 0x1b, 0x36 }, 0, "SKULL" },
-{ { 0xef, 0xb2, 0xfe, 0xf8, 0xf1, 0x41, 0xba, 0x2d, 0x36, 0x03, 0xc4, 0x99, 0xa5, 0xa7, 0xbb, 0x56, 0xe6, 0x3e, 0xd3, 0x6a }, 0, "TREES" },
+{ { 0x24, 0x6a, 0x12, 0xb6, 0x19, 0x32, 0x95, 0x54, 0xcb, 0xce, 0xa5, 0x2d, 0x6c, 0xd0, 0x88, 0x22, 0x80, 0x1d, 0x30, 0x97 }, 0, "DGADA" },
+{ { 0x25, 0xf8, 0xef, 0xb7, 0x66, 0xe5, 0x85, 0xc2, 0x9e, 0x85, 0x4f, 0x63, 0x46, 0xaa, 0x3e, 0x55, 0x74, 0x2c, 0x01, 0x89 }, 6, "PBX" },
+{ { 0x27, 0x10, 0x3e, 0x8a, 0xc1, 0xf4, 0x52, 0x17, 0x2c, 0xd9, 0x4c, 0x32, 0x41, 0xe4, 0xd4, 0x3f, 0x67, 0xed, 0x06, 0xfd }, 6, "CGI" },
+{ { 0x29, 0x35, 0x01, 0xe1, 0xd2, 0xea, 0x4a, 0x6b, 0x70, 0x47, 0x8a, 0xcf, 0x76, 0xb7, 0xab, 0x2d, 0x4e, 0xe2, 0x58, 0xa3 }, 6, "OPT" },
+{ { 0x29, 0x39, 0x3c, 0x8d, 0x53, 0x12, 0xbc, 0x10, 0x14, 0x32, 0x6a, 0xfb, 0x47, 0x99, 0xc9, 0x23, 0x5e, 0xd5, 0x4c, 0x64 }, 6, "NTX" },
+{ { 0x2b, 0x60, 0x77, 0x00, 0xc1, 0xd6, 0x08, 0x71, 0x3d, 0x8f, 0x4f, 0xc5, 0xf6, 0xeb, 0x60, 0x65, 0x35, 0xd7, 0x01, 0x02 }, 2, "BUZZ" },
+{ { 0x2c, 0x2d, 0xdf, 0xbf, 0xa8, 0xef, 0xc9, 0x00, 0x05, 0x09, 0x36, 0xa2, 0x88, 0x3a, 0xc1, 0x16, 0x23, 0x78, 0x2a, 0xb7 }, 0, "$LOBSTER" },
 { { 0x33, 0x4c, 0xa4, 0xeb, 0x94, 0xa1, 0x93, 0xe2, 0x14, 0x1b, 0x96, 0x84, 0x2d, 0x0d, 0x86, 0x30, 0xb7, 0x15, 0x43, 0x81 }, 0, "LOOKZ" },
-{ { 0x73, 0x39, 0x1f, 0xb2, 0xdd, 0xfe, 0xdb, 0xee, 0x6d, 0xe8, 0x66, 0xe4, 0xb7, 0x6d, 0x60, 0xf8, 0x52, 0x62, 0x35, 0x75 }, 0, "DOEX" },
-{ { 0x1b, 0x4e, 0x44, 0x23, 0x7b, 0x3e, 0x88, 0x3f, 0x1d, 0x74, 0x06, 0x89, 0xcc, 0xe4, 0xd1, 0x5f, 0x63, 0xa1, 0x62, 0xf9 }, 6, "LOG" },
-{ { 0x93, 0xe9, 0x1a, 0xbb, 0x2f, 0x08, 0x0a, 0xe9, 0x5d, 0x73, 0xce, 0xfa, 0x2c, 0x33, 0xab, 0xc5, 0x1b, 0x05, 0xd3, 0x8c }, 0, "$CLAW" },
-{ { 0x09, 0xf5, 0xcd, 0x55, 0x6b, 0x56, 0x25, 0xfd, 0xaf, 0xee, 0xa1, 0x0f, 0x08, 0xac, 0x54, 0xbf, 0x72, 0xf3, 0xa3, 0x2d }, 0, "PIGY" },
-{ { 0x4f, 0x7c, 0x70, 0xff, 0x69, 0x10, 0xd8, 0xf7, 0x6d, 0xa3, 0xea, 0x4f, 0xc3, 0xb4, 0x65, 0xec, 0x8f, 0x91, 0xc2, 0x1f }, 0, "CNT" },
-{ { 0xc6, 0xb9, 0xde, 0x78, 0x3c, 0x4c, 0x0d, 0x79, 0xef, 0xd9, 0x43, 0xf3, 0x91, 0xdf, 0x95, 0x84, 0xdc, 0x96, 0x96, 0x13 }, 6, "COPI" },
-{ { 0x8e, 0xeb, 0xaa, 0xf7, 0xc0, 0x2f, 0xc9, 0xa8, 0x33, 0x5b, 0x50, 0x66, 0xc2, 0x16, 0xcb, 0xd0, 0x41, 0x1e, 0x69, 0xa9 }, 0, "KIDZ" },
-{ { 0x53, 0x9a, 0xc0, 0xc3, 0xa8, 0x18, 0x23, 0x50, 0xc5, 0x7a, 0x45, 0xe9, 0xcd, 0xec, 0x0a, 0x3e, 0x24, 0x68, 0x3f, 0x6e }, 6, "FUD" },
-{ { 0x79, 0x0c, 0x25, 0xf7, 0x51, 0x17, 0x5f, 0x7c, 0xbb, 0x7f, 0xf3, 0x4d, 0xee, 0x67, 0xd4, 0x78, 0xed, 0x3d, 0xd5, 0x80 }, 0, "PPC" },
+{ { 0x33, 0xc2, 0xc5, 0x94, 0xcc, 0xf0, 0x2b, 0xeb, 0x0d, 0x45, 0xa8, 0xa2, 0xcc, 0x7e, 0x44, 0xa8, 0x15, 0x16, 0xe4, 0x66 }, 0, "Pina" },
+{ { 0x38, 0x1e, 0xf2, 0xfb, 0x1d, 0x8d, 0xd7, 0x8e, 0x90, 0x78, 0x32, 0xca, 0x76, 0x3e, 0x47, 0x30, 0xe8, 0x46, 0xd7, 0xfd }, 0, "virus" },
 { { 0x3a, 0xa9, 0x28, 0x11, 0x62, 0x0f, 0x9f, 0xf9, 0x3b, 0xf7, 0x0a, 0x77, 0x32, 0x98, 0xaa, 0x77, 0x89, 0xdc, 0x4e, 0xd5 }, 0, "SNOW" },
-{ { 0x17, 0x0e, 0xda, 0xf1, 0x25, 0xf9, 0x65, 0x60, 0x51, 0xb7, 0xbb, 0x52, 0x95, 0xbe, 0x38, 0xc0, 0xf9, 0xc6, 0x8d, 0x57 }, 0, "FIRE" },
-{ { 0xcd, 0x3c, 0x2a, 0xa6, 0x12, 0xc0, 0xe1, 0xd7, 0xfe, 0x8e, 0x18, 0xcd, 0x6b, 0x52, 0x75, 0x03, 0xdd, 0xaf, 0x41, 0x2a }, 0, "GOKEY" },
+{ { 0x3b, 0x34, 0x74, 0xbd, 0x88, 0x62, 0xa7, 0x88, 0xf5, 0x67, 0xc7, 0x39, 0x9d, 0xf9, 0x31, 0x48, 0x96, 0xe0, 0x60, 0x0a }, 6, "WRT" },
+{ { 0x3c, 0xf9, 0x38, 0xc0, 0xcf, 0x6b, 0x0a, 0x6a, 0xf5, 0xe6, 0xdf, 0x0b, 0x4f, 0x0c, 0x10, 0x23, 0xa7, 0x96, 0x7a, 0x8b }, 6, "KAIZEN" },
+{ { 0x4b, 0x70, 0x07, 0xc8, 0xa0, 0xe3, 0x8b, 0xd1, 0xcf, 0x42, 0x49, 0xc6, 0x21, 0x0b, 0x80, 0xbe, 0x03, 0xf7, 0x9d, 0x8d }, 6, "OPTIM" },
+{ { 0x4f, 0x7c, 0x70, 0xff, 0x69, 0x10, 0xd8, 0xf7, 0x6d, 0xa3, 0xea, 0x4f, 0xc3, 0xb4, 0x65, 0xec, 0x8f, 0x91, 0xc2, 0x1f }, 0, "CNT" },
 { { 0x51, 0xa1, 0x36, 0xd3, 0x64, 0x8b, 0x5c, 0xe6, 0x31, 0x9b, 0x07, 0xd0, 0x67, 0x59, 0x15, 0x56, 0x0b, 0x20, 0x82, 0x32 }, 6, "purrADA" },
-{ { 0x0a, 0x8f, 0xea, 0xab, 0x0b, 0xcc, 0xa5, 0x88, 0x51, 0x7c, 0xa1, 0x02, 0xa2, 0x77, 0xb4, 0xa9, 0xb2, 0xaa, 0x6d, 0x2e }, 0, "CDFC5" },
-{ { 0x6d, 0xbf, 0x40, 0xa3, 0x95, 0x8a, 0x33, 0x67, 0x8d, 0x03, 0xd7, 0x5a, 0xdf, 0x2e, 0x5d, 0x7d, 0x85, 0x64, 0x02, 0x22 }, 0, "CDFC4" },
-{ { 0x0f, 0x08, 0xfb, 0x00, 0x3c, 0xe8, 0xe0, 0x40, 0x84, 0xd6, 0x0f, 0xca, 0xe4, 0x92, 0x0c, 0xc9, 0xb4, 0xaf, 0xbb, 0x6c }, 0, "HIS" },
-{ { 0x6d, 0x88, 0xa7, 0x0d, 0xd7, 0x0a, 0x74, 0x0f, 0x89, 0x71, 0x8c, 0x6f, 0xf2, 0xdd, 0xef, 0x6a, 0xf1, 0xbf, 0x49, 0x32 }, 0, "CDFC6" },
-{ { 0x24, 0x6a, 0x12, 0xb6, 0x19, 0x32, 0x95, 0x54, 0xcb, 0xce, 0xa5, 0x2d, 0x6c, 0xd0, 0x88, 0x22, 0x80, 0x1d, 0x30, 0x97 }, 0, "DGADA" },
-{ { 0x07, 0x1c, 0xe8, 0x95, 0xb6, 0xe5, 0xbc, 0x82, 0x48, 0xfd, 0x3c, 0x22, 0x23, 0x68, 0x6e, 0x42, 0x22, 0xa7, 0xd1, 0x2f }, 0, "BDOGE" },
-{ { 0xc8, 0x08, 0xd4, 0xc6, 0x12, 0x93, 0xdf, 0x37, 0x14, 0x00, 0x04, 0xca, 0x06, 0xfa, 0x81, 0xe0, 0xe4, 0x52, 0x28, 0xf4 }, 6, "MEOW" },
-{ { 0x20, 0xee, 0xdc, 0xc7, 0xe1, 0x87, 0xd5, 0xa6, 0x0f, 0x6b, 0x35, 0x57, 0x24, 0x3b, 0x61, 0xfa, 0xa4, 0xe3, 0x61, 0x91 }, 0, "C4" },
+{ { 0x51, 0xff, 0xe7, 0xe7, 0x4f, 0xa1, 0x87, 0xd5, 0xbb, 0xe4, 0x8b, 0x61, 0xbf, 0x4c, 0x65, 0xbc, 0x82, 0xb3, 0xf7, 0xcb }, 6, "BCG" },
+{ { 0x52, 0x52, 0xd9, 0x1e, 0xd6, 0x53, 0xaa, 0x7a, 0x40, 0x7e, 0xed, 0x33, 0x6d, 0xca, 0x4d, 0x26, 0x70, 0x23, 0x86, 0x0a }, 6, "USDM" },
+{ { 0x52, 0xa4, 0xe7, 0x27, 0x57, 0xfc, 0x34, 0xed, 0x37, 0xfc, 0xda, 0x6d, 0x9e, 0x2c, 0xbc, 0x29, 0x71, 0xad, 0x97, 0x0b }, 0, "WOLF" },
+{ { 0x53, 0x9a, 0xc0, 0xc3, 0xa8, 0x18, 0x23, 0x50, 0xc5, 0x7a, 0x45, 0xe9, 0xcd, 0xec, 0x0a, 0x3e, 0x24, 0x68, 0x3f, 0x6e }, 6, "FUD" },
+{ { 0x55, 0xb3, 0xb8, 0xa7, 0x8c, 0x73, 0xdf, 0x8c, 0x35, 0xd5, 0xcc, 0x19, 0xe5, 0x81, 0xfa, 0xf7, 0xd6, 0x14, 0x6c, 0x4f }, 0, "DIBS" },
+{ { 0x55, 0xdf, 0x7e, 0x8b, 0x8f, 0x95, 0x5a, 0xc6, 0x5a, 0xba, 0x1d, 0xc9, 0x84, 0xa3, 0xc2, 0xf9, 0x56, 0x57, 0xbe, 0x7f }, 6, "MINt" },
+{ { 0x56, 0xb4, 0x05, 0x65, 0xd7, 0x47, 0x3f, 0xe9, 0x5e, 0x26, 0x00, 0x59, 0x21, 0x03, 0xa3, 0x1e, 0x42, 0x99, 0x73, 0xf9 }, 6, "GENS" },
+{ { 0x58, 0x61, 0x97, 0x35, 0x64, 0x6d, 0x94, 0xa8, 0xc9, 0x4b, 0xb1, 0x94, 0xeb, 0xbc, 0xa0, 0x0a, 0xf8, 0x44, 0x67, 0x51 }, 6, "SOC" },
 { { 0x58, 0xdb, 0xb5, 0xa1, 0x3c, 0x1a, 0x68, 0x1a, 0x05, 0x78, 0x8c, 0xca, 0x7c, 0x57, 0xf4, 0x9a, 0xf7, 0x40, 0x6a, 0x69 }, 6, "CARGO" },
+{ { 0x5c, 0xc9, 0x71, 0x10, 0x51, 0x3e, 0xf4, 0x86, 0x1e, 0x27, 0x4f, 0x41, 0x16, 0x14, 0x04, 0x25, 0xeb, 0x77, 0x9f, 0x4b }, 0, "FGC" },
+{ { 0x5f, 0x1e, 0x92, 0xd6, 0x67, 0x4e, 0x5c, 0xb9, 0x2f, 0x3e, 0x09, 0x68, 0x56, 0x30, 0x76, 0x27, 0x57, 0x13, 0x95, 0x90 }, 0, "MYST" },
+{ { 0x61, 0x71, 0xd3, 0x3e, 0x73, 0xb4, 0xbb, 0x18, 0x7c, 0xe4, 0x5f, 0xb8, 0x93, 0x2f, 0x73, 0xb0, 0x8a, 0x30, 0xca, 0xd0 }, 0, "FREN" },
+{ { 0x63, 0xdc, 0x06, 0x02, 0xea, 0xac, 0x4c, 0x17, 0x8e, 0xc9, 0x0b, 0xd2, 0x23, 0x8d, 0x94, 0xb6, 0xa9, 0x16, 0x6a, 0x76 }, 6, "HUNT" },
+{ { 0x69, 0x59, 0xee, 0x85, 0x69, 0x60, 0x4d, 0xe7, 0x65, 0x5f, 0xe9, 0xd2, 0xaa, 0x59, 0xc1, 0x1d, 0xa4, 0xad, 0xf6, 0x83 }, 6, "MIN" },
+{ { 0x6d, 0x7a, 0xe0, 0x79, 0xfd, 0x4f, 0xfe, 0xe3, 0x94, 0xe5, 0xe1, 0x4a, 0x59, 0x9d, 0xac, 0x43, 0x3f, 0x47, 0x59, 0x64 }, 6, "SPF" },
+{ { 0x6d, 0x88, 0xa7, 0x0d, 0xd7, 0x0a, 0x74, 0x0f, 0x89, 0x71, 0x8c, 0x6f, 0xf2, 0xdd, 0xef, 0x6a, 0xf1, 0xbf, 0x49, 0x32 }, 0, "CDFC6" },
+{ { 0x6d, 0xbf, 0x40, 0xa3, 0x95, 0x8a, 0x33, 0x67, 0x8d, 0x03, 0xd7, 0x5a, 0xdf, 0x2e, 0x5d, 0x7d, 0x85, 0x64, 0x02, 0x22 }, 0, "CDFC4" },
+{ { 0x70, 0xe6, 0x83, 0xea, 0x65, 0x80, 0xb4, 0xba, 0x35, 0xff, 0xce, 0xd9, 0xc6, 0xf0, 0x75, 0xe7, 0xf5, 0xb4, 0x37, 0x8c }, 6, "ASHIB" },
+{ { 0x73, 0x34, 0x4a, 0xe7, 0x92, 0x50, 0x73, 0x8f, 0x8b, 0xa7, 0xf5, 0x5b, 0x35, 0x7e, 0x5f, 0x25, 0xb9, 0xa5, 0x92, 0xbf }, 0, "CHERRY" },
+{ { 0x73, 0x39, 0x1f, 0xb2, 0xdd, 0xfe, 0xdb, 0xee, 0x6d, 0xe8, 0x66, 0xe4, 0xb7, 0x6d, 0x60, 0xf8, 0x52, 0x62, 0x35, 0x75 }, 0, "DOEX" },
+{ { 0x73, 0x88, 0x43, 0x9d, 0x27, 0xe1, 0x63, 0xeb, 0x8b, 0xd6, 0xe4, 0xff, 0x68, 0x43, 0xc8, 0xe5, 0x6b, 0xa0, 0xeb, 0x2d }, 8, "AGIX" },
 { { 0x74, 0xa0, 0xba, 0x1f, 0x65, 0xe0, 0x88, 0xff, 0xeb, 0x32, 0x77, 0xb8, 0x5e, 0x13, 0xa6, 0xc1, 0x1e, 0x7a, 0xba, 0x66 }, 0, "BSEAL" },
-{ { 0xab, 0x61, 0x6a, 0xc3, 0x78, 0x0a, 0x00, 0xa5, 0xec, 0x73, 0xb9, 0x06, 0x52, 0x39, 0xa2, 0x47, 0xf4, 0xaa, 0xc1, 0x2e }, 0, "NFTC" },
-{ { 0xe1, 0xca, 0x71, 0xb6, 0xaa, 0xaf, 0x40, 0x4e, 0x62, 0xa8, 0xd3, 0x1b, 0x6b, 0x9a, 0xf4, 0xbf, 0x0f, 0xa1, 0x61, 0x8a }, 6, "EMP" },
+{ { 0x74, 0xcc, 0xe2, 0x52, 0xb5, 0x17, 0x0e, 0x94, 0x13, 0x2d, 0xa3, 0x2c, 0x15, 0x41, 0x31, 0x5d, 0x56, 0x5e, 0x85, 0x69 }, 0, "cNETA" },
+{ { 0x76, 0x1c, 0x21, 0x96, 0x92, 0x7f, 0xe6, 0x9c, 0xef, 0x6e, 0x5c, 0x50, 0xed, 0x11, 0x4c, 0x1c, 0x6e, 0xbc, 0xc8, 0x83 }, 0, "BROOM" },
+{ { 0x77, 0xa4, 0x9d, 0x81, 0xc1, 0x3e, 0xbe, 0xb4, 0xbf, 0x39, 0xe0, 0x35, 0xe9, 0xac, 0x54, 0x1a, 0xc1, 0x91, 0xae, 0xe2 }, 0, "MYTH" },
 { { 0x78, 0x39, 0x47, 0x9b, 0x05, 0x7f, 0x13, 0x95, 0xbc, 0xf0, 0x91, 0xef, 0xcf, 0x72, 0x12, 0x78, 0xe6, 0x5f, 0x76, 0x69 }, 0, "RAG" },
-{ { 0x51, 0xff, 0xe7, 0xe7, 0x4f, 0xa1, 0x87, 0xd5, 0xbb, 0xe4, 0x8b, 0x61, 0xbf, 0x4c, 0x65, 0xbc, 0x82, 0xb3, 0xf7, 0xcb }, 6, "BCG" },
-{ { 0xfa, 0x39, 0xf5, 0x9b, 0x51, 0x4f, 0x2d, 0x2f, 0xde, 0x13, 0xc6, 0xdc, 0x15, 0x46, 0x81, 0xc4, 0xef, 0x54, 0xdc, 0xa7 }, 6, "NMKR" },
-{ { 0x3b, 0x34, 0x74, 0xbd, 0x88, 0x62, 0xa7, 0x88, 0xf5, 0x67, 0xc7, 0x39, 0x9d, 0xf9, 0x31, 0x48, 0x96, 0xe0, 0x60, 0x0a }, 6, "WRT" },
-{ { 0x04, 0x93, 0xf4, 0x95, 0x30, 0x89, 0x8e, 0x3d, 0xfe, 0x7d, 0xc0, 0x94, 0x3d, 0x19, 0xbc, 0x1b, 0xdc, 0xb3, 0x6e, 0x10 }, 6, "C3" },
+{ { 0x78, 0x4c, 0x13, 0xb8, 0xf4, 0xd6, 0xc1, 0xf4, 0x5f, 0x4e, 0x9f, 0x6b, 0xe4, 0x17, 0xa3, 0x0f, 0xe7, 0xb7, 0x6d, 0x47 }, 0, "ADAFOX" },
+{ { 0x79, 0x0c, 0x25, 0xf7, 0x51, 0x17, 0x5f, 0x7c, 0xbb, 0x7f, 0xf3, 0x4d, 0xee, 0x67, 0xd4, 0x78, 0xed, 0x3d, 0xd5, 0x80 }, 0, "PPC" },
+{ { 0x79, 0xcd, 0xc7, 0xab, 0x16, 0x70, 0xd3, 0x83, 0x82, 0x05, 0x69, 0x7d, 0xb4, 0x12, 0xf5, 0xb4, 0xce, 0x86, 0xf0, 0xae }, 0, "SNEK" },
+{ { 0x79, 0xde, 0xa8, 0x94, 0xf7, 0xee, 0xb9, 0x20, 0x7c, 0x9e, 0xfd, 0x3b, 0x57, 0x2f, 0x9a, 0xb3, 0xf7, 0x30, 0xab, 0x21 }, 0, "DEFS" },
+{ { 0x7d, 0x27, 0x72, 0x9c, 0xeb, 0x10, 0x85, 0x68, 0xb7, 0x96, 0xd0, 0xf3, 0xfe, 0x23, 0x45, 0x5b, 0x4a, 0x79, 0x76, 0x33 }, 6, "NEWM" },
+{ { 0x7d, 0x4b, 0xf1, 0x92, 0xd8, 0xfa, 0xf3, 0x67, 0xa8, 0xa2, 0x7d, 0xd2, 0x31, 0x4f, 0xca, 0x7d, 0xd8, 0x13, 0xc9, 0x5b }, 6, "PROXIE" },
+{ { 0x7f, 0x8f, 0x4c, 0xd6, 0x4c, 0x13, 0x71, 0x22, 0x35, 0x54, 0xf9, 0x96, 0xa9, 0xf6, 0xe5, 0x6c, 0x0e, 0xe6, 0x1b, 0x36 }, 0, "SKULL" },
 { { 0x83, 0x45, 0xbc, 0xd3, 0x13, 0x72, 0x01, 0x6d, 0x70, 0xb5, 0xb3, 0xd3, 0x3f, 0x93, 0x79, 0x9b, 0x26, 0xc4, 0xb2, 0x32 }, 4, "CLAY" },
-{ { 0x73, 0x88, 0x43, 0x9d, 0x27, 0xe1, 0x63, 0xeb, 0x8b, 0xd6, 0xe4, 0xff, 0x68, 0x43, 0xc8, 0xe5, 0x6b, 0xa0, 0xeb, 0x2d }, 8, "AGIX" },
-{ { 0xe1, 0xf1, 0xde, 0x48, 0x36, 0xc3, 0xed, 0xba, 0xb3, 0xee, 0x34, 0xda, 0x74, 0x96, 0x95, 0xf9, 0x83, 0x71, 0xe0, 0xff }, 6, "INDY" },
+{ { 0x86, 0x78, 0x9a, 0x85, 0xd7, 0x73, 0x4c, 0x05, 0x8e, 0x02, 0xaf, 0x4c, 0x97, 0x2c, 0x61, 0x2d, 0x51, 0x66, 0xfe, 0xf8 }, 6, "GMBL" },
+{ { 0x87, 0xfa, 0x98, 0x6b, 0xf9, 0x96, 0x47, 0x9a, 0xa1, 0xc1, 0x5c, 0x58, 0xc3, 0x72, 0xfc, 0x17, 0xeb, 0x27, 0x09, 0xdf }, 5, "MKA" },
+{ { 0x89, 0xec, 0xc4, 0x0d, 0x74, 0x79, 0x37, 0xa1, 0x28, 0xca, 0x89, 0xcc, 0xb7, 0x33, 0x4a, 0x85, 0x8a, 0x5c, 0xe7, 0xe8 }, 0, "BISON" },
+{ { 0x8e, 0x42, 0x0c, 0xe1, 0x94, 0xca, 0x84, 0x04, 0x0b, 0xa6, 0x97, 0x1e, 0x6a, 0xb8, 0x16, 0xe3, 0xd7, 0x6e, 0xe9, 0xee }, 6, "LQ" },
+{ { 0x8e, 0xeb, 0xaa, 0xf7, 0xc0, 0x2f, 0xc9, 0xa8, 0x33, 0x5b, 0x50, 0x66, 0xc2, 0x16, 0xcb, 0xd0, 0x41, 0x1e, 0x69, 0xa9 }, 0, "KIDZ" },
+{ { 0x93, 0xe9, 0x1a, 0xbb, 0x2f, 0x08, 0x0a, 0xe9, 0x5d, 0x73, 0xce, 0xfa, 0x2c, 0x33, 0xab, 0xc5, 0x1b, 0x05, 0xd3, 0x8c }, 0, "$CLAW" },
+{ { 0x97, 0x24, 0x0c, 0xdf, 0xd4, 0x25, 0xb9, 0x09, 0x05, 0x5c, 0x1f, 0x1d, 0x45, 0x4c, 0x53, 0x4d, 0x77, 0xb5, 0x2d, 0x88 }, 0, "QUID" },
+{ { 0x98, 0xb6, 0x0a, 0x33, 0xc5, 0x54, 0xe6, 0x9b, 0x90, 0xd9, 0x7d, 0x15, 0x7b, 0x5b, 0x3f, 0x2c, 0x9b, 0x85, 0x73, 0x12 }, 0, "KITUP" },
+{ { 0x9a, 0x56, 0x95, 0x83, 0x63, 0x32, 0xd0, 0x6e, 0xdb, 0x97, 0x81, 0xd3, 0xbb, 0x60, 0xdf, 0xd4, 0x74, 0x6e, 0x2d, 0x12 }, 6, "iETH" },
+{ { 0x9e, 0x16, 0xc1, 0x09, 0x3c, 0x5e, 0x67, 0x7b, 0xee, 0xe9, 0xea, 0xca, 0xcd, 0x81, 0x2e, 0xe3, 0x37, 0x78, 0x98, 0x87 }, 0, "BORGZ" },
+{ { 0x9f, 0x33, 0x59, 0x36, 0x52, 0xfa, 0x49, 0xb6, 0x2f, 0xe9, 0x67, 0x4f, 0x8d, 0x1f, 0xae, 0x07, 0x03, 0xaa, 0xed, 0x8d }, 0, "BEAG" },
 { { 0xa2, 0x62, 0x4d, 0xda, 0x5d, 0x49, 0x8d, 0x9e, 0x4d, 0x94, 0x42, 0xdb, 0xfa, 0x55, 0x14, 0x04, 0x0e, 0xb2, 0x16, 0xc7 }, 6, "DJED" },
-{ { 0x1e, 0xe2, 0x7e, 0xdf, 0xf4, 0x99, 0xcf, 0x88, 0xf0, 0x3a, 0x1e, 0xbc, 0x4f, 0x22, 0x6f, 0x4a, 0x4c, 0x07, 0x71, 0xde }, 6, "iUSD" },
-{ { 0x79, 0xcd, 0xc7, 0xab, 0x16, 0x70, 0xd3, 0x83, 0x82, 0x05, 0x69, 0x7d, 0xb4, 0x12, 0xf5, 0xb4, 0xce, 0x86, 0xf0, 0xae }, 0, "SNEK" },
-{ { 0x63, 0xdc, 0x06, 0x02, 0xea, 0xac, 0x4c, 0x17, 0x8e, 0xc9, 0x0b, 0xd2, 0x23, 0x8d, 0x94, 0xb6, 0xa9, 0x16, 0x6a, 0x76 }, 6, "HUNT" },
-{ { 0x16, 0x94, 0xeb, 0x43, 0x8c, 0xac, 0x25, 0x6f, 0xaa, 0xb6, 0x92, 0x06, 0xa8, 0x6c, 0xeb, 0x48, 0xea, 0x17, 0xe1, 0x25 }, 6, "IAG" },
-{ { 0x61, 0x71, 0xd3, 0x3e, 0x73, 0xb4, 0xbb, 0x18, 0x7c, 0xe4, 0x5f, 0xb8, 0x93, 0x2f, 0x73, 0xb0, 0x8a, 0x30, 0xca, 0xd0 }, 0, "FREN" },
-{ { 0xb5, 0xed, 0x5d, 0x2d, 0xa9, 0x85, 0xa6, 0x2c, 0x96, 0xc7, 0xaf, 0x72, 0xfc, 0xe5, 0xf6, 0x51, 0x8f, 0xbc, 0x3a, 0xe2 }, 6, "LENFI" },
+{ { 0xa2, 0xce, 0x9b, 0xe3, 0x4b, 0x2e, 0x03, 0x46, 0xbd, 0x60, 0xa5, 0x2b, 0x00, 0x08, 0x94, 0x6b, 0x54, 0xbc, 0x4c, 0x55 }, 0, "FIRE" },
+{ { 0xa5, 0x26, 0x64, 0x02, 0x54, 0xee, 0x12, 0x9f, 0x25, 0xb7, 0xc1, 0xc7, 0xd9, 0xa5, 0xc4, 0xff, 0xa6, 0x0a, 0xfe, 0x43 }, 3, "STRIP" },
+{ { 0xa9, 0x00, 0x98, 0x87, 0x1f, 0x11, 0x8e, 0x79, 0x4b, 0xb7, 0x23, 0x48, 0x9e, 0xb4, 0xe1, 0x33, 0xa8, 0x6b, 0xf3, 0x1d }, 6, "DRIP" },
+{ { 0xab, 0x61, 0x6a, 0xc3, 0x78, 0x0a, 0x00, 0xa5, 0xec, 0x73, 0xb9, 0x06, 0x52, 0x39, 0xa2, 0x47, 0xf4, 0xaa, 0xc1, 0x2e }, 0, "NFTC" },
+{ { 0xae, 0x19, 0x61, 0x6a, 0x36, 0x42, 0xe0, 0xb7, 0x07, 0xf7, 0x7c, 0xf5, 0x73, 0x51, 0x59, 0x15, 0x9f, 0x94, 0x22, 0xa9 }, 8, "REVU" },
 { { 0xb2, 0x5d, 0xa0, 0xff, 0x7c, 0x12, 0x10, 0x0f, 0x71, 0x85, 0x7d, 0xee, 0xcb, 0x12, 0x81, 0xd1, 0x89, 0x8e, 0x9a, 0x3f }, 6, "iBTC" },
-{ { 0xf8, 0x77, 0x71, 0x02, 0x31, 0x64, 0x24, 0x59, 0x06, 0x4a, 0x74, 0x3f, 0xce, 0x3f, 0x90, 0x02, 0x7a, 0x9d, 0x5a, 0xc5 }, 6, "BOOK" },
-{ { 0x29, 0x39, 0x3c, 0x8d, 0x53, 0x12, 0xbc, 0x10, 0x14, 0x32, 0x6a, 0xfb, 0x47, 0x99, 0xc9, 0x23, 0x5e, 0xd5, 0x4c, 0x64 }, 6, "NTX" },
+{ { 0xb4, 0x45, 0x60, 0xb8, 0xff, 0xb6, 0x9e, 0xf2, 0x80, 0x74, 0x14, 0x2e, 0x6c, 0xf3, 0x2e, 0xcb, 0xe6, 0xfc, 0x15, 0xd9 }, 0, "ADAX" },
+{ { 0xb5, 0xed, 0x5d, 0x2d, 0xa9, 0x85, 0xa6, 0x2c, 0x96, 0xc7, 0xaf, 0x72, 0xfc, 0xe5, 0xf6, 0x51, 0x8f, 0xbc, 0x3a, 0xe2 }, 6, "LENFI" },
 { { 0xb7, 0x1c, 0x96, 0xbf, 0x30, 0x49, 0x4d, 0x83, 0x70, 0x61, 0x51, 0xaa, 0x92, 0xbb, 0x54, 0xfb, 0x05, 0x55, 0xd9, 0x2e }, 6, "FACT" },
-{ { 0x23, 0x54, 0xee, 0x7a, 0xa2, 0x5d, 0xb0, 0xc5, 0x8a, 0x74, 0x94, 0x2c, 0x3f, 0xb9, 0xe7, 0xa1, 0xa5, 0x24, 0x6a, 0xf5 }, 6, "LIFI" },
-{ { 0x4b, 0x70, 0x07, 0xc8, 0xa0, 0xe3, 0x8b, 0xd1, 0xcf, 0x42, 0x49, 0xc6, 0x21, 0x0b, 0x80, 0xbe, 0x03, 0xf7, 0x9d, 0x8d }, 6, "OPTIM" },
-{ { 0x29, 0x35, 0x01, 0xe1, 0xd2, 0xea, 0x4a, 0x6b, 0x70, 0x47, 0x8a, 0xcf, 0x76, 0xb7, 0xab, 0x2d, 0x4e, 0xe2, 0x58, 0xa3 }, 6, "OPT" },
-{ { 0x27, 0x10, 0x3e, 0x8a, 0xc1, 0xf4, 0x52, 0x17, 0x2c, 0xd9, 0x4c, 0x32, 0x41, 0xe4, 0xd4, 0x3f, 0x67, 0xed, 0x06, 0xfd }, 6, "CGI" },
-{ { 0xf3, 0x0a, 0x25, 0x41, 0x3e, 0x63, 0xe8, 0x2d, 0x6e, 0x79, 0xa8, 0x2c, 0xfb, 0x0b, 0xfb, 0xe6, 0x69, 0xd0, 0x19, 0x69 }, 6, "SHEN" },
-{ { 0x25, 0xf8, 0xef, 0xb7, 0x66, 0xe5, 0x85, 0xc2, 0x9e, 0x85, 0x4f, 0x63, 0x46, 0xaa, 0x3e, 0x55, 0x74, 0x2c, 0x01, 0x89 }, 6, "PBX" },
-{ { 0x9a, 0x56, 0x95, 0x83, 0x63, 0x32, 0xd0, 0x6e, 0xdb, 0x97, 0x81, 0xd3, 0xbb, 0x60, 0xdf, 0xd4, 0x74, 0x6e, 0x2d, 0x12 }, 6, "iETH" },
-{ { 0x98, 0xb6, 0x0a, 0x33, 0xc5, 0x54, 0xe6, 0x9b, 0x90, 0xd9, 0x7d, 0x15, 0x7b, 0x5b, 0x3f, 0x2c, 0x9b, 0x85, 0x73, 0x12 }, 0, "KITUP" },
-{ { 0x56, 0xb4, 0x05, 0x65, 0xd7, 0x47, 0x3f, 0xe9, 0x5e, 0x26, 0x00, 0x59, 0x21, 0x03, 0xa3, 0x1e, 0x42, 0x99, 0x73, 0xf9 }, 6, "GENS" },
-{ { 0x1e, 0x57, 0xbc, 0x89, 0xed, 0x20, 0xc5, 0x2f, 0x2d, 0xc1, 0x00, 0x99, 0xf1, 0x8f, 0x25, 0x76, 0xe3, 0x8b, 0xd4, 0x22 }, 0, "RON" },
-{ { 0x19, 0x1c, 0xc9, 0xfe, 0x2b, 0x45, 0xa7, 0xa9, 0x0a, 0x71, 0x1e, 0x10, 0xb8, 0x5a, 0x9d, 0x8b, 0x0c, 0x29, 0xbc, 0x82 }, 0, "TOOL" },
-{ { 0x14, 0xba, 0x77, 0x29, 0x6f, 0x62, 0x73, 0xba, 0x60, 0x15, 0xbd, 0x7e, 0x75, 0xbf, 0x2d, 0x72, 0x4d, 0xb3, 0xcb, 0xa0 }, 6, "JPG" },
-{ { 0x58, 0x61, 0x97, 0x35, 0x64, 0x6d, 0x94, 0xa8, 0xc9, 0x4b, 0xb1, 0x94, 0xeb, 0xbc, 0xa0, 0x0a, 0xf8, 0x44, 0x67, 0x51 }, 6, "SOC" },
-{ { 0x1c, 0x77, 0x87, 0x8f, 0xb4, 0xe1, 0x40, 0x2e, 0xdf, 0xf5, 0x03, 0x40, 0x84, 0x0f, 0x80, 0x89, 0x00, 0x50, 0x68, 0x79 }, 0, "VIPER" },
-{ { 0x0f, 0x76, 0xf8, 0xdd, 0x1a, 0xba, 0xcf, 0xf4, 0xa4, 0xc3, 0x65, 0xa1, 0xfa, 0x64, 0x33, 0xb7, 0xac, 0x8d, 0x49, 0xc5 }, 6, "ENCS" },
+{ { 0xb9, 0x3d, 0x95, 0x0c, 0xaa, 0xa9, 0x09, 0x84, 0x38, 0x14, 0x4b, 0x32, 0x2b, 0x6f, 0x51, 0xc5, 0x28, 0xe1, 0x40, 0x38 }, 0, "PTC" },
+{ { 0xbc, 0xca, 0x70, 0x17, 0x1f, 0xa6, 0x6f, 0x68, 0x0a, 0xe9, 0x3d, 0x42, 0x3b, 0xac, 0xac, 0x97, 0xcd, 0xa6, 0xd7, 0x91 }, 6, "RAT" },
+{ { 0xbe, 0xfa, 0x40, 0x09, 0x14, 0x68, 0xfe, 0x2c, 0xd2, 0x73, 0x50, 0x29, 0xce, 0x23, 0x47, 0xa8, 0x51, 0x82, 0xd4, 0xab }, 6, "ADO" },
+{ { 0xbf, 0xa5, 0x0e, 0x48, 0x4b, 0xac, 0x0e, 0x1e, 0x07, 0x53, 0x18, 0x97, 0x71, 0x96, 0x77, 0xec, 0xbe, 0xf4, 0x6d, 0xd7 }, 6, "WMT" },
+{ { 0xc1, 0x40, 0xcd, 0xae, 0x75, 0xd4, 0xe3, 0x27, 0x28, 0x3e, 0xda, 0x2b, 0x1e, 0x81, 0xb6, 0xbc, 0x6e, 0x64, 0xdc, 0x2a }, 6, "ETB" },
+{ { 0xc1, 0xb9, 0x94, 0x86, 0xca, 0xf1, 0x1a, 0xd8, 0x93, 0xb9, 0xcc, 0x59, 0x27, 0x0d, 0x22, 0x00, 0x71, 0xce, 0xd5, 0xeb }, 0, "SWEET" },
 { { 0xc6, 0x00, 0x7e, 0x0c, 0x42, 0xac, 0x1b, 0x3c, 0xf0, 0x0c, 0xa4, 0x94, 0xce, 0xae, 0x59, 0x90, 0x8f, 0x2a, 0x2f, 0x02 }, 0, "BANK" },
-{ { 0x2b, 0x60, 0x77, 0x00, 0xc1, 0xd6, 0x08, 0x71, 0x3d, 0x8f, 0x4f, 0xc5, 0xf6, 0xeb, 0x60, 0x65, 0x35, 0xd7, 0x01, 0x02 }, 2, "BUZZ" },
-{ { 0xef, 0xb3, 0x25, 0x1f, 0x0d, 0x4b, 0xfc, 0x75, 0xcd, 0xa2, 0xc3, 0x20, 0xed, 0xd1, 0xd7, 0xb2, 0xa4, 0x30, 0xb5, 0xe2 }, 9, "rsERG" },
+{ { 0xc6, 0xb9, 0xde, 0x78, 0x3c, 0x4c, 0x0d, 0x79, 0xef, 0xd9, 0x43, 0xf3, 0x91, 0xdf, 0x95, 0x84, 0xdc, 0x96, 0x96, 0x13 }, 6, "COPI" },
+{ { 0xc8, 0x08, 0xd4, 0xc6, 0x12, 0x93, 0xdf, 0x37, 0x14, 0x00, 0x04, 0xca, 0x06, 0xfa, 0x81, 0xe0, 0xe4, 0x52, 0x28, 0xf4 }, 6, "MEOW" },
 { { 0xca, 0xbf, 0xde, 0x8b, 0xc1, 0xc7, 0xc8, 0x51, 0x9e, 0xbb, 0xf9, 0xf5, 0x6e, 0x48, 0xbd, 0x61, 0x57, 0x2e, 0xef, 0xc5 }, 4, "CNCT" },
-{ { 0xd2, 0x17, 0xf9, 0x26, 0x3c, 0x12, 0x2e, 0x62, 0x6f, 0xe5, 0xc4, 0xae, 0x5e, 0x31, 0xc8, 0xa4, 0xb7, 0x81, 0x2a, 0x88 }, 9, "AXO" },
-{ { 0x6d, 0x7a, 0xe0, 0x79, 0xfd, 0x4f, 0xfe, 0xe3, 0x94, 0xe5, 0xe1, 0x4a, 0x59, 0x9d, 0xac, 0x43, 0x3f, 0x47, 0x59, 0x64 }, 6, "SPF" },
-{ { 0x13, 0xbb, 0x5c, 0x5d, 0xc5, 0x36, 0xfc, 0x67, 0x5b, 0xc8, 0xae, 0xb2, 0x92, 0xd4, 0x10, 0x92, 0x8f, 0x7d, 0xcd, 0xbe }, 6, "XRAY" },
-{ { 0x0e, 0xc9, 0x9e, 0x17, 0x89, 0xa0, 0x23, 0xa9, 0xca, 0x55, 0xef, 0xce, 0xcf, 0xeb, 0x1e, 0xcf, 0x6e, 0x65, 0xfe, 0x6c }, 6, "FLAC" },
 { { 0xcc, 0xcf, 0x11, 0xca, 0xe6, 0x9b, 0xe3, 0xd5, 0x3b, 0xae, 0x0b, 0x68, 0xb2, 0x2c, 0x65, 0x0a, 0xc8, 0x05, 0xa5, 0xa2 }, 6, "CHRY" },
-{ { 0x52, 0x52, 0xd9, 0x1e, 0xd6, 0x53, 0xaa, 0x7a, 0x40, 0x7e, 0xed, 0x33, 0x6d, 0xca, 0x4d, 0x26, 0x70, 0x23, 0x86, 0x0a }, 6, "USDM" }
+{ { 0xcd, 0x3c, 0x2a, 0xa6, 0x12, 0xc0, 0xe1, 0xd7, 0xfe, 0x8e, 0x18, 0xcd, 0x6b, 0x52, 0x75, 0x03, 0xdd, 0xaf, 0x41, 0x2a }, 0, "GOKEY" },
+{ { 0xd2, 0x17, 0xf9, 0x26, 0x3c, 0x12, 0x2e, 0x62, 0x6f, 0xe5, 0xc4, 0xae, 0x5e, 0x31, 0xc8, 0xa4, 0xb7, 0x81, 0x2a, 0x88 }, 9, "AXO" },
+{ { 0xd2, 0x76, 0xf6, 0x5f, 0xce, 0x13, 0x18, 0xc3, 0x85, 0xfb, 0x55, 0x6e, 0xce, 0x88, 0xdc, 0x24, 0x01, 0xbf, 0x31, 0xee }, 0, "CDOG" },
+{ { 0xd8, 0x79, 0xde, 0xfe, 0x51, 0xc6, 0x31, 0xe6, 0x27, 0x38, 0x82, 0x03, 0xe2, 0xe9, 0x6a, 0x6c, 0xf4, 0xa0, 0x2f, 0x18 }, 6, "GTCHI" },
+{ { 0xdd, 0x78, 0x55, 0x5b, 0x3a, 0x3a, 0x9e, 0x1b, 0x59, 0xfe, 0xd9, 0xc1, 0xbd, 0xa3, 0x84, 0xcb, 0xd5, 0x97, 0x0c, 0xe8 }, 6, "SUNDAE" },
+{ { 0xdf, 0x37, 0x63, 0x36, 0xdd, 0xf9, 0x77, 0x71, 0xd5, 0x3c, 0xc3, 0x12, 0x55, 0xf2, 0x78, 0x50, 0x1c, 0x53, 0x06, 0xa3 }, 0, "GROW" },
+{ { 0xe1, 0xca, 0x71, 0xb6, 0xaa, 0xaf, 0x40, 0x4e, 0x62, 0xa8, 0xd3, 0x1b, 0x6b, 0x9a, 0xf4, 0xbf, 0x0f, 0xa1, 0x61, 0x8a }, 6, "EMP" },
+{ { 0xe1, 0xf1, 0xde, 0x48, 0x36, 0xc3, 0xed, 0xba, 0xb3, 0xee, 0x34, 0xda, 0x74, 0x96, 0x95, 0xf9, 0x83, 0x71, 0xe0, 0xff }, 6, "INDY" },
+{ { 0xe2, 0x90, 0xc3, 0xfd, 0xe3, 0x5f, 0x7c, 0xd6, 0x2d, 0x58, 0x2c, 0x25, 0x7a, 0xc7, 0xab, 0x3d, 0x49, 0x8f, 0x96, 0x30 }, 0, "WDAY" },
+{ { 0xe7, 0xeb, 0xb8, 0x68, 0xd3, 0xe2, 0x14, 0xce, 0xaf, 0xe9, 0x9c, 0x52, 0xb0, 0xc3, 0xbf, 0x76, 0x79, 0x2b, 0x6e, 0xd7 }, 0, "EUS" },
+{ { 0xe8, 0x6c, 0xb8, 0x93, 0x45, 0x74, 0x89, 0x85, 0xec, 0xb5, 0x33, 0xf2, 0x8f, 0xdc, 0xd1, 0xa8, 0xcb, 0x6c, 0xcc, 0xd4 }, 0, "PAVIA" },
+{ { 0xea, 0x75, 0xb6, 0xf2, 0x1f, 0x34, 0x2f, 0x99, 0x4d, 0xe7, 0x88, 0xc0, 0x51, 0xd4, 0x52, 0xa0, 0x4e, 0xaa, 0x59, 0x6c }, 0, "RAD" },
+{ { 0xed, 0xf1, 0x52, 0x81, 0x0e, 0xcf, 0x78, 0x5e, 0x50, 0xb3, 0x80, 0x19, 0x9a, 0x2f, 0xaf, 0x88, 0x87, 0x78, 0xbb, 0x46 }, 6, "cbTHC" },
+{ { 0xef, 0xb2, 0xfe, 0xf8, 0xf1, 0x41, 0xba, 0x2d, 0x36, 0x03, 0xc4, 0x99, 0xa5, 0xa7, 0xbb, 0x56, 0xe6, 0x3e, 0xd3, 0x6a }, 0, "TREES" },
+{ { 0xef, 0xb3, 0x25, 0x1f, 0x0d, 0x4b, 0xfc, 0x75, 0xcd, 0xa2, 0xc3, 0x20, 0xed, 0xd1, 0xd7, 0xb2, 0xa4, 0x30, 0xb5, 0xe2 }, 9, "rsERG" },
+{ { 0xf0, 0x3c, 0x3a, 0x14, 0x5f, 0xc4, 0x5a, 0x87, 0x3d, 0x99, 0x9e, 0x0e, 0xf0, 0xb5, 0x94, 0xd6, 0x81, 0xa2, 0x23, 0x8e }, 0, "HOSKY" },
+{ { 0xf3, 0x0a, 0x25, 0x41, 0x3e, 0x63, 0xe8, 0x2d, 0x6e, 0x79, 0xa8, 0x2c, 0xfb, 0x0b, 0xfb, 0xe6, 0x69, 0xd0, 0x19, 0x69 }, 6, "SHEN" },
+{ { 0xf8, 0x77, 0x71, 0x02, 0x31, 0x64, 0x24, 0x59, 0x06, 0x4a, 0x74, 0x3f, 0xce, 0x3f, 0x90, 0x02, 0x7a, 0x9d, 0x5a, 0xc5 }, 6, "BOOK" },
+{ { 0xf9, 0xd2, 0x52, 0x1e, 0x3f, 0x5e, 0xd0, 0xd5, 0x79, 0x1f, 0x3e, 0x2c, 0xe8, 0xa4, 0xaf, 0xc4, 0x4d, 0x11, 0x13, 0x1c }, 0, "KOZ" },
+{ { 0xfa, 0x39, 0xf5, 0x9b, 0x51, 0x4f, 0x2d, 0x2f, 0xde, 0x13, 0xc6, 0xdc, 0x15, 0x46, 0x81, 0xc4, 0xef, 0x54, 0xdc, 0xa7 }, 6, "NMKR" },
+{ { 0xfc, 0x09, 0x66, 0xfe, 0x97, 0x60, 0x10, 0xfe, 0x99, 0x4e, 0xb8, 0x5e, 0x92, 0x88, 0x31, 0x06, 0x23, 0x15, 0x10, 0x97 }, 6, "BLC" },
+{ { 0xff, 0x07, 0x5c, 0xd6, 0x57, 0x82, 0x07, 0xb4, 0x85, 0x8b, 0x1f, 0x14, 0xb4, 0x8c, 0x0a, 0x15, 0x05, 0x46, 0x9d, 0x74 }, 0, "Tokhun" }
 // clang-format on